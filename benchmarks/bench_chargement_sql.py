@@ -0,0 +1,48 @@
+"""
+Benchmark du chargement SQL : `Loader.vers_sql` (to_sql par défaut et 'multi')
+contre `Loader.vers_sql_bulk`, à partir de la table `cocoa` de cocoa.db
+répliquée jusqu'au nombre de lignes demandé.
+
+Usage :
+    python -m benchmarks.bench_chargement_sql [n_lignes ...]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+from sqlalchemy import create_engine
+
+from etl_package import Loader
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def charger_source(n_lignes: int) -> pd.DataFrame:
+    source = create_engine(f"sqlite:///{os.path.join(RACINE, 'cocoa.db')}")
+    df = pd.read_sql_table("cocoa", source)
+    repetitions = -(-n_lignes // len(df))
+    return pd.concat([df] * repetitions, ignore_index=True).iloc[:n_lignes]
+
+
+def mesurer(nom: str, n_lignes: int, fonction) -> None:
+    debut = time.perf_counter()
+    fonction()
+    duree = time.perf_counter() - debut
+    print(f"{nom:>22} {duree:>10.3f} {n_lignes / duree:>14.0f}")
+
+
+if __name__ == "__main__":
+    tailles = [int(n) for n in sys.argv[1:]] or [100_000, 1_000_000]
+    for n in tailles:
+        df = charger_source(n)
+        print(f"\n{n} lignes")
+        print(f"{'méthode':>22} {'temps (s)':>10} {'lignes/s':>14}")
+        with tempfile.TemporaryDirectory() as dossier:
+            engine = create_engine(f"sqlite:///{os.path.join(dossier, 'bench.db')}")
+            mesurer("vers_sql", n, lambda: Loader.vers_sql(df, "t1", engine, verbose=False))
+            mesurer("vers_sql multi", n, lambda: Loader.vers_sql(
+                df, "t2", engine, verbose=False, chunksize=10_000 // df.shape[1], method="multi"))
+            mesurer("vers_sql_bulk", n, lambda: Loader.vers_sql_bulk(df, "t3", engine, verbose=False))
+            engine.dispose()
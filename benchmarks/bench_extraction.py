@@ -0,0 +1,49 @@
+"""
+Benchmark du parsing de tableau HTML : BeautifulSoup (html.parser) contre le
+parseur incrémental lxml.
+
+Usage :
+    python -m benchmarks.bench_extraction [n_lignes ...]
+"""
+import sys
+import time
+import tracemalloc
+
+from etl_package import ExtractionData
+
+COLONNES = ["Company", "Origin", "REF", "ReviewDate", "CocoaPercent",
+            "CompanyLocation", "Rating", "BeanType", "BroadBeanOrigin"]
+
+
+def generer_page(n_lignes: int) -> bytes:
+    """
+    Génère une page HTML au format de l'index cacao (le tableau de données est le 2e).
+    """
+    entete = "".join(f'<td class="{c}">{c}\n</td>' for c in COLONNES)
+    lignes = [f"<tr>{entete}</tr>"]
+    for i in range(n_lignes):
+        valeurs = [f"Company {i % 400}", f"Origin {i}", str(1000 + i), str(2006 + i % 12),
+                   f"{55 + i % 40}%", "France", str(2 + (i % 9) * 0.25), "Criollo", "Peru"]
+        lignes.append("<tr>" + "".join(f'<td class="{c}">{v}</td>' for c, v in zip(COLONNES, valeurs)) + "</tr>")
+    page = "<html><body><table><tr><td>menu</td></tr></table><table>" + "\n".join(lignes) + "</table></body></html>"
+    return page.encode()
+
+
+def mesurer(contenu: bytes, moteur: str):
+    tracemalloc.start()
+    debut = time.perf_counter()
+    df = ExtractionData._parser_page(contenu, moteur=moteur)
+    duree = time.perf_counter() - debut
+    _, pic = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return df.shape[0], duree, pic / 2**20
+
+
+if __name__ == "__main__":
+    tailles = [int(n) for n in sys.argv[1:]] or [10_000, 100_000]
+    print(f"{'lignes':>10} {'moteur':>6} {'temps (s)':>10} {'pic mémoire (Mo)':>17}")
+    for n in tailles:
+        contenu = generer_page(n)
+        for moteur in ExtractionData.MOTEURS:
+            lignes, duree, pic = mesurer(contenu, moteur)
+            print(f"{lignes:>10} {moteur:>6} {duree:>10.3f} {pic:>17.1f}")
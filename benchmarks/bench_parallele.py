@@ -0,0 +1,81 @@
+"""
+Benchmark de `ExecuteurParallele` à 1, 2, 4 et 8 processus, contre l'appel direct :
+- mode colonnes : `ImputateurML` (forêt aléatoire) sur 8 colonnes cibles ;
+- mode lignes : `RemplacementColonne` (expressions régulières) sur une colonne texte.
+
+Le temps mesuré inclut la copie en mémoire partagée et le retour des résultats.
+L'accélération est bornée par le nombre de cœurs de la machine (affiché).
+
+Usage :
+    python -m benchmarks.bench_parallele [n_lignes]
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+
+from etl_package import ExecuteurParallele, ImputateurML, RemplacementColonne
+
+CIBLES = [f"y{i}" for i in range(8)]
+
+
+def generer(n_lignes: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(n_lignes, 6)), columns=[f"x{i}" for i in range(6)])
+    for i, c in enumerate(CIBLES):
+        df[c] = df["x0"] * i + df["x1"] ** 2 + rng.normal(size=n_lignes)
+        df.loc[rng.random(n_lignes) < 0.2, c] = np.nan
+    df["CocoaPercentage"] = (rng.integers(50, 100, n_lignes)).astype(str) + "%"
+    return df
+
+
+def serie_ml(df: pd.DataFrame) -> pd.DataFrame:
+    out = df.copy()
+    explicatives = [f"x{i}" for i in range(6)]
+    for c in CIBLES:
+        out[c] = ImputateurML.imputer_colonne_ml(df[[c] + explicatives], c, modele())
+    return out
+
+
+def modele() -> RandomForestRegressor:
+    return RandomForestRegressor(n_estimators=20, max_depth=8, n_jobs=1, random_state=0)
+
+
+def identite(df: pd.DataFrame) -> pd.DataFrame:
+    return df
+
+
+def chronometrer(fonction) -> float:
+    with contextlib.redirect_stdout(io.StringIO()):
+        debut = time.perf_counter()
+        fonction()
+        return time.perf_counter() - debut
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    df = generer(n)
+    explicatives = [f"x{i}" for i in range(6)]
+    print(f"{n} lignes, {os.cpu_count()} cœur(s)")
+    print(f"{'processus':>10} {'ImputateurML (s)':>18} {'remplacement (s)':>18}")
+
+    ml = chronometrer(lambda: serie_ml(df))
+    remplacement = chronometrer(lambda: RemplacementColonne.remplacer_valeurs(df, "CocoaPercentage", ("%", "")))
+    print(f"{'direct':>10} {ml:>18.2f} {remplacement:>18.2f}")
+
+    for n_processus in (1, 2, 4, 8):
+        with ExecuteurParallele(max_workers=n_processus) as executeur:
+            # Démarrage des processus hors mesure.
+            executeur.par_lignes(df.head(n_processus), identite)
+            ml = chronometrer(lambda: executeur.par_colonnes(
+                df, ImputateurML.imputer_colonne_ml, CIBLES, lues=explicatives, modele=modele()
+            ))
+            remplacement = chronometrer(lambda: executeur.par_lignes(
+                df, RemplacementColonne.remplacer_valeurs, colonne="CocoaPercentage", remplacement=("%", "")
+            ))
+        print(f"{n_processus:>10} {ml:>18.2f} {remplacement:>18.2f}")
@@ -0,0 +1,77 @@
+"""
+Benchmark du `Pipeline` : exécution fusionnée contre l'appel successif des classes
+(chacune avec `inplace=False`), sur la table `cocoa` de cocoa.db répliquée jusqu'au
+nombre de lignes demandé. Mesure le temps et le pic mémoire (tracemalloc, mesuré
+dans une exécution séparée pour ne pas fausser le temps).
+
+Usage :
+    python -m benchmarks.bench_pipeline [n_lignes ...]
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+from sqlalchemy import create_engine
+
+from etl_package import (
+    Pipeline, Imputateur, NormaliserColonne, GestionOutliers, FeatureEngineering, EncodeurCategoriel,
+)
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def charger_source(n_lignes: int) -> pd.DataFrame:
+    source = create_engine(f"sqlite:///{os.path.join(RACINE, 'cocoa.db')}")
+    df = pd.read_sql_table("cocoa", source)
+    repetitions = -(-n_lignes // len(df))
+    df = pd.concat([df] * repetitions, ignore_index=True).iloc[:n_lignes]
+    # Colonnes larges non touchées par les transformations, comme dans un vrai jeu de données.
+    for i in range(8):
+        df[f"extra_{i}"] = df["Rating"] * i
+    return df
+
+
+def sequentiel(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    df["Rating"] = Imputateur.imputer_colonne(df, "Rating", "mediane")["Rating"]
+    df = GestionOutliers.gerer_outliers(df, "CocoaPercentage", "winsorize")
+    df = NormaliserColonne.normaliser_colonne_choisie(df, "Rating")
+    df = FeatureEngineering.creer_feature(df, "ratio", "Rating", "CocoaPercentage")
+    df = EncodeurCategoriel.encoder_colonne(df, "Company", "frequence")
+    return df
+
+
+PIPELINE = (
+    Pipeline()
+    .imputer("Rating", "mediane")
+    .gerer_outliers("CocoaPercentage", "winsorize")
+    .normaliser("Rating")
+    .creer_feature("ratio", "Rating", "CocoaPercentage")
+    .encoder("Company", "frequence")
+)
+
+
+def mesurer(nom: str, fonction) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        debut = time.perf_counter()
+        fonction()
+        duree = time.perf_counter() - debut
+        tracemalloc.start()
+        fonction()
+        _, pic = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    print(f"{nom:>12} {duree:>10.3f} {pic / 2**20:>14.1f}")
+
+
+if __name__ == "__main__":
+    tailles = [int(n) for n in sys.argv[1:]] or [100_000, 1_000_000]
+    for n in tailles:
+        df = charger_source(n)
+        print(f"\n{n} lignes ({df.memory_usage(deep=True).sum() / 2**20:.0f} Mo)")
+        print(f"{'méthode':>12} {'temps (s)':>10} {'pic (Mo)':>14}")
+        mesurer("séquentiel", lambda: sequentiel(df))
+        mesurer("pipeline", lambda: PIPELINE.executer(df))
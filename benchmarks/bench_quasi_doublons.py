@@ -0,0 +1,96 @@
+"""
+Benchmark de `QuasiDoublons.grouper` : noms de compagnies synthétiques avec des
+variantes d'écriture (espaces, casse, accents, lettre supprimée, remplacée ou inversée).
+
+Pour chaque taille : durée, valeurs distinctes, paires candidates retenues par LSH
+rapportées au nombre de paires possibles (taux d'élagage), et qualité des groupes
+par rapport aux noms d'origine (précision / rappel sur les paires de valeurs distinctes).
+
+Usage :
+    python -m benchmarks.bench_quasi_doublons [n_lignes ...]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from etl_package import QuasiDoublons
+
+CONSONNES = list("bcdfghjklmnprstvwxz")
+VOYELLES = list("aeiouy")
+LETTRES = "abcdefghijklmnopqrstuvwxyz"
+TAUX_VARIANTES = 0.1
+
+
+def generer_noms(n: int, rng: np.random.Generator) -> list:
+    noms = set()
+    while len(noms) < n:
+        # Mots prononçables : consonnes et voyelles alternées, 4 à 9 lettres.
+        mots = [
+            "".join(rng.choice(CONSONNES if k % 2 == 0 else VOYELLES) for k in range(rng.integers(4, 10))).capitalize()
+            for _ in range(rng.integers(1, 3))
+        ]
+        noms.add(" ".join(mots))
+    return sorted(noms)
+
+
+def varier(nom: str, rng: np.random.Generator) -> str:
+    k = int(rng.integers(1, len(nom) - 1))
+    transformation = rng.integers(0, 7)
+    if transformation == 0:
+        return nom + " "
+    if transformation == 1:
+        return nom.upper()
+    if transformation == 2:
+        return nom.replace("e", "é", 1) if "e" in nom else nom.lower()
+    if transformation == 3:
+        return nom[:k] + nom[k + 1:]
+    if transformation == 4:
+        return nom[:k] + rng.choice(list(LETTRES)) + nom[k + 1:]
+    if transformation == 5:
+        return nom[:k] + nom[k + 1] + nom[k] + nom[k + 2:]
+    return nom[:k] + nom[k] + nom[k:]
+
+
+def generer(n_lignes: int, graine: int = 0):
+    """
+    Retourne (DataFrame à une colonne "Company", identifiant du nom d'origine par ligne).
+    Une ligne sur 10 porte une variante ; le nombre de noms distincts croît avec n_lignes.
+    """
+    rng = np.random.default_rng(graine)
+    noms = generer_noms(max(n_lignes // 10, 10), rng)
+    origine = rng.integers(0, len(noms), n_lignes)
+    valeurs = np.array(noms, dtype=object)[origine]
+    variantes = np.flatnonzero(rng.random(n_lignes) < TAUX_VARIANTES)
+    valeurs[variantes] = [varier(v, rng) for v in valeurs[variantes]]
+    return pd.DataFrame({"Company": valeurs}), origine
+
+
+def qualite(valeurs: pd.Series, origine: np.ndarray, groupes: pd.Series):
+    """
+    Précision et rappel des paires de valeurs distinctes regroupées.
+    """
+    distinctes = pd.DataFrame({"valeur": valeurs, "origine": origine, "groupe": groupes}).drop_duplicates("valeur")
+
+    def paires(comptes: pd.Series) -> int:
+        return int((comptes * (comptes - 1) // 2).sum())
+
+    vraies = paires(distinctes.groupby(["origine", "groupe"]).size())
+    predites = paires(distinctes.groupby("groupe").size())
+    attendues = paires(distinctes.groupby("origine").size())
+    return vraies / max(predites, 1), vraies / max(attendues, 1)
+
+
+if __name__ == "__main__":
+    tailles = [int(float(t)) for t in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    print(f"{'lignes':>9} {'distinctes':>10} {'temps (s)':>9} {'candidates':>11} "
+          f"{'possibles':>14} {'élagage':>9} {'précision':>9} {'rappel':>7}")
+    for n in tailles:
+        df, origine = generer(n)
+        debut = time.perf_counter()
+        groupes, stats = QuasiDoublons.grouper(df, "Company", detail=True)
+        duree = time.perf_counter() - debut
+        precision, rappel = qualite(df["Company"], origine, groupes)
+        print(f"{n:>9} {stats['valeurs_distinctes']:>10} {duree:>9.2f} {stats['paires_candidates']:>11} "
+              f"{stats['paires_possibles']:>14} {stats['taux_elagage']:>9.6f} {precision:>9.3f} {rappel:>7.3f}")
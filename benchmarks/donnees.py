@@ -0,0 +1,92 @@
+"""
+Générateurs de données synthétiques déterministes sur le schéma de la table `cocoa`
+(index cacao), pour les benchmarks à 10k, 1M ou 10M lignes.
+
+Colonnes produites :
+- Company, Origine spécifique du haricot, BeanType : catégorielles (texte), BeanType
+  avec des valeurs manquantes ;
+- REF, ReviewDate : entiers ;
+- Rating : décimale avec des valeurs manquantes ;
+- CocoaPercentage : pourcentage en texte ("70%", "72.5%"), avec des valeurs manquantes
+  (`generer_brut`) ou déjà converti en fraction (`generer`).
+
+Une proportion fixe de lignes sont des copies exactes d'autres lignes (doublons).
+Les chaînes sont tirées d'un vocabulaire fixe : les colonnes texte partagent les mêmes
+objets Python, ce qui garde 10M lignes en mémoire sur une machine modeste.
+"""
+import numpy as np
+import pandas as pd
+
+N_COMPAGNIES = 416
+N_ORIGINES = 1039
+TYPES_FEVE = [
+    "Criollo", "Trinitario", "Forastero", "Forastero (Nacional)", "Criollo, Trinitario",
+    "Blend", "Forastero (Arriba)", "Amazon", "Beniano", "Matina",
+]
+TAUX_MANQUANTS = 0.05
+TAUX_DOUBLONS = 0.02
+
+
+def _vocabulaire(prefixe: str, n: int) -> np.ndarray:
+    return np.array([f"{prefixe} {i:04d}" for i in range(n)], dtype=object)
+
+
+def generer_brut(n_lignes: int, graine: int = 0) -> pd.DataFrame:
+    """
+    Jeu de données brut, tel qu'extrait : pourcentages en texte.
+
+    Paramètres
+    ----------
+    n_lignes : int
+        Nombre de lignes.
+    graine : int, default=0
+        Graine du générateur : même graine, même jeu de données.
+
+    Retour
+    ------
+    pd.DataFrame
+    """
+    rng = np.random.default_rng(graine)
+    # Popularité des compagnies et origines décroissante, comme dans les données réelles.
+    poids = 1 / np.arange(1, N_COMPAGNIES + 1)
+    compagnies = rng.choice(N_COMPAGNIES, size=n_lignes, p=poids / poids.sum())
+    origines = rng.integers(0, N_ORIGINES, n_lignes)
+    types_feve = rng.integers(0, len(TYPES_FEVE), n_lignes)
+
+    pourcentages = np.array([f"{p:g}%" for p in np.arange(42, 100.5, 0.5)], dtype=object)
+    indices_pourcentage = np.clip(rng.normal(70, 6, n_lignes) * 2 - 84, 0, len(pourcentages) - 1).astype(np.int64)
+    notes = np.clip(np.round(rng.normal(3.2, 0.45, n_lignes) * 4) / 4, 1, 5)
+
+    vocabulaire_types = np.array(TYPES_FEVE, dtype=object)
+    df = pd.DataFrame({
+        "Company": _vocabulaire("Compagnie", N_COMPAGNIES)[compagnies],
+        "Origine spécifique du haricot": _vocabulaire("Origine", N_ORIGINES)[origines],
+        "REF": rng.integers(5, 2000, n_lignes),
+        "ReviewDate": rng.integers(2006, 2018, n_lignes),
+        "CocoaPercentage": pourcentages[indices_pourcentage],
+        "Rating": notes,
+        "BeanType": vocabulaire_types[types_feve],
+    })
+    df.loc[rng.random(n_lignes) < TAUX_MANQUANTS, "Rating"] = np.nan
+    df.loc[rng.random(n_lignes) < TAUX_MANQUANTS / 5, "CocoaPercentage"] = None
+    df.loc[rng.random(n_lignes) < TAUX_MANQUANTS * 4, "BeanType"] = None
+
+    # Doublons : des lignes recopiées à l'identique sur d'autres positions.
+    n_doublons = int(n_lignes * TAUX_DOUBLONS)
+    if n_doublons and n_lignes > 1:
+        cibles = rng.choice(n_lignes, size=n_doublons, replace=False)
+        sources = rng.integers(0, n_lignes, n_doublons)
+        df.iloc[cibles] = df.iloc[sources].to_numpy()
+        df = df.astype({"REF": np.int64, "ReviewDate": np.int64, "Rating": np.float64})
+    return df
+
+
+def generer(n_lignes: int, graine: int = 0) -> pd.DataFrame:
+    """
+    Jeu de données nettoyé : `CocoaPercentage` converti en fraction (0.7 pour "70%"),
+    comme après `RemplacementColonne.remplacer_valeurs(df, "CocoaPercentage", ("%", ""))`.
+    """
+    df = generer_brut(n_lignes, graine)
+    df["CocoaPercentage"] = pd.to_numeric(df["CocoaPercentage"].str.rstrip("%")) / 100
+    return df
+
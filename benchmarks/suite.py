@@ -0,0 +1,726 @@
+"""
+Suite de benchmarks des classes publiques du package (`etl_package.__all__`) :
+temps et pic mémoire de chaque cas sur les données synthétiques au schéma cocoa
+(`benchmarks/donnees.py`), comparés aux références enregistrées dans
+`benchmarks/references.json`.
+
+- Temps : minimum sur plusieurs exécutions (jusqu'à 5, arrêt après 1 s cumulée).
+- Pic mémoire : allocations Python et NumPy suivies par tracemalloc, dans une
+  exécution séparée. Les tampons Arrow et la mémoire des processus de travail
+  (`ExecuteurParallele`) ne sont pas comptés.
+- Les cas trop coûteux plafonnent le nombre de lignes (forêt aléatoire, parsing
+  HTML, MongoDB) : la colonne `lignes` donne la taille réellement mesurée.
+
+Une régression est signalée lorsqu'un cas dépasse sa référence de plus du seuil
+(+25 % en temps, +10 % en mémoire par défaut, en ignorant les écarts de moins de
+5 ms ou 1 Mo) ; le code de sortie vaut alors 1. Les références n'ont de sens que
+sur la machine qui les a produites : les réenregistrer (`--enregistrer`) en
+changeant de machine.
+
+Usage :
+    python -m benchmarks.suite [--tailles 10k 1M 10M] [--cas MOTIF ...]
+                               [--seuil 0.25] [--seuil-memoire 0.10]
+                               [--references CHEMIN] [--enregistrer]
+"""
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+from sqlalchemy import create_engine
+
+import etl_package
+from etl_package import (
+    ExtractionData, CacheHTTP, ExtractionCSV, ExtractionSQL, ExtractionMongo,
+    ValeurDouble, ValeurManquante, Imputateur, ImputateurML, NormaliserColonne,
+    RemplacementColonne, FeatureEngineering, Loader, ChargementMultiple, EcrivainCSV,
+    ZScoreAnomalie, GestionOutliers, EncodeurCategoriel, Pipeline,
+    ImputateurAjuste, NormaliserColonneAjuste, StandardisationAjustee,
+    GestionOutliersAjustee, EncodeurCategorielAjuste, MoteurHorsMemoire, ExecuteurParallele,
+    Instrumentation, CollecteurMesures, CacheEtapes, EmpreintesTriees, FiltreBloom,
+    QuasiDoublons, ProfilColonnes,
+)
+
+from .bench_extraction import generer_page
+from .donnees import TYPES_FEVE, generer, generer_brut
+
+REFERENCES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "references.json")
+TAILLE_MORCEAU = 100_000
+
+
+class Contexte:
+    """
+    Données et ressources partagées par les cas d'une même taille : jeux de données
+    générés une seule fois par nombre de lignes, répertoire temporaire, ressources
+    à libérer après chaque cas.
+    """
+
+    def __init__(self, dossier: str):
+        self.dossier = dossier
+        self._jeux: Dict[Tuple[str, int], pd.DataFrame] = {}
+        self._a_fermer: List[Callable[[], Any]] = []
+
+    def brut(self, n_lignes: int) -> pd.DataFrame:
+        cle = ("brut", n_lignes)
+        if cle not in self._jeux:
+            self._jeux[cle] = generer_brut(n_lignes)
+        return self._jeux[cle]
+
+    def propre(self, n_lignes: int) -> pd.DataFrame:
+        cle = ("propre", n_lignes)
+        if cle not in self._jeux:
+            self._jeux[cle] = generer(n_lignes)
+        return self._jeux[cle]
+
+    def chemin(self, nom: str) -> str:
+        return os.path.join(self.dossier, nom)
+
+    def fermer_apres(self, fermeture: Callable[[], Any]) -> None:
+        self._a_fermer.append(fermeture)
+
+    def liberer(self) -> None:
+        while self._a_fermer:
+            self._a_fermer.pop()()
+
+
+class Cas:
+    """
+    Un cas de benchmark : `preparer(contexte, n_lignes)` fait le travail non mesuré
+    (données, fichiers sources, connexions) et retourne la fonction à mesurer.
+    """
+
+    def __init__(
+        self,
+        classe: str,
+        nom: str,
+        preparer: Callable[[Contexte, int], Callable[[], Any]],
+        n_max: Optional[int] = None,
+        dependance: Optional[str] = None,
+    ):
+        self.classe = classe
+        self.nom = nom
+        self.preparer = preparer
+        self.n_max = n_max
+        self.dependance = dependance
+
+    @property
+    def cle(self) -> str:
+        return f"{self.classe}.{self.nom}"
+
+
+CAS: List[Cas] = []
+
+
+def cas(classe: str, nom: str, n_max: Optional[int] = None, dependance: Optional[str] = None):
+    """
+    Enregistre un cas de benchmark pour la classe publique `classe`.
+    """
+    def enregistrer(preparer):
+        CAS.append(Cas(classe, nom, preparer, n_max, dependance))
+        return preparer
+    return enregistrer
+
+
+# ----------------------------------------------------------------------
+# Extraction
+# ----------------------------------------------------------------------
+
+@cas("ExtractionData", "parser_lxml", n_max=1_000_000)
+def _(ctx, n):
+    contenu = generer_page(n)
+    return lambda: ExtractionData._parser_page(contenu, moteur="lxml")
+
+
+@cas("ExtractionData", "parser_bs4", n_max=100_000)
+def _(ctx, n):
+    contenu = generer_page(n)
+    return lambda: ExtractionData._parser_page(contenu, moteur="bs4")
+
+
+@cas("CacheHTTP", "ecrire_lire_df")
+def _(ctx, n):
+    cache = CacheHTTP(ctx.chemin("cache"), taille_max=2**40)
+    df = ctx.brut(n)
+    empreinte = CacheHTTP.empreinte(b"benchmark", n_lignes=n)
+
+    def executer():
+        cache.ecrire_df(empreinte, df)
+        return cache.lire_df(empreinte)
+    return executer
+
+
+@cas("ExtractionCSV", "extract_csv")
+def _(ctx, n):
+    chemin = ctx.chemin("source.csv")
+    ctx.brut(n).to_csv(chemin, index=False)
+    return lambda: ExtractionCSV.extract_csv(chemin)
+
+
+@cas("ExtractionSQL", "extract_sql")
+def _(ctx, n):
+    engine = create_engine(f"sqlite:///{ctx.chemin('source.db')}")
+    ctx.fermer_apres(engine.dispose)
+    ctx.brut(n).to_sql("cocoa", engine, index=False, if_exists="replace", chunksize=100_000)
+    return lambda: ExtractionSQL.extract_sql("SELECT * FROM cocoa", engine)
+
+
+@cas("ExtractionMongo", "extract_mongodb", n_max=100_000, dependance="mongomock")
+def _(ctx, n):
+    import mongomock
+    collection = mongomock.MongoClient().benchmark.cocoa
+    collection.insert_many(ctx.brut(n).to_dict("records"))
+    return lambda: ExtractionMongo.extract_mongodb(collection)
+
+
+# ----------------------------------------------------------------------
+# Exploration et transformations
+# ----------------------------------------------------------------------
+
+@cas("ValeurDouble", "calcul_valeur_double")
+def _(ctx, n):
+    df = ctx.brut(n)
+    return lambda: ValeurDouble.calcul_valeur_double(df)
+
+
+# Lot du jour comparé aux empreintes des lots précédents (magasin non modifié : mesure répétable).
+@cas("EmpreintesTriees", "doublons_connus")
+def _(ctx, n):
+    df = ctx.brut(n)
+    connues = EmpreintesTriees()
+    connues.ajouter(ValeurDouble.empreintes_lignes(df.iloc[: n // 2]))
+    return lambda: ValeurDouble.doublons_connus(df.iloc[n // 2:], connues, ajouter=False)
+
+
+@cas("FiltreBloom", "doublons_connus")
+def _(ctx, n):
+    df = ctx.brut(n)
+    filtre = FiltreBloom(capacite=n, taux_faux_positifs=0.001)
+    filtre.ajouter(ValeurDouble.empreintes_lignes(df.iloc[: n // 2]))
+    return lambda: ValeurDouble.doublons_connus(df.iloc[n // 2:], filtre, ajouter=False)
+
+
+@cas("QuasiDoublons", "grouper")
+def _(ctx, n):
+    df = ctx.brut(n)
+    return lambda: QuasiDoublons.grouper(df, "Company")
+
+
+@cas("ValeurManquante", "calcul_valeur_manquante")
+def _(ctx, n):
+    df = ctx.brut(n)
+    return lambda: ValeurManquante.calcul_valeur_manquante(df, detail=True)
+
+
+@cas("ProfilColonnes", "profiler")
+def _(ctx, n):
+    df = ctx.brut(n)
+    return lambda: ProfilColonnes.profiler(df).rapport()
+
+
+@cas("Imputateur", "mediane")
+def _(ctx, n):
+    df = ctx.propre(n)
+    return lambda: Imputateur.imputer_colonne(df, "Rating", "mediane")
+
+
+@cas("Imputateur", "mode")
+def _(ctx, n):
+    df = ctx.propre(n)
+    return lambda: Imputateur.imputer_colonne(df, "BeanType", "mode")
+
+
+@cas("ImputateurML", "foret_aleatoire", n_max=100_000)
+def _(ctx, n):
+    df = ctx.propre(n)[["Rating", "REF", "ReviewDate"]]
+    modele = RandomForestRegressor(n_estimators=20, max_depth=8, n_jobs=1, random_state=0)
+    return lambda: ImputateurML.imputer_colonne_ml(df, "Rating", modele)
+
+
+@cas("NormaliserColonne", "une_colonne")
+def _(ctx, n):
+    df = ctx.propre(n)
+    return lambda: NormaliserColonne.normaliser_colonne_choisie(df, "Rating")
+
+
+@cas("NormaliserColonne", "bloc_numerique")
+def _(ctx, n):
+    df = ctx.propre(n)
+    return lambda: NormaliserColonne.normaliser_colonne_choisie(df, "number")
+
+
+@cas("RemplacementColonne", "pourcentage")
+def _(ctx, n):
+    df = ctx.brut(n)
+    return lambda: RemplacementColonne.remplacer_valeurs(df, "CocoaPercentage", ("%", ""))
+
+
+@cas("FeatureEngineering", "ratio")
+def _(ctx, n):
+    df = ctx.propre(n)
+    return lambda: FeatureEngineering.creer_feature(df, "ratio", "Rating", "CocoaPercentage")
+
+
+@cas("FeatureEngineering", "rolling_mean")
+def _(ctx, n):
+    df = ctx.propre(n)
+    return lambda: FeatureEngineering.creer_feature(df, "rolling_mean", "Rating", window=7)
+
+
+@cas("ZScoreAnomalie", "une_colonne")
+def _(ctx, n):
+    df = ctx.propre(n)
+    return lambda: ZScoreAnomalie.calcul_zscore(df, "Rating")
+
+
+@cas("ZScoreAnomalie", "bloc_numerique")
+def _(ctx, n):
+    df = ctx.propre(n)
+    return lambda: ZScoreAnomalie.calcul_zscore(df, "number")
+
+
+@cas("GestionOutliers", "winsorize")
+def _(ctx, n):
+    df = ctx.propre(n)
+    return lambda: GestionOutliers.gerer_outliers(df, "CocoaPercentage", "winsorize")
+
+
+@cas("GestionOutliers", "remove")
+def _(ctx, n):
+    df = ctx.propre(n)
+    return lambda: GestionOutliers.gerer_outliers(df, "CocoaPercentage", "remove")
+
+
+@cas("EncodeurCategoriel", "onehot")
+def _(ctx, n):
+    df = ctx.propre(n)
+    return lambda: EncodeurCategoriel.encoder_colonne(df, "BeanType", "onehot")
+
+
+@cas("EncodeurCategoriel", "frequence")
+def _(ctx, n):
+    df = ctx.propre(n)
+    return lambda: EncodeurCategoriel.encoder_colonne(df, "Company", "frequence")
+
+
+@cas("EncodeurCategoriel", "ordinal")
+def _(ctx, n):
+    df = ctx.propre(n)
+    mapping = {valeur: rang for rang, valeur in enumerate(TYPES_FEVE)}
+    return lambda: EncodeurCategoriel.encoder_colonne(df, "BeanType", "ordinal", mapping=mapping)
+
+
+def _pipeline() -> Pipeline:
+    return (
+        Pipeline()
+        .imputer("Rating", "mediane")
+        .gerer_outliers("CocoaPercentage", "winsorize")
+        .normaliser("Rating")
+        .creer_feature("ratio", "Rating", "CocoaPercentage")
+        .encoder("Company", "frequence")
+    )
+
+
+@cas("Pipeline", "executer")
+def _(ctx, n):
+    df = ctx.propre(n)
+    pipeline = _pipeline()
+    return lambda: pipeline.executer(df)
+
+
+# Reprise d'une exécution entièrement en cache : empreinte de l'entrée et relecture du résultat.
+@cas("CacheEtapes", "reprise", dependance="pyarrow")
+def _(ctx, n):
+    df = ctx.propre(n)
+    pipeline = _pipeline()
+    cache = CacheEtapes(ctx.chemin("cache_etapes"))
+    pipeline.executer(df, cache=cache)
+    return lambda: pipeline.executer(df, cache=cache)
+
+
+# Mêmes étapes, instrumentation active : l'écart avec Pipeline/executer en est le coût.
+@cas("Instrumentation", "pipeline_active")
+def _(ctx, n):
+    df = ctx.propre(n)
+    pipeline = _pipeline()
+
+    def executer():
+        with Instrumentation.session(hooks=[_ignorer]):
+            return pipeline.executer(df)
+    return executer
+
+
+@cas("CollecteurMesures", "pipeline_tableau")
+def _(ctx, n):
+    df = ctx.propre(n)
+    pipeline = _pipeline()
+
+    def executer():
+        collecteur = CollecteurMesures()
+        with Instrumentation.session(hooks=[collecteur]):
+            pipeline.executer(df)
+        return collecteur.tableau()
+    return executer
+
+
+def _ignorer(mesure: Dict[str, Any]) -> None:
+    pass
+
+
+# ----------------------------------------------------------------------
+# Transformateurs ajustés et exécution
+# ----------------------------------------------------------------------
+
+@cas("ImputateurAjuste", "fit_transform")
+def _(ctx, n):
+    df = ctx.propre(n)
+    return lambda: ImputateurAjuste(["Rating", "CocoaPercentage"], "mediane").fit_transform(df)
+
+
+@cas("NormaliserColonneAjuste", "fit_transform")
+def _(ctx, n):
+    df = ctx.propre(n)
+    return lambda: NormaliserColonneAjuste(["Rating", "REF"]).fit_transform(df)
+
+
+@cas("StandardisationAjustee", "fit_transform")
+def _(ctx, n):
+    df = ctx.propre(n)
+    return lambda: StandardisationAjustee(["Rating", "CocoaPercentage"]).fit_transform(df)
+
+
+@cas("GestionOutliersAjustee", "fit_transform")
+def _(ctx, n):
+    df = ctx.propre(n)
+    return lambda: GestionOutliersAjustee("CocoaPercentage", "winsorize").fit_transform(df)
+
+
+@cas("EncodeurCategorielAjuste", "fit_transform")
+def _(ctx, n):
+    df = ctx.propre(n)
+    return lambda: EncodeurCategorielAjuste("BeanType", "onehot").fit_transform(df)
+
+
+@cas("MoteurHorsMemoire", "executer")
+def _(ctx, n):
+    df = ctx.propre(n)
+    morceaux = [df.iloc[i:i + TAILLE_MORCEAU] for i in range(0, n, TAILLE_MORCEAU)]
+
+    def executer():
+        moteur = MoteurHorsMemoire([
+            ImputateurAjuste("Rating", "mediane"),
+            StandardisationAjustee("Rating"),
+            EncodeurCategorielAjuste("Company", "frequence"),
+        ])
+        return moteur.executer(morceaux, lambda morceau: None, verbose=False)
+    return executer
+
+
+@cas("ExecuteurParallele", "par_lignes")
+def _(ctx, n):
+    df = ctx.brut(n)
+    executeur = ExecuteurParallele(max_workers=2)
+    ctx.fermer_apres(executeur.fermer)
+    # Démarrage des processus hors mesure.
+    executeur.par_lignes(df.head(2), _identite)
+    return lambda: executeur.par_lignes(
+        df, RemplacementColonne.remplacer_valeurs, colonne="CocoaPercentage", remplacement=("%", "")
+    )
+
+
+@cas("ExecuteurParallele", "par_colonnes")
+def _(ctx, n):
+    df = ctx.propre(n)
+    executeur = ExecuteurParallele(max_workers=2)
+    ctx.fermer_apres(executeur.fermer)
+    executeur.par_lignes(df.head(2), _identite)
+    return lambda: executeur.par_colonnes(
+        df, GestionOutliers.gerer_outliers, ["Rating", "CocoaPercentage"], strategie="winsorize"
+    )
+
+
+def _identite(df: pd.DataFrame) -> pd.DataFrame:
+    return df
+
+
+# ----------------------------------------------------------------------
+# Chargement
+# ----------------------------------------------------------------------
+
+@cas("Loader", "vers_csv")
+def _(ctx, n):
+    df = ctx.propre(n)
+    chemin = ctx.chemin("sortie.csv")
+    return lambda: Loader.vers_csv(df, chemin, verbose=False)
+
+
+@cas("Loader", "vers_sql")
+def _(ctx, n):
+    df = ctx.propre(n)
+    engine = create_engine(f"sqlite:///{ctx.chemin('sortie.db')}")
+    ctx.fermer_apres(engine.dispose)
+    return lambda: Loader.vers_sql(df, "cocoa", engine, verbose=False)
+
+
+@cas("Loader", "vers_sql_bulk")
+def _(ctx, n):
+    df = ctx.propre(n)
+    engine = create_engine(f"sqlite:///{ctx.chemin('sortie_bulk.db')}")
+    ctx.fermer_apres(engine.dispose)
+    return lambda: Loader.vers_sql_bulk(df, "cocoa", engine, verbose=False)
+
+
+@cas("Loader", "vers_parquet", dependance="pyarrow")
+def _(ctx, n):
+    df = ctx.propre(n)
+    chemin = ctx.chemin("sortie.parquet")
+    return lambda: Loader.vers_parquet(df, chemin, verbose=False)
+
+
+@cas("ChargementMultiple", "csv_parquet", dependance="pyarrow")
+def _(ctx, n):
+    df = ctx.propre(n)
+    sinks = [
+        {"type": "csv", "chemin": ctx.chemin("multiple.csv")},
+        {"type": "parquet", "chemin": ctx.chemin("multiple.parquet")},
+    ]
+    return lambda: ChargementMultiple.charger(df, sinks, verbose=False)
+
+
+@cas("EcrivainCSV", "morceaux")
+def _(ctx, n):
+    df = ctx.propre(n)
+    chemin = ctx.chemin("ecrivain.csv")
+
+    def executer():
+        ecrivain = EcrivainCSV(chemin)
+        for i in range(0, n, TAILLE_MORCEAU):
+            ecrivain.ecrire(df.iloc[i:i + TAILLE_MORCEAU])
+        ecrivain.fermer()
+    return executer
+
+
+# ----------------------------------------------------------------------
+# Mesure et rapport
+# ----------------------------------------------------------------------
+
+def mesurer(fonction: Callable[[], Any], repetitions: int = 5, duree_min: float = 1.0) -> Tuple[float, float]:
+    """
+    Retourne (meilleur temps en secondes, pic mémoire en Mo).
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        durees: List[float] = []
+        while len(durees) < repetitions and sum(durees) < duree_min:
+            gc.collect()
+            debut = time.perf_counter()
+            fonction()
+            durees.append(time.perf_counter() - debut)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            fonction()
+            _, pic = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return min(durees), pic / 2**20
+
+
+def statut(
+    mesure: dict,
+    reference: Optional[dict],
+    seuil: float,
+    seuil_memoire: float,
+    plancher: float = 0.005,
+    plancher_memoire: float = 1.0,
+) -> str:
+    """
+    'ok', 'amélioration', 'RÉGRESSION temps', 'RÉGRESSION mémoire' ou 'nouveau'.
+    """
+    if reference is None or reference.get("lignes") != mesure["lignes"]:
+        return "nouveau"
+    regressions = []
+    if (mesure["secondes"] > reference["secondes"] * (1 + seuil)
+            and mesure["secondes"] - reference["secondes"] > plancher):
+        regressions.append("temps")
+    if (mesure["pic_mo"] > reference["pic_mo"] * (1 + seuil_memoire)
+            and mesure["pic_mo"] - reference["pic_mo"] > plancher_memoire):
+        regressions.append("mémoire")
+    if regressions:
+        return "RÉGRESSION " + "+".join(regressions)
+    if (mesure["secondes"] < reference["secondes"] * (1 - seuil)
+            and reference["secondes"] - mesure["secondes"] > plancher):
+        return "amélioration"
+    return "ok"
+
+
+def _ratio(valeur: float, reference: Optional[float]) -> str:
+    return f"{valeur / reference:.2f}" if reference else "-"
+
+
+def _format(valeur: Optional[float], decimales: int) -> str:
+    return "-" if valeur is None else f"{valeur:.{decimales}f}"
+
+
+def _taille(texte: str) -> int:
+    correspondance = re.fullmatch(r"(\d+(?:\.\d+)?)([kKmM]?)", texte)
+    if not correspondance:
+        raise argparse.ArgumentTypeError(f"Taille invalide : {texte} (ex: 10000, 10k, 1M)")
+    nombre, unite = correspondance.groups()
+    return int(float(nombre) * {"": 1, "k": 1_000, "m": 1_000_000}[unite.lower()])
+
+
+def environnement() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "systeme": platform.system(),
+        "coeurs": os.cpu_count(),
+    }
+
+
+def charger_references(chemin: str) -> dict:
+    try:
+        with open(chemin, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"environnement": {}, "resultats": {}}
+    except (OSError, ValueError) as e:
+        raise IOError(f"Erreur lors de la lecture des références : {e}")
+
+
+def executer_suite(
+    tailles: List[int],
+    motifs: Optional[List[str]] = None,
+    references: Optional[dict] = None,
+    seuil: float = 0.25,
+    seuil_memoire: float = 0.10,
+) -> Tuple[Dict[str, Dict[str, dict]], List[str]]:
+    """
+    Exécute les cas sélectionnés à chaque taille et affiche le rapport.
+
+    Retour
+    ------
+    tuple
+        (résultats {cas: {taille: {lignes, secondes, pic_mo}}}, liste des régressions)
+    """
+    selection = [c for c in CAS if not motifs or any(re.search(m, c.cle) for m in motifs)]
+    anciens = (references or {}).get("resultats", {})
+    resultats: Dict[str, Dict[str, dict]] = {}
+    regressions: List[str] = []
+
+    for taille in tailles:
+        print(f"\n{taille} lignes")
+        print(
+            f"{'cas':<42} {'lignes':>9} {'temps (s)':>10} {'réf.':>9} {'ratio':>6} "
+            f"{'pic (Mo)':>9} {'réf.':>9} {'ratio':>6}  statut"
+        )
+        with tempfile.TemporaryDirectory() as dossier:
+            contexte = Contexte(dossier)
+            for c in selection:
+                n = min(taille, c.n_max) if c.n_max else taille
+                if c.dependance:
+                    try:
+                        __import__(c.dependance)
+                    except ImportError:
+                        print(f"{c.cle:<42} {n:>9} ignoré ({c.dependance} non installé)")
+                        continue
+                try:
+                    # Les processus de travail démarrés ici héritent de la sortie redirigée.
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        fonction = c.preparer(contexte, n)
+                    secondes, pic = mesurer(fonction)
+                except MemoryError:
+                    print(f"{c.cle:<42} {n:>9} mémoire insuffisante")
+                    continue
+                except Exception as e:
+                    # Un cas en échec est une régression : la suite continue avec les autres.
+                    print(f"{c.cle:<42} {n:>9} ERREUR : {e}")
+                    regressions.append(f"{c.cle} à {taille} lignes : erreur ({e})")
+                    continue
+                finally:
+                    contexte.liberer()
+
+                mesure = {"lignes": n, "secondes": round(secondes, 6), "pic_mo": round(pic, 3)}
+                resultats.setdefault(c.cle, {})[str(taille)] = mesure
+                reference = anciens.get(c.cle, {}).get(str(taille))
+                etat = statut(mesure, reference, seuil, seuil_memoire)
+                if etat.startswith("RÉGRESSION"):
+                    regressions.append(f"{c.cle} à {taille} lignes : {etat}")
+                ref_s = reference["secondes"] if etat != "nouveau" else None
+                ref_m = reference["pic_mo"] if etat != "nouveau" else None
+                print(
+                    f"{c.cle:<42} {n:>9} {secondes:>10.4f} {_format(ref_s, 4):>9} {_ratio(secondes, ref_s):>6} "
+                    f"{pic:>9.1f} {_format(ref_m, 1):>9} {_ratio(pic, ref_m):>6}  {etat}"
+                )
+    return resultats, regressions
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parseur = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parseur.add_argument("--tailles", nargs="+", type=_taille, default=[10_000, 1_000_000],
+                         help="Nombres de lignes (ex: 10k 1M 10M). Par défaut : 10k 1M.")
+    parseur.add_argument("--cas", nargs="+", dest="motifs",
+                         help="Expressions régulières filtrant les cas (ex: GestionOutliers Loader.vers_sql).")
+    parseur.add_argument("--seuil", type=float, default=0.25,
+                         help="Hausse de temps tolérée (0.25 = +25 %%).")
+    parseur.add_argument("--seuil-memoire", type=float, default=0.10,
+                         help="Hausse de pic mémoire tolérée (0.10 = +10 %%).")
+    parseur.add_argument("--references", default=REFERENCES, help="Fichier JSON des références.")
+    parseur.add_argument("--enregistrer", action="store_true",
+                         help="Enregistre les mesures comme nouvelles références.")
+    options = parseur.parse_args(arguments)
+
+    couvertes = {c.classe for c in CAS}
+    sans_cas = [nom for nom in etl_package.__all__ if nom not in couvertes]
+    if sans_cas:
+        print(f"Attention : classes publiques sans cas de benchmark : {sans_cas}")
+
+    references = charger_references(options.references)
+    if references.get("environnement") and references["environnement"] != environnement():
+        print(
+            "Attention : références produites dans un autre environnement "
+            f"({references['environnement']}) : les rapports ne sont pas comparables."
+        )
+
+    resultats, regressions = executer_suite(
+        options.tailles, options.motifs, references, options.seuil, options.seuil_memoire
+    )
+
+    if regressions:
+        print(f"\n{len(regressions)} régression(s) :")
+        for regression in regressions:
+            print(f"  - {regression}")
+    else:
+        print("\nAucune régression.")
+
+    if options.enregistrer:
+        references["environnement"] = environnement()
+        for cle, par_taille in resultats.items():
+            references["resultats"].setdefault(cle, {}).update(par_taille)
+        references["resultats"] = dict(sorted(references["resultats"].items()))
+        try:
+            with open(options.references, "w", encoding="utf-8") as f:
+                json.dump(references, f, ensure_ascii=False, indent=1)
+                f.write("\n")
+        except OSError as e:
+            raise IOError(f"Erreur lors de l'enregistrement des références : {e}")
+        print(f"Références enregistrées dans {options.references}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
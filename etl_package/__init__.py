@@ -1,29 +1,69 @@
 
+import logging
+
 from .extraction.webscrapping import ExtractionData
+from .extraction.cache import CacheHTTP
+from .extraction.fichiers import ExtractionCSV
+from .extraction.bases_donnees import ExtractionSQL, ExtractionMongo
 from .module_exploration.doublons import  ValeurDouble
+from .module_exploration.empreintes import EmpreintesTriees, FiltreBloom
+from .module_exploration.quasi_doublons import QuasiDoublons
 from .module_exploration.valeurs_manquantes import  ValeurManquante
-from .imputation.imputer import Imputateur
+from .module_exploration.profil import ProfilColonnes
+from .imputation.imputer import Imputateur, ImputateurAjuste
 from .imputation.imputation_supervisee import ImputateurML
-from .transformation.normalisation import NormaliserColonne
+from .transformation.normalisation import NormaliserColonne, NormaliserColonneAjuste
+from .transformation.standardisation_z_score import StandardisationAjustee
 from .remplacement.remplacer import RemplacementColonne
 from .feature_engineering.feature_derivation import FeatureEngineering
 from .chargement.loader import Loader
+from .chargement.chargement_multiple import ChargementMultiple
+from .chargement.ecrivain_csv import EcrivainCSV
 from .anomalie.z_score import ZScoreAnomalie
-from .encodage.methode_encodage import EncodeurCategoriel
-from .nettoyage.gestion_outliers import GestionOutliers
+from .encodage.methode_encodage import EncodeurCategoriel, EncodeurCategorielAjuste
+from .nettoyage.gestion_outliers import GestionOutliers, GestionOutliersAjustee
+from .pipeline.pipeline import Pipeline
+from .pipeline.cache_etapes import CacheEtapes
+from .execution.moteur import MoteurHorsMemoire
+from .execution.parallele import ExecuteurParallele
+from .outils.instrumentation import Instrumentation, CollecteurMesures
+
+# Messages du package silencieux tant que l'application ne configure pas `logging`.
+logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 
 __all__ = [
     "ExtractionData",
+    "CacheHTTP",
+    "ExtractionCSV",
+    "ExtractionSQL",
+    "ExtractionMongo",
     "ValeurDouble",
+    "EmpreintesTriees",
+    "FiltreBloom",
+    "QuasiDoublons",
     "ValeurManquante",
+    "ProfilColonnes",
     "Imputateur",
     "ImputateurML",
     "NormaliserColonne",
     "RemplacementColonne",
     "FeatureEngineering",
     "Loader",
+    "ChargementMultiple",
+    "EcrivainCSV",
     "ZScoreAnomalie",
     "GestionOutliers",
     "EncodeurCategoriel",
+    "Pipeline",
+    "CacheEtapes",
+    "ImputateurAjuste",
+    "NormaliserColonneAjuste",
+    "StandardisationAjustee",
+    "GestionOutliersAjustee",
+    "EncodeurCategorielAjuste",
+    "MoteurHorsMemoire",
+    "ExecuteurParallele",
+    "Instrumentation",
+    "CollecteurMesures",
 ]
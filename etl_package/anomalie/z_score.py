@@ -1,5 +1,13 @@
+import logging
+import warnings
 import pandas as pd
 import numpy as np
+from typing import Any, List
+
+from ..outils.colonnes import resoudre_colonnes
+from ..outils.instrumentation import compter, instrumenter
+
+journal = logging.getLogger(__name__)
 
 class ZScoreAnomalie:
     """ 
@@ -7,7 +15,8 @@ class ZScoreAnomalie:
     """
     
     @staticmethod
-    def calcul_zscore(df: pd.DataFrame, colonne: str) -> pd.DataFrame:
+    @instrumenter("ZScoreAnomalie.calcul_zscore")
+    def calcul_zscore(df: pd.DataFrame, colonne: str | List[str] | Any) -> pd.DataFrame:
         """
         Détecte les valeurs aberrantes dans une colonne numérique en utilisant le Z-score.
 
@@ -15,21 +24,24 @@ class ZScoreAnomalie:
         ----------
         df : pd.DataFrame
             La DataFrame contenant les données.
-        colonne : str
-            Le nom de la colonne à analyser.
+        colonne : str, list ou sélecteur de types
+            Le nom de la colonne à analyser, une liste de colonnes ou un sélecteur
+            de types (ex: "number") : les colonnes sont alors analysées en un seul passage 2-D.
 
         Retour
         ------
         pd.DataFrame ou None
             - DataFrame contenant la colonne spécfiée uniquement les valeurs aberrantes si elles existent.
-            - None si aucune valeur aberrante n'est trouvée (message affiché).
+            - None si aucune valeur aberrante n'est trouvée (message journalisé).
+            - Plusieurs colonnes : DataFrame des lignes contenant au moins une valeur
+              aberrante (NaN pour les valeurs non aberrantes).
         """
         
         if not isinstance(df, pd.DataFrame):
             raise TypeError("df doit être un pandas DataFrame")
-        
-        if colonne not in df.columns:
-            raise ValueError(f"La colonne '{colonne}' n'existe pas dans la DataFrame")
+
+        if not (isinstance(colonne, str) and colonne in df.columns):
+            return ZScoreAnomalie._calcul_bloc(df, resoudre_colonnes(df, colonne, numeriques=True))
         
         if not pd.api.types.is_numeric_dtype(df[colonne]):
             raise TypeError(f"La colonne '{colonne}' doit être de type numérique (int ou float)")
@@ -38,14 +50,14 @@ class ZScoreAnomalie:
         series = df[colonne].dropna()
         
         if series.empty:
-            print(f"La colonne '{colonne}' est vide ou ne contient que des NaN.")
+            journal.warning("La colonne '%s' est vide ou ne contient que des NaN.", colonne)
             return
         
         mean = series.mean()
         std = series.std()
         
         if std == 0 or np.isnan(std):
-            print(f"La colonne '{colonne}' a une variance nulle, pas de détection possible.")
+            journal.warning("La colonne '%s' a une variance nulle, pas de détection possible.", colonne)
             return
         
         lim_sup = mean + 3 * std
@@ -53,10 +65,47 @@ class ZScoreAnomalie:
         
         val_aber = df.loc[(df[colonne] > lim_sup) | (df[colonne] < lim_inf), colonne]
         nbre = val_aber.shape[0]
+        compter(anomalies=nbre)
         
         if val_aber.empty:
-            print(f"Aucune valeur aberrante détectée dans la colonne '{colonne}'.")
+            journal.info("Aucune valeur aberrante détectée dans la colonne '%s'.", colonne)
             return
         else:
-            print(f"La colonne {colonne} contient {nbre} valeurs abérantes")
+            journal.info("La colonne %s contient %d valeurs abérantes", colonne, nbre)
             return val_aber
+
+    @staticmethod
+    def _calcul_bloc(df: pd.DataFrame, colonnes: List[str]) -> pd.DataFrame:
+        """
+        Détecte les valeurs aberrantes de plusieurs colonnes : moyennes et écarts-types
+        calculés en un seul passage NumPy sur le bloc.
+        """
+        X = df[colonnes].to_numpy(dtype=float)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            mean = np.nanmean(X, axis=0)
+            std = np.nanstd(X, axis=0, ddof=1)
+
+        valides = (std > 0) & ~np.isnan(std)
+        for c in np.asarray(colonnes)[~valides]:
+            journal.warning("La colonne '%s' est vide, constante ou sans variance : pas de détection possible.", c)
+
+        lim_sup = mean[valides] + 3 * std[valides]
+        lim_inf = mean[valides] - 3 * std[valides]
+        aberrantes = (X[:, valides] > lim_sup) | (X[:, valides] < lim_inf)
+        lignes = aberrantes.any(axis=1)
+        if not lignes.any():
+            journal.info("Aucune valeur aberrante détectée dans les colonnes %s.", colonnes)
+            return
+
+        nbres = aberrantes.sum(axis=0)
+        compter(anomalies=nbres.sum())
+        avec = nbres > 0
+        val_aber = pd.DataFrame(
+            np.where(aberrantes[lignes][:, avec], X[lignes][:, valides][:, avec], np.nan),
+            index=df.index[lignes],
+            columns=np.asarray(colonnes)[valides][avec],
+        )
+        for c, nbre in zip(val_aber.columns, nbres[avec]):
+            journal.info("La colonne %s contient %d valeurs abérantes", c, nbre)
+        return val_aber
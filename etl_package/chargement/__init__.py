@@ -1,2 +1,4 @@
 
-from .loader import Loader
\ No newline at end of file
+from .loader import Loader
+from .chargement_multiple import ChargementMultiple
+from .ecrivain_csv import EcrivainCSV
@@ -0,0 +1,210 @@
+import logging
+import threading
+import time
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from .loader import Loader
+from ..outils.instrumentation import compter, instrumenter
+
+journal = logging.getLogger(__name__)
+
+
+class _RepresentationsPartagees:
+    """
+    Représentations d'un DataFrame calculées une seule fois et partagées
+    entre les destinations (texte CSV par jeu d'options, table Arrow).
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._verrou = threading.Lock()
+        self._verrous: Dict[tuple, threading.Lock] = {}
+        self._valeurs: Dict[tuple, object] = {}
+
+    def obtenir(self, cle: tuple, calcul):
+        with self._verrou:
+            verrou = self._verrous.setdefault(cle, threading.Lock())
+        with verrou:
+            if cle not in self._valeurs:
+                self._valeurs[cle] = calcul()
+            return self._valeurs[cle]
+
+    def csv(self, sep: str, index: bool) -> str:
+        return self.obtenir(("csv", sep, index), lambda: self.df.to_csv(sep=sep, index=index))
+
+    def arrow(self, index: bool):
+        def convertir():
+            try:
+                import pyarrow as pa
+            except ImportError:
+                raise ImportError("pyarrow est requis pour ce format : pip install pyarrow")
+            return pa.Table.from_pandas(self.df, preserve_index=index)
+        return self.obtenir(("arrow", index), convertir)
+
+
+class ChargementMultiple:
+    """
+    Classe pour charger un même DataFrame vers plusieurs destinations en parallèle
+    (pool de threads), avec isolation des erreurs et réessais par destination.
+    """
+
+    TYPES = (
+        "csv", "excel", "excel_flux", "sql", "sql_bulk", "sql_incremental",
+        "mongodb", "mongodb_batch", "parquet", "feather", "arrow_ipc",
+    )
+    FORMATS_ARROW = {"parquet": "parquet", "feather": "feather", "arrow_ipc": "ipc"}
+    # Lignes écrites, d'après le retour de `Loader.vers_<type>` (les autres types écrivent tout `df`).
+    LIGNES_ECRITES = {
+        "excel_flux": lambda retour: sum(retour.values()),
+        "sql_bulk": lambda retour: retour["lignes"],
+        "sql_incremental": lambda retour: retour["inseres"] + retour["mis_a_jour"],
+        "mongodb_batch": lambda retour: retour["inseres"] + retour["modifies"],
+    }
+
+    @staticmethod
+    def _ecrire(df: pd.DataFrame, sink: dict, partage: _RepresentationsPartagees) -> int:
+        """
+        Écrit le DataFrame vers une destination, en réutilisant les représentations partagées,
+        et retourne le nombre de lignes écrites.
+        """
+        options = {k: v for k, v in sink.items() if k not in ("type", "nom", "verbose")}
+        type_ = sink["type"]
+
+        if type_ == "csv":
+            sep = options.pop("sep", ",")
+            index = options.pop("index", False)
+            mode = options.pop("mode", "w")
+            chemin = options.pop("chemin")
+            if options:
+                raise ValueError(f"Options CSV non supportées : {sorted(options)}")
+            try:
+                with open(chemin, mode, encoding="utf-8", newline="") as f:
+                    f.write(partage.csv(sep, index))
+            except OSError as e:
+                raise IOError(f"Erreur lors de l'écriture CSV : {e}")
+            return len(df)
+
+        elif type_ in ChargementMultiple.FORMATS_ARROW:
+            index = options.pop("index", False)
+            chemin = options.pop("chemin")
+            compression = options.pop(
+                "compression", "snappy" if type_ == "parquet" else "lz4" if type_ == "feather" else None
+            )
+            partition_cols = options.pop("partition_cols", None)
+            row_group_size = options.pop("row_group_size", None)
+            ajouter = options.pop("ajouter", False)
+            if options:
+                raise ValueError(f"Options {type_} non supportées : {sorted(options)}")
+            Loader._ecrire_arrow(
+                df,
+                chemin,
+                ChargementMultiple.FORMATS_ARROW[type_],
+                compression,
+                partition_cols,
+                row_group_size,
+                ajouter,
+                index,
+                table=partage.arrow(index),
+            )
+            return len(df)
+
+        retour = getattr(Loader, f"vers_{type_}")(df, **options, verbose=False)
+        compte = ChargementMultiple.LIGNES_ECRITES.get(type_)
+        return compte(retour) if compte is not None else len(df)
+
+    @staticmethod
+    @instrumenter("ChargementMultiple.charger")
+    def charger(
+        df: pd.DataFrame,
+        sinks: List[dict],
+        max_workers: Optional[int] = None,
+        tentatives: int = 1,
+        backoff: float = 0.5,
+        verbose: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Charge un DataFrame vers toutes les destinations simultanément.
+
+        Paramètres
+        ----------
+        df : pd.DataFrame
+            DataFrame à charger.
+        sinks : list de dict
+            Une spécification par destination : {"type": ..., "nom": ..., **options}.
+            - "type" : 'csv', 'excel', 'excel_flux', 'sql', 'sql_bulk', 'sql_incremental',
+              'mongodb', 'mongodb_batch', 'parquet', 'feather' ou 'arrow_ipc'.
+            - "nom" (optionnel) : libellé dans le rapport (par défaut "type#position").
+            - options : paramètres de la méthode `Loader.vers_<type>` correspondante,
+              sans `df` (ex: {"type": "sql", "table_name": "cocoa", "engine": engine}).
+            Les destinations CSV de mêmes `sep`/`index` partagent un seul texte CSV,
+            et les destinations Parquet / Feather / Arrow IPC une seule table Arrow.
+        max_workers : int, optionnel
+            Nombre de destinations écrites simultanément. None : toutes.
+        tentatives : int, default=1
+            Nombre total d'essais par destination.
+        backoff : float, default=0.5
+            Attente de base en secondes entre deux essais (doublée à chaque essai).
+        verbose : bool, default=True
+            Si True, journalise le bilan par destination (niveau INFO, échecs en WARNING).
+
+        Retour
+        ------
+        pd.DataFrame
+            Rapport par destination : nom, type, statut ('ok' / 'echec'), lignes,
+            secondes, tentatives, erreur. L'échec d'une destination n'interrompt pas les autres.
+            `lignes` est le nombre de lignes écrites déclaré par la destination : insérées
+            + mises à jour pour 'sql_incremental' et 'mongodb_batch' (UPSERT), `len(df)`
+            pour les destinations qui écrivent tout le DataFrame sans compte.
+        """
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("`df` doit être un pandas DataFrame")
+        if tentatives < 1:
+            raise ValueError("`tentatives` doit être supérieur ou égal à 1.")
+        for position, sink in enumerate(sinks):
+            if sink.get("type") not in ChargementMultiple.TYPES:
+                raise ValueError(
+                    f"Destination {position} : type invalide, choisir parmi {ChargementMultiple.TYPES}."
+                )
+
+        partage = _RepresentationsPartagees(df)
+
+        def executer(position: int, sink: dict) -> dict:
+            nom = sink.get("nom") or f"{sink['type']}#{position}"
+            debut = time.perf_counter()
+            erreur = None
+            lignes = 0
+            for essai in range(1, tentatives + 1):
+                try:
+                    lignes = ChargementMultiple._ecrire(df, sink, partage)
+                    erreur = None
+                    break
+                except Exception as e:
+                    erreur = e
+                    if essai < tentatives:
+                        time.sleep(backoff * 2 ** (essai - 1))
+            return {
+                "nom": nom,
+                "type": sink["type"],
+                "statut": "ok" if erreur is None else "echec",
+                "lignes": lignes if erreur is None else 0,
+                "secondes": time.perf_counter() - debut,
+                "tentatives": essai,
+                "erreur": None if erreur is None else f"{type(erreur).__name__}: {erreur}",
+            }
+
+        with ThreadPoolExecutor(max_workers=max_workers or max(len(sinks), 1)) as pool:
+            rapport = list(pool.map(lambda args: executer(*args), enumerate(sinks)))
+
+        rapport = pd.DataFrame(
+            rapport, columns=["nom", "type", "statut", "lignes", "secondes", "tentatives", "erreur"]
+        )
+        n_ok = int((rapport["statut"] == "ok").sum())
+        compter(destinations_en_echec=len(rapport) - n_ok)
+        if verbose:
+            journal.info("Chargement multiple : %d/%d destinations chargées.", n_ok, len(rapport))
+            for ligne in rapport.itertuples():
+                if ligne.statut != "ok":
+                    journal.warning("  %s en échec : %s", ligne.nom, ligne.erreur)
+        return rapport
@@ -0,0 +1,201 @@
+import gzip
+import io
+import logging
+import os
+import queue
+import threading
+import pandas as pd
+from typing import Optional
+
+journal = logging.getLogger(__name__)
+
+class EcrivainCSV:
+    """
+    Destination CSV pour une écriture par morceaux en arrière-plan.
+
+    Les morceaux déposés par `ecrire` passent par une file bornée : un thread les
+    formate en CSV dans de grands tampons, un second thread écrit les tampons pleins
+    dans un unique fichier ouvert (double tampon : le formatage du tampon suivant
+    se fait pendant l'écriture du précédent). Le producteur n'est bloqué que lorsque
+    la file est pleine. L'entête est écrite une seule fois.
+
+    Exemple
+    -------
+    >>> with EcrivainCSV("sortie.csv.gz", compression="gzip") as ecrivain:
+    ...     for morceau in ExtractionCSV.extract_csv("entree.csv", taille_chunk=100_000):
+    ...         ecrivain.ecrire(morceau)
+    """
+
+    _FIN = object()
+
+    def __init__(
+        self,
+        chemin: str,
+        sep: str = ",",
+        index: bool = False,
+        mode: str = "w",
+        compression: Optional[str] = None,
+        taille_file: int = 4,
+        taille_tampon: int = 8 * 2**20,
+        encoding: str = "utf-8",
+    ):
+        """
+        Paramètres
+        ----------
+        chemin : str
+            Chemin complet du fichier CSV de sortie.
+        sep : str, default=','
+            Séparateur de colonnes.
+        index : bool, default=False
+            Si True, inclut l’index des morceaux dans le fichier.
+        mode : str, default='w'
+            'w' pour écraser, 'a' pour ajouter (pas d'entête si le fichier n'est pas vide).
+        compression : {None, 'gzip', 'zstd'}, optionnel
+            Compression du fichier ('zstd' nécessite le paquet `zstandard`).
+        taille_file : int, default=4
+            Nombre maximal de morceaux en attente de formatage.
+        taille_tampon : int, default=8 Mo
+            Taille des tampons écrits sur disque, en octets.
+        encoding : str, default='utf-8'
+            Encodage du texte.
+        """
+        if mode not in ("w", "a"):
+            raise ValueError("`mode` doit être 'w' ou 'a'.")
+        if compression not in (None, "gzip", "zstd"):
+            raise ValueError("`compression` doit être None, 'gzip' ou 'zstd'.")
+        if taille_file < 1 or taille_tampon < 1:
+            raise ValueError("`taille_file` et `taille_tampon` doivent être supérieurs ou égaux à 1.")
+
+        self.chemin = chemin
+        self.sep = sep
+        self.index = index
+        self.encoding = encoding
+        self.taille_tampon = taille_tampon
+        self.lignes_ecrites = 0
+        self._colonnes = None
+        self._entete = not (mode == "a" and os.path.exists(chemin) and os.path.getsize(chemin) > 0)
+        self._erreur: Optional[BaseException] = None
+        self._ferme = False
+
+        try:
+            self._fichier = self._ouvrir(chemin, mode, compression)
+        except OSError as e:
+            raise IOError(f"Erreur lors de l'ouverture du fichier CSV : {e}")
+
+        self._morceaux: queue.Queue = queue.Queue(maxsize=taille_file)
+        self._tampons: queue.Queue = queue.Queue(maxsize=1)
+        self._formateur = threading.Thread(target=self._formater, name="EcrivainCSV-format", daemon=True)
+        self._ecrivain = threading.Thread(target=self._ecrire_tampons, name="EcrivainCSV-ecriture", daemon=True)
+        self._formateur.start()
+        self._ecrivain.start()
+
+    @staticmethod
+    def _ouvrir(chemin: str, mode: str, compression: Optional[str]):
+        mode_binaire = mode + "b"
+        if compression == "gzip":
+            return gzip.open(chemin, mode_binaire)
+        if compression == "zstd":
+            try:
+                import zstandard
+            except ImportError:
+                raise ImportError("Le paquet zstandard est requis pour la compression 'zstd' : pip install zstandard")
+            return zstandard.open(chemin, mode_binaire)
+        return open(chemin, mode_binaire)
+
+    def _formater(self) -> None:
+        """
+        Thread de formatage : morceaux → tampons CSV encodés.
+        """
+        tampon = io.StringIO()
+        n_lignes = 0
+        entete = self._entete
+        while True:
+            morceau = self._morceaux.get()
+            if morceau is self._FIN:
+                break
+            if self._erreur is not None:
+                continue
+            try:
+                morceau.to_csv(tampon, sep=self.sep, index=self.index, header=entete)
+                entete = False
+                n_lignes += len(morceau)
+                if tampon.tell() >= self.taille_tampon:
+                    self._tampons.put((tampon.getvalue().encode(self.encoding), n_lignes))
+                    tampon = io.StringIO()
+                    n_lignes = 0
+            except BaseException as e:
+                self._erreur = e
+        if self._erreur is None and tampon.tell():
+            self._tampons.put((tampon.getvalue().encode(self.encoding), n_lignes))
+        self._tampons.put(self._FIN)
+
+    def _ecrire_tampons(self) -> None:
+        """
+        Thread d'écriture : tampons → fichier, dans l'ordre.
+        `lignes_ecrites` n'augmente qu'une fois le tampon écrit.
+        """
+        while True:
+            element = self._tampons.get()
+            if element is self._FIN:
+                break
+            if self._erreur is not None:
+                continue
+            tampon, n_lignes = element
+            try:
+                self._fichier.write(tampon)
+                self.lignes_ecrites += n_lignes
+            except BaseException as e:
+                self._erreur = e
+
+    def _verifier(self) -> None:
+        if self._erreur is not None:
+            raise IOError(f"Erreur lors de l'écriture CSV : {self._erreur}")
+
+    def ecrire(self, df: pd.DataFrame) -> None:
+        """
+        Dépose un morceau dans la file d'écriture (bloquant uniquement si la file est pleine).
+        Tous les morceaux doivent avoir les mêmes colonnes, dans le même ordre.
+
+        Le morceau est mis en file par référence, sans copie : il ne doit pas être
+        modifié après l'appel (il peut être formaté plus tard par le thread de formatage).
+        """
+        if self._ferme:
+            raise ValueError("L'écrivain CSV est fermé.")
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("`df` doit être un pandas DataFrame")
+        self._verifier()
+        if self._colonnes is None:
+            self._colonnes = list(df.columns)
+        elif list(df.columns) != self._colonnes:
+            raise ValueError("Les colonnes du morceau diffèrent de celles du premier morceau.")
+        self._morceaux.put(df)
+
+    def fermer(self) -> None:
+        """
+        Attend l'écriture de tous les morceaux puis ferme le fichier.
+        """
+        if self._ferme:
+            return
+        self._ferme = True
+        self._morceaux.put(self._FIN)
+        self._formateur.join()
+        self._ecrivain.join()
+        try:
+            self._fichier.close()
+        except OSError as e:
+            if self._erreur is None:
+                self._erreur = e
+        self._verifier()
+
+    def __enter__(self) -> "EcrivainCSV":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.fermer()
+            return
+        # Une erreur d'écriture ne doit pas masquer l'exception en cours.
+        try:
+            self.fermer()
+        except IOError as e:
+            journal.warning("Erreur ignorée à la fermeture de l'écrivain CSV : %s", e)
@@ -1,11 +1,16 @@
 
 
+import logging
 import pandas as pd
-from typing import Optional, Union
+import numpy as np
+from typing import Dict, Iterable, List, Optional, Union
+import io
 import os
+import time
 
+from ..outils.instrumentation import compter, instrumenter
 
-
+journal = logging.getLogger(__name__)
 
 
 class Loader:
@@ -15,12 +20,13 @@ class Loader:
     - Excel
     - Base SQL (via SQLAlchemy engine)
     - MongoDB (via pymongo collection)
+    - Parquet, Feather et Arrow IPC (via pyarrow, dépendance optionnelle)
 
     Chaque méthode est statique et peut être appelée sans instancier la classe.
     """
 
     @staticmethod
-
+    @instrumenter("Loader.vers_csv")
     def vers_csv(
         df: pd.DataFrame,
         chemin: str,
@@ -45,7 +51,7 @@ class Loader:
         mode : str, default='w'
             Mode d’écriture : 'w' pour écraser, 'a' pour ajouter.
         verbose : bool, default=True
-            Si True, affiche un message de confirmation.
+            Si True, journalise un message de confirmation (niveau INFO).
         """
 
         if not isinstance(df, pd.DataFrame):
@@ -53,12 +59,12 @@ class Loader:
         try:
             df.to_csv(chemin, sep=sep, index=index, mode=mode)
             if verbose:
-                print(f"DataFrame sauvegardé en CSV : {chemin}")
+                journal.info("DataFrame sauvegardé en CSV : %s", chemin)
         except Exception as e:
             raise IOError(f"Erreur lors de l'écriture CSV : {e}")
 
     @staticmethod
-
+    @instrumenter("Loader.vers_excel")
     def vers_excel(
         df: pd.DataFrame,
         chemin: str,
@@ -80,26 +86,138 @@ class Loader:
         index : bool, default=False
             Si True, inclut l’index du DataFrame dans le fichier.
         verbose : bool, default=True
-            Si True, affiche un message de confirmation.
+            Si True, journalise un message de confirmation (niveau INFO).
         """
         if not isinstance(df, pd.DataFrame):
             raise TypeError("`df` doit être un pandas DataFrame")
         try:
             df.to_excel(chemin, sheet_name=sheet_name, index=index)
             if verbose:
-                print(f"DataFrame sauvegardé en Excel : {chemin}")
+                journal.info("DataFrame sauvegardé en Excel : %s", chemin)
         except Exception as e:
             raise IOError(f"Erreur lors de l'écriture Excel : {e}")
 
     @staticmethod
+    @instrumenter("Loader.vers_excel_flux")
+    def vers_excel_flux(
+        donnees: Union[pd.DataFrame, Iterable[pd.DataFrame], Dict[str, Union[pd.DataFrame, Iterable[pd.DataFrame]]]],
+        chemin: str,
+        sheet_name: str = "Sheet1",
+        index: bool = False,
+        max_lignes: int = 1_048_576,
+        verbose: bool = True
+    ) -> Dict[str, int]:
+        """
+        Sauvegarde un ou plusieurs DataFrames au format Excel en flux
+        (mode write-only d'openpyxl : les lignes sont écrites au fur et à mesure,
+        sans garder d'objets cellule en mémoire). Le fichier est écrit une seule fois.
+
+        Paramètres
+        ----------
+        donnees : pd.DataFrame, itérable de DataFrames ou dict
+            - DataFrame : écrit dans la feuille `sheet_name`.
+            - Itérable de DataFrames (morceaux de mêmes colonnes) : écrits à la suite
+              dans la feuille `sheet_name`.
+            - dict {nom_feuille: DataFrame ou itérable} : une feuille par entrée.
+            Les morceaux d'une même feuille doivent avoir les mêmes colonnes (ValueError sinon).
+            Les noms sont tronqués à 31 caractères ; deux noms identiques après troncature
+            (casse ignorée) sont distingués par un suffixe `_2`, `_3`...
+        chemin : str
+            Chemin complet du fichier Excel de sortie (.xlsx).
+        sheet_name : str, default='Sheet1'
+            Nom de la feuille lorsque `donnees` n'est pas un dict.
+        index : bool, default=False
+            Si True, inclut l’index des DataFrames.
+        max_lignes : int, default=1048576
+            Nombre maximal de lignes par feuille, entête comprise (limite Excel).
+            Au-delà, les lignes continuent dans une feuille suivante `nom_2`, `nom_3`...
+        verbose : bool, default=True
+            Si True, journalise un message de confirmation (niveau INFO).
+
+        Retour
+        ------
+        dict
+            Nombre de lignes de données écrites par feuille (clé : titre réel de la feuille).
+        """
+        from openpyxl import Workbook
+
+        if max_lignes < 2:
+            raise ValueError("`max_lignes` doit être supérieur ou égal à 2 (entête + une ligne).")
+        if isinstance(donnees, pd.DataFrame) or not isinstance(donnees, dict):
+            donnees = {sheet_name: donnees}
+
+        classeur = Workbook(write_only=True)
+        lignes_par_feuille: Dict[str, int] = {}
+
+        def creer_feuille(nom: str, numero: int):
+            # Titres limités à 31 caractères et uniques sans tenir compte de la casse (règles Excel) :
+            # deux noms de même préfixe reçoivent un suffixe `_2`, `_3`...
+            base = str(nom)
+            while True:
+                titre = base[:31] if numero == 1 else f"{base[:31 - len(str(numero)) - 1]}_{numero}"
+                if titre.lower() not in {t.lower() for t in lignes_par_feuille}:
+                    break
+                numero += 1
+            feuille = classeur.create_sheet(titre)
+            lignes_par_feuille[feuille.title] = 0
+            return feuille, numero
+
+        try:
+            for nom, source in donnees.items():
+                morceaux = [source] if isinstance(source, pd.DataFrame) else source
+                feuille = None
+                colonnes = None
+                entete = None
+                numero = 0
+                for morceau in morceaux:
+                    if not isinstance(morceau, pd.DataFrame):
+                        raise TypeError("Les morceaux doivent être des pandas DataFrame")
+                    if index:
+                        morceau = morceau.reset_index()
+                    if colonnes is None:
+                        colonnes = list(morceau.columns)
+                        entete = [str(c) for c in colonnes]
+                    elif list(morceau.columns) != colonnes:
+                        raise ValueError(
+                            f"Feuille '{nom}' : les colonnes du morceau diffèrent de celles du premier morceau."
+                        )
+                    for ligne in zip(*Loader._colonnes_python(morceau)):
+                        if feuille is None or lignes_par_feuille[feuille.title] + 1 >= max_lignes:
+                            feuille, numero = creer_feuille(nom, numero + 1)
+                            feuille.append(entete)
+                        feuille.append(ligne)
+                        lignes_par_feuille[feuille.title] += 1
+                if feuille is None:
+                    feuille, _ = creer_feuille(nom, 1)
+                    if entete:
+                        feuille.append(entete)
+            classeur.save(chemin)
+        except Exception as e:
+            # Feuilles write-only d'un classeur abandonné : flux et fichiers temporaires fermés.
+            for feuille_ouverte in classeur.worksheets:
+                try:
+                    feuille_ouverte.close()
+                except Exception:
+                    pass
+            if isinstance(e, (TypeError, ValueError)):
+                raise
+            raise IOError(f"Erreur lors de l'écriture Excel : {e}")
+
+        if verbose:
+            journal.info("DataFrame sauvegardé en Excel : %s (%d feuilles)", chemin, len(lignes_par_feuille))
+        return lignes_par_feuille
 
+    @staticmethod
+    @instrumenter("Loader.vers_sql")
     def vers_sql(
         df: pd.DataFrame,
         table_name: str,
         engine,
         if_exists: str = "replace",
         index: bool = False,
-        verbose: bool = True
+        verbose: bool = True,
+        chunksize: Optional[int] = None,
+        method: Optional[str] = None
     ) -> None:
         """
         Sauvegarde un DataFrame dans une base SQL via un SQLAlchemy engine.
@@ -120,19 +238,381 @@ class Loader:
         index : bool, default=False
             Si True, inclut l’index du DataFrame dans la table.
         verbose : bool, default=True
-            Si True, affiche un message de confirmation.
+            Si True, journalise un message de confirmation (niveau INFO).
+        chunksize : int, optionnel
+            Nombre de lignes écrites par lot. None : toutes les lignes en une fois.
+        method : {None, 'multi'}, optionnel
+            Méthode d'insertion de `DataFrame.to_sql` ('multi' : INSERT multi-lignes).
+            Pour les gros volumes, voir `vers_sql_bulk`.
         """
         if not isinstance(df, pd.DataFrame):
             raise TypeError("`df` doit être un pandas DataFrame")
         try:
-            df.to_sql(table_name, engine, if_exists=if_exists, index=index)
+            df.to_sql(table_name, engine, if_exists=if_exists, index=index, chunksize=chunksize, method=method)
             if verbose:
-                print(f"DataFrame chargé dans la table SQL : {table_name}")
+                journal.info("DataFrame chargé dans la table SQL : %s", table_name)
+        except Exception as e:
+            raise IOError(f"Erreur lors de l'écriture SQL : {e}")
+
+    @staticmethod
+    def _colonnes_python(df: pd.DataFrame, dates_en_texte: bool = False) -> List[list]:
+        """
+        Convertit chaque colonne en liste de valeurs Python natives (int, float, str,
+        datetime...), les valeurs manquantes (NaN, NaT, NA) devenant None.
+        La conversion est faite colonne par colonne, sans passer par des dicts ligne à ligne.
+
+        Avec `dates_en_texte=True`, les dates sont écrites en texte
+        'AAAA-MM-JJ HH:MM:SS.ffffff' (heure locale, sans fuseau), le format
+        qu'utilise SQLAlchemy pour SQLite.
+        """
+        colonnes = []
+        for nom in df.columns:
+            serie = df[nom]
+            if pd.api.types.is_datetime64_any_dtype(serie) and dates_en_texte:
+                valeurs = serie.dt.strftime("%Y-%m-%d %H:%M:%S.%f").to_numpy(dtype=object)
+            elif pd.api.types.is_datetime64_any_dtype(serie):
+                valeurs = np.asarray(serie.dt.to_pydatetime(), dtype=object)
+            else:
+                valeurs = serie.to_numpy(dtype=object)
+            manquants = serie.isna().to_numpy()
+            if manquants.any():
+                valeurs = valeurs.copy()
+                valeurs[manquants] = None
+            colonnes.append(valeurs.tolist())
+        return colonnes
+
+    @staticmethod
+    @instrumenter("Loader.vers_sql_bulk")
+    def vers_sql_bulk(
+        df: pd.DataFrame,
+        table_name: str,
+        engine,
+        if_exists: str = "append",
+        index: bool = False,
+        chunksize: int = 50_000,
+        verbose: bool = True
+    ) -> Dict[str, float]:
+        """
+        Charge un DataFrame volumineux dans une base SQL, par lots insérés
+        chacun dans une seule transaction.
+
+        Chemins rapides selon le dialecte :
+        - SQLite : `executemany` sur le curseur natif, avec `PRAGMA synchronous=OFF`
+          et `journal_mode=MEMORY` le temps du chargement (valeurs restaurées ensuite).
+          Les dates sont écrites dans le même texte que `vers_sql` (microsecondes
+          comprises, fuseau horaire retiré).
+        - PostgreSQL (psycopg2 / psycopg) : `COPY ... FROM STDIN` au format CSV.
+        - Autres dialectes : INSERT `executemany` via SQLAlchemy.
+
+        Paramètres
+        ----------
+        df : pd.DataFrame
+            DataFrame à sauvegarder.
+        table_name : str
+            Nom de la table SQL dans laquelle écrire les données.
+        engine : SQLAlchemy engine
+            Objet SQLAlchemy créé via `create_engine`.
+        if_exists : str, default='append'
+            Comportement si la table existe déjà ('fail', 'replace', 'append'),
+            comme pour `vers_sql`. La table est créée si elle n'existe pas.
+        index : bool, default=False
+            Si True, inclut l’index du DataFrame dans la table.
+        chunksize : int, default=50000
+            Nombre de lignes par lot (une transaction par lot).
+        verbose : bool, default=True
+            Si True, journalise le débit obtenu (niveau INFO).
+
+        Retour
+        ------
+        dict
+            {"lignes", "secondes", "lignes_par_seconde", "methode"}.
+        """
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("`df` doit être un pandas DataFrame")
+        if chunksize < 1:
+            raise ValueError("`chunksize` doit être supérieur ou égal à 1.")
+        if index:
+            df = df.reset_index()
+
+        debut = time.perf_counter()
+        dialecte = engine.dialect.name
+        quote = engine.dialect.identifier_preparer.quote
+        table = quote(table_name)
+        colonnes = ", ".join(quote(str(c)) for c in df.columns)
+
+        try:
+            df.head(0).to_sql(table_name, engine, if_exists=if_exists, index=False)
+
+            with engine.connect() as conn:
+                if dialecte == "sqlite":
+                    methode = "sqlite-executemany"
+                    with conn.begin():
+                        anciens = {
+                            pragma: conn.exec_driver_sql(f"PRAGMA {pragma}").scalar()
+                            for pragma in ("synchronous", "journal_mode")
+                        }
+                        conn.exec_driver_sql("PRAGMA synchronous=OFF")
+                        conn.exec_driver_sql("PRAGMA journal_mode=MEMORY")
+                    requete = f"INSERT INTO {table} ({colonnes}) VALUES ({', '.join('?' * df.shape[1])})"
+                    try:
+                        for debut_lot in range(0, len(df), chunksize):
+                            lot = df.iloc[debut_lot:debut_lot + chunksize]
+                            with conn.begin():
+                                conn.exec_driver_sql(requete, list(zip(*Loader._colonnes_python(lot, True))))
+                    finally:
+                        with conn.begin():
+                            for pragma, valeur in anciens.items():
+                                conn.exec_driver_sql(f"PRAGMA {pragma}={valeur}")
+
+                elif dialecte == "postgresql":
+                    methode = "postgres-copy"
+                    requete = f"COPY {table} ({colonnes}) FROM STDIN WITH (FORMAT csv)"
+                    for debut_lot in range(0, len(df), chunksize):
+                        lot = df.iloc[debut_lot:debut_lot + chunksize]
+                        tampon = io.StringIO()
+                        lot.to_csv(tampon, header=False, index=False)
+                        tampon.seek(0)
+                        with conn.begin():
+                            curseur = conn.connection.cursor()
+                            try:
+                                if hasattr(curseur, "copy_expert"):
+                                    curseur.copy_expert(requete, tampon)
+                                else:
+                                    with curseur.copy(requete) as copie:
+                                        copie.write(tampon.getvalue())
+                            finally:
+                                curseur.close()
+
+                else:
+                    from sqlalchemy import MetaData, Table
+                    methode = "executemany"
+                    cible = Table(table_name, MetaData(), autoload_with=engine)
+                    noms = [str(c) for c in df.columns]
+                    for debut_lot in range(0, len(df), chunksize):
+                        lot = df.iloc[debut_lot:debut_lot + chunksize]
+                        lignes = [dict(zip(noms, valeurs)) for valeurs in zip(*Loader._colonnes_python(lot))]
+                        with conn.begin():
+                            conn.execute(cible.insert(), lignes)
+
+        except Exception as e:
+            raise IOError(f"Erreur lors de l'écriture SQL : {e}")
+
+        duree = time.perf_counter() - debut
+        rapport = {
+            "lignes": len(df),
+            "secondes": duree,
+            "lignes_par_seconde": len(df) / duree if duree > 0 else float("inf"),
+            "methode": methode,
+        }
+        if verbose:
+            journal.info(
+                "DataFrame chargé dans la table SQL : %s (%d lignes, %.0f lignes/s, %s)",
+                table_name, rapport["lignes"], rapport["lignes_par_seconde"], methode,
+            )
+        return rapport
+
+    @staticmethod
+    def _cle_unique_existe(inspecteur, table_name: str, cles: List[str]) -> bool:
+        """
+        True si la table a déjà une clé primaire, une contrainte ou un index unique
+        portant exactement sur les colonnes `cles`.
+        """
+        cibles = set(cles)
+        if set(inspecteur.get_pk_constraint(table_name).get("constrained_columns") or []) == cibles:
+            return True
+        try:
+            contraintes = inspecteur.get_unique_constraints(table_name)
+        except NotImplementedError:
+            contraintes = []
+        if any(set(c["column_names"]) == cibles for c in contraintes):
+            return True
+        return any(i.get("unique") and set(i["column_names"]) == cibles for i in inspecteur.get_indexes(table_name))
+
+    @staticmethod
+    @instrumenter("Loader.vers_sql_incremental")
+    def vers_sql_incremental(
+        df: pd.DataFrame,
+        table_name: str,
+        engine,
+        cles: Union[str, List[str]],
+        colonnes_valeurs: Optional[List[str]] = None,
+        *,
+        colonne_hash: str = "row_hash",
+        colonne_watermark: Optional[str] = None,
+        chunksize: int = 10_000,
+        verbose: bool = True
+    ) -> Dict[str, int]:
+        """
+        Charge uniquement les lignes nouvelles ou modifiées d'un DataFrame (UPSERT).
+
+        Une empreinte 64 bits des colonnes clés et valeurs est calculée pour chaque ligne
+        et stockée dans `colonne_hash`. Seules les empreintes de la table cible sont relues :
+        les lignes dont la clé est absente sont insérées, celles dont l'empreinte a changé
+        sont mises à jour (`ON CONFLICT DO UPDATE` pour SQLite / PostgreSQL,
+        `ON DUPLICATE KEY UPDATE` pour MySQL), les autres ne sont pas écrites.
+
+        Paramètres
+        ----------
+        df : pd.DataFrame
+            DataFrame à charger.
+        table_name : str
+            Nom de la table SQL cible (créée si absente). Un index unique sur `cles` est
+            créé s'il n'existe pas ; si la table contient déjà des clés en double, une
+            ValueError est levée avant toute écriture.
+        engine : SQLAlchemy engine
+            Objet SQLAlchemy créé via `create_engine`.
+        cles : str ou list de str
+            Colonne(s) identifiant une ligne.
+        colonnes_valeurs : list de str, optionnel
+            Colonnes comparées pour détecter une modification. None : toutes les autres colonnes.
+        colonne_hash : str, default='row_hash'
+            Nom de la colonne stockant l'empreinte dans la table cible.
+        colonne_watermark : str, optionnel
+            Colonne croissante (date de mise à jour, identifiant...) : les lignes dont la valeur
+            ne dépasse pas le maximum déjà chargé sont considérées inchangées sans comparaison.
+        chunksize : int, default=10000
+            Nombre de lignes écrites par transaction.
+        verbose : bool, default=True
+            Si True, journalise le bilan du chargement (niveau INFO).
+
+        Retour
+        ------
+        dict
+            {"inseres", "mis_a_jour", "inchanges"}.
+        """
+        from sqlalchemy import MetaData, Table, inspect, text
+
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("`df` doit être un pandas DataFrame")
+        if isinstance(cles, str):
+            cles = [cles]
+        manquantes = [c for c in cles + (colonnes_valeurs or []) if c not in df.columns]
+        if colonne_watermark and colonne_watermark not in df.columns:
+            manquantes.append(colonne_watermark)
+        if manquantes:
+            raise ValueError(f"Colonnes inexistantes dans le DataFrame: {manquantes}")
+        if colonne_hash in df.columns:
+            raise ValueError(f"La colonne '{colonne_hash}' est réservée à l'empreinte des lignes.")
+
+        dialecte = engine.dialect.name
+        if dialecte not in ("sqlite", "postgresql", "mysql", "mariadb"):
+            raise ValueError(f"UPSERT non supporté pour le dialecte '{dialecte}'.")
+
+        n_doublons = int(df.duplicated(subset=cles, keep="last").sum())
+        if n_doublons:
+            journal.warning("Attention : %d lignes en double sur %s, seule la dernière est chargée.", n_doublons, cles)
+            df = df.drop_duplicates(subset=cles, keep="last")
+
+        valeurs = colonnes_valeurs or [c for c in df.columns if c not in cles]
+        df = df.assign(**{
+            colonne_hash: pd.util.hash_pandas_object(df[cles + valeurs], index=False).to_numpy().view(np.int64)
+        })
+
+        quote = engine.dialect.identifier_preparer.quote
+        table = quote(table_name)
+        liste_cles = ", ".join(quote(c) for c in cles)
+        n_total = len(df)
+        n_ignores = 0
+
+        try:
+            if not inspect(engine).has_table(table_name):
+                types_sql = None
+                if dialecte in ("mysql", "mariadb"):
+                    # MySQL n'indexe pas une colonne TEXT sans longueur : clés texte en VARCHAR.
+                    from sqlalchemy import String
+                    types_sql = {c: String(255) for c in cles if not pd.api.types.is_numeric_dtype(df[c])}
+                df.head(0).to_sql(table_name, engine, index=False, dtype=types_sql)
+                existants = None
+            else:
+                colonnes_cible = [c["name"] for c in inspect(engine).get_columns(table_name)]
+                if colonne_hash not in colonnes_cible:
+                    with engine.begin() as conn:
+                        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {quote(colonne_hash)} BIGINT"))
+                with engine.connect() as conn:
+                    if colonne_watermark:
+                        maximum = conn.execute(text(f"SELECT MAX({quote(colonne_watermark)}) FROM {table}")).scalar()
+                        if maximum is not None:
+                            recents = df[colonne_watermark] > maximum
+                            n_ignores = int((~recents).sum())
+                            df = df[recents]
+                    existants = pd.read_sql(text(f"SELECT {liste_cles}, {quote(colonne_hash)} FROM {table}"), conn)
+
+            # Index et UPSERT sur la même connexion : SQLite résout la cible de `ON CONFLICT`
+            # avec le schéma en cache de la connexion, qui peut ignorer un index créé par une autre.
+            with engine.connect() as conn:
+                if not Loader._cle_unique_existe(inspect(engine), table_name, cles):
+                    if existants is not None and existants.duplicated(subset=cles).any():
+                        doublons = existants.loc[existants.duplicated(subset=cles, keep=False), cles]
+                        raise ValueError(
+                            f"La table '{table_name}' contient déjà des lignes en double sur {cles} "
+                            f"(ex: {doublons.head(3).to_dict('records')}) : index unique impossible, "
+                            "dédoublonner la table avant le chargement incrémental."
+                        )
+                    # `IF NOT EXISTS` n'est pas accepté par MySQL / MariaDB : existence vérifiée ci-dessus.
+                    with conn.begin():
+                        nom_index = quote(f"ux_{table_name}_{'_'.join(cles)}")
+                        conn.execute(text(f"CREATE UNIQUE INDEX {nom_index} ON {table} ({liste_cles})"))
+
+                if existants is None or existants.empty:
+                    a_ecrire = df
+                    n_inseres, n_maj = len(df), 0
+                else:
+                    existants = existants.rename(columns={colonne_hash: "_hash_cible"})
+                    for c in cles:
+                        if existants[c].dtype != df[c].dtype:
+                            existants[c] = existants[c].astype(df[c].dtype)
+                    comparaison = df[cles + [colonne_hash]].merge(existants, on=cles, how="left", indicator=True)
+                    nouveaux = (comparaison["_merge"] == "left_only").to_numpy()
+                    modifies = (~nouveaux) & (comparaison[colonne_hash] != comparaison["_hash_cible"]).to_numpy()
+                    a_ecrire = df[nouveaux | modifies]
+                    n_inseres, n_maj = int(nouveaux.sum()), int(modifies.sum())
+
+                if len(a_ecrire):
+                    cible = Table(table_name, MetaData(), autoload_with=engine)
+                    if dialecte in ("mysql", "mariadb"):
+                        from sqlalchemy.dialects.mysql import insert
+                    elif dialecte == "postgresql":
+                        from sqlalchemy.dialects.postgresql import insert
+                    else:
+                        from sqlalchemy.dialects.sqlite import insert
+                    noms = [str(c) for c in a_ecrire.columns]
+                    a_mettre_a_jour = [c for c in noms if c not in cles]
+                    for debut_lot in range(0, len(a_ecrire), chunksize):
+                        lot = a_ecrire.iloc[debut_lot:debut_lot + chunksize]
+                        lignes = [dict(zip(noms, v)) for v in zip(*Loader._colonnes_python(lot))]
+                        requete = insert(cible)
+                        if dialecte in ("mysql", "mariadb"):
+                            requete = requete.on_duplicate_key_update(
+                                {c: requete.inserted[c] for c in a_mettre_a_jour}
+                            )
+                        else:
+                            requete = requete.on_conflict_do_update(
+                                index_elements=cles,
+                                set_={c: requete.excluded[c] for c in a_mettre_a_jour},
+                            )
+                        with conn.begin():
+                            conn.execute(requete, lignes)
+        except ValueError:
+            raise
         except Exception as e:
             raise IOError(f"Erreur lors de l'écriture SQL : {e}")
 
+        rapport = {
+            "inseres": n_inseres,
+            "mis_a_jour": n_maj,
+            "inchanges": n_total - n_inseres - n_maj,
+        }
+        compter(inseres=n_inseres, mis_a_jour=n_maj)
+        if verbose:
+            journal.info(
+                "Chargement incrémental dans %s : %d insérées, %d mises à jour, %d inchangées%s",
+                table_name, rapport["inseres"], rapport["mis_a_jour"], rapport["inchanges"],
+                f" (dont {n_ignores} sous le watermark)." if n_ignores else ".",
+            )
+        return rapport
+
     @staticmethod
-    
+    @instrumenter("Loader.vers_mongodb")
     def vers_mongodb(
         df: pd.DataFrame,
         collection,
@@ -148,7 +628,7 @@ class Loader:
         collection : pymongo collection
             Objet collection créé via `pymongo.MongoClient()['nom_db']['nom_collection']`.
         verbose : bool, default=True
-            Si True, affiche un message de confirmation.
+            Si True, journalise un message de confirmation (niveau INFO).
         """
         if not isinstance(df, pd.DataFrame):
             raise TypeError("`df` doit être un pandas DataFrame")
@@ -156,6 +636,290 @@ class Loader:
             records = df.to_dict(orient="records")
             collection.insert_many(records)
             if verbose:
-                print(f"DataFrame inséré dans MongoDB (n={len(df)})")
+                journal.info("DataFrame inséré dans MongoDB (n=%d)", len(df))
+        except Exception as e:
+            raise IOError(f"Erreur lors de l'écriture MongoDB : {e}")
+
+    @staticmethod
+    @instrumenter("Loader.vers_mongodb_batch")
+    def vers_mongodb_batch(
+        df: pd.DataFrame,
+        collection,
+        taille_batch: int = 10_000,
+        cles: Optional[Union[str, List[str]]] = None,
+        n_threads: int = 1,
+        verbose: bool = True
+    ) -> Dict[str, float]:
+        """
+        Sauvegarde un DataFrame volumineux dans une collection MongoDB par lots.
+
+        Les documents de chaque lot sont construits à partir des colonnes converties
+        en types Python natifs (NaN/NaT → None), sans `to_dict` sur tout le DataFrame :
+        la mémoire reste bornée par la taille d'un lot, et chaque lot respecte
+        les limites de taille des requêtes BSON.
+
+        Paramètres
+        ----------
+        df : pd.DataFrame
+            DataFrame à sauvegarder.
+        collection : pymongo collection
+            Objet collection créé via `pymongo.MongoClient()['nom_db']['nom_collection']`.
+        taille_batch : int, default=10000
+            Nombre de documents par lot.
+        cles : str ou list de str, optionnel
+            - None : insertion (`insert_many(ordered=False)`).
+            - Colonne(s) clé : UPSERT par clé (`bulk_write` de `UpdateOne(upsert=True)`).
+        n_threads : int, default=1
+            Nombre de lots écrits simultanément (au plus 2 * n_threads lots en mémoire).
+        verbose : bool, default=True
+            Si True, journalise un message de confirmation (niveau INFO).
+
+        Retour
+        ------
+        dict
+            {"documents", "inseres", "modifies", "secondes"}.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("`df` doit être un pandas DataFrame")
+        if taille_batch < 1 or n_threads < 1:
+            raise ValueError("`taille_batch` et `n_threads` doivent être supérieurs ou égaux à 1.")
+        if isinstance(cles, str):
+            cles = [cles]
+        if cles:
+            manquantes = [c for c in cles if c not in df.columns]
+            if manquantes:
+                raise ValueError(f"Colonnes inexistantes dans le DataFrame: {manquantes}")
+
+        noms = [str(c) for c in df.columns]
+        debut = time.perf_counter()
+
+        def ecrire(documents: list) -> tuple:
+            if not cles:
+                resultat = collection.insert_many(documents, ordered=False)
+                return len(resultat.inserted_ids), 0
+            from pymongo import UpdateOne
+            operations = [
+                UpdateOne({c: doc[c] for c in cles}, {"$set": doc}, upsert=True)
+                for doc in documents
+            ]
+            resultat = collection.bulk_write(operations, ordered=False)
+            return resultat.upserted_count, resultat.modified_count
+
+        inseres = modifies = 0
+        try:
+            with ThreadPoolExecutor(max_workers=n_threads) as pool:
+                en_cours = []
+                for debut_lot in range(0, len(df), taille_batch):
+                    lot = df.iloc[debut_lot:debut_lot + taille_batch]
+                    documents = [dict(zip(noms, valeurs)) for valeurs in zip(*Loader._colonnes_python(lot))]
+                    en_cours.append(pool.submit(ecrire, documents))
+                    if len(en_cours) >= 2 * n_threads:
+                        n_ins, n_mod = en_cours.pop(0).result()
+                        inseres += n_ins
+                        modifies += n_mod
+                for futur in en_cours:
+                    n_ins, n_mod = futur.result()
+                    inseres += n_ins
+                    modifies += n_mod
         except Exception as e:
             raise IOError(f"Erreur lors de l'écriture MongoDB : {e}")
+
+        rapport = {
+            "documents": len(df),
+            "inseres": inseres,
+            "modifies": modifies,
+            "secondes": time.perf_counter() - debut,
+        }
+        compter(inseres=inseres, modifies=modifies)
+        if verbose:
+            journal.info(
+                "DataFrame inséré dans MongoDB par lots (n=%d, %d insérés, %d modifiés)", len(df), inseres, modifies
+            )
+        return rapport
+
+    @staticmethod
+    def _ecrire_arrow(
+        df: pd.DataFrame,
+        chemin: str,
+        format_: str,
+        compression: Optional[str],
+        partition_cols: Optional[List[str]],
+        row_group_size: Optional[int],
+        ajouter: bool,
+        index: bool,
+        table=None,
+    ) -> str:
+        """
+        Écrit un DataFrame au format Parquet ou Arrow IPC (Feather v2).
+
+        Sans partitionnement ni ajout, `chemin` est un fichier. Sinon, `chemin` est un
+        répertoire : partitions `colonne=valeur/` (style Hive) et un nouveau fichier
+        par appel lorsque `ajouter=True`. Une `pyarrow.Table` déjà convertie depuis `df`
+        peut être fournie pour éviter une nouvelle conversion. Retourne le chemin écrit.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.dataset as ds
+        except ImportError:
+            raise ImportError("pyarrow est requis pour ce format : pip install pyarrow")
+
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("`df` doit être un pandas DataFrame")
+        if partition_cols:
+            manquantes = [c for c in partition_cols if c not in df.columns]
+            if manquantes:
+                raise ValueError(f"Colonnes de partition inexistantes dans le DataFrame: {manquantes}")
+        if row_group_size is not None and row_group_size < 1:
+            raise ValueError("`row_group_size` doit être supérieur ou égal à 1.")
+
+        if table is None:
+            table = pa.Table.from_pandas(df, preserve_index=index)
+        extension = ".parquet" if format_ == "parquet" else ".arrow"
+
+        if not partition_cols and not ajouter:
+            if format_ == "parquet":
+                import pyarrow.parquet as pq
+                pq.write_table(table, chemin, compression=compression or "none", row_group_size=row_group_size)
+            else:
+                import pyarrow.feather as feather
+                feather.write_feather(
+                    table, chemin, compression=compression or "uncompressed", chunksize=row_group_size
+                )
+            return chemin
+
+        import uuid
+        if format_ == "parquet":
+            fichier = ds.ParquetFileFormat()
+            options = fichier.make_write_options(compression=compression or "none")
+        else:
+            fichier = ds.IpcFileFormat()
+            options = fichier.make_write_options(compression=compression)
+        ds.write_dataset(
+            table,
+            chemin,
+            format=fichier,
+            file_options=options,
+            partitioning=partition_cols or None,
+            partitioning_flavor="hive" if partition_cols else None,
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}{extension}",
+            existing_data_behavior="overwrite_or_ignore" if ajouter else "delete_matching",
+            max_rows_per_group=row_group_size or 1 << 20,
+            min_rows_per_group=0,
+        )
+        return chemin
+
+    @staticmethod
+    @instrumenter("Loader.vers_parquet")
+    def vers_parquet(
+        df: pd.DataFrame,
+        chemin: str,
+        compression: Optional[str] = "snappy",
+        partition_cols: Optional[List[str]] = None,
+        row_group_size: Optional[int] = None,
+        ajouter: bool = False,
+        index: bool = False,
+        verbose: bool = True
+    ) -> None:
+        """
+        Sauvegarde un DataFrame au format Parquet (colonnaire, compressé).
+
+        Paramètres
+        ----------
+        df : pd.DataFrame
+            DataFrame à sauvegarder.
+        chemin : str
+            Fichier de sortie, ou répertoire si `partition_cols` ou `ajouter` est utilisé.
+        compression : str, default='snappy'
+            Codec : 'snappy', 'zstd', 'gzip', 'brotli', 'lz4' ou None.
+        partition_cols : list de str, optionnel
+            Colonnes de partitionnement (répertoires `colonne=valeur/`, style Hive),
+            utilisables par les lecteurs pour filtrer sans lire les autres partitions.
+            Les partitions réécrites sont remplacées, sauf si `ajouter=True`.
+        row_group_size : int, optionnel
+            Nombre maximal de lignes par row group.
+        ajouter : bool, default=False
+            Si True, écrit un nouveau fichier dans le répertoire `chemin` sans toucher
+            aux fichiers existants (écriture par morceaux).
+        index : bool, default=False
+            Si True, inclut l’index du DataFrame.
+        verbose : bool, default=True
+            Si True, journalise un message de confirmation (niveau INFO).
+        """
+        try:
+            Loader._ecrire_arrow(df, chemin, "parquet", compression, partition_cols, row_group_size, ajouter, index)
+            if verbose:
+                journal.info("DataFrame sauvegardé en Parquet : %s", chemin)
+        except (ImportError, TypeError, ValueError):
+            raise
+        except Exception as e:
+            raise IOError(f"Erreur lors de l'écriture Parquet : {e}")
+
+    @staticmethod
+    @instrumenter("Loader.vers_feather")
+    def vers_feather(
+        df: pd.DataFrame,
+        chemin: str,
+        compression: Optional[str] = "lz4",
+        partition_cols: Optional[List[str]] = None,
+        row_group_size: Optional[int] = None,
+        ajouter: bool = False,
+        index: bool = False,
+        verbose: bool = True
+    ) -> None:
+        """
+        Sauvegarde un DataFrame au format Feather v2 (fichier Arrow IPC, lecture rapide
+        et projetable en mémoire).
+
+        Paramètres
+        ----------
+        compression : str, default='lz4'
+            Codec : 'lz4', 'zstd' ou None.
+        row_group_size : int, optionnel
+            Nombre maximal de lignes par record batch.
+
+        Les autres paramètres sont ceux de `vers_parquet`.
+        """
+        try:
+            Loader._ecrire_arrow(df, chemin, "feather", compression, partition_cols, row_group_size, ajouter, index)
+            if verbose:
+                journal.info("DataFrame sauvegardé en Feather : %s", chemin)
+        except (ImportError, TypeError, ValueError):
+            raise
+        except Exception as e:
+            raise IOError(f"Erreur lors de l'écriture Feather : {e}")
+
+    @staticmethod
+    @instrumenter("Loader.vers_arrow_ipc")
+    def vers_arrow_ipc(
+        df: pd.DataFrame,
+        chemin: str,
+        compression: Optional[str] = None,
+        partition_cols: Optional[List[str]] = None,
+        row_group_size: Optional[int] = None,
+        ajouter: bool = False,
+        index: bool = False,
+        verbose: bool = True
+    ) -> None:
+        """
+        Sauvegarde un DataFrame au format Arrow IPC (fichier), non compressé par défaut
+        pour être lu sans copie (memory-map).
+
+        Paramètres
+        ----------
+        compression : str, optionnel
+            Codec : 'lz4', 'zstd' ou None.
+        row_group_size : int, optionnel
+            Nombre maximal de lignes par record batch.
+
+        Les autres paramètres sont ceux de `vers_parquet`.
+        """
+        try:
+            Loader._ecrire_arrow(df, chemin, "ipc", compression, partition_cols, row_group_size, ajouter, index)
+            if verbose:
+                journal.info("DataFrame sauvegardé en Arrow IPC : %s", chemin)
+        except (ImportError, TypeError, ValueError):
+            raise
+        except Exception as e:
+            raise IOError(f"Erreur lors de l'écriture Arrow IPC : {e}")
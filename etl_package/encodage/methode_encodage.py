@@ -1,6 +1,14 @@
 
+import logging
 import pandas as pd
-from typing import Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Union
+
+from ..outils.ajustable import TransformateurAjuste
+from ..outils.copie import Copie, copier
+from ..outils.instrumentation import compter, instrumenter
+from ..outils.statistiques import Frequences
+
+journal = logging.getLogger(__name__)
 
 class EncodeurCategoriel:
     """
@@ -12,7 +20,7 @@ class EncodeurCategoriel:
     Strategy = Literal["onehot", "ordinal", "frequence"]
 
     @staticmethod
-
+    @instrumenter("EncodeurCategoriel.encoder_colonne")
     def encoder_colonne(
         df: pd.DataFrame,
         colonne: str,
@@ -21,6 +29,7 @@ class EncodeurCategoriel:
         mapping: Optional[dict] = None,
         prefix: Optional[str] = None,
         inplace: bool = False,
+        copie: Copie = "auto",
     ) -> pd.DataFrame:
         """
         Encode une colonne catégorielle selon la stratégie choisie.
@@ -39,6 +48,9 @@ class EncodeurCategoriel:
             Préfixe pour les colonnes générées en one-hot encoding.
         inplace : bool, default=False
             Si True, modifie `df` directement. Sinon, retourne une copie.
+        copie : {"auto", "profonde", "colonnes"}, default="auto"
+            Mode de copie lorsque `inplace=False` (voir `outils.copie.copier`) :
+            "colonnes" partage les colonnes non modifiées avec `df`.
 
         Retour
         ------
@@ -53,26 +65,127 @@ class EncodeurCategoriel:
         if inplace:
             df_out = df
         else:
-            df_out = df.copy()
+            df_out = copier(df, copie)
 
         if strategie == "onehot":
             prefix = prefix or colonne
             dummies = pd.get_dummies(df_out[colonne], prefix=prefix, dummy_na=False)
-            df_out = pd.concat([df_out.drop(columns=[colonne]), dummies], axis=1)
-            print(f"Colonne '{colonne}' encodée en one-hot ({dummies.shape[1]} colonnes).")
+            # Suppression puis ajout colonne par colonne : contrairement à `concat`,
+            # les autres colonnes ne sont pas recopiées.
+            del df_out[colonne]
+            if dummies.shape[1]:
+                df_out[list(dummies.columns)] = dummies
+            compter(categories=dummies.shape[1])
+            journal.info("Colonne '%s' encodée en one-hot (%d colonnes).", colonne, dummies.shape[1])
 
         elif strategie == "ordinal":
             if mapping is None:
                 raise ValueError("Un mapping {valeur: entier} est requis pour l'encodage ordinal.")
             df_out[colonne] = df_out[colonne].map(mapping)
-            print(f"Colonne '{colonne}' encodée en ordinal avec le mapping fourni.")
+            journal.info("Colonne '%s' encodée en ordinal avec le mapping fourni.", colonne)
 
         elif strategie == "frequence":
             freq_map = df_out[colonne].value_counts(normalize=True).to_dict()
             df_out[colonne] = df_out[colonne].map(freq_map)
-            print(f"Colonne '{colonne}' encodée par fréquence.")
+            compter(categories=len(freq_map))
+            journal.info("Colonne '%s' encodée par fréquence.", colonne)
 
         else:
             raise ValueError("Stratégie invalide : choisir 'onehot', 'ordinal' ou 'frequence'.")
 
         return df_out
+
+
+class EncodeurCategorielAjuste(TransformateurAjuste):
+    """
+    Encodage catégoriel avec catégories et fréquences ajustées par `fit` / `partial_fit` :
+    `transform` produit toujours les mêmes colonnes one-hot et les mêmes fréquences,
+    quel que soit le lot transformé.
+    """
+
+    def __init__(
+        self,
+        colonnes: Union[str, List[str]],
+        strategie: EncodeurCategoriel.Strategy = "onehot",
+        *,
+        mapping: Optional[Union[dict, list]] = None,
+        prefix: Optional[str] = None,
+        inconnues: Literal["ignorer", "erreur"] = "ignorer",
+        valeur_inconnue: Any = None,
+    ):
+        """
+        Paramètres
+        ----------
+        colonnes : str ou list de str
+            Colonne(s) catégorielle(s) à encoder.
+        strategie : {"onehot", "ordinal", "frequence"}, default="onehot"
+            Stratégie d’encodage.
+        mapping : dict, optionnel
+            Mapping {valeur: entier} requis si `strategie="ordinal"`.
+        prefix : str, optionnel
+            Préfixe des colonnes one-hot (une seule colonne encodée). Par défaut, le nom de la colonne.
+        inconnues : {"ignorer", "erreur"}, default="ignorer"
+            Traitement des valeurs non vues pendant l'ajustement (ou absentes du mapping) :
+            - "ignorer" : ligne à 0 dans toutes les colonnes one-hot, `valeur_inconnue` sinon.
+            - "erreur"  : lève une ValueError.
+        valeur_inconnue : Any, default=None
+            Valeur des catégories inconnues en ordinal / fréquence (None : NaN).
+        """
+        super().__init__(colonnes)
+        if strategie not in ("onehot", "ordinal", "frequence"):
+            raise ValueError("Stratégie invalide : choisir 'onehot', 'ordinal' ou 'frequence'.")
+        if strategie == "ordinal" and mapping is None:
+            raise ValueError("Un mapping {valeur: entier} est requis pour l'encodage ordinal.")
+        if prefix is not None and len(self.colonnes) > 1:
+            raise ValueError("`prefix` ne s'utilise qu'avec une seule colonne.")
+        if inconnues not in ("ignorer", "erreur"):
+            raise ValueError("`inconnues` doit être 'ignorer' ou 'erreur'.")
+        self.strategie = strategie
+        self.mapping = dict(mapping) if mapping is not None else None
+        self.prefix = prefix
+        self.inconnues = inconnues
+        self.valeur_inconnue = valeur_inconnue
+
+    def _parametres(self) -> Dict[str, Any]:
+        return {
+            "colonnes": self.colonnes,
+            "strategie": self.strategie,
+            # Liste de paires : les clés non textuelles survivent à la sérialisation JSON.
+            "mapping": None if self.mapping is None else [[k, v] for k, v in self.mapping.items()],
+            "prefix": self.prefix,
+            "inconnues": self.inconnues,
+            "valeur_inconnue": self.valeur_inconnue,
+        }
+
+    def _statistiques_colonne(self) -> Dict[str, Any]:
+        return {"frequences": Frequences()}
+
+    def _encoder_valeurs(self, s: pd.Series, correspondance: dict) -> pd.Series:
+        encodee = s.map(correspondance)
+        if self.valeur_inconnue is not None:
+            encodee = encodee.mask(s.notna() & encodee.isna(), self.valeur_inconnue)
+        return encodee
+
+    def _transformer(self, df_out: pd.DataFrame) -> pd.DataFrame:
+        for c in self.colonnes:
+            s = df_out[c]
+            if self.strategie == "ordinal":
+                connues = list(self.mapping)
+            else:
+                connues = self.statistiques[c]["frequences"].categories()
+
+            if self.inconnues == "erreur":
+                inconnues = s[s.notna() & ~s.isin(connues)]
+                if not inconnues.empty:
+                    raise ValueError(f"Colonne '{c}' : valeurs inconnues {inconnues.unique()[:10].tolist()}")
+
+            if self.strategie == "onehot":
+                dummies = pd.get_dummies(s.astype(pd.CategoricalDtype(connues)), prefix=self.prefix or c)
+                del df_out[c]
+                if dummies.shape[1]:
+                    df_out[list(dummies.columns)] = dummies
+            elif self.strategie == "ordinal":
+                df_out[c] = self._encoder_valeurs(s, self.mapping)
+            else:
+                df_out[c] = self._encoder_valeurs(s, self.statistiques[c]["frequences"].proportions())
+        return df_out
@@ -0,0 +1,2 @@
+from .moteur import MoteurHorsMemoire
+from .parallele import ExecuteurParallele
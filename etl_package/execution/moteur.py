@@ -0,0 +1,311 @@
+import logging
+import os
+import time
+import pandas as pd
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Union
+
+from ..outils.ajustable import TransformateurAjuste
+from ..chargement.loader import Loader
+from ..chargement.ecrivain_csv import EcrivainCSV
+from ..outils.instrumentation import compter, instrumenter
+
+journal = logging.getLogger(__name__)
+
+Source = Union[Callable[[], Iterable[pd.DataFrame]], List[pd.DataFrame]]
+Etape = Union[TransformateurAjuste, Callable[[pd.DataFrame], pd.DataFrame]]
+
+
+class _Destination:
+    """
+    Destination alimentée morceau par morceau : le premier morceau est écrit avec
+    les options fournies, les suivants sont ajoutés.
+    """
+
+    TYPES = (
+        "csv", "sql", "sql_bulk", "sql_incremental", "mongodb", "mongodb_batch",
+        "parquet", "feather", "arrow_ipc",
+    )
+
+    def __init__(self, destination: Union[dict, Callable, EcrivainCSV]):
+        self.ecrivain = None
+        self.fonction = None
+        self.premier = True
+        self.proprietaire = False
+        if isinstance(destination, dict):
+            self.options = {k: v for k, v in destination.items() if k not in ("type", "verbose", "ecraser")}
+            self.type_ = destination.get("type")
+            if self.type_ not in self.TYPES:
+                raise ValueError(f"Type de destination invalide, choisir parmi {self.TYPES}.")
+            if self.type_ == "csv":
+                self.ecrivain = EcrivainCSV(**self.options)
+                self.proprietaire = True
+            elif self.type_ in ("parquet", "feather", "arrow_ipc") and not self.options.get("ajouter", False):
+                self._preparer_repertoire(self.options["chemin"], destination.get("ecraser", False))
+        elif hasattr(destination, "ecrire"):
+            self.ecrivain = destination
+        elif callable(destination):
+            self.fonction = destination
+        else:
+            raise TypeError("`destination` doit être un dict, un objet avec `ecrire` ou une fonction.")
+
+    @staticmethod
+    def _preparer_repertoire(chemin: str, ecraser: bool) -> None:
+        """
+        Le répertoire `chemin` reçoit un fichier par morceau. S'il existe déjà et n'est
+        pas vide, il n'est vidé qu'avec `ecraser=True`, et seuls les fichiers de morceaux
+        ("part-*.parquet" / "part-*.arrow", partitions comprises) sont supprimés.
+        """
+        if not os.path.exists(chemin) or (os.path.isdir(chemin) and not os.listdir(chemin)):
+            return
+        if not ecraser:
+            raise IOError(
+                f"La destination '{chemin}' existe déjà : passer `ecraser=True` pour remplacer "
+                "les fichiers de morceaux, ou `ajouter=True` pour les compléter."
+            )
+        if not os.path.isdir(chemin):
+            raise IOError(f"La destination '{chemin}' est un fichier et non un répertoire.")
+        for racine, _, fichiers in os.walk(chemin, topdown=False):
+            for nom in fichiers:
+                if nom.startswith("part-") and nom.endswith((".parquet", ".arrow")):
+                    os.remove(os.path.join(racine, nom))
+            if racine != chemin and not os.listdir(racine):
+                os.rmdir(racine)
+
+    def ecrire(self, morceau: pd.DataFrame) -> None:
+        if self.ecrivain is not None:
+            self.ecrivain.ecrire(morceau)
+        elif self.fonction is not None:
+            self.fonction(morceau)
+        else:
+            options = dict(self.options)
+            if self.type_ in ("sql", "sql_bulk") and not self.premier:
+                options["if_exists"] = "append"
+            elif self.type_ in ("parquet", "feather", "arrow_ipc"):
+                options["ajouter"] = True
+            getattr(Loader, f"vers_{self.type_}")(morceau, **options, verbose=False)
+        self.premier = False
+
+    def fermer(self) -> None:
+        # Un écrivain fourni par l'appelant reste sous sa responsabilité.
+        if self.proprietaire:
+            self.ecrivain.fermer()
+
+
+class MoteurHorsMemoire:
+    """
+    Exécution d'une suite de transformations sur une source lue par morceaux,
+    sans jamais charger le jeu de données complet.
+
+    - Passages de statistiques : les étapes ajustables (`ImputateurAjuste`,
+      `NormaliserColonneAjuste`, `StandardisationAjustee`, `GestionOutliersAjustee`,
+      `EncodeurCategorielAjuste`) cumulent leurs statistiques morceau par morceau
+      (`partial_fit`). Une étape qui lit une colonne produite par une étape non encore
+      ajustée (ou qui suit une suppression de lignes non encore ajustée) attend le
+      passage suivant : un seul passage suffit lorsque les étapes sont indépendantes.
+    - Passage d'écriture : chaque morceau traverse toutes les étapes puis est écrit
+      dans la destination.
+
+    Les étapes non ajustables sont des fonctions `f(df) -> df` appliquées morceau par
+    morceau ; elles sont supposées lire toutes les colonnes.
+
+    Tolérance par rapport à l'exécution en mémoire (`fit_transform` sur le DataFrame
+    complet) : moyennes, écarts-types, minimums, maximums et fréquences sont exacts
+    (écart relatif de l'ordre de 1e-12, arrondis flottants). Médianes et quartiles sont
+    exacts pour une source d'un seul morceau ou de 2048 valeurs au plus, sinon approchés avec une erreur de rang de l'ordre de
+    1/2048 (quelques millièmes d'écart-type sur une distribution régulière). Les
+    fonctions dépendant de l'ordre des lignes (moyennes glissantes, décalages) ne
+    voient pas au-delà des bornes de morceau.
+
+    Exemple
+    -------
+    >>> moteur = MoteurHorsMemoire([
+    ...     ImputateurAjuste("Rating", "mediane"),
+    ...     StandardisationAjustee("Rating"),
+    ...     EncodeurCategorielAjuste("Company", "frequence"),
+    ... ])
+    >>> source = lambda: ExtractionCSV.extract_csv("historique.csv", taille_chunk=500_000)
+    >>> moteur.executer(source, {"type": "parquet", "chemin": "sortie/"})
+    """
+
+    def __init__(self, etapes: List[Etape]):
+        """
+        Paramètres
+        ----------
+        etapes : list
+            Transformateurs ajustables et/ou fonctions `f(df) -> df`, dans l'ordre d'exécution.
+        """
+        for position, etape in enumerate(etapes):
+            if not isinstance(etape, TransformateurAjuste) and not callable(etape):
+                raise TypeError(f"Étape {position} : transformateur ajustable ou fonction attendu.")
+        self.etapes = list(etapes)
+
+    @staticmethod
+    def _morceaux(source: Source) -> Iterator[pd.DataFrame]:
+        if callable(source):
+            return iter(source())
+        if iter(source) is source:
+            raise TypeError(
+                "La source doit pouvoir être relue à chaque passage : "
+                "fournir une fonction qui retourne un nouvel itérateur de morceaux."
+            )
+        return iter(source)
+
+    @staticmethod
+    def _appliquer(etape: Etape, morceau: pd.DataFrame) -> pd.DataFrame:
+        if isinstance(etape, TransformateurAjuste):
+            return etape.transform(morceau, copie="colonnes")
+        return etape(morceau)
+
+    @staticmethod
+    def _action(etape: Etape, morceau: pd.DataFrame, ajustees: set, blocage: dict) -> str:
+        """
+        Action d'une étape pendant un passage de statistiques : 'appliquer', 'ajuster'
+        ou 'attendre' (entrées pas encore définitives). Met à jour `blocage`
+        {"colonnes": colonnes en attente, "tout": toutes les colonnes en attente}.
+        """
+        ajustable = isinstance(etape, TransformateurAjuste)
+        if ajustable:
+            disponible = not blocage["tout"] and all(
+                c in morceau.columns and c not in blocage["colonnes"] for c in etape.colonnes
+            )
+        else:
+            disponible = not blocage["tout"] and not blocage["colonnes"]
+
+        if disponible and (not ajustable or id(etape) in ajustees):
+            return "appliquer"
+        if ajustable:
+            blocage["colonnes"].update(etape.sorties())
+            blocage["tout"] = blocage["tout"] or etape.modifie_lignes
+        else:
+            blocage["tout"] = True
+        return "ajuster" if disponible else "attendre"
+
+    @instrumenter("MoteurHorsMemoire.ajuster")
+    def ajuster(self, source: Source, verbose: bool = True) -> int:
+        """
+        Calcule les statistiques de toutes les étapes ajustables (les précédentes
+        sont oubliées).
+
+        Paramètres
+        ----------
+        source : callable ou list
+            Fonction sans argument retournant un nouvel itérable de DataFrames à chaque
+            appel (ex: `lambda: ExtractionCSV.extract_csv(chemin, taille_chunk=100_000)`),
+            ou liste de DataFrames.
+        verbose : bool, default=True
+            Si True, journalise le bilan de chaque passage (niveau INFO).
+
+        Retour
+        ------
+        int
+            Nombre de passages sur la source.
+        """
+        a_ajuster = [e for e in self.etapes if isinstance(e, TransformateurAjuste)]
+        for etape in a_ajuster:
+            etape.statistiques = {}
+        ajustees: set = set()
+        passages = 0
+
+        while len(ajustees) < len(a_ajuster):
+            actions = None
+            n_morceaux = 0
+            for morceau in self._morceaux(source):
+                # Les actions sont décidées sur le premier morceau, puis reprises à l'identique.
+                premier = actions is None
+                if premier:
+                    actions, blocage = [], {"colonnes": set(), "tout": False}
+                for position, etape in enumerate(self.etapes):
+                    if premier:
+                        actions.append(self._action(etape, morceau, ajustees, blocage))
+                    if actions[position] == "appliquer":
+                        morceau = self._appliquer(etape, morceau)
+                    elif actions[position] == "ajuster":
+                        etape.partial_fit(morceau)
+                if premier and "ajuster" not in actions:
+                    attente = [
+                        e for e, a in zip(self.etapes, actions)
+                        if a == "attendre" and isinstance(e, TransformateurAjuste)
+                    ]
+                    raise ValueError(f"Étapes impossibles à ajuster (colonnes absentes ?) : {attente}")
+                n_morceaux += 1
+            if actions is None:
+                raise ValueError("La source ne contient aucun morceau.")
+
+            nouvelles = [e for e, a in zip(self.etapes, actions) if a == "ajuster"]
+            ajustees.update(id(e) for e in nouvelles)
+            passages += 1
+            if verbose:
+                journal.info("Passage %d : %d étape(s) ajustée(s) sur %d morceaux.", passages, len(nouvelles), n_morceaux)
+        return passages
+
+    def transformer(self, source: Source) -> Iterator[pd.DataFrame]:
+        """
+        Itère sur les morceaux transformés par toutes les étapes (déjà ajustées).
+        """
+        for morceau in self._morceaux(source):
+            for etape in self.etapes:
+                morceau = self._appliquer(etape, morceau)
+            yield morceau
+
+    @instrumenter("MoteurHorsMemoire.executer")
+    def executer(
+        self,
+        source: Source,
+        destination: Union[dict, Callable[[pd.DataFrame], Any], EcrivainCSV],
+        *,
+        ajuster: bool = True,
+        verbose: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Ajuste les étapes puis écrit les morceaux transformés dans la destination.
+
+        Paramètres
+        ----------
+        source : callable ou list
+            Voir `ajuster`.
+        destination : dict, EcrivainCSV ou callable
+            - dict {"type": ..., **options} : méthode `Loader.vers_<type>` appelée par
+              morceau ('sql', 'sql_bulk', 'sql_incremental', 'mongodb', 'mongodb_batch' ;
+              'parquet' / 'feather' / 'arrow_ipc' : un fichier par morceau dans le
+              répertoire `chemin`), ou 'csv' : options d'un `EcrivainCSV`.
+              Pour 'parquet' / 'feather' / 'arrow_ipc' sans `ajouter=True`, un répertoire
+              `chemin` existant et non vide est refusé (IOError), sauf avec `"ecraser": True` :
+              seuls les fichiers de morceaux "part-*" y sont alors supprimés, les autres
+              fichiers sont conservés.
+            - objet avec une méthode `ecrire(df)` (ex: `EcrivainCSV`, non fermé ici).
+            - fonction `f(df)` appelée pour chaque morceau.
+        ajuster : bool, default=True
+            Si False, les étapes doivent déjà être ajustées (ex: rechargées avec `charger`).
+        verbose : bool, default=True
+            Si True, journalise le bilan (niveau INFO).
+
+        Retour
+        ------
+        dict
+            passages, morceaux, lignes_ecrites, secondes.
+        """
+        debut = time.perf_counter()
+        passages = self.ajuster(source, verbose=verbose) if ajuster else 0
+        sortie = _Destination(destination)
+        morceaux = lignes = 0
+        try:
+            for morceau in self.transformer(source):
+                sortie.ecrire(morceau)
+                morceaux += 1
+                lignes += len(morceau)
+        finally:
+            sortie.fermer()
+
+        rapport = {
+            "passages": passages + 1,
+            "morceaux": morceaux,
+            "lignes_ecrites": lignes,
+            "secondes": time.perf_counter() - debut,
+        }
+        compter(passages=rapport["passages"], morceaux=morceaux, lignes_ecrites=lignes)
+        if verbose:
+            journal.info(
+                "Exécution terminée : %d lignes écrites en %d morceaux, %d passage(s) sur la source, %.2f s.",
+                lignes, morceaux, rapport["passages"], rapport["secondes"],
+            )
+        return rapport
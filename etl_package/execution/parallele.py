@@ -0,0 +1,333 @@
+import multiprocessing
+import os
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from ..outils.instrumentation import Instrumentation, instrumenter
+
+Groupe = Union[str, List[str]]
+
+
+def _partageable(s: pd.Series) -> bool:
+    """
+    True si la colonne est un tableau NumPy de types fixes (numérique, booléen, date),
+    transmissible par mémoire partagée.
+    """
+    return isinstance(s.dtype, np.dtype) and s.dtype.kind in "biufcmM"
+
+
+def _attacher(nom: str) -> shared_memory.SharedMemory:
+    """
+    Ouvre un segment créé par le processus parent, sans en transférer la responsabilité
+    (le parent le détruit).
+    """
+    try:
+        return shared_memory.SharedMemory(name=nom, track=False)
+    except TypeError:
+        # Python < 3.13 : le suivi est partagé avec le parent, qui appelle `unlink`.
+        return shared_memory.SharedMemory(name=nom)
+
+
+def _vue(
+    partagees: Dict[str, Tuple[str, str]],
+    objets: Dict[str, Any],
+    colonnes: List[str],
+    n_lignes: int,
+    debut: int,
+    fin: int,
+) -> Tuple[pd.DataFrame, list]:
+    """
+    Reconstruit dans un processus de travail le DataFrame des lignes [debut, fin)
+    des colonnes demandées : colonnes partagées lues sans copie, autres colonnes reçues
+    sous forme de tableaux pandas (`Series.array`), avec leur dtype d'origine
+    (Int64, category, string...).
+    """
+    segments = []
+    donnees = {}
+    for c in colonnes:
+        if c in partagees:
+            nom, dtype = partagees[c]
+            shm = _attacher(nom)
+            segments.append(shm)
+            donnees[c] = np.ndarray((n_lignes,), dtype=np.dtype(dtype), buffer=shm.buf)[debut:fin]
+        else:
+            donnees[c] = objets[c]
+    return pd.DataFrame(donnees, index=pd.RangeIndex(debut, fin), columns=colonnes, copy=False), segments
+
+
+def _executer_tache(
+    partagees: Dict[str, Tuple[str, str]],
+    objets: Dict[str, Any],
+    colonnes: List[str],
+    n_lignes: int,
+    debut: int,
+    fin: int,
+    fonction: Callable,
+    groupe: Optional[Groupe],
+    kwargs: Dict[str, Any],
+) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    Tâche d'un processus de travail : applique `fonction` à la vue partagée et ne
+    renvoie que les colonnes produites (et la liste des colonnes supprimées).
+    """
+    # Processus créés par fork : seul le processus parent produit des mesures.
+    Instrumentation.desactiver()
+    vue, segments = _vue(partagees, objets, colonnes, n_lignes, debut, fin)
+    try:
+        if groupe is None:
+            resultat = fonction(vue, **kwargs)
+            supprimees: List[str] = []
+        else:
+            resultat = fonction(vue, groupe, **kwargs)
+            if isinstance(resultat, pd.Series):
+                resultat = resultat.to_frame(groupe if isinstance(groupe, str) else resultat.name)
+            cibles = [groupe] if isinstance(groupe, str) else list(groupe)
+            supprimees = [c for c in cibles if c not in resultat.columns]
+            resultat = resultat[[c for c in resultat.columns if c in cibles or c not in vue.columns]]
+        # Copie hors mémoire partagée avant fermeture des segments.
+        resultat = resultat.copy()
+    finally:
+        del vue
+        for shm in segments:
+            shm.close()
+    return resultat, supprimees
+
+
+class ExecuteurParallele:
+    """
+    Exécution d'une étape sur un pool de processus, par groupes de colonnes ou par
+    plages de lignes.
+
+    Les colonnes numériques, booléennes et dates sont copiées une seule fois dans des
+    segments `multiprocessing.shared_memory` et lues sans copie par les processus de
+    travail ; seules les colonnes objet / catégorielles utiles à une tâche sont
+    transmises (par plage de lignes en mode lignes). Chaque tâche ne renvoie que
+    les colonnes qu'elle produit.
+
+    Les fonctions et leurs arguments doivent être sérialisables (fonctions de module,
+    méthodes statiques des classes du package, transformateurs ajustés...).
+
+    Exemple
+    -------
+    >>> with ExecuteurParallele(max_workers=8) as ex:
+    ...     df = ex.par_colonnes(df, ImputateurML.imputer_colonne_ml, ["Rating", "Prix"],
+    ...                          modele=RandomForestRegressor())
+    ...     df = ex.par_lignes(df, outliers_ajustes.transform)
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, contexte: Optional[str] = None):
+        """
+        Paramètres
+        ----------
+        max_workers : int, optionnel
+            Nombre de processus. Par défaut, le nombre de cœurs.
+        contexte : {'fork', 'spawn', 'forkserver'}, optionnel
+            Méthode de démarrage des processus. Par défaut, celle de la plateforme.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("`max_workers` doit être supérieur ou égal à 1.")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.contexte = contexte
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _obtenir_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            contexte = multiprocessing.get_context(self.contexte) if self.contexte else None
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=contexte)
+        return self._pool
+
+    def fermer(self) -> None:
+        """
+        Arrête les processus de travail.
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "ExecuteurParallele":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.fermer()
+
+    @staticmethod
+    def _partager(df: pd.DataFrame, colonnes: List[str]):
+        """
+        Copie les colonnes partageables dans des segments de mémoire partagée.
+        """
+        segments = []
+        partagees = {}
+        try:
+            for c in colonnes:
+                if not _partageable(df[c]):
+                    continue
+                valeurs = df[c].to_numpy()
+                shm = shared_memory.SharedMemory(create=True, size=max(valeurs.nbytes, 1))
+                segments.append(shm)
+                np.ndarray(valeurs.shape, dtype=valeurs.dtype, buffer=shm.buf)[:] = valeurs
+                partagees[c] = (shm.name, valeurs.dtype.str)
+        except BaseException:
+            ExecuteurParallele._liberer(segments)
+            raise
+        return partagees, segments
+
+    @staticmethod
+    def _liberer(segments: list) -> None:
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+
+    @instrumenter("ExecuteurParallele.par_colonnes")
+    def par_colonnes(
+        self,
+        df: pd.DataFrame,
+        fonction: Callable,
+        groupes: List[Groupe],
+        *,
+        lues: Optional[List[str]] = None,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """
+        Applique `fonction(vue, groupe, **kwargs)` à chaque groupe de colonnes en parallèle,
+        pour des étapes indépendantes d'une colonne à l'autre.
+
+        Paramètres
+        ----------
+        df : pd.DataFrame
+            DataFrame d'entrée (non modifié).
+        fonction : callable
+            Fonction `fonction(df, groupe, **kwargs)` retournant un DataFrame (mêmes lignes)
+            ou une Series pour la colonne `groupe`
+            (ex: `GestionOutliers.gerer_outliers`, `ImputateurML.imputer_colonne_ml`).
+        groupes : list
+            Une tâche par élément : nom de colonne ou liste de colonnes.
+        lues : list, optionnel
+            Colonnes supplémentaires lues par chaque tâche (ex: variables explicatives
+            d'`ImputateurML`). Par défaut, les colonnes du groupe seulement ;
+            `lues=list(df.columns)` pour toutes.
+        **kwargs
+            Arguments transmis à `fonction`.
+
+        Retour
+        ------
+        pd.DataFrame
+            `df` dont les colonnes des groupes sont remplacées par les résultats
+            (colonnes nouvelles ajoutées, colonnes supprimées retirées).
+        """
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("`df` doit être un pandas.DataFrame.")
+        taches = []
+        for groupe in groupes:
+            cibles = [groupe] if isinstance(groupe, str) else list(groupe)
+            colonnes = list(dict.fromkeys(cibles + list(lues or [])))
+            absentes = [c for c in colonnes if c not in df.columns]
+            if absentes:
+                raise ValueError(f"Colonnes absentes du DataFrame : {absentes}")
+            taches.append((groupe, colonnes))
+
+        toutes = list(dict.fromkeys(c for _, colonnes in taches for c in colonnes))
+        partagees, segments = self._partager(df, toutes)
+        try:
+            pool = self._obtenir_pool()
+            futures = [
+                pool.submit(
+                    _executer_tache, partagees,
+                    {c: df[c].array for c in colonnes if c not in partagees},
+                    colonnes, len(df), 0, len(df), fonction, groupe, kwargs,
+                )
+                for groupe, colonnes in taches
+            ]
+            resultats = [f.result() for f in futures]
+        finally:
+            self._liberer(segments)
+
+        out = df.copy(deep=False)
+        for (groupe, _), (resultat, supprimees) in zip(taches, resultats):
+            if len(resultat) != len(df) or not resultat.index.equals(pd.RangeIndex(len(df))):
+                raise ValueError(f"Groupe {groupe} : le mode colonnes exige que les lignes soient conservées.")
+            for c in supprimees:
+                del out[c]
+            if resultat.shape[1]:
+                resultat.index = df.index
+                out[list(resultat.columns)] = resultat
+        return out
+
+    @instrumenter("ExecuteurParallele.par_lignes")
+    def par_lignes(
+        self,
+        df: pd.DataFrame,
+        fonction: Callable[..., pd.DataFrame],
+        *,
+        n_parts: Optional[int] = None,
+        colonnes: Optional[List[str]] = None,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """
+        Applique `fonction(vue, **kwargs)` à des plages de lignes en parallèle, pour des
+        étapes indépendantes d'une ligne à l'autre (remplacements, types, features
+        ligne à ligne, transformateurs ajustés : `transform` d'un `...Ajuste`).
+
+        Paramètres
+        ----------
+        df : pd.DataFrame
+            DataFrame d'entrée (non modifié).
+        fonction : callable
+            Fonction `fonction(df, **kwargs) -> pd.DataFrame`. Elle peut retirer des lignes
+            mais ne doit pas réinitialiser l'index.
+        n_parts : int, optionnel
+            Nombre de plages. Par défaut, le nombre de processus.
+        colonnes : list, optionnel
+            Colonnes transmises à `fonction`. Par défaut, toutes. Les autres colonnes
+            ne sont pas envoyées aux processus et sont reprises de `df` dans le résultat.
+        **kwargs
+            Arguments transmis à `fonction`.
+
+        Retour
+        ------
+        pd.DataFrame
+            Concaténation des résultats, dans l'ordre des lignes, avec l'index de `df`.
+            Avec `colonnes`, le résultat est réassemblé sur `df` (lignes conservées par
+            `fonction`) : les colonnes transmises sont remplacées par les résultats,
+            les colonnes nouvelles ajoutées et les colonnes supprimées retirées.
+        """
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("`df` doit être un pandas.DataFrame.")
+        colonnes = list(colonnes) if colonnes is not None else list(df.columns)
+        n_parts = max(1, min(n_parts or self.max_workers, len(df) or 1))
+        bornes = np.linspace(0, len(df), n_parts + 1).astype(int)
+
+        partagees, segments = self._partager(df, colonnes)
+        try:
+            pool = self._obtenir_pool()
+            futures = [
+                pool.submit(
+                    _executer_tache, partagees,
+                    {c: df[c].array[debut:fin] for c in colonnes if c not in partagees},
+                    colonnes, len(df), int(debut), int(fin), fonction, None, kwargs,
+                )
+                for debut, fin in zip(bornes[:-1], bornes[1:])
+            ]
+            resultats = [f.result()[0] for f in futures]
+        finally:
+            self._liberer(segments)
+
+        out = pd.concat(resultats)
+        positions = out.index.to_numpy()
+        if len(colonnes) == df.shape[1]:
+            out.index = df.index[positions]
+            return out
+
+        if len(positions) == len(df) and (positions == np.arange(len(df))).all():
+            base = df.copy(deep=False)
+        else:
+            base = df.take(positions)
+        for c in colonnes:
+            if c not in out.columns:
+                del base[c]
+        if out.shape[1]:
+            out.index = base.index
+            base[list(out.columns)] = out
+        return base
@@ -1 +1,5 @@
 
+from .webscrapping import ExtractionData
+from .cache import CacheHTTP
+from .fichiers import ExtractionCSV
+from .bases_donnees import ExtractionSQL, ExtractionMongo
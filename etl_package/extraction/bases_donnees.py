@@ -0,0 +1,189 @@
+import re
+import pandas as pd
+from typing import Callable, Iterator, Optional, Union
+
+from ..outils.instrumentation import instrumenter
+
+
+def _appliquer(df: pd.DataFrame, dtypes: Optional[dict], filtre: Optional[Callable]) -> pd.DataFrame:
+    """
+    Applique les types et le filtre éventuels à un morceau.
+    """
+    if dtypes:
+        df = df.astype(dtypes)
+    if filtre is not None:
+        df = filtre(df)
+    return df
+
+
+def _resultat(
+    morceaux: Callable[[int], Iterator[pd.DataFrame]],
+    taille_chunk: Optional[int],
+    colonnes_vides: list,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """
+    Retourne l'itérateur de morceaux, ou leur concaténation si `taille_chunk` est None.
+    """
+    if taille_chunk is not None:
+        if taille_chunk < 1:
+            raise ValueError("`taille_chunk` doit être supérieur ou égal à 1.")
+        return morceaux(taille_chunk)
+    resultats = list(morceaux(100_000))
+    if not resultats:
+        return pd.DataFrame(columns=colonnes_vides)
+    return pd.concat(resultats, ignore_index=True)
+
+
+class ExtractionSQL:
+    """
+    Classe pour extraire des données depuis une base SQL (via SQLAlchemy engine)
+    avec un curseur côté serveur lu par `fetchmany`.
+    """
+
+    @staticmethod
+    @instrumenter("ExtractionSQL.extract_sql")
+    def extract_sql(
+        requete: str,
+        engine,
+        colonnes: Optional[list] = None,
+        dtypes: Optional[dict] = None,
+        *,
+        params: Optional[dict] = None,
+        taille_chunk: Optional[int] = None,
+        filtre: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Exécute une requête SQL et lit le résultat par morceaux.
+
+        Paramètres
+        ----------
+        requete : str
+            Requête SQL (paramètres nommés `:nom`) ou simple nom de table.
+        engine : SQLAlchemy engine
+            Objet SQLAlchemy créé via `create_engine`.
+        colonnes : list, optionnel
+            Colonnes à lire lorsque `requete` est un nom de table (SELECT ciblé).
+        dtypes : dict, optionnel
+            Types appliqués à chaque morceau {colonne: type}.
+        params : dict, optionnel
+            Valeurs des paramètres de la requête.
+        taille_chunk : int, optionnel
+            - None : retourne un seul DataFrame.
+            - int  : retourne un itérateur de DataFrames de `taille_chunk` lignes au plus.
+        filtre : callable, optionnel
+            Fonction appliquée à chaque morceau avant de le conserver.
+
+        Retour
+        ------
+        pd.DataFrame | Iterator[pd.DataFrame]
+            Résultat selon le paramètre `taille_chunk`. Le curseur est en mode flux
+            (`stream_results`) lorsque le pilote le permet (PostgreSQL, MySQL...) ;
+            SQLite lit les lignes à la demande.
+        """
+        from sqlalchemy import text
+
+        if re.fullmatch(r"[A-Za-z_][\w.]*", requete.strip()):
+            quote = engine.dialect.identifier_preparer.quote
+            liste = ", ".join(quote(c) for c in colonnes) if colonnes else "*"
+            table = ".".join(quote(partie) for partie in requete.strip().split("."))
+            requete = f"SELECT {liste} FROM {table}"
+        elif colonnes:
+            raise ValueError("`colonnes` ne s'utilise qu'avec un nom de table ; sinon, sélectionnez-les dans la requête.")
+
+        # Colonnes du résultat, renseignées à l'exécution (DataFrame vide si aucune ligne).
+        noms_lus = list(colonnes or [])
+
+        def morceaux(taille: int) -> Iterator[pd.DataFrame]:
+            try:
+                with engine.connect() as conn:
+                    resultat = conn.execution_options(stream_results=True).execute(text(requete), params or {})
+                    noms = list(resultat.keys())
+                    noms_lus[:] = noms
+                    while True:
+                        lignes = resultat.fetchmany(taille)
+                        if not lignes:
+                            break
+                        yield _appliquer(pd.DataFrame.from_records(lignes, columns=noms), dtypes, filtre)
+            except Exception as e:
+                raise IOError(f"Erreur lors de la lecture SQL : {e}")
+
+        return _resultat(morceaux, taille_chunk, noms_lus)
+
+
+class ExtractionMongo:
+    """
+    Classe pour extraire des données depuis une collection MongoDB (via pymongo)
+    avec un curseur lu par lots et une projection.
+    """
+
+    @staticmethod
+    @instrumenter("ExtractionMongo.extract_mongodb")
+    def extract_mongodb(
+        collection,
+        requete: Optional[dict] = None,
+        colonnes: Optional[list] = None,
+        dtypes: Optional[dict] = None,
+        *,
+        taille_batch: int = 1000,
+        taille_chunk: Optional[int] = None,
+        filtre: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+        garder_id: bool = False,
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Lit les documents d'une collection MongoDB par lots.
+
+        Paramètres
+        ----------
+        collection : pymongo collection
+            Objet collection créé via `pymongo.MongoClient()['nom_db']['nom_collection']`.
+        requete : dict, optionnel
+            Filtre MongoDB évalué par le serveur (ex: {"Rating": {"$gte": 3}}).
+        colonnes : list, optionnel
+            Champs à lire (projection) ; les autres ne sont pas transférés.
+        dtypes : dict, optionnel
+            Types appliqués à chaque morceau {colonne: type}.
+        taille_batch : int, default=1000
+            Nombre de documents transférés par aller-retour réseau.
+        taille_chunk : int, optionnel
+            - None : retourne un seul DataFrame.
+            - int  : retourne un itérateur de DataFrames de `taille_chunk` lignes au plus.
+        filtre : callable, optionnel
+            Fonction appliquée à chaque morceau avant de le conserver.
+        garder_id : bool, default=False
+            Si True, conserve le champ `_id`.
+
+        Retour
+        ------
+        pd.DataFrame | Iterator[pd.DataFrame]
+            Résultat selon le paramètre `taille_chunk`.
+        """
+        if taille_batch < 1:
+            raise ValueError("`taille_batch` doit être supérieur ou égal à 1.")
+
+        projection = None
+        if colonnes:
+            projection = {c: 1 for c in colonnes}
+            projection["_id"] = 1 if garder_id else 0
+            if garder_id and "_id" not in colonnes:
+                colonnes = list(colonnes) + ["_id"]
+        elif not garder_id:
+            projection = {"_id": 0}
+
+        def morceaux(taille: int) -> Iterator[pd.DataFrame]:
+            try:
+                curseur = collection.find(requete or {}, projection).batch_size(taille_batch)
+                try:
+                    documents = []
+                    for document in curseur:
+                        documents.append(document)
+                        if len(documents) >= taille:
+                            yield _appliquer(pd.DataFrame.from_records(documents, columns=colonnes), dtypes, filtre)
+                            documents = []
+                    if documents:
+                        yield _appliquer(pd.DataFrame.from_records(documents, columns=colonnes), dtypes, filtre)
+                finally:
+                    curseur.close()
+            except Exception as e:
+                raise IOError(f"Erreur lors de la lecture MongoDB : {e}")
+
+        return _resultat(morceaux, taille_chunk, colonnes or [])
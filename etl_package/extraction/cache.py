@@ -0,0 +1,277 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+import pandas as pd
+from typing import Dict, Optional, Tuple
+
+
+class CacheHTTP:
+    """
+    Cache disque des réponses HTTP et des DataFrames extraits.
+
+    - Les corps de page sont stockés par URL avec leurs entêtes `ETag` / `Last-Modified`,
+      renvoyés en `If-None-Match` / `If-Modified-Since` lors du téléchargement suivant :
+      une réponse 304 réutilise le corps en cache.
+    - Les DataFrames extraits sont stockés par empreinte du contenu et des paramètres
+      d'extraction : un contenu inchangé n'est pas ré-analysé.
+    - Éviction par âge (`age_max`) puis par taille totale (`taille_max`, les entrées
+      les moins récemment utilisées sont supprimées en premier). Les deux reposent sur
+      la date de dernière utilisation (mtime des fichiers), mise à jour à chaque lecture.
+    - Les compteurs sont disponibles via `stats`.
+    """
+
+    def __init__(
+        self,
+        repertoire: str,
+        taille_max: int = 512 * 2**20,
+        age_max: Optional[float] = None,
+        fraicheur: float = 0,
+    ):
+        """
+        Paramètres
+        ----------
+        repertoire : str
+            Répertoire du cache (créé si besoin).
+        taille_max : int, default=512 Mo
+            Taille totale maximale du cache, en octets.
+        age_max : float, optionnel
+            Durée maximale en secondes depuis la dernière utilisation d'une entrée
+            (écriture, lecture ou revalidation). None : pas de limite d'âge.
+        fraicheur : float, default=0
+            Durée en secondes pendant laquelle une page en cache est servie
+            sans interroger le serveur. 0 : revalidation systématique.
+        """
+        if taille_max <= 0:
+            raise ValueError("`taille_max` doit être strictement positif.")
+        self.repertoire = repertoire
+        self.taille_max = taille_max
+        self.age_max = age_max
+        self.fraicheur = fraicheur
+        self._pages = os.path.join(repertoire, "pages")
+        self._frames = os.path.join(repertoire, "frames")
+        os.makedirs(self._pages, exist_ok=True)
+        os.makedirs(self._frames, exist_ok=True)
+        self._verrou = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "revalidations": 0,
+            "parse_hits": 0,
+            "parse_misses": 0,
+            "octets_economises": 0,
+        }
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Compteurs du cache :
+        - hits : pages servies depuis le cache (fraîches ou revalidées par un 304)
+        - misses : pages téléchargées
+        - revalidations : réponses 304 reçues
+        - parse_hits / parse_misses : DataFrames réutilisés / analysés
+        - octets_economises : volume de corps de page non retéléchargés
+        """
+        with self._verrou:
+            return dict(self._stats)
+
+    def incrementer(self, compteur: str, valeur: int = 1) -> None:
+        """
+        Incrémente un compteur de `stats`.
+        """
+        with self._verrou:
+            self._stats[compteur] += valeur
+
+    @staticmethod
+    def _cle(texte: str) -> str:
+        return hashlib.sha256(texte.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _ecrire_atomique(chemin: str, donnees: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(chemin))
+        with os.fdopen(fd, "wb") as f:
+            f.write(donnees)
+        os.replace(tmp, chemin)
+
+    def _chemins_page(self, url: str) -> Tuple[str, str]:
+        cle = self._cle(url)
+        return os.path.join(self._pages, cle + ".body"), os.path.join(self._pages, cle + ".json")
+
+    def lire_page(self, url: str) -> Optional[Tuple[bytes, dict]]:
+        """
+        Retourne (contenu, métadonnées) pour une URL en cache, sinon None.
+        Une entrée lue est marquée comme récemment utilisée.
+        """
+        chemin_corps, chemin_meta = self._chemins_page(url)
+        try:
+            derniere_utilisation = os.stat(chemin_corps).st_mtime
+            with open(chemin_meta, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(chemin_corps, "rb") as f:
+                contenu = f.read()
+        except (OSError, ValueError):
+            return None
+        if self.age_max is not None and time.time() - derniere_utilisation > self.age_max:
+            self._supprimer(chemin_corps, chemin_meta)
+            return None
+        self._toucher(chemin_corps, chemin_meta)
+        return contenu, meta
+
+    def entetes_conditionnels(self, meta: dict) -> Dict[str, str]:
+        """
+        Entêtes HTTP de revalidation pour une entrée en cache.
+        """
+        entetes = {}
+        if meta.get("etag"):
+            entetes["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            entetes["If-Modified-Since"] = meta["last_modified"]
+        return entetes
+
+    def est_frais(self, meta: dict) -> bool:
+        """
+        True si l'entrée peut être servie sans interroger le serveur.
+        """
+        return self.fraicheur > 0 and time.time() - meta["date_validation"] <= self.fraicheur
+
+    def ecrire_page(self, url: str, contenu: bytes, etag: Optional[str], last_modified: Optional[str]) -> None:
+        """
+        Enregistre le corps d'une page et ses entêtes de validation.
+        """
+        chemin_corps, chemin_meta = self._chemins_page(url)
+        maintenant = time.time()
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "date_stockage": maintenant,
+            "date_validation": maintenant,
+        }
+        self._ecrire_atomique(chemin_corps, contenu)
+        self._ecrire_atomique(chemin_meta, json.dumps(meta).encode("utf-8"))
+        self.evincer()
+
+    def revalider_page(self, url: str, meta: dict) -> None:
+        """
+        Marque une entrée comme revalidée (réponse 304).
+        """
+        chemin_corps, chemin_meta = self._chemins_page(url)
+        meta = dict(meta, date_validation=time.time())
+        self._ecrire_atomique(chemin_meta, json.dumps(meta).encode("utf-8"))
+        self._toucher(chemin_corps)
+
+    @staticmethod
+    def empreinte(contenu: bytes, **parametres) -> str:
+        """
+        Empreinte d'un contenu et des paramètres d'extraction, clé du cache de DataFrames.
+        """
+        h = hashlib.sha256(contenu)
+        h.update(json.dumps(parametres, sort_keys=True, default=str).encode("utf-8"))
+        return h.hexdigest()
+
+    def lire_df(self, empreinte: str) -> Optional[pd.DataFrame]:
+        """
+        Retourne le DataFrame associé à une empreinte, sinon None.
+        Une entrée illisible (fichier tronqué, pickle écrit par une autre version de
+        pandas ou du package...) est supprimée et comptée comme un échec.
+        """
+        chemin = os.path.join(self._frames, empreinte + ".pkl")
+        try:
+            with open(chemin, "rb") as f:
+                df = pickle.load(f)
+        except FileNotFoundError:
+            self.incrementer("parse_misses")
+            return None
+        except Exception:
+            self._supprimer(chemin)
+            self.incrementer("parse_misses")
+            return None
+        self._toucher(chemin)
+        self.incrementer("parse_hits")
+        return df
+
+    def ecrire_df(self, empreinte: str, df: pd.DataFrame) -> None:
+        """
+        Enregistre un DataFrame extrait sous son empreinte.
+        """
+        chemin = os.path.join(self._frames, empreinte + ".pkl")
+        self._ecrire_atomique(chemin, pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL))
+        self.evincer()
+
+    @staticmethod
+    def _toucher(*chemins: str) -> None:
+        """
+        Met à jour la date de dernière utilisation (mtime) des fichiers.
+        """
+        for chemin in chemins:
+            try:
+                os.utime(chemin)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _supprimer(*chemins: str) -> None:
+        for chemin in chemins:
+            try:
+                os.remove(chemin)
+            except OSError:
+                pass
+
+    def _entrees(self):
+        """
+        Liste des fichiers du cache : (date de dernière utilisation, taille, chemin).
+        """
+        entrees = []
+        for dossier in (self._pages, self._frames):
+            for entree in os.scandir(dossier):
+                if entree.name.startswith("tmp"):
+                    continue
+                try:
+                    info = entree.stat()
+                except OSError:
+                    continue
+                entrees.append((info.st_mtime, info.st_size, entree.path))
+        return entrees
+
+    def evincer(self) -> int:
+        """
+        Supprime les entrées trop anciennes puis les moins récemment utilisées
+        jusqu'à revenir sous `taille_max`. Retourne le nombre de fichiers supprimés.
+        """
+        with self._verrou:
+            entrees = sorted(self._entrees())
+            supprimes = 0
+            if self.age_max is not None:
+                limite = time.time() - self.age_max
+                while entrees and entrees[0][0] < limite:
+                    self._supprimer(entrees.pop(0)[2])
+                    supprimes += 1
+            total = sum(taille for _, taille, _ in entrees)
+            while entrees and total > self.taille_max:
+                _, taille, chemin = entrees.pop(0)
+                self._supprimer(chemin)
+                total -= taille
+                supprimes += 1
+                base, ext = os.path.splitext(chemin)
+                if ext in (".body", ".json"):
+                    # Le corps et les métadonnées d'une page sont évincés ensemble.
+                    voisin = base + (".json" if ext == ".body" else ".body")
+                    for i, (_, taille_voisin, autre) in enumerate(entrees):
+                        if autre == voisin:
+                            del entrees[i]
+                            self._supprimer(autre)
+                            total -= taille_voisin
+                            supprimes += 1
+                            break
+            return supprimes
+
+    def vider(self) -> None:
+        """
+        Supprime toutes les entrées du cache (les compteurs sont conservés).
+        """
+        with self._verrou:
+            for _, _, chemin in self._entrees():
+                self._supprimer(chemin)
@@ -0,0 +1,79 @@
+import pandas as pd
+from typing import Callable, Iterator, Optional, Union
+
+from ..outils.instrumentation import instrumenter
+
+
+class ExtractionCSV:
+    """
+    Classe pour extraire des données depuis un fichier CSV volumineux,
+    par morceaux de taille bornée.
+    """
+
+    @staticmethod
+    @instrumenter("ExtractionCSV.extract_csv")
+    def extract_csv(
+        chemin: str,
+        colonnes: Optional[list] = None,
+        dtypes: Optional[dict] = None,
+        *,
+        taille_chunk: Optional[int] = None,
+        filtre: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+        sep: str = ",",
+        **options,
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Lit un fichier CSV, éventuellement par morceaux.
+
+        Paramètres
+        ----------
+        chemin : str
+            Chemin du fichier CSV (compression déduite de l'extension).
+        colonnes : list, optionnel
+            Colonnes à lire ; les autres ne sont pas analysées.
+        dtypes : dict, optionnel
+            Types des colonnes {colonne: type} (ex: {"Rating": "float32", "Company": "category"}).
+        taille_chunk : int, optionnel
+            - None : retourne un seul DataFrame.
+            - int  : retourne un itérateur de DataFrames de `taille_chunk` lignes au plus.
+        filtre : callable, optionnel
+            Fonction appliquée à chaque morceau (ex: `lambda df: df[df["Rating"] > 3]`),
+            pour ne garder en mémoire que les lignes utiles. Sans `taille_chunk`,
+            le fichier est tout de même lu par morceaux de 100 000 lignes.
+        sep : str, default=','
+            Séparateur de colonnes.
+        **options
+            Options supplémentaires transmises à `pd.read_csv`.
+
+        Retour
+        ------
+        pd.DataFrame | Iterator[pd.DataFrame]
+            Résultat selon le paramètre `taille_chunk`.
+        """
+        if taille_chunk is not None and taille_chunk < 1:
+            raise ValueError("`taille_chunk` doit être supérieur ou égal à 1.")
+
+        lecture = dict(sep=sep, usecols=colonnes, dtype=dtypes, **options)
+
+        if taille_chunk is None and filtre is None:
+            try:
+                return pd.read_csv(chemin, **lecture)
+            except Exception as e:
+                raise IOError(f"Erreur lors de la lecture CSV : {e}")
+
+        def morceaux() -> Iterator[pd.DataFrame]:
+            try:
+                lecteur = pd.read_csv(chemin, chunksize=taille_chunk or 100_000, **lecture)
+            except Exception as e:
+                raise IOError(f"Erreur lors de la lecture CSV : {e}")
+            with lecteur:
+                for morceau in lecteur:
+                    yield filtre(morceau) if filtre is not None else morceau
+
+        if taille_chunk is not None:
+            return morceaux()
+
+        resultats = list(morceaux())
+        if not resultats:
+            return pd.read_csv(chemin, nrows=0, **lecture)
+        return pd.concat(resultats, ignore_index=True)
@@ -0,0 +1,163 @@
+import logging
+import pandas as pd
+from lxml import etree
+from typing import Dict, List, Optional
+
+journal = logging.getLogger(__name__)
+
+
+class ParseurTableFlux:
+    """
+    Parseur HTML incrémental (lxml `HTMLPullParser`) pour les tableaux volumineux.
+
+    Le contenu est fourni par blocs via `alimenter`. Chaque ligne `<tr>` du tableau
+    ciblé est rangée dans des buffers par colonne, puis les éléments déjà traités
+    sont libérés : la mémoire ne dépend pas de la taille de l'arbre HTML.
+
+    Comme avec BeautifulSoup, une ligne plus courte que l'entête est complétée par None ;
+    une ligne plus longue est tronquée (nombre de lignes tronquées dans `n_tronquees`).
+    """
+
+    def __init__(self, index_table: int = 1, garder_liens: bool = False):
+        """
+        Paramètres
+        ----------
+        index_table : int, default=1
+            Position (à partir de 0) du tableau à lire parmi les `<table>` de la page,
+            comme `soup.find_all("table")[index_table]`.
+        garder_liens : bool, default=False
+            Si True, le HTML de chaque élément `<a>` de la page est conservé dans `liens`
+            (recherche d'un lien de pagination sans garder la page entière).
+        """
+        self.index_table = index_table
+        self.entetes: Optional[List[str]] = None
+        self.colonnes: Dict[int, list] = {}
+        self.n_lignes = 0
+        self.n_tronquees = 0
+        self.liens: Optional[List[bytes]] = [] if garder_liens else None
+        balises = ("table", "tr", "td", "a") if garder_liens else ("table", "tr", "td")
+        self._parser = etree.HTMLPullParser(events=("start", "end"), tag=balises)
+        self._n_tables = -1
+        self._profondeur_cible = 0
+        self._cellules: List[str] = []
+
+    @staticmethod
+    def _texte(element) -> str:
+        """
+        Texte d'une cellule, équivalent à `get_text(" ", strip=True)` de BeautifulSoup.
+        """
+        return " ".join(s.strip() for s in element.itertext() if s.strip())
+
+    @staticmethod
+    def _liberer(element) -> None:
+        """
+        Libère un élément traité ainsi que ses frères précédents.
+        """
+        element.clear()
+        parent = element.getparent()
+        if parent is not None:
+            while element.getprevious() is not None:
+                del parent[0]
+
+    def _ajouter_ligne(self, cellules: List[str]) -> None:
+        if self.entetes is None:
+            self.entetes = cellules
+            self.colonnes = {i: [] for i in range(len(cellules))}
+            return
+        if not cellules:
+            return
+        n_colonnes = len(self.entetes)
+        if len(cellules) > n_colonnes:
+            cellules = cellules[:n_colonnes]
+            self.n_tronquees += 1
+        for i in range(n_colonnes):
+            self.colonnes[i].append(cellules[i] if i < len(cellules) else None)
+        self.n_lignes += 1
+
+    def _traiter_evenements(self) -> None:
+        for evenement, element in self._parser.read_events():
+            if element.tag == "table":
+                if evenement == "start":
+                    self._n_tables += 1
+                    if self._n_tables == self.index_table or self._profondeur_cible:
+                        self._profondeur_cible += 1
+                else:
+                    if self._profondeur_cible:
+                        self._profondeur_cible -= 1
+                    self._liberer(element)
+            elif element.tag == "a":
+                if evenement == "end":
+                    self.liens.append(etree.tostring(element, method="html", with_tail=False))
+            elif evenement == "end" and element.tag == "td":
+                if self._profondeur_cible:
+                    self._cellules.append(self._texte(element))
+            elif evenement == "end" and element.tag == "tr":
+                if self._profondeur_cible:
+                    self._ajouter_ligne(self._cellules)
+                self._cellules = []
+                self._liberer(element)
+
+    def alimenter(self, bloc: bytes) -> None:
+        """
+        Transmet un bloc de contenu HTML au parseur et range les lignes complètes.
+        """
+        self._parser.feed(bloc)
+        self._traiter_evenements()
+
+    def terminer(self) -> None:
+        """
+        Signale la fin du contenu et traite les derniers éléments.
+        """
+        self._parser.close()
+        self._traiter_evenements()
+        if self.n_tronquees:
+            journal.warning(
+                "%d ligne(s) du tableau tronquée(s) à %d cellules (nombre de colonnes d'entête).",
+                self.n_tronquees, len(self.entetes),
+            )
+
+    def vider(self, n_max: Optional[int] = None) -> pd.DataFrame:
+        """
+        Retourne les lignes accumulées sous forme de DataFrame et les retire des buffers.
+        Si `n_max` est renseigné, seules les `n_max` premières lignes sont retirées.
+        """
+        if self.entetes is None:
+            return pd.DataFrame()
+        if n_max is None or n_max >= self.n_lignes:
+            df = pd.DataFrame(self.colonnes)
+            self.colonnes = {i: [] for i in range(len(self.entetes))}
+            self.n_lignes = 0
+        else:
+            df = pd.DataFrame({i: valeurs[:n_max] for i, valeurs in self.colonnes.items()})
+            for valeurs in self.colonnes.values():
+                del valeurs[:n_max]
+            self.n_lignes -= n_max
+        df.columns = self.entetes
+        return df
+
+
+def parser_table_lxml(contenu: bytes, index_table: int = 1, taille_bloc: int = 1 << 16) -> pd.DataFrame:
+    """
+    Lit un tableau HTML de manière incrémentale et retourne un DataFrame.
+
+    Paramètres
+    ----------
+    contenu : bytes
+        Contenu HTML de la page.
+    index_table : int, default=1
+        Position du tableau à lire parmi les `<table>` de la page.
+    taille_bloc : int, default=65536
+        Taille des blocs transmis au parseur, en octets.
+
+    Retour
+    ------
+    pd.DataFrame
+    """
+    parseur = ParseurTableFlux(index_table)
+    vue = memoryview(contenu)
+    for debut in range(0, len(vue), taille_bloc):
+        parseur.alimenter(bytes(vue[debut:debut + taille_bloc]))
+    parseur.terminer()
+    if parseur.entetes is None:
+        raise ValueError("Impossible de trouver le tableau de données.")
+    return parseur.vider()
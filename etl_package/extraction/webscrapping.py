@@ -1,15 +1,35 @@
+import logging
 import requests
+import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Union
+from urllib.parse import urljoin, urlsplit
+from requests.adapters import HTTPAdapter
+from .cache import CacheHTTP
+from .parseur_lxml import ParseurTableFlux, parser_table_lxml
+from ..outils.instrumentation import compter, instrumenter
+
+journal = logging.getLogger(__name__)
 
 class ExtractionData:
     """
     Classe pour extraire des données depuis un site web via webscraping.
     Supporte les tableaux HTML ou l'extraction par classes CSS.
     Les entêtes sont automatiquement nettoyées.
+    Les requêtes passent par une session HTTP partagée (connexions keep-alive réutilisées).
     """
 
+    CODES_A_REESSAYER = (429, 500, 502, 503, 504)
+    MOTEURS = ("bs4", "lxml")
+
+    _session: Optional[requests.Session] = None
+    _verrou = threading.Lock()
+
     @staticmethod
     def _nettoyer_colonnes(df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -17,15 +37,271 @@ class ExtractionData:
         """
         new_cols = []
         for col in df.columns:
-            col = col.replace("\n", " ")          
-            col = re.sub(r"\s+", " ", col)       
-            col = col.strip()                     
+            col = col.replace("\n", " ")
+            col = re.sub(r"\s+", " ", col)
+            col = col.strip()
             new_cols.append(col)
         df.columns = new_cols
         return df
 
     @staticmethod
-    def extract_webscrapping(url: str, columns_to_extract: list = None, rename_columns: list = None) -> pd.DataFrame:
+    def _obtenir_session(taille_pool: int = 10) -> requests.Session:
+        """
+        Retourne la session HTTP partagée, créée au premier appel.
+        Si `taille_pool` dépasse la taille actuelle, un adaptateur plus grand est monté
+        sur la même session et l'ancien est fermé (ses connexions ne fuient pas).
+        """
+        with ExtractionData._verrou:
+            session = ExtractionData._session
+            if session is None:
+                session = requests.Session()
+                session._taille_pool = 0
+                ExtractionData._session = session
+            if session._taille_pool < taille_pool:
+                anciens = {id(a): a for a in session.adapters.values()}
+                adapter = HTTPAdapter(pool_connections=taille_pool, pool_maxsize=taille_pool)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session._taille_pool = taille_pool
+                for ancien in anciens.values():
+                    ancien.close()
+            return session
+
+    @staticmethod
+    def _requete(
+        url: str,
+        session: requests.Session,
+        *,
+        timeout: float = 10,
+        tentatives: int = 1,
+        backoff: float = 0.5,
+        semaphore: Optional[threading.Semaphore] = None,
+        entetes: Optional[dict] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Envoie une requête GET avec réessais et attente exponentielle
+        (backoff * 2**i) sur les erreurs réseau et les codes 429/5xx.
+        Une réponse 304 est retournée telle quelle.
+        """
+        for essai in range(tentatives):
+            try:
+                if semaphore is not None:
+                    with semaphore:
+                        pageweb = session.get(url, timeout=timeout, headers=entetes, stream=stream)
+                else:
+                    pageweb = session.get(url, timeout=timeout, headers=entetes, stream=stream)
+                if pageweb.status_code == 304:
+                    return pageweb
+                if pageweb.status_code in ExtractionData.CODES_A_REESSAYER and essai < tentatives - 1:
+                    raise requests.HTTPError(f"{pageweb.status_code} pour {url}", response=pageweb)
+                pageweb.raise_for_status()
+                return pageweb
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+                reponse = getattr(e, "response", None)
+                reessayable = reponse is None or reponse.status_code in ExtractionData.CODES_A_REESSAYER
+                if not reessayable or essai == tentatives - 1:
+                    raise
+                time.sleep(backoff * 2 ** essai)
+
+    @staticmethod
+    def _telecharger(
+        url: str,
+        session: requests.Session,
+        *,
+        timeout: float = 10,
+        tentatives: int = 1,
+        backoff: float = 0.5,
+        semaphore: Optional[threading.Semaphore] = None,
+        cache: Optional[CacheHTTP] = None,
+    ) -> bytes:
+        """
+        Télécharge le contenu d'une page (voir `_requete`).
+        Avec un cache, la requête est conditionnelle et une réponse 304 sert le corps en cache.
+        """
+        entree = cache.lire_page(url) if cache is not None else None
+        entetes = {}
+        if entree is not None:
+            contenu, meta = entree
+            if cache.est_frais(meta):
+                cache.incrementer("hits")
+                cache.incrementer("octets_economises", len(contenu))
+                return contenu
+            entetes = cache.entetes_conditionnels(meta)
+
+        pageweb = ExtractionData._requete(
+            url,
+            session,
+            timeout=timeout,
+            tentatives=tentatives,
+            backoff=backoff,
+            semaphore=semaphore,
+            entetes=entetes,
+        )
+        if pageweb.status_code == 304:
+            if entree is None:
+                raise requests.HTTPError(f"Réponse 304 inattendue pour {url}", response=pageweb)
+            cache.revalider_page(url, meta)
+            cache.incrementer("hits")
+            cache.incrementer("revalidations")
+            cache.incrementer("octets_economises", len(contenu))
+            return contenu
+        if cache is not None:
+            cache.incrementer("misses")
+            cache.ecrire_page(
+                url,
+                pageweb.content,
+                pageweb.headers.get("ETag"),
+                pageweb.headers.get("Last-Modified"),
+            )
+        return pageweb.content
+
+    @staticmethod
+    def _parser_page(
+        contenu: bytes,
+        columns_to_extract: list = None,
+        rename_columns: list = None,
+        moteur: str = "bs4",
+        dtypes: Optional[dict] = None,
+    ) -> pd.DataFrame:
+        """
+        Transforme le contenu HTML d'une page en DataFrame
+        (tableau HTML ou extraction par classes CSS).
+        """
+        if moteur not in ExtractionData.MOTEURS:
+            raise ValueError(f"Moteur invalide : choisir parmi {ExtractionData.MOTEURS}.")
+
+        if moteur == "lxml" and columns_to_extract is None:
+            return parser_table_lxml(contenu, index_table=1)
+
+        soup = BeautifulSoup(contenu, "lxml" if moteur == "lxml" else "html.parser")
+
+        if columns_to_extract is None:
+            tables = soup.find_all("table")
+            if not tables or len(tables) < 2:
+                raise ValueError("Impossible de trouver le tableau de données.")
+
+            table = tables[1]
+            all_rows = table.find_all("tr")
+
+            headers = [td.get_text(" ", strip=True) for td in all_rows[0].find_all("td")]
+
+
+            rows = []
+            for tr in all_rows[1:]:
+                cells = [td.get_text(" ",strip=True) for td in tr.find_all("td")]
+                if cells:
+                    rows.append(cells)
+
+            df = pd.DataFrame(rows, columns=headers)
+
+            return df
+
+
+        df = ExtractionData._extraire_classes(soup, columns_to_extract, dtypes)
+        if rename_columns and len(rename_columns) == len(df.columns):
+            df.columns = rename_columns
+
+
+        return df
+
+    @staticmethod
+    def _analyser(
+        contenu: bytes,
+        cache: Optional[CacheHTTP],
+        columns_to_extract: list = None,
+        rename_columns: list = None,
+        moteur: str = "bs4",
+        dtypes: Optional[dict] = None,
+    ) -> pd.DataFrame:
+        """
+        Analyse une page en réutilisant, si un cache est fourni, le DataFrame
+        déjà extrait d'un contenu identique avec les mêmes paramètres.
+        """
+        if cache is None:
+            return ExtractionData._parser_page(contenu, columns_to_extract, rename_columns, moteur, dtypes)
+        empreinte = cache.empreinte(
+            contenu,
+            columns_to_extract=columns_to_extract,
+            rename_columns=rename_columns,
+            moteur=moteur,
+            dtypes=dtypes,
+        )
+        df = cache.lire_df(empreinte)
+        if df is None:
+            df = ExtractionData._parser_page(contenu, columns_to_extract, rename_columns, moteur, dtypes)
+            cache.ecrire_df(empreinte, df)
+        return df
+
+    @staticmethod
+    def _convertir(valeur: str, type_):
+        """
+        Convertit une valeur textuelle selon l'indication de type (NaN si la conversion échoue).
+        """
+        try:
+            return type_(valeur)
+        except (TypeError, ValueError):
+            return float("nan")
+
+    @staticmethod
+    def _extraire_classes(soup: BeautifulSoup, columns_to_extract: list, dtypes: Optional[dict] = None) -> pd.DataFrame:
+        """
+        Extrait les colonnes demandées en un seul parcours du document.
+
+        Chaque élément portant une des classes demandées est rangé dans sa colonne ;
+        les valeurs sont alignées par ligne parente (`<tr>` le plus proche, sinon le parent direct),
+        une valeur absente d'une ligne devient NaN. La première ligne (entêtes) est ignorée.
+        Les colonnes présentes dans `dtypes` sont converties pendant l'extraction.
+        Une indication entière donne le type nullable de même taille et de même signe
+        ('uint8' -> UInt8, 'int32' -> Int32) ; une valeur hors de ses bornes devient NA.
+        """
+        types = {col: pd.api.types.pandas_dtype(type_) for col, type_ in (dtypes or {}).items()}
+        inconnues = [col for col in types if col not in columns_to_extract]
+        if inconnues:
+            raise ValueError(f"Colonnes de `dtypes` absentes de columns_to_extract : {inconnues}")
+        non_numeriques = [col for col, type_ in types.items() if type_.kind not in "iuf"]
+        if non_numeriques:
+            raise TypeError(f"Les indications de `dtypes` doivent être numériques : {non_numeriques}")
+        entiers = {
+            col: np.dtype(getattr(type_, "numpy_dtype", type_)) for col, type_ in types.items() if type_.kind in "iu"
+        }
+        convertisseurs = {col: (int if col in entiers else float) for col in types}
+        demandees = set(columns_to_extract)
+
+        lignes = {}
+        for tag in soup.find_all(attrs={"class": list(demandees)}):
+            parent = tag.find_parent("tr") or tag.parent
+            ligne = lignes.setdefault(id(parent), {})
+            texte = tag.get_text(strip=True)
+            for col in demandees.intersection(tag.get("class", [])):
+                if col in ligne:
+                    continue
+                conv = convertisseurs.get(col)
+                ligne[col] = ExtractionData._convertir(texte, conv) if conv else texte
+
+        valeurs = list(lignes.values())[1:]
+        data = {col: [ligne.get(col) for ligne in valeurs] for col in columns_to_extract}
+        for col, numpy_type in entiers.items():
+            bornes = np.iinfo(numpy_type)
+            data[col] = [v if isinstance(v, int) and bornes.min <= v <= bornes.max else None for v in data[col]]
+            types[col] = pd.api.types.pandas_dtype(
+                f"{'UInt' if numpy_type.kind == 'u' else 'Int'}{numpy_type.itemsize * 8}"
+            )
+        df = pd.DataFrame(data, columns=columns_to_extract)
+        for col, type_ in types.items():
+            df[col] = df[col].astype(type_)
+        return df
+
+    @staticmethod
+    @instrumenter("ExtractionData.extract_webscrapping")
+    def extract_webscrapping(
+        url: str,
+        columns_to_extract: list = None,
+        rename_columns: list = None,
+        moteur: str = "bs4",
+        dtypes: Optional[dict] = None,
+        cache: Optional[CacheHTTP] = None,
+    ) -> pd.DataFrame:
         """
         Extrait des données d'un site web et retourne un DataFrame pandas.
         ----------
@@ -38,51 +314,288 @@ class ExtractionData:
         rename_columns : list (optionnel)
         Liste des nouveaux noms de colonnes pour le DataFrame.
         Doit avoir la même taille que columns_to_extract.
+        moteur : str, default="bs4"
+        - "bs4"  : arbre BeautifulSoup complet (html.parser).
+        - "lxml" : lecture incrémentale du tableau avec lxml, mémoire constante
+          quelle que soit la taille de la page (BeautifulSoup sur lxml pour les classes).
+        dtypes : dict (optionnel)
+        Indications de type numérique {classe: type} (ex: {"Rating": float}),
+        appliquées pendant l'extraction par classes ; une valeur non convertible devient NaN.
+        Les types entiers donnent le type nullable de même taille ('uint8' -> UInt8).
+        cache : CacheHTTP (optionnel)
+        Cache disque : requête conditionnelle (ETag / Last-Modified) et
+        réutilisation du DataFrame si le contenu n'a pas changé.
 
         Retour :
         pandas.DataFrame
         """
         try:
-            pageweb = requests.get(url, timeout=10)
-            pageweb.raise_for_status()
-            soup = BeautifulSoup(pageweb.content, "html.parser")
-
-           
-            if columns_to_extract is None:
-                tables = soup.find_all("table")
-                if not tables or len(tables) < 2:
-                    raise ValueError("Impossible de trouver le tableau de données.")
-
-                table = tables[1]  
-                all_rows = table.find_all("tr")
-               
-                headers = [td.get_text(" ", strip=True) for td in all_rows[0].find_all("td")]
-
-            
-                rows = []
-                for tr in all_rows[1:]:
-                    cells = [td.get_text(" ",strip=True) for td in tr.find_all("td")]
-                    if cells:
-                        rows.append(cells)
-
-                df = pd.DataFrame(rows, columns=headers)
-              
-                return df
-
-          
-            data = {}
-            for col in columns_to_extract:
-                tags = soup.find_all(attrs={"class": col})
-                values = [tag.get_text(strip=True) for tag in tags[1:]]
-                data[col] = values
-
-            df = pd.DataFrame(data)
-            if rename_columns and len(rename_columns) == len(df.columns):
-                df.columns = rename_columns
-
-            
-            return df
+            contenu = ExtractionData._telecharger(url, ExtractionData._obtenir_session(), timeout=10, cache=cache)
+            return ExtractionData._analyser(contenu, cache, columns_to_extract, rename_columns, moteur, dtypes)
 
         except Exception as e:
-            print(f"Erreur lors de l'extraction : {e}")
-            return pd.DataFrame(columns=columns_to_extract if columns_to_extract else [])
\ No newline at end of file
+            compter(erreurs=1)
+            journal.error("Erreur lors de l'extraction : %s", e)
+            return pd.DataFrame(columns=columns_to_extract if columns_to_extract else [])
+
+    @staticmethod
+    @instrumenter("ExtractionData.extract_many")
+    def extract_many(
+        urls: List[str],
+        columns_to_extract: list = None,
+        rename_columns: list = None,
+        *,
+        max_workers: int = 8,
+        max_par_hote: int = 4,
+        tentatives: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 10,
+        concatener: bool = True,
+        colonne_source: Optional[str] = None,
+        moteur: str = "bs4",
+        dtypes: Optional[dict] = None,
+        cache: Optional[CacheHTTP] = None,
+    ) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
+        """
+        Extrait plusieurs pages en parallèle via un pool de threads borné.
+
+        Paramètres
+        ----------
+        urls : list de str
+            URLs des pages à extraire.
+        columns_to_extract : list, optionnel
+            Liste des classes HTML à extraire (voir `extract_webscrapping`).
+        rename_columns : list, optionnel
+            Nouveaux noms de colonnes (voir `extract_webscrapping`).
+        max_workers : int, default=8
+            Nombre maximal de téléchargements simultanés.
+        max_par_hote : int, default=4
+            Nombre maximal de requêtes simultanées vers un même hôte.
+        tentatives : int, default=3
+            Nombre total d'essais par URL (erreurs réseau, codes 429 et 5xx).
+        backoff : float, default=0.5
+            Attente de base en secondes entre deux essais (doublée à chaque essai).
+        timeout : float, default=10
+            Délai maximal d'une requête, en secondes.
+        concatener : bool, default=True
+            - True  : retourne un seul DataFrame concaténé, dans l'ordre des URLs.
+            - False : retourne un dict {url: DataFrame}.
+            Une URL répétée n'est téléchargée qu'une fois : une seule entrée dans le dict,
+            ses lignes répétées à chacune de ses positions dans le DataFrame concaténé.
+        colonne_source : str, optionnel
+            Si renseigné, ajoute une colonne de ce nom contenant l'URL d'origine de chaque ligne.
+        moteur : {"bs4", "lxml"}, default="bs4"
+            Moteur d'analyse HTML (voir `extract_webscrapping`).
+        dtypes : dict, optionnel
+            Indications de type numérique par classe (voir `extract_webscrapping`).
+        cache : CacheHTTP, optionnel
+            Cache disque des pages et des DataFrames extraits (voir `extract_webscrapping`).
+
+        Retour
+        ------
+        pd.DataFrame | dict
+            Résultat selon le paramètre `concatener`. Une URL en échec donne un DataFrame vide
+            (l'erreur est affichée), les autres URLs ne sont pas interrompues.
+        """
+        if isinstance(urls, str):
+            urls = [urls]
+        if max_workers < 1 or max_par_hote < 1:
+            raise ValueError("`max_workers` et `max_par_hote` doivent être supérieurs ou égaux à 1.")
+        if tentatives < 1:
+            raise ValueError("`tentatives` doit être supérieur ou égal à 1.")
+
+        session = ExtractionData._obtenir_session(max_workers)
+        semaphores = {
+            hote: threading.Semaphore(max_par_hote)
+            for hote in {urlsplit(url).netloc for url in urls}
+        }
+
+        def extraire(url: str) -> pd.DataFrame:
+            try:
+                contenu = ExtractionData._telecharger(
+                    url,
+                    session,
+                    timeout=timeout,
+                    tentatives=tentatives,
+                    backoff=backoff,
+                    semaphore=semaphores[urlsplit(url).netloc],
+                    cache=cache,
+                )
+                df = ExtractionData._analyser(contenu, cache, columns_to_extract, rename_columns, moteur, dtypes)
+            except Exception as e:
+                compter(erreurs=1)
+                journal.error("Erreur lors de l'extraction de %s : %s", url, e)
+                df = pd.DataFrame(columns=columns_to_extract if columns_to_extract else [])
+            if colonne_source:
+                df[colonne_source] = url
+            return df
+
+        uniques = list(dict.fromkeys(urls))
+        with ThreadPoolExecutor(max_workers=min(max_workers, max(len(uniques), 1))) as pool:
+            par_url = dict(zip(uniques, pool.map(extraire, uniques)))
+
+        if not concatener:
+            return par_url
+        if not urls:
+            return pd.DataFrame(columns=columns_to_extract if columns_to_extract else [])
+        return pd.concat([par_url[url] for url in urls], ignore_index=True)
+
+    @staticmethod
+    def _lien_suivant(contenu: bytes, url: str, selecteur: str) -> Optional[str]:
+        """
+        Retourne l'URL absolue du lien `<a>` correspondant au sélecteur CSS, sinon None.
+        Seuls les éléments `<a>` sont analysés.
+        """
+        soup = BeautifulSoup(contenu, "lxml", parse_only=SoupStrainer("a"))
+        lien = soup.select_one(selecteur)
+        if lien is None or not lien.get("href"):
+            return None
+        return urljoin(url, lien["href"])
+
+    @staticmethod
+    def _iter_page(
+        url: str,
+        session: requests.Session,
+        columns_to_extract: Optional[list],
+        rename_columns: Optional[list],
+        dtypes: Optional[dict],
+        taille_chunk: int,
+        moteur: str,
+        liens: Optional[list],
+        **options_requete,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Produit les lignes d'une page par morceaux.
+        En mode tableau, la réponse est lue en flux et analysée au fil de l'eau ;
+        en mode classes, la page est analysée en une fois avec `moteur`.
+        Si une liste `liens` est fournie, le HTML contenant les éléments `<a>` de la page
+        y est ajouté (en mode tableau, seuls ces éléments sont conservés).
+        """
+        if columns_to_extract is not None:
+            contenu = ExtractionData._telecharger(url, session, **options_requete)
+            if liens is not None:
+                liens.append(contenu)
+            yield ExtractionData._parser_page(contenu, columns_to_extract, rename_columns, moteur, dtypes)
+            return
+
+        pageweb = ExtractionData._requete(url, session, stream=True, **options_requete)
+        with pageweb:
+            parseur = ParseurTableFlux(index_table=1, garder_liens=liens is not None)
+            for bloc in pageweb.iter_content(chunk_size=1 << 16):
+                parseur.alimenter(bloc)
+                while parseur.n_lignes >= taille_chunk:
+                    yield parseur.vider(taille_chunk)
+            parseur.terminer()
+        if liens is not None:
+            liens.extend(parseur.liens)
+        if parseur.entetes is None:
+            raise ValueError(f"Impossible de trouver le tableau de données : {url}")
+        yield parseur.vider()
+
+    @staticmethod
+    @instrumenter("ExtractionData.iter_extract")
+    def iter_extract(
+        url: str,
+        columns_to_extract: list = None,
+        rename_columns: list = None,
+        *,
+        taille_chunk: int = 10_000,
+        selecteur_suivant: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        dtypes: Optional[dict] = None,
+        moteur: str = "lxml",
+        tentatives: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 10,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Extrait des données par morceaux de `taille_chunk` lignes, au fil de l'analyse.
+
+        Les étapes suivantes (transformation, `Loader`) peuvent traiter un morceau
+        pendant que l'extraction continue, avec une mémoire bornée.
+
+        Paramètres
+        ----------
+        url : str
+            URL de la première page.
+        columns_to_extract : list, optionnel
+            Liste des classes HTML à extraire. Si None, le tableau de données est lu
+            en flux (parseur lxml incrémental) directement depuis la réponse HTTP.
+        rename_columns : list, optionnel
+            Nouveaux noms de colonnes (mode classes, voir `extract_webscrapping`).
+        taille_chunk : int, default=10000
+            Nombre de lignes par DataFrame produit (le dernier peut être plus petit).
+            Les morceaux peuvent regrouper des lignes de plusieurs pages.
+        selecteur_suivant : str, optionnel
+            Sélecteur CSS du lien vers la page suivante (ex: "a.next", "a[rel=next]"),
+            appliqué aux éléments `<a>` de chaque page. Si None, seule `url` est lue.
+            En mode tableau, seuls les éléments `<a>` de la page courante sont conservés
+            pour cette recherche, pas la page entière.
+        max_pages : int, optionnel
+            Nombre maximal de pages lues. None : jusqu'à la dernière page.
+        dtypes : dict, optionnel
+            Indications de type numérique par classe (voir `extract_webscrapping`).
+        moteur : {"bs4", "lxml"}, default="lxml"
+            Moteur d'analyse des pages en mode classes (voir `extract_webscrapping`).
+            Le mode tableau est toujours lu en flux avec lxml.
+        tentatives, backoff, timeout
+            Réessais et délai des requêtes (voir `extract_many`).
+
+        Retour
+        ------
+        Iterator[pd.DataFrame]
+            Morceaux successifs, indexés de manière continue sur l'ensemble du flux.
+            Les erreurs de téléchargement ou d'analyse sont levées.
+        """
+        if taille_chunk < 1:
+            raise ValueError("`taille_chunk` doit être supérieur ou égal à 1.")
+        if max_pages is not None and max_pages < 1:
+            raise ValueError("`max_pages` doit être supérieur ou égal à 1.")
+        if tentatives < 1:
+            raise ValueError("`tentatives` doit être supérieur ou égal à 1.")
+        if moteur not in ExtractionData.MOTEURS:
+            raise ValueError(f"Moteur invalide : choisir parmi {ExtractionData.MOTEURS}.")
+
+        session = ExtractionData._obtenir_session()
+        en_attente: List[pd.DataFrame] = []
+        n_attente = 0
+        debut = 0
+        visitees = set()
+
+        def emettre(n: int) -> pd.DataFrame:
+            nonlocal en_attente, n_attente, debut
+            df = pd.concat(en_attente, ignore_index=True) if len(en_attente) > 1 else en_attente[0]
+            chunk, reste = df.iloc[:n], df.iloc[n:]
+            en_attente = [reste] if len(reste) else []
+            n_attente = len(reste)
+            chunk = chunk.reset_index(drop=True)
+            chunk.index = pd.RangeIndex(debut, debut + len(chunk))
+            debut += len(chunk)
+            return chunk
+
+        while url and url not in visitees and (max_pages is None or len(visitees) < max_pages):
+            visitees.add(url)
+            liens = [] if selecteur_suivant else None
+            for morceau in ExtractionData._iter_page(
+                url,
+                session,
+                columns_to_extract,
+                rename_columns,
+                dtypes,
+                taille_chunk,
+                moteur,
+                liens,
+                timeout=timeout,
+                tentatives=tentatives,
+                backoff=backoff,
+            ):
+                if morceau.empty:
+                    continue
+                en_attente.append(morceau)
+                n_attente += len(morceau)
+                while n_attente >= taille_chunk:
+                    yield emettre(taille_chunk)
+            url = ExtractionData._lien_suivant(b"".join(liens), url, selecteur_suivant) if selecteur_suivant else None
+
+        if n_attente:
+            yield emettre(n_attente)
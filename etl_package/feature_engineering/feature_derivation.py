@@ -2,6 +2,9 @@ import pandas as pd
 import numpy as np
 from typing import Literal, Optional
 
+from ..outils.copie import Copie, copier
+from ..outils.instrumentation import instrumenter
+
 
 class FeatureEngineering:
     """
@@ -11,6 +14,7 @@ class FeatureEngineering:
     Strategy = Literal["ratio", "difference", "rolling_mean", "rolling_std", "lag"]
 
     @staticmethod
+    @instrumenter("FeatureEngineering.creer_feature")
     def creer_feature(
         df: pd.DataFrame,
         methode: Strategy,
@@ -21,6 +25,7 @@ class FeatureEngineering:
         periods: int = 1,
         new_col: Optional[str] = None,
         inplace: bool = False,
+        copie: Copie = "auto",
     ) -> pd.DataFrame:
         """
         Crée une nouvelle feature dérivée selon la méthode choisie.
@@ -43,6 +48,9 @@ class FeatureEngineering:
             Nom de la nouvelle colonne. Si None, un nom par défaut est généré.
         inplace : bool, default=False
             Si True, modifie directement df. Sinon, retourne une copie.
+        copie : {"auto", "profonde", "colonnes"}, default="auto"
+            Mode de copie lorsque `inplace=False` (voir `outils.copie.copier`) :
+            "colonnes" partage les colonnes non modifiées avec `df`.
 
         Retour
         ------
@@ -55,7 +63,7 @@ class FeatureEngineering:
         if col2 and col2 not in df.columns:
             raise ValueError(f"La colonne '{col2}' est absente du DataFrame.")
 
-        df_out = df if inplace else df.copy()
+        df_out = df if inplace else copier(df, copie)
 
         if methode == "ratio":
             if not col2:
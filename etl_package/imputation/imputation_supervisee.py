@@ -1,8 +1,13 @@
 
 
+import logging
 import pandas as pd
 from sklearn.base import BaseEstimator
 
+from ..outils.instrumentation import compter, instrumenter
+
+journal = logging.getLogger(__name__)
+
 class ImputateurML:
     """
     Classe permettant d'imputer une colonne contenant des NaN
@@ -10,6 +15,7 @@ class ImputateurML:
     """
 
     @staticmethod
+    @instrumenter("ImputateurML.imputer_colonne_ml")
     def imputer_colonne_ml(
         df: pd.DataFrame,
         colonne_cible: str,
@@ -17,7 +23,7 @@ class ImputateurML:
     ) -> pd.DataFrame:
         """
         Impute les valeurs manquantes d'une colonne avec un modèle ML.
-        Affiche toujours un message sur l'état de l'imputation.
+        Journalise toujours un message sur l'état de l'imputation.
 
         Paramètres
         ----------
@@ -51,7 +57,7 @@ class ImputateurML:
 
        
         if s.isna().sum() == 0:
-            print(f" Colonne '{colonne_cible}' ne contient aucun NaN → aucune imputation nécessaire.")
+            journal.info("Colonne '%s' ne contient aucun NaN → aucune imputation nécessaire.", colonne_cible)
             return s
 
       
@@ -61,10 +67,10 @@ class ImputateurML:
         X_pred = X[s.isna()]
 
         if X_train.empty:
-            print("Pas de lignes disponibles pour entraîner le modèle. Imputation impossible.")
+            journal.warning("Pas de lignes disponibles pour entraîner le modèle. Imputation impossible.")
             return s
         if X_pred.empty:
-            print("Aucune valeur à imputer.")
+            journal.info("Aucune valeur à imputer.")
             return s
 
         try:
@@ -73,13 +79,15 @@ class ImputateurML:
 
             y_pred = modele.predict(X_pred)
 
-           
+            # Copie de la seule colonne cible : `df` n'est pas modifié.
+            s = s.copy()
             s.loc[s.isna()] = y_pred
 
-            print(f"Imputation ML appliquée sur '{colonne_cible}' pour {len(y_pred)} valeurs manquantes.")
+            compter(valeurs_imputees=len(y_pred))
+            journal.info("Imputation ML appliquée sur '%s' pour %d valeurs manquantes.", colonne_cible, len(y_pred))
 
             return s
 
         except Exception as e:
-            print(f" Erreur lors de l'imputation ML : {e}")
+            journal.error("Erreur lors de l'imputation ML : %s", e)
             return s
@@ -1,14 +1,23 @@
+import logging
 import pandas as pd
 import numpy as np
-from typing import Literal, Any
+from typing import Literal, Any, Dict, List, Union
+
+from ..outils.ajustable import TransformateurAjuste
+from ..outils.colonnes import resoudre_colonnes
+from ..outils.instrumentation import compter, est_active, instrumenter
+from ..outils.statistiques import Frequences, Moments, Quantiles
+
+journal = logging.getLogger(__name__)
 
 class Imputateur:
     Strategy = Literal["moyenne", "mediane", "mode", "mean", "median"]
 
     @staticmethod
+    @instrumenter("Imputateur.imputer_colonne")
     def imputer_colonne(
         df: pd.DataFrame,
-        colonne: str,
+        colonne: str | List[str] | Any,
         strategie: Strategy = "moyenne",
         *,
         fallback: Any | None = None,
@@ -20,31 +29,35 @@ class Imputateur:
             ---------- 
             df : pd.DataFrame 
                 Jeu de données.
-        colonne : str 
-                Nom de la colonne à imputer. 
+        colonne : str, list ou sélecteur de types
+                Nom de la colonne à imputer, liste de colonnes ou sélecteur de types
+                (ex: "number") : les colonnes float64 sont alors imputées en un seul passage 2-D.
         strategie : {"moyenne","mediane","mode","mean","median"} 
                 Stratégie d'imputation. 
         fallback : Any | None, default None 
                 Valeur de repli si la statistique est indisponible (colonne entièrement NaN). 
         verbose : bool, default False 
-                Si True, affiche la valeur utilisée pour l’imputation. 
+                Si True, journalise la valeur utilisée pour l’imputation (niveau INFO). 
         Retour 
         ------
         pd.DataFrame 
-                Colonne imputée si NaN existants, sinon renvoie la colonne originale avec un message. 
+                Colonne(s) imputée(s) si NaN existants, sinon renvoie la ou les colonnes originales avec un message. 
                 
                 """
         
         if not isinstance(df, pd.DataFrame):
             raise TypeError("`df` doit être un pandas.DataFrame.")
-        if colonne not in df.columns:
-            raise ValueError(f"La colonne '{colonne}' est absente du DataFrame.")
+        if not (isinstance(colonne, str) and colonne in df.columns):
+            return Imputateur._imputer_bloc(
+                df, resoudre_colonnes(df, colonne), strategie, fallback=fallback, verbose=verbose
+            )
 
         s = df[colonne]
 
-        if s.isna().sum() == 0:
+        n_manquants = int(s.isna().sum())
+        if n_manquants == 0:
             if verbose:
-                print(f"Colonne '{colonne}' ne contient aucun NaN → aucune imputation nécessaire.")
+                journal.info("Colonne '%s' ne contient aucun NaN → aucune imputation nécessaire.", colonne)
             return s.to_frame()
 
         strat = strategie.lower()
@@ -71,8 +84,133 @@ class Imputateur:
             val = fallback
 
         out_col = s.fillna(val)
+        compter(valeurs_imputees=n_manquants if not pd.isna(val) else 0)
 
         if verbose:
-            print(f"Imputation appliquée sur '{colonne}' avec la valeur : {val}")
+            journal.info("Imputation appliquée sur '%s' avec la valeur : %s", colonne, val)
 
         return out_col.to_frame()
+
+    @staticmethod
+    def _imputer_bloc(
+        df: pd.DataFrame,
+        colonnes: List[str],
+        strategie: Strategy,
+        *,
+        fallback: Any | None = None,
+        verbose: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Impute plusieurs colonnes : moyennes / médianes des colonnes float64 en un seul
+        passage NumPy sur le bloc, les autres colonnes une par une.
+        """
+        strat = strategie.lower()
+        if strat not in ("moyenne", "mean", "mediane", "median", "mode"):
+            raise ValueError("Stratégie invalide : choisir 'moyenne', 'mediane' ou 'mode'.")
+
+        out = df[colonnes].copy(deep=False)
+        avec_nan = out.isna().any()
+        bloc = [c for c in colonnes if avec_nan[c] and strat != "mode" and out[c].dtype == np.float64]
+        autres = [c for c in colonnes if c not in bloc]
+
+        if bloc:
+            X = out[bloc].to_numpy(dtype=float, copy=True)
+            manquants = np.isnan(X)
+            vides = manquants.all(axis=0)
+            vals = np.full(len(bloc), np.nan)
+            if not vides.all():
+                calcul = np.nanmean if strat in ("moyenne", "mean") else np.nanmedian
+                vals[~vides] = calcul(X[:, ~vides], axis=0)
+            if fallback is not None:
+                vals[vides] = fallback
+            lignes, cols = np.nonzero(manquants)
+            X[lignes, cols] = vals[cols]
+            out[bloc] = X
+            compter(valeurs_imputees=(~np.isnan(vals[cols])).sum())
+            if verbose:
+                for c, val in zip(bloc, vals):
+                    journal.info("Imputation appliquée sur '%s' avec la valeur : %s", c, val)
+
+        for c in autres:
+            out[c] = Imputateur.imputer_colonne(df, c, strat, fallback=fallback, verbose=verbose)[c]
+
+        return out
+
+
+class ImputateurAjuste(TransformateurAjuste):
+    """
+    Imputation avec statistiques ajustées : la valeur d'imputation de chaque colonne
+    est calculée par `fit` / `partial_fit`, puis réutilisée par `transform`
+    (ex: statistiques du jeu d'entraînement appliquées aux lots suivants).
+
+    Exemple
+    -------
+    >>> imp = ImputateurAjuste(["Rating", "CocoaPercentage"], "mediane").fit(df_train)
+    >>> imp.sauvegarder("imputateur.json")
+    >>> df_lot = ImputateurAjuste.charger("imputateur.json").transform(df_lot)
+    """
+
+    def __init__(
+        self,
+        colonnes: Union[str, List[str]],
+        strategie: Imputateur.Strategy = "moyenne",
+        fallback: Any | None = None,
+    ):
+        """
+        Paramètres
+        ----------
+        colonnes : str ou list de str
+            Colonne(s) à imputer.
+        strategie : {"moyenne","mediane","mode","mean","median"}, default="moyenne"
+            Stratégie d'imputation. La médiane est exacte après `fit` (un seul lot) ;
+            cumulée sur plusieurs lots (`partial_fit`), elle est approchée au-delà de
+            2048 valeurs.
+        fallback : Any | None, default None
+            Valeur de repli si la statistique est indisponible (colonne entièrement NaN).
+        """
+        super().__init__(colonnes)
+        self.strategie = strategie.lower()
+        if self.strategie not in ("moyenne", "mean", "mediane", "median", "mode"):
+            raise ValueError("Stratégie invalide : choisir 'moyenne', 'mediane' ou 'mode'.")
+        self.fallback = fallback
+
+    def _parametres(self) -> Dict[str, Any]:
+        return {"colonnes": self.colonnes, "strategie": self.strategie, "fallback": self.fallback}
+
+    def _statistiques_colonne(self) -> Dict[str, Any]:
+        if self.strategie in ("moyenne", "mean"):
+            return {"moments": Moments()}
+        if self.strategie in ("mediane", "median"):
+            return {"quantiles": Quantiles()}
+        return {"frequences": Frequences()}
+
+    def _verifier_colonne(self, s: pd.Series) -> None:
+        if self.strategie != "mode" and not pd.api.types.is_numeric_dtype(s):
+            raise TypeError(
+                f"La stratégie '{self.strategie}' requiert une colonne numérique. Colonne '{s.name}' est de type {s.dtype}."
+            )
+
+    def valeurs(self) -> Dict[str, Any]:
+        """
+        Valeur d'imputation de chaque colonne ajustée.
+        """
+        valeurs = {}
+        for c, stats in self.statistiques.items():
+            if "moments" in stats:
+                val = stats["moments"].moyenne if stats["moments"].n else np.nan
+            elif "quantiles" in stats:
+                val = stats["quantiles"].quantile(0.5)
+            else:
+                val = stats["frequences"].mode()
+            if (val is None or pd.isna(val)) and self.fallback is not None:
+                val = self.fallback
+            valeurs[c] = val
+        return valeurs
+
+    def _transformer(self, df_out: pd.DataFrame) -> pd.DataFrame:
+        for c, val in self.valeurs().items():
+            if c in self.colonnes and val is not None and not pd.isna(val) and df_out[c].isna().any():
+                if est_active():
+                    compter(valeurs_imputees=df_out[c].isna().sum())
+                df_out[c] = df_out[c].fillna(val)
+        return df_out
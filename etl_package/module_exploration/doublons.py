@@ -1,15 +1,151 @@
+import logging
+import numpy as np
 import pandas as pd
+from typing import Any, Optional
+
+from ..outils.colonnes import resoudre_colonnes
+from ..outils.instrumentation import compter, instrumenter
+from .empreintes import MagasinEmpreintes
+
+journal = logging.getLogger(__name__)
+
+
+_MANQUANT = np.iinfo(np.uint64).max
+
+
+def _hacher_numerique(s: pd.Series) -> np.ndarray:
+    """
+    Empreintes des valeurs d'une colonne numérique, indépendantes de son dtype :
+    une valeur entière a la même empreinte en int64, float64, Int64... (1 == 1.0) ;
+    les autres flottants sont hachés en float64 et les valeurs manquantes valent `_MANQUANT`.
+    """
+    manquants = s.isna().to_numpy()
+    if pd.api.types.is_integer_dtype(s.dtype):
+        resultat = pd.util.hash_array(s.to_numpy(dtype=np.int64, na_value=0))
+    else:
+        flottants = s.to_numpy(dtype=np.float64, na_value=np.nan)
+        with np.errstate(invalid="ignore"):
+            entiers = np.isfinite(flottants) & (flottants == np.floor(flottants)) & (np.abs(flottants) < 2.0 ** 63)
+        resultat = pd.util.hash_array(flottants)
+        if entiers.any():
+            resultat[entiers] = pd.util.hash_array(flottants[entiers].astype(np.int64))
+    resultat[manquants] = _MANQUANT
+    return resultat
+
+
+def _hacher_colonne(s: pd.Series) -> np.ndarray:
+    """
+    Empreintes 64 bits des valeurs d'une colonne.
+    Les colonnes numériques (hors booléens) sont normalisées (voir `_hacher_numerique`) ;
+    les colonnes texte sont factorisées d'abord : seules les valeurs distinctes sont hachées.
+    """
+    if pd.api.types.is_numeric_dtype(s.dtype) and not pd.api.types.is_bool_dtype(s.dtype) \
+            and not pd.api.types.is_complex_dtype(s.dtype):
+        return _hacher_numerique(s)
+    if isinstance(s.dtype, np.dtype) and s.dtype.kind in "biufcmM":
+        return pd.util.hash_array(s.to_numpy())
+    if s.dtype == object or isinstance(s.dtype, pd.StringDtype):
+        codes, valeurs = pd.factorize(s)
+        empreintes = pd.util.hash_array(np.asarray(valeurs, dtype=object), categorize=False)
+        resultat = empreintes.take(codes) if len(empreintes) else np.zeros(len(codes), dtype=np.uint64)
+        resultat[codes < 0] = _MANQUANT
+        return resultat
+    return pd.util.hash_pandas_object(s, index=False).to_numpy()
 
 class ValeurDouble:
     """
     Cette classe permet de calculer le nombre de doublons dans un DataFrame.
 
+    Au-delà d'un DataFrame en mémoire, les doublons peuvent être recherchés entre
+    morceaux et entre exécutions : chaque ligne est réduite à une empreinte 64 bits de
+    ses colonnes clés, comparée à un magasin d'empreintes persistant
+    (`EmpreintesTriees`, exact, ou `FiltreBloom`, approché en mémoire bornée).
+    """
 
+    @staticmethod
+    def empreintes_lignes(df: pd.DataFrame, colonnes: Optional[Any] = None) -> np.ndarray:
+        """
+        Calcule une empreinte 64 bits par ligne à partir des colonnes clés (vectorisé).
 
-    """
+        Les empreintes sont stables d'une exécution à l'autre : deux lignes de mêmes valeurs
+        ont la même empreinte. Les clés numériques sont normalisées avant hachage : une valeur
+        entière a la même empreinte quel que soit le dtype (int64, Int64, ou float64 après
+        l'apparition d'un NaN dans un morceau CSV), et une valeur manquante a la même
+        empreinte (NaN, None, pd.NA). Pour les autres types (texte, dates...), les valeurs
+        sont comparées avec leur type. L'index n'est pas pris en compte.
+
+        Paramètres
+        ----------
+        df : pd.DataFrame
+            Jeu de données.
+        colonnes : str, list ou sélecteur de types, optionnel
+            Colonnes clés. Par défaut, toutes.
+
+        Retour
+        ------
+        np.ndarray
+            Tableau uint64 de longueur len(df).
+        """
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("df doit être un pandas DataFrame")
+        noms = list(df.columns) if colonnes is None else resoudre_colonnes(df, colonnes)
+        if not noms:
+            raise ValueError("Aucune colonne clé sélectionnée.")
+        # Combinaison des colonnes reprise de pandas (`combine_hash_arrays`).
+        multiplicateur = np.uint64(1000003)
+        resultat = np.full(len(df), 0x345678, dtype=np.uint64)
+        for i, nom in enumerate(noms):
+            resultat ^= _hacher_colonne(df[nom])
+            resultat *= multiplicateur
+            multiplicateur += np.uint64(82520 + 2 * (len(noms) - i))
+        resultat += np.uint64(97531)
+        return resultat
 
     @staticmethod
-    def calcul_valeur_double(df: pd.DataFrame, return_rows: bool = False, keep: str = 'first'):
+    @instrumenter("ValeurDouble.doublons_connus")
+    def doublons_connus(
+        df: pd.DataFrame,
+        magasin: MagasinEmpreintes,
+        colonnes: Optional[Any] = None,
+        ajouter: bool = True,
+    ) -> pd.Series:
+        """
+        Repère les lignes déjà vues : doublons d'une ligne précédente du même DataFrame
+        ou d'une ligne d'un morceau / d'une exécution précédente enregistrée dans `magasin`.
+
+        Paramètres
+        ----------
+        df : pd.DataFrame
+            Morceau à examiner.
+        magasin : EmpreintesTriees ou FiltreBloom
+            Empreintes déjà vues (à enregistrer avec `sauvegarder` pour les exécutions suivantes).
+        colonnes : str, list ou sélecteur de types, optionnel
+            Colonnes clés. Par défaut, toutes.
+        ajouter : bool, default=True
+            Si True, les empreintes nouvelles du morceau sont ajoutées au magasin.
+
+        Retour
+        ------
+        pd.Series
+            Masque booléen aligné sur `df.index` : True pour les doublons
+            (la première occurrence d'une clé n'est pas marquée).
+        """
+        empreintes = ValeurDouble.empreintes_lignes(df, colonnes)
+        masque = pd.Series(empreintes).duplicated(keep="first").to_numpy() | magasin.contient(empreintes)
+        if ajouter:
+            magasin.ajouter(empreintes[~masque])
+        compter(doublons=int(masque.sum()))
+        return pd.Series(masque, index=df.index, name="doublon")
+
+    @staticmethod
+    @instrumenter("ValeurDouble.calcul_valeur_double")
+    def calcul_valeur_double(
+        df: pd.DataFrame,
+        return_rows: bool = False,
+        keep: str = 'first',
+        colonnes: Optional[Any] = None,
+        magasin: Optional[MagasinEmpreintes] = None,
+    ):
         
         """
         Cette fonction permet de détecter les doublons dans un dataframe pandas
@@ -21,32 +157,47 @@ class ValeurDouble:
          Si True, retourne les lignes dupliquées au lieu du nombre. 
          keep : str, optionnel Paramètre pour df.duplicated() : 
          'first', 'last' ou False 
+         colonnes : str, list ou sélecteur de types, optionnel
+         Colonnes clés comparées. Par défaut, toutes.
+         magasin : EmpreintesTriees ou FiltreBloom, optionnel
+         Si fourni, mode empreintes : les lignes déjà présentes dans le magasin
+         (morceaux ou exécutions précédentes) sont aussi des doublons, et les nouvelles
+         clés y sont ajoutées (voir `doublons_connus`). Exige keep='first'.
          Retour :
          -------- nombre de doublons ou pd.DataFrame 
          - Si return_rows=False : nombre de doublons ou 0 si aucun. 
          - Si return_rows=True : DataFrame contenant uniquement les lignes en double (vide si aucune valeur dupliquée).
         
         """
+        if magasin is not None and keep != 'first':
+            raise ValueError("Le mode empreintes (magasin) exige keep='first'.")
+
         try:
             if not isinstance(df, pd.DataFrame):
                 raise TypeError("df doit être un pandas DataFrame")
 
             if df.empty:
                 if return_rows:
-                    print("Aucune ligne à retourner, DataFrame vide.")
+                    journal.info("Aucune ligne à retourner, DataFrame vide.")
                     return pd.DataFrame()
                 else:
-                    print("La DataFrame est vide.")
+                    journal.info("La DataFrame est vide.")
                     return 0
 
-            duplicates_mask = df.duplicated(keep=keep)
-            n_duplicates = int(duplicates_mask.sum())
+            if magasin is not None:
+                duplicates_mask = ValeurDouble.doublons_connus(df, magasin, colonnes)
+                n_duplicates = int(duplicates_mask.sum())
+            else:
+                subset = None if colonnes is None else resoudre_colonnes(df, colonnes)
+                duplicates_mask = df.duplicated(subset=subset, keep=keep)
+                n_duplicates = int(duplicates_mask.sum())
+                compter(doublons=n_duplicates)
 
             if n_duplicates == 0:
                 if return_rows:
-                    print("Pas de lignes à retourner, aucune valeur dupliquée.")
+                    journal.info("Pas de lignes à retourner, aucune valeur dupliquée.")
                 else:
-                    print("Il n'y a pas de valeur double dans la DataFrame.")
+                    journal.info("Il n'y a pas de valeur double dans la DataFrame.")
                 return
             else:
                 if return_rows:
@@ -56,6 +207,6 @@ class ValeurDouble:
 
         except Exception as e:
 
-            print(f" Une erreur est survenue : {e}")
+            journal.error("Une erreur est survenue : %s", e)
 
             return
@@ -0,0 +1,256 @@
+import logging
+import math
+import numpy as np
+from typing import Union
+
+journal = logging.getLogger(__name__)
+
+
+def _uint64(empreintes) -> np.ndarray:
+    empreintes = np.asarray(empreintes)
+    if empreintes.dtype != np.uint64:
+        raise TypeError("Les empreintes doivent être un tableau d'entiers uint64 (voir `ValeurDouble.empreintes_lignes`).")
+    return empreintes.ravel()
+
+
+def melanger64(x: np.ndarray) -> np.ndarray:
+    """
+    Mélange « splitmix64 » d'entiers uint64 (vectorisé) : bijection aux bits bien répartis,
+    utilisée pour dériver des fonctions de hachage indépendantes d'une empreinte.
+    """
+    z = x + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _distinctes(empreintes: np.ndarray) -> np.ndarray:
+    """
+    Empreintes distinctes triées (tri puis comparaison des voisines, bien plus rapide
+    que `np.unique` sur des entiers 64 bits aléatoires).
+    """
+    triees = np.sort(empreintes)
+    if len(triees) < 2:
+        return triees
+    return triees[np.concatenate(([True], triees[1:] != triees[:-1]))]
+
+
+class EmpreintesTriees:
+    """
+    Ensemble exact d'empreintes de lignes 64 bits, conservé sous forme de tableau trié
+    (8 octets par clé distincte). La recherche se fait par dichotomie (`np.searchsorted`).
+
+    Exemple
+    -------
+    >>> connues = EmpreintesTriees.charger("empreintes.npy")
+    >>> masque = ValeurDouble.doublons_connus(df_du_jour, connues, colonnes=["REF", "Company"])
+    >>> connues.sauvegarder("empreintes.npy")
+    """
+
+    def __init__(self):
+        self.valeurs = np.empty(0, dtype=np.uint64)
+
+    def __len__(self) -> int:
+        return len(self.valeurs)
+
+    def __repr__(self) -> str:
+        return f"EmpreintesTriees({len(self)} clés)"
+
+    def contient(self, empreintes) -> np.ndarray:
+        """
+        Retourne un masque booléen : True pour les empreintes déjà présentes.
+        """
+        empreintes = _uint64(empreintes)
+        if not len(self.valeurs):
+            return np.zeros(len(empreintes), dtype=bool)
+        positions = np.searchsorted(self.valeurs, empreintes)
+        positions[positions == len(self.valeurs)] = 0
+        return self.valeurs[positions] == empreintes
+
+    def ajouter(self, empreintes) -> int:
+        """
+        Ajoute des empreintes (fusion dans le tableau trié). Retourne le nombre de clés nouvelles.
+        """
+        nouvelles = _distinctes(_uint64(empreintes))
+        nouvelles = nouvelles[~self.contient(nouvelles)]
+        if len(nouvelles):
+            self.valeurs = np.insert(self.valeurs, np.searchsorted(self.valeurs, nouvelles), nouvelles)
+        return len(nouvelles)
+
+    def merge(self, autre: "EmpreintesTriees") -> "EmpreintesTriees":
+        """
+        Ajoute les clés d'un autre ensemble (ex: calculé sur un autre lot).
+        """
+        self.ajouter(autre.valeurs)
+        return self
+
+    def sauvegarder(self, chemin: str) -> None:
+        """
+        Enregistre les empreintes au format NumPy (.npy).
+        """
+        try:
+            with open(chemin, "wb") as f:
+                np.save(f, self.valeurs, allow_pickle=False)
+        except OSError as e:
+            raise IOError(f"Erreur lors de la sauvegarde des empreintes : {e}")
+
+    @classmethod
+    def charger(cls, chemin: str, creer: bool = True) -> "EmpreintesTriees":
+        """
+        Recharge des empreintes enregistrées par `sauvegarder`.
+        Si le fichier n'existe pas et `creer=True`, retourne un ensemble vide.
+        """
+        ensemble = cls()
+        try:
+            with open(chemin, "rb") as f:
+                valeurs = np.load(f, allow_pickle=False)
+        except FileNotFoundError:
+            if creer:
+                return ensemble
+            raise IOError(f"Fichier d'empreintes introuvable : {chemin}")
+        except (OSError, ValueError) as e:
+            raise IOError(f"Erreur lors du chargement des empreintes : {e}")
+        if valeurs.dtype != np.uint64 or valeurs.ndim != 1:
+            raise TypeError("Le fichier ne contient pas un tableau d'empreintes uint64.")
+        ensemble.valeurs = valeurs
+        return ensemble
+
+
+class FiltreBloom:
+    """
+    Filtre de Bloom sur des empreintes de lignes 64 bits : appartenance approchée
+    en mémoire constante (environ -ln(p) / ln(2)² bits par clé pour un taux de faux
+    positifs p). Une clé ajoutée est toujours retrouvée ; une clé absente peut être
+    signalée présente avec une probabilité proche de `taux_faux_positifs`, tant que
+    le nombre de clés ne dépasse pas `capacite`.
+
+    Les k positions d'une clé sont obtenues par double hachage : h + i * g(h),
+    avec g un mélange « splitmix64 » de l'empreinte.
+    """
+
+    def __init__(self, capacite: int = 10_000_000, taux_faux_positifs: float = 0.001):
+        """
+        Paramètres
+        ----------
+        capacite : int, default=10 000 000
+            Nombre de clés distinctes prévu.
+        taux_faux_positifs : float, default=0.001
+            Taux de faux positifs visé à pleine capacité.
+        """
+        if capacite < 1:
+            raise ValueError("`capacite` doit être supérieur ou égal à 1.")
+        if not 0 < taux_faux_positifs < 1:
+            raise ValueError("`taux_faux_positifs` doit être compris entre 0 et 1 (exclus).")
+        self.capacite = int(capacite)
+        self.taux_faux_positifs = float(taux_faux_positifs)
+        self.n_bits = max(8, math.ceil(-capacite * math.log(taux_faux_positifs) / math.log(2) ** 2))
+        self.n_hachages = max(1, round(self.n_bits / capacite * math.log(2)))
+        self.bits = np.zeros((self.n_bits + 7) // 8, dtype=np.uint8)
+        self.n = 0
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __repr__(self) -> str:
+        return (
+            f"FiltreBloom({self.n}/{self.capacite} clés, {self.bits.nbytes / 2**20:.1f} Mo, "
+            f"faux positifs ~{self.taux_estime():.2e})"
+        )
+
+    def _positions(self, empreintes: np.ndarray):
+        """
+        Positions des bits des clés, une fonction de hachage à la fois.
+        """
+        pas = melanger64(empreintes) | np.uint64(1)
+        m = np.uint64(self.n_bits)
+        for i in range(self.n_hachages):
+            yield (empreintes + np.uint64(i) * pas) % m
+
+    def contient(self, empreintes) -> np.ndarray:
+        """
+        Retourne un masque booléen : True pour les empreintes probablement présentes.
+        """
+        empreintes = _uint64(empreintes)
+        presentes = np.ones(len(empreintes), dtype=bool)
+        for positions in self._positions(empreintes):
+            octets = self.bits[positions >> np.uint64(3)]
+            presentes &= (octets >> (positions & np.uint64(7)).astype(np.uint8)) & 1 == 1
+        return presentes
+
+    def ajouter(self, empreintes) -> int:
+        """
+        Ajoute des empreintes. Retourne le nombre de clés nouvelles (estimé : une clé
+        confondue avec une clé existante n'est pas comptée).
+        """
+        empreintes = _distinctes(_uint64(empreintes))
+        nouvelles = empreintes[~self.contient(empreintes)]
+        for positions in self._positions(nouvelles):
+            masques = np.left_shift(np.uint8(1), (positions & np.uint64(7)).astype(np.uint8))
+            np.bitwise_or.at(self.bits, positions >> np.uint64(3), masques)
+        depassement = self.n <= self.capacite < self.n + len(nouvelles)
+        self.n += len(nouvelles)
+        if depassement:
+            journal.warning(
+                "Filtre de Bloom au-delà de sa capacité (%d clés) : le taux de faux positifs augmente.",
+                self.capacite,
+            )
+        return len(nouvelles)
+
+    def merge(self, autre: "FiltreBloom") -> "FiltreBloom":
+        """
+        Union avec un filtre de mêmes paramètres (même capacité et même taux).
+        """
+        if (autre.n_bits, autre.n_hachages) != (self.n_bits, self.n_hachages):
+            raise ValueError("Les filtres doivent avoir la même capacité et le même taux de faux positifs.")
+        self.bits |= autre.bits
+        self.n += autre.n
+        return self
+
+    def taux_estime(self) -> float:
+        """
+        Taux de faux positifs attendu pour le nombre de clés ajoutées.
+        """
+        return (1 - math.exp(-self.n_hachages * self.n / self.n_bits)) ** self.n_hachages
+
+    def sauvegarder(self, chemin: str) -> None:
+        """
+        Enregistre le filtre au format NumPy (.npz).
+        """
+        parametres = np.array([self.capacite, self.n_bits, self.n_hachages, self.n], dtype=np.int64)
+        try:
+            with open(chemin, "wb") as f:
+                np.savez(f, bits=self.bits, parametres=parametres, taux=np.float64(self.taux_faux_positifs))
+        except OSError as e:
+            raise IOError(f"Erreur lors de la sauvegarde du filtre de Bloom : {e}")
+
+    @classmethod
+    def charger(
+        cls,
+        chemin: str,
+        creer: bool = True,
+        capacite: int = 10_000_000,
+        taux_faux_positifs: float = 0.001,
+    ) -> "FiltreBloom":
+        """
+        Recharge un filtre enregistré par `sauvegarder`. Si le fichier n'existe pas et
+        `creer=True`, retourne un filtre vide de `capacite` et `taux_faux_positifs` donnés.
+        """
+        try:
+            with open(chemin, "rb") as f, np.load(f, allow_pickle=False) as archive:
+                bits = archive["bits"]
+                capacite_, n_bits, n_hachages, n = (int(v) for v in archive["parametres"])
+                taux = float(archive["taux"])
+        except FileNotFoundError:
+            if creer:
+                return cls(capacite, taux_faux_positifs)
+            raise IOError(f"Fichier de filtre de Bloom introuvable : {chemin}")
+        except (OSError, ValueError, KeyError) as e:
+            raise IOError(f"Erreur lors du chargement du filtre de Bloom : {e}")
+        filtre = cls.__new__(cls)
+        filtre.capacite, filtre.taux_faux_positifs = capacite_, taux
+        filtre.n_bits, filtre.n_hachages, filtre.n = n_bits, n_hachages, n
+        filtre.bits = bits
+        return filtre
+
+
+MagasinEmpreintes = Union[EmpreintesTriees, FiltreBloom]
@@ -0,0 +1,434 @@
+import json
+import logging
+import pickle
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from ..outils.instrumentation import compter, instrumenter
+from ..outils.statistiques import HyperLogLog, Moments, SpaceSaving, _natif
+
+journal = logging.getLogger(__name__)
+
+TYPES = ("booleen", "entier", "decimal", "pourcentage", "date", "texte")
+_BOOLEENS = {"true", "false", "vrai", "faux", "oui", "non", "yes", "no"}
+_DTYPES = {
+    "decimal": "float64",
+    "date": "datetime64[ns]",
+    "categorie": "category",
+    "texte": "string",
+}
+
+
+def _encoder(valeur: Any) -> Any:
+    """
+    Valeur sérialisable en JSON (les dates sont marquées pour être relues comme telles).
+    """
+    if isinstance(valeur, pd.Timestamp):
+        return {"date": valeur.isoformat()}
+    return _natif(valeur)
+
+
+def _decoder(valeur: Any) -> Any:
+    if isinstance(valeur, dict):
+        return pd.Timestamp(valeur["date"])
+    return valeur
+
+
+def _borner(actuelle, nouvelle, fonction):
+    if actuelle is None:
+        return nouvelle
+    try:
+        return fonction(actuelle, nouvelle)
+    except TypeError:
+        # Types non comparables d'un lot à l'autre : bornes comparées sous forme de texte.
+        return fonction(str(actuelle), str(nouvelle))
+
+
+class _ProfilColonne:
+    """
+    État cumulé d'une colonne : toutes les statistiques sont calculées à partir des
+    valeurs distinctes du lot et de leurs effectifs (une seule factorisation par lot).
+    """
+
+    def __init__(self, precision: int, capacite: int):
+        self.lignes = 0
+        self.manquantes = 0
+        self.dtypes: List[str] = []
+        self.types = dict.fromkeys(TYPES, 0)
+        self.moments = Moments()
+        self.distinctes = HyperLogLog(precision)
+        self.frequentes = SpaceSaving(capacite)
+        self.minimum = None
+        self.maximum = None
+
+    def update(self, s: pd.Series) -> None:
+        codes, uniques = pd.factorize(s)
+        presents = codes[codes >= 0]
+        effectifs = np.bincount(presents, minlength=len(uniques))
+        uniques = pd.Series(uniques)
+        self.lignes += len(codes)
+        self.manquantes += len(codes) - len(presents)
+        if str(s.dtype) not in self.dtypes:
+            self.dtypes.append(str(s.dtype))
+        if not len(uniques):
+            return
+
+        if pd.api.types.is_bool_dtype(uniques) or pd.api.types.is_numeric_dtype(uniques):
+            x = uniques.to_numpy(dtype=float, na_value=np.nan)
+            if pd.api.types.is_bool_dtype(uniques):
+                self.types["booleen"] += int(effectifs.sum())
+            else:
+                entiers = np.isfinite(x) & (x == np.floor(x))
+                self.types["entier"] += int(effectifs[entiers].sum())
+                self.types["decimal"] += int(effectifs[~entiers].sum())
+                self.moments.update(x, effectifs)
+            empreintes = pd.util.hash_array(x)
+            self._borner(uniques)
+        elif pd.api.types.is_datetime64_any_dtype(uniques):
+            self.types["date"] += int(effectifs.sum())
+            empreintes = pd.util.hash_array(np.asarray(uniques.astype(str), dtype=object))
+            self._borner(uniques)
+        else:
+            textes = uniques.astype(str)
+            nombres = self._types_texte(textes, effectifs)
+            empreintes = pd.util.hash_array(np.asarray(textes, dtype=object))
+            # Un nombre écrit en texte a l'empreinte de sa valeur numérique : "1" dans un lot
+            # lu en texte et 1 dans un lot lu en entiers comptent pour une seule valeur distincte.
+            numeriques = ~np.isnan(nombres)
+            empreintes[numeriques] = pd.util.hash_array(nombres[numeriques])
+            self._borner(textes)
+        self.distinctes.ajouter_empreintes(empreintes)
+        self.frequentes.ajouter_effectifs(uniques.to_numpy(dtype=object), effectifs)
+
+    def _types_texte(self, textes: pd.Series, effectifs: np.ndarray) -> np.ndarray:
+        """
+        Type de chaque valeur texte distincte, par ordre de priorité : booléen, entier,
+        décimal, pourcentage ("72.5%"), date ISO 8601, texte. Les valeurs numériques
+        (pourcentages compris) alimentent les moments.
+
+        Retourne la valeur des entiers et décimaux en float64 (NaN pour les autres).
+        """
+        t = textes.str.strip()
+        booleens = t.str.lower().isin(_BOOLEENS).to_numpy(dtype=bool)
+        nombres = pd.to_numeric(t, errors="coerce").to_numpy(dtype=float, na_value=np.nan, copy=True)
+        nombres[booleens] = np.nan
+        numeriques = ~np.isnan(nombres)
+        entiers = t.str.fullmatch(r"[+-]?\d+").to_numpy(dtype=bool) & numeriques
+        valeurs = np.where(numeriques, nombres, np.nan)
+        pourcentages = t.str.fullmatch(r"[+-]?\d+(?:\.\d+)?\s*%").to_numpy(dtype=bool)
+        nombres[pourcentages] = pd.to_numeric(t[pourcentages].str.rstrip("% "), errors="coerce")
+        reste = ~(booleens | numeriques | pourcentages)
+        # Seules les valeurs commençant comme une date ISO (AAAA-MM) sont analysées.
+        dates = np.zeros(len(t), dtype=bool)
+        candidates = reste & t.str.match(r"\d{4}-\d{2}").to_numpy(dtype=bool)
+        if candidates.any():
+            dates[candidates] = pd.to_datetime(t[candidates], errors="coerce", format="ISO8601").notna().to_numpy()
+
+        for nom, masque in (
+            ("booleen", booleens), ("entier", entiers), ("decimal", numeriques & ~entiers),
+            ("pourcentage", pourcentages), ("date", dates), ("texte", reste & ~dates),
+        ):
+            self.types[nom] += int(effectifs[masque].sum())
+        self.moments.update(nombres, effectifs)
+        return valeurs
+
+    def _borner(self, uniques: pd.Series) -> None:
+        try:
+            minimum, maximum = _natif(uniques.min()), _natif(uniques.max())
+        except TypeError:
+            # Valeurs non comparables entre elles (types Python mélangés) : comparées en texte.
+            textes = uniques.astype(str)
+            minimum, maximum = textes.min(), textes.max()
+        self.minimum = _borner(self.minimum, minimum, min)
+        self.maximum = _borner(self.maximum, maximum, max)
+
+    def merge(self, autre: "_ProfilColonne") -> None:
+        self.lignes += autre.lignes
+        self.manquantes += autre.manquantes
+        self.dtypes += [d for d in autre.dtypes if d not in self.dtypes]
+        for nom in TYPES:
+            self.types[nom] += autre.types[nom]
+        self.moments.merge(autre.moments)
+        self.distinctes.merge(autre.distinctes)
+        self.frequentes.merge(autre.frequentes)
+        if autre.minimum is not None:
+            self.minimum = _borner(self.minimum, autre.minimum, min)
+            self.maximum = _borner(self.maximum, autre.maximum, max)
+
+    def type_infere(self, tolerance: float, seuil_categorie: float) -> str:
+        renseignees = self.lignes - self.manquantes
+        if not renseignees:
+            return "vide"
+        minimum = (1 - tolerance) * renseignees
+        t = self.types
+        for nom, effectif in (
+            ("booleen", t["booleen"]),
+            ("entier", t["entier"]),
+            ("decimal", t["entier"] + t["decimal"]),
+            ("pourcentage", t["pourcentage"]),
+            ("date", t["date"]),
+        ):
+            if effectif and effectif >= minimum:
+                return nom
+        return "categorie" if self.n_distinctes() <= seuil_categorie * renseignees else "texte"
+
+    def n_distinctes(self) -> int:
+        # Estimation bornée par le nombre de valeurs renseignées.
+        return min(int(round(self.distinctes.estimation())), self.lignes - self.manquantes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        frequentes = self.frequentes.to_dict()
+        frequentes["compteurs"] = [[_encoder(v), c, e] for v, c, e in frequentes["compteurs"]]
+        return {
+            "lignes": self.lignes,
+            "manquantes": self.manquantes,
+            "dtypes": self.dtypes,
+            "types": self.types,
+            "moments": self.moments.to_dict(),
+            "distinctes": self.distinctes.to_dict(),
+            "frequentes": frequentes,
+            "minimum": _encoder(self.minimum),
+            "maximum": _encoder(self.maximum),
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "_ProfilColonne":
+        profil = cls.__new__(cls)
+        profil.lignes, profil.manquantes = d["lignes"], d["manquantes"]
+        profil.dtypes, profil.types = list(d["dtypes"]), dict(d["types"])
+        profil.moments = Moments.from_dict(d["moments"])
+        profil.distinctes = HyperLogLog.from_dict(d["distinctes"])
+        frequentes = dict(d["frequentes"])
+        frequentes["compteurs"] = [[_decoder(v), c, e] for v, c, e in frequentes["compteurs"]]
+        profil.frequentes = SpaceSaving.from_dict(frequentes)
+        profil.minimum, profil.maximum = _decoder(d["minimum"]), _decoder(d["maximum"])
+        return profil
+
+
+class ProfilColonnes:
+    """
+    Profil des colonnes d'un jeu de données en une seule passe par lot : valeurs
+    manquantes, nombre de valeurs distinctes (HyperLogLog), minimum et maximum,
+    moyenne et écart-type (Welford), valeurs les plus fréquentes (Space-Saving)
+    et type inféré.
+
+    L'état est borné en mémoire (~16 Ko et `capacite` compteurs par colonne) et
+    fusionnable : un profil peut être cumulé lot par lot (`update`), calculé dans
+    plusieurs processus puis réuni (`merge`), et enregistré (`sauvegarder`).
+
+    Une colonne lue en texte dans un lot et en nombres dans un autre (ex: lots CSV)
+    garde un décompte de valeurs distinctes cohérent : un nombre écrit en texte compte
+    comme sa valeur ("1", "1.0" et 1 ne font qu'une valeur ; "007" et 7 aussi). Les
+    valeurs fréquentes restent en revanche sous leur forme lue : "1" et 1 y sont suivies
+    séparément.
+
+    Exemple
+    -------
+    >>> profil = ProfilColonnes.profiler(ExtractionCSV.extract_csv("cocoa.csv", taille_chunk=100_000))
+    >>> profil.rapport()
+    >>> df = df.astype(profil.dtypes_suggeres(colonnes=["REF", "Company"]))
+    """
+
+    def __init__(
+        self,
+        colonnes: Optional[Union[str, List[str]]] = None,
+        *,
+        precision: int = 14,
+        capacite: int = 64,
+        k: int = 10,
+    ):
+        """
+        Paramètres
+        ----------
+        colonnes : str | list, optionnel
+            Colonnes à profiler. Par défaut, toutes celles rencontrées.
+        precision : int, default=14
+            Précision HyperLogLog (2**precision registres par colonne, erreur ~0.8 %).
+        capacite : int, default=64
+            Nombre de valeurs fréquentes suivies par colonne.
+        k : int, default=10
+            Nombre de valeurs fréquentes reportées dans le rapport.
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError("`precision` doit être comprise entre 4 et 18.")
+        if not 1 <= k <= capacite:
+            raise ValueError("`k` doit être compris entre 1 et `capacite`.")
+        self.colonnes = [colonnes] if isinstance(colonnes, str) else colonnes
+        self.precision = precision
+        self.capacite = capacite
+        self.k = k
+        self.profils: Dict[Any, _ProfilColonne] = {}
+
+    def __repr__(self) -> str:
+        lignes = max((p.lignes for p in self.profils.values()), default=0)
+        return f"ProfilColonnes({len(self.profils)} colonnes, {lignes} lignes)"
+
+    @instrumenter()
+    def update(self, df: pd.DataFrame) -> "ProfilColonnes":
+        """
+        Cumule un lot (DataFrame) au profil.
+        """
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("`df` doit être un pandas.DataFrame.")
+        colonnes = df.columns if self.colonnes is None else self.colonnes
+        absentes = [c for c in colonnes if c not in df.columns]
+        if absentes:
+            raise ValueError(f"Colonnes absentes du DataFrame : {absentes}")
+        for c in colonnes:
+            profil = self.profils.get(c)
+            if profil is None:
+                profil = self.profils[c] = _ProfilColonne(self.precision, self.capacite)
+            profil.update(df[c])
+        compter(lignes_profilees=len(df))
+        return self
+
+    def merge(self, autre: "ProfilColonnes") -> "ProfilColonnes":
+        """
+        Ajoute un profil calculé sur d'autres lots (ex: dans un autre processus).
+        """
+        if (autre.precision, autre.capacite) != (self.precision, self.capacite):
+            raise ValueError("Les profils doivent avoir la même `precision` et la même `capacite`.")
+        for c, profil in autre.profils.items():
+            if c in self.profils:
+                self.profils[c].merge(profil)
+            else:
+                self.profils[c] = _ProfilColonne.from_dict(profil.to_dict())
+        return self
+
+    @staticmethod
+    def profiler(source: Union[pd.DataFrame, Iterable[pd.DataFrame]], **options) -> "ProfilColonnes":
+        """
+        Profile un DataFrame ou une suite de lots (ex: extraction par morceaux),
+        sans conserver les lots. `options` : paramètres de `ProfilColonnes`.
+        """
+        profil = ProfilColonnes(**options)
+        for lot in [source] if isinstance(source, pd.DataFrame) else source:
+            profil.update(lot)
+        return profil
+
+    def types_inferes(self, tolerance: float = 0.0, seuil_categorie: float = 0.5) -> Dict[Any, str]:
+        """
+        Type inféré de chaque colonne : 'booleen', 'entier', 'decimal', 'pourcentage',
+        'date', 'categorie', 'texte' ou 'vide' (aucune valeur renseignée).
+
+        Paramètres
+        ----------
+        tolerance : float, default=0.0
+            Part des valeurs renseignées qui peut ne pas être du type retenu
+            (ex: 0.01 pour une colonne numérique avec quelques saisies erronées).
+        seuil_categorie : float, default=0.5
+            Une colonne texte est 'categorie' si son nombre de valeurs distinctes
+            ne dépasse pas cette part des valeurs renseignées.
+        """
+        if not 0 <= tolerance < 1:
+            raise ValueError("`tolerance` doit être comprise entre 0 (inclus) et 1 (exclu).")
+        return {c: p.type_infere(tolerance, seuil_categorie) for c, p in self.profils.items()}
+
+    def dtypes_suggeres(
+        self,
+        colonnes: Optional[List[str]] = None,
+        tolerance: float = 0.0,
+        seuil_categorie: float = 0.5,
+    ) -> Dict[Any, str]:
+        """
+        Types pandas correspondant aux types inférés, pour `DataFrame.astype` ou
+        `TypeColonne.changer_type_colonne` : entier -> 'int64' ('Int64' avec des valeurs
+        manquantes), booleen -> 'bool' ('boolean'), decimal -> 'float64', date -> 'datetime64[ns]',
+        categorie -> 'category', texte -> 'string'.
+
+        Les colonnes 'vide', 'pourcentage' et les booléens en texte ("oui"/"non") sont
+        omis (les pourcentages en texte se convertissent avec
+        `RemplacementColonne.remplacer_valeurs`). Avec `tolerance > 0`,
+        les valeurs non conformes empêchent `astype` : passer par `pd.to_numeric(errors="coerce")`.
+        """
+        types = self.types_inferes(tolerance, seuil_categorie)
+        dtypes = {}
+        for c in types if colonnes is None else colonnes:
+            if c not in types:
+                raise ValueError(f"Colonne '{c}' absente du profil.")
+            # Types pandas « nullables » seulement si la colonne a des valeurs manquantes.
+            if types[c] == "entier":
+                dtypes[c] = "Int64" if self.profils[c].manquantes else "int64"
+            elif types[c] == "booleen":
+                # `astype(bool)` sur du texte donnerait True pour "non" : colonnes déjà booléennes seulement.
+                if all("bool" in d for d in self.profils[c].dtypes):
+                    dtypes[c] = "boolean" if self.profils[c].manquantes else "bool"
+            elif types[c] in _DTYPES:
+                dtypes[c] = _DTYPES[types[c]]
+        return dtypes
+
+    def rapport(self, tolerance: float = 0.0, seuil_categorie: float = 0.5) -> pd.DataFrame:
+        """
+        Une ligne par colonne : colonne, dtype, type_infere, lignes, manquantes,
+        taux_manquantes, distinctes (estimation), min, max, moyenne, ecart_type,
+        frequentes (liste de (valeur, effectif) ; effectif surestimé d'au plus
+        l'erreur du résumé lorsque le nombre de valeurs distinctes dépasse `capacite`).
+        """
+        types = self.types_inferes(tolerance, seuil_categorie)
+        lignes = []
+        for c, p in self.profils.items():
+            numerique = types[c] in ("entier", "decimal", "pourcentage") and p.moments.n
+            lignes.append({
+                "colonne": c,
+                "dtype": " | ".join(p.dtypes),
+                "type_infere": types[c],
+                "lignes": p.lignes,
+                "manquantes": p.manquantes,
+                "taux_manquantes": p.manquantes / p.lignes if p.lignes else np.nan,
+                "distinctes": p.n_distinctes(),
+                "min": p.moments.min if numerique else p.minimum,
+                "max": p.moments.max if numerique else p.maximum,
+                "moyenne": p.moments.moyenne if numerique else np.nan,
+                "ecart_type": p.moments.ecart_type(ddof=1) if numerique else np.nan,
+                "frequentes": [(v, e) for v, e, _ in p.frequentes.top(self.k)],
+            })
+        return pd.DataFrame(lignes)
+
+    # ------------------------------------------------------------------
+    # Persistance
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "parametres": {"colonnes": self.colonnes, "precision": self.precision,
+                           "capacite": self.capacite, "k": self.k},
+            "profils": [[c, p.to_dict()] for c, p in self.profils.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "ProfilColonnes":
+        profil = cls(**d["parametres"])
+        profil.profils = {c: _ProfilColonne.from_dict(p) for c, p in d["profils"]}
+        return profil
+
+    def sauvegarder(self, chemin: str) -> None:
+        """
+        Enregistre le profil : JSON si `chemin` se termine par '.json', pickle sinon.
+        """
+        try:
+            if chemin.endswith(".json"):
+                with open(chemin, "w", encoding="utf-8") as f:
+                    json.dump(self.to_dict(), f, ensure_ascii=False)
+            else:
+                with open(chemin, "wb") as f:
+                    pickle.dump(self, f)
+        except (OSError, TypeError) as e:
+            raise IOError(f"Erreur lors de la sauvegarde du profil : {e}")
+
+    @classmethod
+    def charger(cls, chemin: str) -> "ProfilColonnes":
+        """
+        Recharge un profil enregistré par `sauvegarder`.
+        """
+        try:
+            if chemin.endswith(".json"):
+                with open(chemin, encoding="utf-8") as f:
+                    return cls.from_dict(json.load(f))
+            with open(chemin, "rb") as f:
+                profil = pickle.load(f)
+        except OSError as e:
+            raise IOError(f"Erreur lors du chargement du profil : {e}")
+        if not isinstance(profil, cls):
+            raise TypeError(f"Le fichier ne contient pas un {cls.__name__}.")
+        return profil
@@ -0,0 +1,354 @@
+import functools
+import logging
+import numpy as np
+import pandas as pd
+from typing import Dict, Tuple, Union
+
+from ..outils.instrumentation import compter, instrumenter
+from .empreintes import melanger64
+
+journal = logging.getLogger(__name__)
+
+# Nombre de chaînes traitées ensemble pour les signatures (mémoire : lignes x n-grammes x 8 octets).
+_TAILLE_BLOC = 4096
+# Comparaisons de n-grammes par lot lors de la vérification des paires candidates.
+_ELEMENTS_LOT = 2**24
+_ABSENT = np.uint64(2**64 - 1)
+_integrer = getattr(np, "trapezoid", None) or np.trapz
+
+
+def _normaliser(valeurs: pd.Series) -> pd.Series:
+    """
+    Minuscules, accents retirés, espaces réduits : "  Amédéi " -> "amedei".
+    """
+    return (
+        valeurs.str.normalize("NFKD")
+        .str.replace("[\u0300-\u036f]", "", regex=True)
+        .str.lower()
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _parametres_lsh(seuil: float, n_permutations: int) -> Tuple[int, int]:
+    """
+    Choisit (bandes, lignes par bande) minimisant la somme des probabilités de faux
+    positifs (similarité < seuil) et de faux négatifs (similarité >= seuil) d'une paire.
+    """
+    s = np.linspace(0, 1, 201)
+    meilleur, parametres = np.inf, (n_permutations, 1)
+    for bandes in range(1, n_permutations + 1):
+        lignes = n_permutations // bandes
+        candidate = 1 - (1 - s ** lignes) ** bandes
+        erreur = _integrer(np.where(s < seuil, candidate, 1 - candidate), s)
+        if erreur < meilleur:
+            meilleur, parametres = erreur, (bandes, lignes)
+    return parametres
+
+
+def _signatures(
+    textes: np.ndarray,
+    longueurs: np.ndarray,
+    n_gram: int,
+    n_permutations: int,
+    graine: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Signatures MinHash (une ligne par chaîne) des ensembles de n-grammes de caractères,
+    et ces ensembles eux-mêmes, stockés à plat pour la vérification exacte.
+
+    Les n-grammes sont codés directement depuis les points de code (tableau NumPy UTF-32),
+    sans boucle Python par chaîne : 21 bits par caractère, donc sans collision pour
+    n_gram <= 3 (la vérification par Jaccard est exacte) ; une chaîne plus courte que `n_gram` forme un seul n-gramme.
+    Chaque permutation est une fonction affine modulo 2**64 d'un mélange du code du n-gramme.
+
+    Retour
+    ------
+    (signatures, grammes, debuts, tailles) : n-grammes distincts et triés de la chaîne i
+    dans grammes[debuts[i]:debuts[i] + tailles[i]].
+    """
+    rng = np.random.default_rng(graine)
+    a = rng.integers(0, 2**63, n_permutations, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+    b = rng.integers(0, 2**63, n_permutations, dtype=np.uint64)
+    signatures = np.empty((len(textes), n_permutations), dtype=np.uint64)
+    debuts = np.empty(len(textes), dtype=np.int64)
+    tailles = np.empty(len(textes), dtype=np.int64)
+    ensembles = []
+    position = 0
+
+    ordre = np.argsort(longueurs, kind="stable")
+    for debut in range(0, len(ordre), _TAILLE_BLOC):
+        indices = ordre[debut:debut + _TAILLE_BLOC]
+        bloc = np.asarray(textes[indices], dtype=str)
+        largeur = max(bloc.dtype.itemsize // 4, 1)
+        n_fenetres = max(largeur - n_gram + 1, 1)
+        points = np.zeros((len(bloc), n_fenetres + n_gram - 1), dtype=np.uint64)
+        points[:, :largeur] = bloc.view(np.uint32).reshape(len(bloc), largeur)
+
+        codes = np.zeros((len(bloc), n_fenetres), dtype=np.uint64)
+        for t in range(n_gram):
+            codes = codes * np.uint64(1 << 21) + points[:, t:t + n_fenetres]
+        valides = np.arange(n_fenetres) < np.maximum(longueurs[indices] - n_gram + 1, 1)[:, None]
+
+        # Ensembles : n-grammes triés, positions invalides et répétitions écartées.
+        triees = np.sort(np.where(valides, codes, _ABSENT), axis=1)
+        triees[:, 1:][triees[:, 1:] == triees[:, :-1]] = _ABSENT
+        gardes = triees != _ABSENT
+        tailles[indices] = gardes.sum(axis=1)
+        debuts[indices] = position + np.cumsum(tailles[indices]) - tailles[indices]
+        ensembles.append(triees[gardes])
+        position += len(ensembles[-1])
+
+        # Positions au-delà de la fin de la chaîne : remplacées par le premier n-gramme,
+        # sans effet sur le minimum.
+        melanges = melanger64(codes)
+        melanges = np.where(valides, melanges, melanges[:, :1])
+        for i in range(n_permutations):
+            signatures[indices, i] = (melanges * a[i] + b[i]).min(axis=1)
+    return signatures, np.concatenate(ensembles), debuts, tailles
+
+
+def _jaccard(
+    paires: np.ndarray,
+    n: int,
+    grammes: np.ndarray,
+    debuts: np.ndarray,
+    tailles: np.ndarray,
+) -> np.ndarray:
+    """
+    Similarité de Jaccard exacte des ensembles de n-grammes de chaque paire candidate,
+    par lots de paires de tailles voisines (comparaison de tous les n-grammes deux à deux).
+    """
+    i, j = np.divmod(paires, n)
+    ti, tj = tailles[i], tailles[j]
+    largeurs = np.maximum(ti, tj)
+    ordre = np.argsort(largeurs, kind="stable")
+    similarites = np.empty(len(paires))
+    debut = 0
+    while debut < len(ordre):
+        largeur = int(largeurs[ordre[debut]])
+        fin = debut + max(1, _ELEMENTS_LOT // largeur ** 2)
+        lot = ordre[debut:fin]
+        largeur = int(largeurs[lot].max())
+        colonnes = np.arange(largeur)
+        # Valeurs de remplissage distinctes des deux côtés : elles ne se rencontrent jamais.
+        gauche = np.where(colonnes < ti[lot, None],
+                          grammes[np.minimum(debuts[i[lot], None] + colonnes, len(grammes) - 1)], _ABSENT)
+        droite = np.where(colonnes < tj[lot, None],
+                          grammes[np.minimum(debuts[j[lot], None] + colonnes, len(grammes) - 1)], _ABSENT - 1)
+        communs = (gauche[:, :, None] == droite[:, None, :]).sum(axis=(1, 2))
+        similarites[lot] = communs / (ti[lot] + tj[lot] - communs)
+        debut = fin
+    return similarites
+
+
+def _paires_candidates(signatures: np.ndarray, bandes: int, lignes: int) -> np.ndarray:
+    """
+    Paires (i, j), i < j, de chaînes partageant au moins une bande de signature identique.
+    Retourne un tableau int64 de codes i * n + j, triés et distincts.
+    """
+    n = len(signatures)
+    codes = []
+    for bande in range(bandes):
+        cles = np.zeros(n, dtype=np.uint64)
+        for colonne in range(bande * lignes, (bande + 1) * lignes):
+            cles = melanger64(cles ^ signatures[:, colonne])
+        ordre = np.argsort(cles, kind="stable")
+        triees = cles[ordre]
+        # Pour chaque position d'un seau, nombre d'éléments suivants dans le même seau.
+        debuts = np.flatnonzero(np.concatenate(([True], triees[1:] != triees[:-1])))
+        tailles = np.diff(np.append(debuts, n))
+        fins = np.repeat(debuts + tailles, tailles)
+        suivants = fins - np.arange(n) - 1
+        total = int(suivants.sum())
+        if not total:
+            continue
+        gauche = np.repeat(np.arange(n), suivants)
+        decalages = np.repeat(np.cumsum(suivants) - suivants, suivants)
+        droite = gauche + 1 + (np.arange(total) - decalages)
+        i, j = ordre[gauche], ordre[droite]
+        codes.append(np.minimum(i, j).astype(np.int64) * n + np.maximum(i, j))
+    if not codes:
+        return np.empty(0, dtype=np.int64)
+    codes = np.sort(np.concatenate(codes))
+    return codes[np.concatenate(([True], codes[1:] != codes[:-1]))]
+
+
+def _composantes(similaires: np.ndarray, n: int) -> np.ndarray:
+    """
+    Groupes = composantes connexes du graphe des paires similaires (liaison simple).
+    """
+    # scipy est installé avec scikit-learn.
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+
+    if not len(similaires):
+        return np.arange(n)
+    i, j = np.divmod(similaires, n)
+    graphe = coo_matrix((np.ones(len(similaires), dtype=np.int8), (i, j)), shape=(n, n))
+    return connected_components(graphe, directed=False)[1]
+
+
+def _centres(similaires: np.ndarray, n: int, effectifs: np.ndarray) -> np.ndarray:
+    """
+    Groupes en étoile : par effectif décroissant, chaque valeur non encore groupée devient
+    un centre et rassemble ses voisines similaires non groupées. Sans chaînage : chaque
+    valeur d'un groupe est similaire à son centre, la graphie la plus fréquente.
+    """
+    i, j = np.divmod(similaires, n)
+    origines = np.concatenate((i, j))
+    voisines = np.concatenate((j, i))
+    ordre = np.argsort(origines, kind="stable")
+    origines, voisines = origines[ordre], voisines[ordre]
+    bornes = np.searchsorted(origines, np.arange(n + 1))
+
+    groupes = np.full(n, -1)
+    for centre in np.argsort(-effectifs, kind="stable"):
+        if groupes[centre] >= 0:
+            continue
+        groupes[centre] = centre
+        candidates = voisines[bornes[centre]:bornes[centre + 1]]
+        groupes[candidates[groupes[candidates] < 0]] = centre
+    return groupes
+
+
+class QuasiDoublons:
+    """
+    Détection de quasi-doublons dans une colonne texte (variantes d'orthographe,
+    d'espaces, de casse ou d'accents : "Amedei" / "Amedei " / "Amédei").
+
+    Les valeurs sont normalisées puis comparées par similarité de Jaccard de leurs
+    n-grammes de caractères. Pour éviter de comparer toutes les paires (O(n²)) :
+
+    1. seules les valeurs distinctes sont traitées ;
+    2. chaque valeur reçoit une signature MinHash ; la signature est découpée en bandes
+       et deux valeurs ne sont candidates que si elles partagent une bande (LSH) ;
+    3. la similarité exacte n'est calculée que pour les paires candidates ;
+    4. les paires au-dessus du seuil sont regroupées : autour des graphies les plus
+       fréquentes (par défaut) ou par composantes connexes.
+
+    Le coût est proportionnel au nombre de lignes (factorisation) et au nombre de
+    valeurs distinctes (signatures), plus le nombre de paires candidates.
+    La détection est probabiliste : une paire au-dessus du seuil peut, rarement,
+    ne pas être candidate (augmenter `n_permutations` réduit ce risque).
+    """
+
+    @staticmethod
+    @instrumenter("QuasiDoublons.grouper")
+    def grouper(
+        df: pd.DataFrame,
+        colonne: str,
+        seuil: float = 0.5,
+        *,
+        n_gram: int = 2,
+        n_permutations: int = 128,
+        normaliser: bool = True,
+        liaison: str = "centre",
+        graine: int = 0,
+        detail: bool = False,
+    ) -> Union[pd.Series, Tuple[pd.Series, Dict[str, float]]]:
+        """
+        Attribue un identifiant de groupe à chaque ligne : les lignes dont les valeurs
+        sont des quasi-doublons partagent le même identifiant.
+
+        Paramètres
+        ----------
+        df : pd.DataFrame
+            Jeu de données.
+        colonne : str
+            Colonne texte à examiner (ex: "Company").
+        seuil : float, default=0.5
+            Similarité de Jaccard minimale entre les ensembles de n-grammes de deux valeurs
+            (bordées d'un espace). Avec les bigrammes, "Valrhona" / "Valhrona" : 0.5,
+            "Bonnat" / "Bonat" : 0.86.
+        n_gram : int, default=2
+            Taille des n-grammes de caractères, de 1 à 3 (codés exactement sur 64 bits).
+            Les bigrammes tolèrent mieux les fautes de frappe dans les noms courts ;
+            3 est plus sélectif sur des textes longs.
+        n_permutations : int, default=128
+            Taille des signatures MinHash ; le découpage en bandes est choisi selon `seuil`.
+        normaliser : bool, default=True
+            Si True, comparaison sans casse, accents ni espaces superflus
+            (des valeurs identiques après normalisation sont toujours groupées).
+        liaison : {'centre', 'simple'}, default='centre'
+            - 'centre' : chaque groupe réunit une graphie (la plus fréquente d'abord) et ses
+              variantes similaires ; deux valeurs d'un même groupe peuvent être peu similaires
+              entre elles, mais le sont chacune au centre.
+            - 'simple' : composantes connexes (similarité transitive) ; sur des valeurs proches
+              les unes des autres, les chaînes de paires similaires peuvent former de très grands groupes.
+        graine : int, default=0
+            Graine des permutations MinHash.
+        detail : bool, default=False
+            Si True, retourne aussi les statistiques d'élagage.
+
+        Retour
+        ------
+        pd.Series | (pd.Series, dict)
+            Identifiants de groupe (entiers à partir de 0, dans l'ordre de première
+            apparition ; -1 pour les valeurs manquantes), alignés sur `df.index`.
+            Avec `detail=True`, statistiques : valeurs_distinctes, paires_possibles,
+            paires_candidates, paires_similaires, taux_elagage (part des paires non comparées).
+        """
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("`df` doit être un pandas.DataFrame.")
+        if colonne not in df.columns:
+            raise ValueError(f"Colonne '{colonne}' inexistante dans le DataFrame.")
+        if not 0 < seuil <= 1:
+            raise ValueError("`seuil` doit être compris entre 0 (exclu) et 1.")
+        if liaison not in ("centre", "simple"):
+            raise ValueError(f"Liaison '{liaison}' non supportée. Choisir parmi ['centre', 'simple'].")
+        if not 1 <= n_gram <= 3:
+            # Un n-gramme est codé sans perte sur 64 bits (21 bits par point de code).
+            raise ValueError("`n_gram` doit être compris entre 1 et 3.")
+        if n_permutations < 1:
+            raise ValueError("`n_permutations` doit être supérieur ou égal à 1.")
+
+        codes, valeurs = pd.factorize(df[colonne])
+        textes = pd.Series(np.asarray(valeurs, dtype=object)).astype(str)
+        if normaliser:
+            textes = _normaliser(textes)
+        # Valeurs identiques après normalisation : une seule valeur distincte.
+        codes_normalises, textes = pd.factorize(textes)
+        # Espaces de bordure : les débuts et fins de mots forment aussi des n-grammes.
+        textes = np.asarray(" " + pd.Series(textes, dtype=object) + " ", dtype=object)
+        n = len(textes)
+
+        paires = np.empty(0, dtype=np.int64)
+        similaires = np.empty(0, dtype=np.int64)
+        if n > 1:
+            longueurs = pd.Series(textes).str.len().to_numpy()
+            signatures, grammes, debuts, tailles = _signatures(textes, longueurs, n_gram, n_permutations, graine)
+            bandes, lignes = _parametres_lsh(seuil, n_permutations)
+            paires = _paires_candidates(signatures, bandes, lignes)
+            # Tolérance d'arrondi : une similarité égale au seuil est retenue.
+            similaires = paires[_jaccard(paires, n, grammes, debuts, tailles) >= seuil - 1e-12]
+
+        presentes = codes >= 0
+        normalises = codes_normalises[codes[presentes]]
+        if liaison == "centre":
+            composantes = _centres(similaires, n, np.bincount(normalises, minlength=n))
+        else:
+            composantes = _composantes(similaires, n)
+
+        par_ligne = np.full(len(codes), -1)
+        par_ligne[presentes] = composantes[normalises]
+        groupes = np.full(len(codes), -1)
+        groupes[presentes] = pd.factorize(par_ligne[presentes])[0]
+        resultat = pd.Series(groupes, index=df.index, name=f"{colonne}_groupe")
+
+        statistiques = {
+            "valeurs_distinctes": n,
+            "paires_possibles": n * (n - 1) // 2,
+            "paires_candidates": len(paires),
+            "paires_similaires": len(similaires),
+            "taux_elagage": 1 - len(paires) / (n * (n - 1) // 2) if n > 1 else 1.0,
+        }
+        compter(paires_candidates=len(paires), paires_similaires=len(similaires))
+        journal.info(
+            "%s : %d valeurs distinctes, %d paires candidates sur %d (élagage %.4f), %d paires similaires.",
+            colonne, n, len(paires), statistiques["paires_possibles"], statistiques["taux_elagage"], len(similaires),
+        )
+        if detail:
+            return resultat, statistiques
+        return resultat
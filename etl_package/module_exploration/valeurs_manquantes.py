@@ -1,11 +1,17 @@
+import logging
 import pandas as pd
 
+from ..outils.instrumentation import compter, instrumenter
+
+journal = logging.getLogger(__name__)
+
 class ValeurManquante:
     """
     Classe pour calculer les valeurs manquantes dans un DataFrame.
     """
 
     @staticmethod
+    @instrumenter("ValeurManquante.calcul_valeur_manquante")
     def calcul_valeur_manquante(df: pd.DataFrame, detail: bool = False):
         """
         Calcule le nombre de valeurs manquantes.
@@ -27,15 +33,17 @@ class ValeurManquante:
             raise ValueError("df doit être un DataFrame pandas")
 
         if df.empty:
-            print("Le DataFrame spécifié est vide")
+            journal.warning("Le DataFrame spécifié est vide")
             return pd.DataFrame()
 
         if detail:
             res = df.isnull().sum().reset_index()
             res.columns = ["colonne", "nbre_valeurs_manquantes"]
+            compter(valeurs_manquantes=res["nbre_valeurs_manquantes"].sum())
             return res[res["nbre_valeurs_manquantes"] > 0]
 
         total = int(df.isnull().sum().sum())
+        compter(valeurs_manquantes=total)
         if total == 0:
-            print("Le DataFrame ne contient pas de valeurs manquantes")
+            journal.info("Le DataFrame ne contient pas de valeurs manquantes")
         return total
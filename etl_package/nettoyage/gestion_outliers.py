@@ -1,36 +1,53 @@
 
 
+import logging
+import warnings
 import pandas as pd
 import numpy as np
-from typing import Literal
+from typing import Any, Dict, List, Literal, Union
+
+from ..outils.ajustable import TransformateurAjuste
+from ..outils.colonnes import resoudre_colonnes
+from ..outils.copie import Copie, copier
+from ..outils.instrumentation import compter, est_active, instrumenter
+from ..outils.statistiques import Moments, Quantiles
+
+journal = logging.getLogger(__name__)
 
 
 class GestionOutliers:
     Strategy = Literal["remove", "winsorize", "median", "mean", "log", "flag"]
 
     @staticmethod
-
+    @instrumenter("GestionOutliers.gerer_outliers")
     def gerer_outliers(
         df: pd.DataFrame,
-        colonne: str,
+        colonne: str | List[str] | Any,
         strategie: Strategy = "remove",
         *,
         inplace: bool = False,
         seuil: float = 1.5,
+        copie: Copie = "auto",
     ) -> pd.DataFrame:
         
         if not isinstance(df, pd.DataFrame):
             raise TypeError("`df` doit être un pandas.DataFrame.")
-        if colonne not in df.columns:
-            raise ValueError(f"La colonne '{colonne}' est absente du DataFrame.")
-        if not np.issubdtype(df[colonne].dtype, np.number):
+        if not (isinstance(colonne, str) and colonne in df.columns):
+            # Liste de colonnes ou sélecteur de types (ex: "number") : traitement en bloc.
+            return GestionOutliers._gerer_bloc(
+                df, resoudre_colonnes(df, colonne, numeriques=True), strategie,
+                inplace=inplace, seuil=seuil, copie=copie,
+            )
+        # Même règle que `resoudre_colonnes` : types nullables (Int64...) acceptés, booléens refusés.
+        if not pd.api.types.is_numeric_dtype(df[colonne]) or pd.api.types.is_bool_dtype(df[colonne]):
             raise TypeError(f"La colonne '{colonne}' doit être numérique.")
 
        
-        if inplace:
+        # 'remove' sans inplace filtre les lignes de `df` : une copie préalable serait perdue.
+        if inplace or strategie == "remove":
             df_out = df
         else:
-            df_out = df.copy()
+            df_out = copier(df, copie)
 
        
         Q1 = df_out[colonne].quantile(0.25)
@@ -40,8 +57,12 @@ class GestionOutliers:
         borne_sup = Q3 + seuil * IQR
 
        
-        is_outlier = (df_out[colonne] < borne_inf) | (df_out[colonne] > borne_sup)
+        # Valeurs en float64 (NA -> NaN) : une valeur manquante n'est jamais un outlier,
+        # y compris pour les types nullables (Int64, Float64).
+        valeurs = df_out[colonne].to_numpy(dtype="float64", na_value=np.nan)
+        is_outlier = pd.Series((valeurs < borne_inf) | (valeurs > borne_sup), index=df_out.index)
         n_outliers = int(is_outlier.sum())
+        compter(outliers=n_outliers)
 
         if strategie == "remove":
             if inplace:
@@ -49,47 +70,205 @@ class GestionOutliers:
                     
                     indices = df_out.index[is_outlier]
                     df.drop(index=indices, inplace=True)
-                    print(f"{colonne}: outliers supprimés (n={n_outliers}).")
+                    journal.info("%s: outliers supprimés (n=%d).", colonne, n_outliers)
                 else:
-                    print(f"{colonne}: aucun outlier à supprimer.")
+                    journal.info("%s: aucun outlier à supprimer.", colonne)
                 return df  
             else:
                 df_filtered = df_out.loc[~is_outlier].copy()
-                print(f"{colonne}: outliers supprimés (n={n_outliers}).")
+                journal.info("%s: outliers supprimés (n=%d).", colonne, n_outliers)
                 return df_filtered
 
         elif strategie == "winsorize":
             df_out[colonne] = np.where(
-                df_out[colonne] > borne_sup,
+                valeurs > borne_sup,
                 borne_sup,
-                np.where(df_out[colonne] < borne_inf, borne_inf, df_out[colonne]),
+                np.where(valeurs < borne_inf, borne_inf, valeurs),
             )
-            print(f"{colonne}: valeurs extrêmes winsorisées (n={n_outliers}).")
+            journal.info("%s: valeurs extrêmes winsorisées (n=%d).", colonne, n_outliers)
             return df_out
 
         elif strategie == "median":
             median = df_out[colonne].median()
-            df_out[colonne] = np.where(is_outlier, median, df_out[colonne])
-            print(f"{colonne}: outliers remplacés par la médiane (n={n_outliers}).")
+            df_out[colonne] = np.where(is_outlier, median, valeurs)
+            journal.info("%s: outliers remplacés par la médiane (n=%d).", colonne, n_outliers)
             return df_out
 
         elif strategie == "mean":
             mean = df_out[colonne].mean()
-            df_out[colonne] = np.where(is_outlier, mean, df_out[colonne])
-            print(f" {colonne}: outliers remplacés par la moyenne (n={n_outliers}).")
+            df_out[colonne] = np.where(is_outlier, mean, valeurs)
+            journal.info("%s: outliers remplacés par la moyenne (n=%d).", colonne, n_outliers)
             return df_out
 
         elif strategie == "log":
            
             df_out[colonne] = np.log1p(df_out[colonne].clip(lower=0))
-            print(f"{colonne}: transformation log appliquée.")
+            journal.info("%s: transformation log appliquée.", colonne)
             return df_out
 
         elif strategie == "flag":
             flag_col = f"{colonne}_outlier_flag"
             df_out[flag_col] = is_outlier.astype(int)
-            print(f"{colonne}: indicateur binaire '{flag_col}' ajouté (n={n_outliers}).")
+            journal.info("%s: indicateur binaire '%s' ajouté (n=%d).", colonne, flag_col, n_outliers)
             return df_out
 
         else:
             raise ValueError("Stratégie invalide. Choisir: remove, winsorize, median, mean, log, flag.")
+
+    @staticmethod
+    def _gerer_bloc(
+        df: pd.DataFrame,
+        colonnes: List[str],
+        strategie: Strategy,
+        *,
+        inplace: bool,
+        seuil: float,
+        copie: Copie,
+    ) -> pd.DataFrame:
+        """
+        Traite plusieurs colonnes : quartiles (et médianes / moyennes) calculés en un seul
+        passage NumPy sur le bloc, résultat réécrit en une seule affectation.
+        Avec 'remove', une ligne est supprimée dès qu'une des colonnes est hors bornes.
+        """
+        if strategie not in ("remove", "winsorize", "median", "mean", "log", "flag"):
+            raise ValueError("Stratégie invalide. Choisir: remove, winsorize, median, mean, log, flag.")
+
+        df_out = df if inplace or strategie == "remove" else copier(df, copie)
+        X = df_out[colonnes].to_numpy(dtype=float)
+
+        with warnings.catch_warnings():
+            # Colonnes entièrement NaN : statistiques NaN, aucune valeur hors bornes.
+            warnings.simplefilter("ignore", RuntimeWarning)
+            Q1, Q3 = np.nanquantile(X, [0.25, 0.75], axis=0)
+            IQR = Q3 - Q1
+            borne_inf = Q1 - seuil * IQR
+            borne_sup = Q3 + seuil * IQR
+            is_outlier = (X < borne_inf) | (X > borne_sup)
+            n_outliers = is_outlier.sum(axis=0)
+            compter(outliers=n_outliers.sum())
+
+            if strategie == "remove":
+                lignes = is_outlier.any(axis=1)
+                journal.info("%d colonnes : outliers supprimés (n=%d lignes).", len(colonnes), lignes.sum())
+                if inplace:
+                    if lignes.any():
+                        df.drop(index=df.index[lignes], inplace=True)
+                    return df
+                return df_out.loc[~lignes].copy()
+
+            if strategie == "winsorize":
+                resultat = np.clip(X, borne_inf, borne_sup)
+            elif strategie == "median":
+                resultat = np.where(is_outlier, np.nanmedian(X, axis=0), X)
+            elif strategie == "mean":
+                resultat = np.where(is_outlier, np.nanmean(X, axis=0), X)
+            elif strategie == "log":
+                resultat = np.log1p(np.clip(X, 0, None))
+            else:
+                df_out[[f"{c}_outlier_flag" for c in colonnes]] = is_outlier.astype(int)
+                journal.info("%d colonnes : indicateurs binaires ajoutés (n=%d).", len(colonnes), n_outliers.sum())
+                return df_out
+
+        df_out[colonnes] = resultat
+        journal.info(
+            "%d colonnes : stratégie '%s' appliquée (n=%d outliers).", len(colonnes), strategie, n_outliers.sum()
+        )
+        return df_out
+
+
+class GestionOutliersAjustee(TransformateurAjuste):
+    """
+    Traitement des outliers avec bornes IQR (et médiane / moyenne de remplacement)
+    ajustées par `fit` / `partial_fit`, puis réutilisées par `transform`.
+    Les quartiles sont exacts après `fit` (un seul lot) ; cumulés sur plusieurs lots
+    (`partial_fit`), ils sont approchés au-delà de 2048 valeurs.
+    """
+
+    def __init__(
+        self,
+        colonnes: Union[str, List[str]],
+        strategie: GestionOutliers.Strategy = "winsorize",
+        seuil: float = 1.5,
+    ):
+        """
+        Paramètres
+        ----------
+        colonnes : str ou list de str
+            Colonne(s) numérique(s) à traiter.
+        strategie : {"remove", "winsorize", "median", "mean", "log", "flag"}, default="winsorize"
+            Traitement appliqué (voir `GestionOutliers.gerer_outliers`). Avec 'remove',
+            une ligne est supprimée dès qu'une des colonnes est hors bornes.
+        seuil : float, default=1.5
+            Multiplicateur de l'IQR.
+        """
+        super().__init__(colonnes)
+        if strategie not in ("remove", "winsorize", "median", "mean", "log", "flag"):
+            raise ValueError("Stratégie invalide. Choisir: remove, winsorize, median, mean, log, flag.")
+        self.strategie = strategie
+        self.seuil = seuil
+
+    def _parametres(self) -> Dict[str, Any]:
+        return {"colonnes": self.colonnes, "strategie": self.strategie, "seuil": self.seuil}
+
+    def sorties(self) -> List[str]:
+        if self.strategie == "remove":
+            return []
+        if self.strategie == "flag":
+            return [f"{c}_outlier_flag" for c in self.colonnes]
+        return list(self.colonnes)
+
+    @property
+    def modifie_lignes(self) -> bool:
+        return self.strategie == "remove"
+
+    def _statistiques_colonne(self) -> Dict[str, Any]:
+        if self.strategie == "mean":
+            return {"quantiles": Quantiles(), "moments": Moments()}
+        return {"quantiles": Quantiles()}
+
+    def _verifier_colonne(self, s: pd.Series) -> None:
+        if not np.issubdtype(s.dtype, np.number):
+            raise TypeError(f"La colonne '{s.name}' doit être numérique.")
+
+    def bornes(self) -> Dict[str, tuple]:
+        """
+        Bornes (inférieure, supérieure) de chaque colonne ajustée.
+        """
+        bornes = {}
+        for c, stats in self.statistiques.items():
+            q1, q3 = stats["quantiles"].quantile(0.25), stats["quantiles"].quantile(0.75)
+            bornes[c] = (q1 - self.seuil * (q3 - q1), q3 + self.seuil * (q3 - q1))
+        return bornes
+
+    def transform(self, df: pd.DataFrame, *, inplace: bool = False, copie: Copie = "auto") -> pd.DataFrame:
+        # 'remove' recopie les lignes conservées : une copie préalable complète serait perdue.
+        if self.strategie == "remove":
+            copie = "colonnes"
+        return super().transform(df, inplace=inplace, copie=copie)
+
+    def _transformer(self, df_out: pd.DataFrame) -> pd.DataFrame:
+        bornes = self.bornes()
+        hors_bornes = pd.Series(False, index=df_out.index)
+        for c in self.colonnes:
+            borne_inf, borne_sup = bornes[c]
+            s = df_out[c]
+            is_outlier = (s < borne_inf) | (s > borne_sup)
+            if est_active():
+                compter(outliers=is_outlier.sum())
+
+            if self.strategie == "remove":
+                hors_bornes |= is_outlier
+            elif self.strategie == "winsorize":
+                df_out[c] = s.clip(borne_inf, borne_sup)
+            elif self.strategie == "median":
+                df_out[c] = s.mask(is_outlier, self.statistiques[c]["quantiles"].quantile(0.5))
+            elif self.strategie == "mean":
+                df_out[c] = s.mask(is_outlier, self.statistiques[c]["moments"].moyenne)
+            elif self.strategie == "log":
+                df_out[c] = np.log1p(s.clip(lower=0))
+            else:
+                df_out[f"{c}_outlier_flag"] = is_outlier.astype(int)
+
+        if self.strategie == "remove" and hors_bornes.any():
+            df_out.drop(index=df_out.index[hors_bornes.to_numpy()], inplace=True)
+        return df_out
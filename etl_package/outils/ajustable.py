@@ -0,0 +1,183 @@
+import json
+import pickle
+import pandas as pd
+from typing import Any, Dict, List, Union
+
+from .copie import Copie, copier
+from .instrumentation import instrumenter
+from .statistiques import STATISTIQUES
+
+
+class TransformateurAjuste:
+    """
+    Base des transformateurs ajustés : les statistiques sont calculées par `fit`
+    (ou cumulées lot par lot avec `partial_fit`), conservées dans `statistiques`
+    {colonne: {nom: statistique}}, puis appliquées telles quelles par `transform`.
+
+    Les sous-classes définissent `_statistiques_colonne` (statistiques à cumuler),
+    `_parametres` (arguments du constructeur) et `_transformer`.
+    """
+
+    def __init__(self, colonnes: Union[str, List[str]]):
+        self.colonnes = [colonnes] if isinstance(colonnes, str) else list(colonnes)
+        self.statistiques: Dict[str, Dict[str, Any]] = {}
+
+    def __repr__(self) -> str:
+        parametres = ", ".join(f"{k}={v!r}" for k, v in self._parametres().items())
+        return f"{type(self).__name__}({parametres})"
+
+    # ------------------------------------------------------------------
+    # À définir par les sous-classes
+    # ------------------------------------------------------------------
+
+    def _statistiques_colonne(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def _parametres(self) -> Dict[str, Any]:
+        return {"colonnes": self.colonnes}
+
+    def _transformer(self, df_out: pd.DataFrame) -> pd.DataFrame:
+        raise NotImplementedError
+
+    def _verifier_colonne(self, s: pd.Series) -> None:
+        pass
+
+    def sorties(self) -> List[str]:
+        """
+        Colonnes écrites (ou supprimées) par `transform`.
+        """
+        return list(self.colonnes)
+
+    @property
+    def modifie_lignes(self) -> bool:
+        """
+        True si `transform` supprime des lignes.
+        """
+        return False
+
+    # ------------------------------------------------------------------
+    # Ajustement et transformation
+    # ------------------------------------------------------------------
+
+    def _verifier_df(self, df: pd.DataFrame) -> None:
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("`df` doit être un pandas.DataFrame.")
+        absentes = [c for c in self.colonnes if c not in df.columns]
+        if absentes:
+            raise ValueError(f"Colonnes absentes du DataFrame : {absentes}")
+
+    @instrumenter()
+    def partial_fit(self, df: pd.DataFrame) -> "TransformateurAjuste":
+        """
+        Cumule les statistiques d'un nouveau lot à celles déjà ajustées.
+        """
+        self._verifier_df(df)
+        for c in self.colonnes:
+            self._verifier_colonne(df[c])
+            statistiques = self.statistiques.setdefault(c, self._statistiques_colonne())
+            for statistique in statistiques.values():
+                statistique.update(df[c])
+        return self
+
+    def fit(self, df: pd.DataFrame) -> "TransformateurAjuste":
+        """
+        Calcule les statistiques sur `df` (les précédentes sont oubliées).
+        """
+        self.statistiques = {}
+        return self.partial_fit(df)
+
+    def est_ajuste(self) -> bool:
+        return all(c in self.statistiques for c in self.colonnes)
+
+    @instrumenter()
+    def transform(self, df: pd.DataFrame, *, inplace: bool = False, copie: Copie = "auto") -> pd.DataFrame:
+        """
+        Applique les statistiques ajustées à `df`, sans les recalculer.
+
+        Paramètres
+        ----------
+        df : pd.DataFrame
+            DataFrame à transformer.
+        inplace : bool, default=False
+            Si True, modifie directement df. Sinon, retourne une copie.
+        copie : {"auto", "profonde", "colonnes"}, default="auto"
+            Mode de copie lorsque `inplace=False` (voir `outils.copie.copier`).
+
+        Retour
+        ------
+        pd.DataFrame
+            DataFrame transformé.
+        """
+        if not self.est_ajuste():
+            raise ValueError(f"{type(self).__name__} n'est pas ajusté : appeler `fit` ou `partial_fit`.")
+        self._verifier_df(df)
+        return self._transformer(df if inplace else copier(df, copie))
+
+    def fit_transform(self, df: pd.DataFrame, *, inplace: bool = False, copie: Copie = "auto") -> pd.DataFrame:
+        return self.fit(df).transform(df, inplace=inplace, copie=copie)
+
+    # ------------------------------------------------------------------
+    # Persistance
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "classe": type(self).__name__,
+            "parametres": self._parametres(),
+            "statistiques": {
+                c: {nom: {"type": type(s).__name__, **s.to_dict()} for nom, s in stats.items()}
+                for c, stats in self.statistiques.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "TransformateurAjuste":
+        classe = cls._classe(d["classe"])
+        transformateur = classe(**d["parametres"])
+        transformateur.statistiques = {
+            c: {nom: STATISTIQUES[s["type"]].from_dict(s) for nom, s in stats.items()}
+            for c, stats in d["statistiques"].items()
+        }
+        return transformateur
+
+    @classmethod
+    def _classe(cls, nom: str) -> type:
+        a_visiter = [cls]
+        while a_visiter:
+            classe = a_visiter.pop()
+            if classe.__name__ == nom:
+                return classe
+            a_visiter.extend(classe.__subclasses__())
+        raise ValueError(f"Classe '{nom}' inconnue pour {cls.__name__}.")
+
+    def sauvegarder(self, chemin: str) -> None:
+        """
+        Enregistre le transformateur ajusté : JSON si `chemin` se termine par '.json',
+        pickle sinon.
+        """
+        try:
+            if chemin.endswith(".json"):
+                with open(chemin, "w", encoding="utf-8") as f:
+                    json.dump(self.to_dict(), f, ensure_ascii=False)
+            else:
+                with open(chemin, "wb") as f:
+                    pickle.dump(self, f)
+        except (OSError, TypeError) as e:
+            raise IOError(f"Erreur lors de la sauvegarde de {type(self).__name__} : {e}")
+
+    @classmethod
+    def charger(cls, chemin: str) -> "TransformateurAjuste":
+        """
+        Recharge un transformateur enregistré par `sauvegarder`.
+        """
+        try:
+            if chemin.endswith(".json"):
+                with open(chemin, encoding="utf-8") as f:
+                    return cls.from_dict(json.load(f))
+            with open(chemin, "rb") as f:
+                transformateur = pickle.load(f)
+        except OSError as e:
+            raise IOError(f"Erreur lors du chargement : {e}")
+        if not isinstance(transformateur, cls):
+            raise TypeError(f"Le fichier ne contient pas un {cls.__name__}.")
+        return transformateur
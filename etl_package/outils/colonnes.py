@@ -0,0 +1,47 @@
+import pandas as pd
+from typing import Any, List
+
+
+def resoudre_colonnes(df: pd.DataFrame, colonnes: Any, numeriques: bool = False) -> List[str]:
+    """
+    Résout une sélection de colonnes en liste de noms.
+
+    Paramètres
+    ----------
+    df : pd.DataFrame
+        DataFrame de référence.
+    colonnes : str, list ou sélecteur de types
+        - str : nom d'une colonne.
+        - list / tuple / pd.Index : noms de colonnes.
+        - sinon : sélecteur de types transmis à `df.select_dtypes(include=...)`
+          (ex: "number", np.number, "float", ["int64", "float64"]).
+    numeriques : bool, default=False
+        Si True, vérifie que toutes les colonnes sont numériques.
+
+    Retour
+    ------
+    list
+        Noms des colonnes sélectionnées.
+    """
+    liste = isinstance(colonnes, (list, tuple, pd.Index))
+    if isinstance(colonnes, str) and colonnes in df.columns:
+        noms = [colonnes]
+    elif liste and (not len(colonnes) or any(c in df.columns for c in colonnes)):
+        absentes = [c for c in colonnes if c not in df.columns]
+        if absentes:
+            raise ValueError(f"Colonnes absentes du DataFrame : {absentes}")
+        noms = list(colonnes)
+    else:
+        try:
+            noms = list(df.select_dtypes(include=colonnes).columns)
+        except (TypeError, ValueError):
+            raise ValueError(f"Colonnes absentes du DataFrame : {list(colonnes) if liste else [colonnes]}")
+    if numeriques:
+        # Types « nullables » (Int64, Float64) acceptés ; les booléens ne sont pas numériques.
+        non_numeriques = [
+            c for c in noms
+            if not pd.api.types.is_numeric_dtype(df[c]) or pd.api.types.is_bool_dtype(df[c])
+        ]
+        if non_numeriques:
+            raise TypeError(f"Les colonnes {non_numeriques} doivent être numériques.")
+    return noms
@@ -0,0 +1,36 @@
+import pandas as pd
+from typing import Literal
+
+Copie = Literal["auto", "profonde", "colonnes"]
+
+COPY_ON_WRITE = int(pd.__version__.split(".")[0]) >= 3 or pd.options.mode.copy_on_write is True
+
+
+def copier(df: pd.DataFrame, copie: Copie = "auto") -> pd.DataFrame:
+    """
+    Retourne la copie de `df` sur laquelle une méthode `inplace=False` travaille.
+
+    Paramètres
+    ----------
+    df : pd.DataFrame
+        DataFrame à copier.
+    copie : {"auto", "profonde", "colonnes"}, default="auto"
+        - "profonde" : copie de toutes les colonnes.
+        - "colonnes" : nouveau DataFrame qui partage les colonnes non modifiées avec `df` ;
+          seules les colonnes réaffectées par la méthode sont de nouveaux tableaux.
+          Sans Copy-on-Write (pandas < 3), une modification en place ultérieure
+          (`.loc`, `.iloc`, `.values`) d'une colonne partagée modifie aussi `df`.
+        - "auto" : "colonnes" si le Copy-on-Write de pandas est actif, sinon "profonde".
+
+    Retour
+    ------
+    pd.DataFrame
+        Copie de `df`.
+    """
+    if copie == "auto":
+        copie = "colonnes" if COPY_ON_WRITE else "profonde"
+    if copie == "colonnes":
+        return df.copy(deep=False)
+    if copie == "profonde":
+        return df.copy()
+    raise ValueError("`copie` doit être 'auto', 'profonde' ou 'colonnes'.")
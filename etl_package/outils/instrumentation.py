@@ -0,0 +1,380 @@
+import contextlib
+import contextvars
+import cProfile
+import functools
+import inspect
+import logging
+import pstats
+import threading
+import time
+import tracemalloc
+import pandas as pd
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+journal = logging.getLogger(__name__)
+
+Hook = Callable[[Dict[str, Any]], Any]
+
+
+class _Etat:
+    """
+    Configuration globale de l'instrumentation (voir `Instrumentation.activer`).
+    """
+    actif = False
+    profil = False
+    memoire = False
+    echantillon = 1
+    etapes: Optional[frozenset] = None
+    hooks: List[Hook] = []
+    appels: Dict[str, int] = {}
+    tracemalloc_demarre = False
+
+
+# Étapes en cours dans le contexte courant (thread ou tâche asyncio), de la plus externe
+# à la plus interne.
+_pile: contextvars.ContextVar = contextvars.ContextVar("etl_package_etapes", default=())
+
+
+def _forme(objet: Any):
+    if isinstance(objet, pd.DataFrame):
+        return objet.shape
+    if isinstance(objet, pd.Series):
+        return len(objet), 1
+    return None, None
+
+
+# Marque la fin d'un générateur instrumenté (voir `instrumenter`).
+_FIN = object()
+
+
+def _entree(args: tuple, kwargs: dict) -> Any:
+    for valeur in (kwargs.get("df"), *args):
+        if isinstance(valeur, (pd.DataFrame, pd.Series)):
+            return valeur
+    return None
+
+
+def instrumenter(nom: Optional[str] = None) -> Callable:
+    """
+    Décore une étape publique : lorsque l'instrumentation est active, chaque appel
+    produit une mesure transmise aux hooks. Désactivée, l'enveloppe se limite à un test.
+
+    Paramètres
+    ----------
+    nom : str, optionnel
+        Nom de l'étape (ex: "GestionOutliers.gerer_outliers"). Par défaut, pour une méthode
+        d'instance, "<classe de l'instance>.<méthode>".
+
+    Pour une fonction génératrice, chaque élément produit donne une mesure (durée du
+    calcul de cet élément, sans le temps passé par l'appelant entre deux éléments),
+    et la fin du flux une dernière mesure, sans lignes de sortie.
+    """
+    def decorer(fonction: Callable) -> Callable:
+        if inspect.isgeneratorfunction(fonction):
+            @functools.wraps(fonction)
+            def enveloppe_flux(*args, **kwargs):
+                etape = nom or f"{type(args[0]).__name__}.{fonction.__name__}"
+                iterateur = fonction(*args, **kwargs)
+                try:
+                    while True:
+                        if _Etat.actif:
+                            element = _mesurer(etape, next, (iterateur, _FIN), {})
+                        else:
+                            element = next(iterateur, _FIN)
+                        if element is _FIN:
+                            return
+                        yield element
+                finally:
+                    iterateur.close()
+            return enveloppe_flux
+
+        @functools.wraps(fonction)
+        def enveloppe(*args, **kwargs):
+            if not _Etat.actif:
+                return fonction(*args, **kwargs)
+            etape = nom or f"{type(args[0]).__name__}.{fonction.__name__}"
+            return _mesurer(etape, fonction, args, kwargs)
+        return enveloppe
+    return decorer
+
+
+def _mesurer(etape: str, fonction: Callable, args: tuple, kwargs: dict) -> Any:
+    if _Etat.etapes is not None and etape not in _Etat.etapes:
+        return fonction(*args, **kwargs)
+    appel = _Etat.appels.get(etape, 0)
+    _Etat.appels[etape] = appel + 1
+    echantillonne = appel % _Etat.echantillon == 0
+
+    pile = _pile.get()
+    parent = pile[-1] if pile else None
+    cadre: Dict[str, Any] = {"etape": etape, "compteurs": {}, "pic": 0}
+    jeton = _pile.set(pile + (cadre,))
+
+    memoire = _Etat.memoire and echantillonne and tracemalloc.is_tracing()
+    if memoire:
+        courant, pic = tracemalloc.get_traced_memory()
+        # `reset_peak` est global : le pic atteint jusqu'ici est reporté sur l'étape parente.
+        if parent is not None:
+            parent["pic"] = max(parent["pic"], pic)
+        tracemalloc.reset_peak()
+        cadre["memoire_debut"] = courant
+    profileur = None
+    # Un seul profileur actif à la fois : les étapes imbriquées sont incluses dans celui du parent.
+    if _Etat.profil and echantillonne and not any("profileur" in c for c in pile):
+        profileur = cProfile.Profile()
+        cadre["profileur"] = profileur
+        profileur.enable()
+
+    entree = _entree(args, kwargs)
+    resultat = None
+    erreur = None
+    debut = time.perf_counter()
+    try:
+        resultat = fonction(*args, **kwargs)
+        return resultat
+    except BaseException as e:
+        erreur = e
+        raise
+    finally:
+        secondes = time.perf_counter() - debut
+        if profileur is not None:
+            profileur.disable()
+        _pile.reset(jeton)
+
+        memoire_mo = None
+        if memoire:
+            pic = max(tracemalloc.get_traced_memory()[1], cadre["pic"])
+            memoire_mo = (pic - cadre["memoire_debut"]) / 2**20
+            if parent is not None:
+                parent["pic"] = max(parent["pic"], pic)
+        lignes_entree, colonnes_entree = _forme(entree)
+        lignes_sortie, colonnes_sortie = _forme(resultat)
+        _publier({
+            "etape": etape,
+            "parent": parent["etape"] if parent is not None else None,
+            "secondes": secondes,
+            "lignes_entree": lignes_entree,
+            "colonnes_entree": colonnes_entree,
+            "lignes_sortie": lignes_sortie,
+            "colonnes_sortie": colonnes_sortie,
+            "memoire_mo": memoire_mo,
+            "compteurs": cadre["compteurs"],
+            "profil": pstats.Stats(profileur) if profileur is not None else None,
+            "erreur": repr(erreur) if erreur is not None else None,
+        })
+
+
+def _publier(mesure: Dict[str, Any]) -> None:
+    if journal.isEnabledFor(logging.DEBUG):
+        journal.debug(
+            "%s : %.4f s, %s -> %s lignes, %s -> %s colonnes, compteurs %s",
+            mesure["etape"], mesure["secondes"], mesure["lignes_entree"], mesure["lignes_sortie"],
+            mesure["colonnes_entree"], mesure["colonnes_sortie"], mesure["compteurs"],
+        )
+    for hook in list(_Etat.hooks):
+        try:
+            hook(mesure)
+        except Exception as e:
+            # Un hook défaillant ne doit pas interrompre le traitement mesuré.
+            journal.warning("Hook d'instrumentation %r en échec : %s", hook, e)
+
+
+def compter(**compteurs: int) -> None:
+    """
+    Ajoute des compteurs (ex: outliers=12) à la mesure de l'étape en cours.
+    Sans effet si l'instrumentation est inactive ou hors d'une étape instrumentée.
+    """
+    if not _Etat.actif:
+        return
+    pile = _pile.get()
+    if pile:
+        cumul = pile[-1]["compteurs"]
+        for nom, valeur in compteurs.items():
+            cumul[nom] = cumul.get(nom, 0) + int(valeur)
+
+
+def est_active() -> bool:
+    """
+    True si l'instrumentation est active (pour ne calculer un compteur coûteux qu'à la demande).
+    """
+    return _Etat.actif
+
+
+class Instrumentation:
+    """
+    Configuration de la journalisation et de l'instrumentation des étapes du package.
+
+    Les messages du package passent par le module `logging` (loggers `etl_package.*`,
+    niveau INFO pour les comptes rendus, WARNING pour les avertissements) : ils ne sont
+    affichés que si l'application configure `logging` ou appelle `afficher_messages`.
+
+    Une fois activée, chaque étape publique (méthodes des classes de transformation,
+    d'extraction et de chargement, `Pipeline.executer`, transformateurs ajustés...)
+    produit une mesure, transmise à chaque hook :
+
+    - etape, parent : nom de l'étape et de l'étape englobante (ou None) ;
+    - secondes : durée ;
+    - lignes_entree, colonnes_entree, lignes_sortie, colonnes_sortie ;
+    - memoire_mo : pic d'allocations au-dessus du niveau initial (si `memoire=True`) ;
+    - compteurs : ex. {"outliers": 12}, {"valeurs_imputees": 40} ;
+    - profil : `pstats.Stats` de l'étape (si `profil=True`) ;
+    - erreur : représentation de l'exception levée, sinon None.
+
+    Désactivée (par défaut), l'instrumentation ne coûte qu'un test par appel d'étape.
+    Les mesures ne sont produites que dans le processus courant (pas dans les processus
+    de travail d'`ExecuteurParallele`). Pour une extraction par morceaux (`taille_chunk`),
+    seule la création de l'itérateur est mesurée ; `ExtractionData.iter_extract` produit
+    en revanche une mesure par morceau.
+
+    Exemple
+    -------
+    >>> collecteur = CollecteurMesures()
+    >>> with Instrumentation.session(hooks=[collecteur], memoire=True):
+    ...     df = pipeline.executer(df)
+    >>> collecteur.tableau()
+    """
+
+    @staticmethod
+    def activer(
+        *,
+        hooks: Optional[Iterable[Hook]] = None,
+        profil: bool = False,
+        memoire: bool = False,
+        echantillon: int = 1,
+        etapes: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Active l'instrumentation.
+
+        Paramètres
+        ----------
+        hooks : list, optionnel
+            Fonctions `hook(mesure)` ajoutées aux hooks déjà enregistrés.
+        profil : bool, default=False
+            Si True, profile les étapes avec cProfile (étapes les plus externes ;
+            les étapes imbriquées sont incluses dans le profil de leur parent).
+        memoire : bool, default=False
+            Si True, mesure le pic mémoire de chaque étape avec tracemalloc (démarré
+            si nécessaire). Ralentit nettement les allocations.
+        echantillon : int, default=1
+            Profil et mémoire mesurés pour un appel sur `echantillon` de chaque étape ;
+            durée, formes et compteurs le sont toujours.
+        etapes : list, optionnel
+            Noms des étapes à mesurer (ex: ["GestionOutliers.gerer_outliers"]).
+            Par défaut, toutes.
+        """
+        if echantillon < 1:
+            raise ValueError("`echantillon` doit être supérieur ou égal à 1.")
+        for hook in hooks or []:
+            Instrumentation.ajouter_hook(hook)
+        _Etat.profil = profil
+        _Etat.memoire = memoire
+        _Etat.echantillon = echantillon
+        _Etat.etapes = frozenset(etapes) if etapes is not None else None
+        _Etat.appels = {}
+        if memoire and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _Etat.tracemalloc_demarre = True
+        _Etat.actif = True
+
+    @staticmethod
+    def desactiver() -> None:
+        """
+        Désactive l'instrumentation (les hooks restent enregistrés).
+        """
+        _Etat.actif = False
+        if _Etat.tracemalloc_demarre:
+            tracemalloc.stop()
+            _Etat.tracemalloc_demarre = False
+
+    @staticmethod
+    def est_active() -> bool:
+        return _Etat.actif
+
+    @staticmethod
+    def ajouter_hook(hook: Hook) -> None:
+        if not callable(hook):
+            raise TypeError("Un hook doit être une fonction `hook(mesure)`.")
+        if hook not in _Etat.hooks:
+            _Etat.hooks.append(hook)
+
+    @staticmethod
+    def retirer_hook(hook: Hook) -> None:
+        if hook in _Etat.hooks:
+            _Etat.hooks.remove(hook)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def session(*, hooks: Optional[Iterable[Hook]] = None, **options) -> Iterator[None]:
+        """
+        Active l'instrumentation le temps d'un bloc `with`, puis la désactive et
+        retire les hooks fournis.
+        """
+        hooks = list(hooks or [])
+        Instrumentation.activer(hooks=hooks, **options)
+        try:
+            yield
+        finally:
+            Instrumentation.desactiver()
+            for hook in hooks:
+                Instrumentation.retirer_hook(hook)
+
+    @staticmethod
+    def afficher_messages(niveau: int = logging.INFO, format: str = "%(message)s") -> logging.Handler:
+        """
+        Affiche les messages du package sur la sortie d'erreur (usage interactif).
+
+        Retour
+        ------
+        logging.Handler
+            Handler ajouté au logger `etl_package` (à retirer avec `removeHandler`).
+        """
+        logger = logging.getLogger("etl_package")
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(format))
+        logger.addHandler(handler)
+        logger.setLevel(niveau)
+        return handler
+
+
+class CollecteurMesures:
+    """
+    Hook qui conserve les mesures en mémoire.
+    """
+
+    def __init__(self):
+        self.mesures: List[Dict[str, Any]] = []
+        self._verrou = threading.Lock()
+
+    def __call__(self, mesure: Dict[str, Any]) -> None:
+        with self._verrou:
+            self.mesures.append(mesure)
+
+    def vider(self) -> None:
+        with self._verrou:
+            self.mesures = []
+
+    def tableau(self) -> pd.DataFrame:
+        """
+        Mesures sous forme de DataFrame, une ligne par appel, un compteur par colonne.
+        """
+        with self._verrou:
+            mesures = list(self.mesures)
+        lignes = [
+            {**{k: v for k, v in m.items() if k not in ("compteurs", "profil")}, **m["compteurs"]}
+            for m in mesures
+        ]
+        return pd.DataFrame(lignes)
+
+    def profil(self, etape: Optional[str] = None) -> Optional[pstats.Stats]:
+        """
+        Profils cProfile cumulés des appels (d'une étape ou de toutes), sinon None.
+        """
+        with self._verrou:
+            profils = [m["profil"] for m in self.mesures
+                       if m["profil"] is not None and (etape is None or m["etape"] == etape)]
+        if not profils:
+            return None
+        cumul = pstats.Stats()
+        cumul.add(*profils)
+        return cumul
@@ -0,0 +1,372 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _natif(valeur: Any) -> Any:
+    """
+    Convertit un scalaire numpy en valeur Python native (sérialisable en JSON).
+    """
+    return valeur.item() if isinstance(valeur, np.generic) else valeur
+
+
+class Moments:
+    """
+    Effectif, moyenne, somme des carrés des écarts (Welford), minimum et maximum
+    d'une colonne numérique, fusionnables entre lots (formule de Chan).
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.moyenne = 0.0
+        self.m2 = 0.0
+        self.min = np.nan
+        self.max = np.nan
+
+    def update(self, valeurs, poids=None) -> "Moments":
+        """
+        Cumule des valeurs ; `poids` (effectifs entiers) permet de passer des valeurs
+        distinctes avec leur nombre d'occurrences.
+        """
+        x = np.asarray(valeurs, dtype=float)
+        w = np.ones(x.size) if poids is None else np.asarray(poids, dtype=float)
+        garde = ~np.isnan(x)
+        x, w = x[garde], w[garde]
+        if x.size:
+            autre = Moments()
+            autre.n = int(w.sum())
+            autre.moyenne = float(np.average(x, weights=w))
+            autre.m2 = float((w * (x - autre.moyenne) ** 2).sum())
+            autre.min = float(x.min())
+            autre.max = float(x.max())
+            self.merge(autre)
+        return self
+
+    def merge(self, autre: "Moments") -> "Moments":
+        if autre.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.moyenne, self.m2, self.min, self.max = autre.n, autre.moyenne, autre.m2, autre.min, autre.max
+            return self
+        n = self.n + autre.n
+        delta = autre.moyenne - self.moyenne
+        self.moyenne += delta * autre.n / n
+        self.m2 += autre.m2 + delta ** 2 * self.n * autre.n / n
+        self.n = n
+        self.min = min(self.min, autre.min)
+        self.max = max(self.max, autre.max)
+        return self
+
+    def variance(self, ddof: int = 0) -> float:
+        return self.m2 / (self.n - ddof) if self.n > ddof else np.nan
+
+    def ecart_type(self, ddof: int = 0) -> float:
+        return float(np.sqrt(self.variance(ddof)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"n": self.n, "moyenne": self.moyenne, "m2": self.m2,
+                "min": None if np.isnan(self.min) else self.min,
+                "max": None if np.isnan(self.max) else self.max}
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Moments":
+        m = cls()
+        m.n, m.moyenne, m.m2 = d["n"], d["moyenne"], d["m2"]
+        m.min = np.nan if d["min"] is None else d["min"]
+        m.max = np.nan if d["max"] is None else d["max"]
+        return m
+
+
+class Quantiles:
+    """
+    Résumé de distribution fusionnable pour les quantiles (médiane, quartiles).
+
+    Exact tant que l'effectif ne dépasse pas `k` (même interpolation linéaire que pandas).
+    Au-delà, les valeurs triées sont regroupées en `k` centroïdes de poids égaux :
+    l'erreur de rang est de l'ordre de 1/k.
+
+    Les quantiles de `EXACTS` (quartiles et médiane) d'un résumé construit en un seul
+    lot sont en outre conservés exacts, quel que soit l'effectif : un ajustement sur un
+    DataFrame en mémoire (`fit`) donne les mêmes valeurs que pandas. Ils sont oubliés dès
+    qu'un autre lot est cumulé (`update`, `merge`).
+    """
+
+    EXACTS = (0.25, 0.5, 0.75)
+
+    def __init__(self, k: int = 2048):
+        if k < 2:
+            raise ValueError("`k` doit être supérieur ou égal à 2.")
+        self.k = k
+        self.valeurs = np.empty(0)
+        self.poids = np.empty(0)
+        self.exacts: Dict[float, float] = {}
+
+    @property
+    def n(self) -> float:
+        return float(self.poids.sum())
+
+    def _ajouter(self, valeurs: np.ndarray, poids: np.ndarray) -> "Quantiles":
+        v = np.concatenate([self.valeurs, valeurs])
+        w = np.concatenate([self.poids, poids])
+        ordre = np.argsort(v, kind="mergesort")
+        v, w = v[ordre], w[ordre]
+        if v.size > self.k:
+            cumul = np.cumsum(w)
+            bacs = np.minimum(((cumul - w / 2) / cumul[-1] * self.k).astype(int), self.k - 1)
+            somme_poids = np.bincount(bacs, weights=w, minlength=self.k)
+            somme_valeurs = np.bincount(bacs, weights=w * v, minlength=self.k)
+            garde = somme_poids > 0
+            w = somme_poids[garde]
+            v = somme_valeurs[garde] / w
+        self.valeurs, self.poids = v, w
+        return self
+
+    def update(self, valeurs) -> "Quantiles":
+        x = np.asarray(valeurs, dtype=float)
+        x = x[~np.isnan(x)]
+        if not x.size:
+            return self
+        exacts = {}
+        if not self.valeurs.size:
+            exacts = dict(zip(self.EXACTS, np.quantile(x, self.EXACTS).tolist()))
+        self._ajouter(x, np.ones(x.size))
+        self.exacts = exacts
+        return self
+
+    def merge(self, autre: "Quantiles") -> "Quantiles":
+        if not autre.valeurs.size:
+            return self
+        exacts = dict(autre.exacts) if not self.valeurs.size else {}
+        self._ajouter(autre.valeurs, autre.poids)
+        self.exacts = exacts
+        return self
+
+    def quantile(self, q: float) -> float:
+        if not self.valeurs.size:
+            return np.nan
+        if q in self.exacts:
+            return self.exacts[q]
+        if np.all(self.poids == 1):
+            return float(np.quantile(self.valeurs, q))
+        cumul = np.cumsum(self.poids)
+        return float(np.interp(q * cumul[-1], cumul - self.poids / 2, self.valeurs))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"k": self.k, "valeurs": self.valeurs.tolist(), "poids": self.poids.tolist(),
+                "exacts": [[p, v] for p, v in self.exacts.items()]}
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Quantiles":
+        q = cls(d["k"])
+        q.valeurs = np.asarray(d["valeurs"], dtype=float)
+        q.poids = np.asarray(d["poids"], dtype=float)
+        q.exacts = {p: v for p, v in d.get("exacts", [])}
+        return q
+
+
+class Frequences:
+    """
+    Effectifs exacts par valeur (hors NaN), fusionnables entre lots.
+    """
+
+    def __init__(self):
+        self.effectifs: Dict[Any, int] = {}
+
+    @property
+    def n(self) -> int:
+        return sum(self.effectifs.values())
+
+    def update(self, valeurs) -> "Frequences":
+        for valeur, effectif in pd.Series(valeurs).value_counts(dropna=True).items():
+            valeur = _natif(valeur)
+            self.effectifs[valeur] = self.effectifs.get(valeur, 0) + int(effectif)
+        return self
+
+    def merge(self, autre: "Frequences") -> "Frequences":
+        for valeur, effectif in autre.effectifs.items():
+            self.effectifs[valeur] = self.effectifs.get(valeur, 0) + effectif
+        return self
+
+    def categories(self) -> List[Any]:
+        """
+        Valeurs observées, triées comme les colonnes de `pd.get_dummies`.
+        """
+        return pd.Index(list(self.effectifs)).sort_values().tolist()
+
+    def mode(self) -> Optional[Any]:
+        """
+        Valeur la plus fréquente (la plus petite en cas d'égalité, comme `Series.mode`).
+        """
+        if not self.effectifs:
+            return None
+        maximum = max(self.effectifs.values())
+        candidats = [v for v, e in self.effectifs.items() if e == maximum]
+        try:
+            return min(candidats)
+        except TypeError:
+            return candidats[0]
+
+    def proportions(self) -> Dict[Any, float]:
+        total = self.n
+        return {v: e / total for v, e in self.effectifs.items()} if total else {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"effectifs": [[v, e] for v, e in self.effectifs.items()]}
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Frequences":
+        f = cls()
+        f.effectifs = {v: e for v, e in d["effectifs"]}
+        return f
+
+
+def _longueur_bits(x: np.ndarray) -> np.ndarray:
+    """
+    Nombre de bits significatifs d'entiers uint64 (0 pour 0), par dichotomie vectorisée.
+    """
+    longueur = np.zeros(x.shape, dtype=np.int64)
+    for decalage in (32, 16, 8, 4, 2, 1):
+        haut = (x >> np.uint64(decalage)) != 0
+        longueur += decalage * haut
+        x = np.where(haut, x >> np.uint64(decalage), x)
+    return longueur + (x != 0)
+
+
+class HyperLogLog:
+    """
+    Estimation du nombre de valeurs distinctes en mémoire constante (2**precision
+    registres d'un octet), fusionnable entre lots et processus (maximum des registres).
+    Erreur relative typique : 1.04 / sqrt(2**precision), soit ~0.8 % pour precision=14 ;
+    quasi exacte pour les petits effectifs (comptage linéaire).
+    """
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError("`precision` doit être comprise entre 4 et 18.")
+        self.precision = precision
+        self.registres = np.zeros(2 ** precision, dtype=np.uint8)
+
+    def ajouter_empreintes(self, empreintes: np.ndarray) -> "HyperLogLog":
+        """
+        Cumule des empreintes 64 bits (ex: `pd.util.hash_array`) : les `precision` bits
+        de poids fort choisissent le registre, le rang du premier bit à 1 des suivants
+        est conservé s'il est plus grand.
+        """
+        h = np.asarray(empreintes, dtype=np.uint64)
+        if h.size:
+            p = np.uint64(self.precision)
+            reste = h << p
+            rang = np.minimum(64 - _longueur_bits(reste) + 1, 64 - self.precision + 1)
+            np.maximum.at(self.registres, (h >> (np.uint64(64) - p)).astype(np.intp), rang.astype(np.uint8))
+        return self
+
+    def update(self, valeurs) -> "HyperLogLog":
+        valeurs = pd.Series(valeurs).dropna()
+        return self.ajouter_empreintes(pd.util.hash_pandas_object(valeurs, index=False).to_numpy())
+
+    def merge(self, autre: "HyperLogLog") -> "HyperLogLog":
+        if autre.precision != self.precision:
+            raise ValueError("Les estimateurs HyperLogLog doivent avoir la même précision.")
+        np.maximum(self.registres, autre.registres, out=self.registres)
+        return self
+
+    def estimation(self) -> float:
+        m = len(self.registres)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimation = alpha * m * m / np.ldexp(1.0, -self.registres.astype(np.int64)).sum()
+        vides = int((self.registres == 0).sum())
+        if estimation <= 2.5 * m and vides:
+            return m * float(np.log(m / vides))
+        return float(estimation)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"precision": self.precision, "registres": self.registres.tolist()}
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "HyperLogLog":
+        h = cls(d["precision"])
+        h.registres = np.asarray(d["registres"], dtype=np.uint8)
+        return h
+
+
+class SpaceSaving:
+    """
+    Valeurs les plus fréquentes en mémoire bornée (`capacite` compteurs, à la manière
+    de Space-Saving), fusionnable entre lots et processus.
+
+    Chaque compteur surestime l'effectif réel d'au plus son `erreur` ; une valeur
+    non suivie a un effectif au plus égal à `plancher`. Toute valeur d'effectif
+    supérieur à `plancher` est donc suivie.
+    """
+
+    def __init__(self, capacite: int = 64):
+        if capacite < 1:
+            raise ValueError("`capacite` doit être supérieur ou égal à 1.")
+        self.capacite = capacite
+        self.compteurs: Dict[Any, List[int]] = {}
+        self.plancher = 0
+
+    @property
+    def n(self) -> int:
+        return sum(c for c, _ in self.compteurs.values())
+
+    def ajouter_effectifs(self, valeurs, effectifs) -> "SpaceSaving":
+        """
+        Cumule les effectifs exacts de valeurs distinctes (ex: d'un lot).
+        """
+        effectifs = np.asarray(effectifs, dtype=np.int64)
+        if not effectifs.size:
+            return self
+        lot = SpaceSaving(self.capacite)
+        if effectifs.size > self.capacite:
+            ordre = np.argpartition(-effectifs, self.capacite)
+            lot.plancher = int(effectifs[ordre[self.capacite:]].max())
+            gardes = ordre[:self.capacite]
+        else:
+            gardes = np.arange(effectifs.size)
+        valeurs = np.asarray(valeurs, dtype=object)
+        lot.compteurs = {_natif(valeurs[i]): [int(effectifs[i]), 0] for i in gardes}
+        return self.merge(lot)
+
+    def update(self, valeurs) -> "SpaceSaving":
+        comptes = pd.Series(valeurs).value_counts(dropna=True)
+        return self.ajouter_effectifs(comptes.index.to_numpy(dtype=object), comptes.to_numpy())
+
+    def merge(self, autre: "SpaceSaving") -> "SpaceSaving":
+        # Valeur absente d'un résumé : son effectif y est au plus le plancher de ce résumé.
+        fusion = {}
+        for valeur in self.compteurs.keys() | autre.compteurs.keys():
+            c1, e1 = self.compteurs.get(valeur, (self.plancher, self.plancher))
+            c2, e2 = autre.compteurs.get(valeur, (autre.plancher, autre.plancher))
+            fusion[valeur] = [c1 + c2, e1 + e2]
+        plancher = self.plancher + autre.plancher
+        if len(fusion) > self.capacite:
+            ordre = sorted(fusion, key=lambda v: fusion[v][0], reverse=True)
+            plancher = max(plancher, fusion[ordre[self.capacite]][0])
+            fusion = {v: fusion[v] for v in ordre[:self.capacite]}
+        self.compteurs, self.plancher = fusion, plancher
+        return self
+
+    def top(self, k: int = 10) -> List[Tuple[Any, int, int]]:
+        """
+        Les k valeurs les plus fréquentes : (valeur, effectif estimé, erreur maximale).
+        """
+        ordre = sorted(self.compteurs.items(), key=lambda item: item[1][0], reverse=True)
+        return [(v, c, e) for v, (c, e) in ordre[:k]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"capacite": self.capacite, "plancher": self.plancher,
+                "compteurs": [[v, c, e] for v, (c, e) in self.compteurs.items()]}
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "SpaceSaving":
+        s = cls(d["capacite"])
+        s.plancher = d["plancher"]
+        s.compteurs = {v: [c, e] for v, c, e in d["compteurs"]}
+        return s
+
+
+STATISTIQUES = {
+    "Moments": Moments, "Quantiles": Quantiles, "Frequences": Frequences,
+    "HyperLogLog": HyperLogLog, "SpaceSaving": SpaceSaving,
+}
@@ -0,0 +1,2 @@
+from .pipeline import Pipeline
+from .cache_etapes import CacheEtapes
@@ -0,0 +1,356 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+journal = logging.getLogger(__name__)
+
+# Incrémentée lorsque le calcul des clés change : les anciennes entrées ne sont plus lues.
+_VERSION = 1
+_META = b"etl_package.cache_etapes"
+
+
+def _canonique(valeur: Any) -> Any:
+    """
+    Représentation stable d'un paramètre d'étape, sérialisable en JSON.
+    Les objets sans représentation stable (fonctions anonymes, objets quelconques) gardent
+    leur `repr`, qui contient en général leur adresse : au pire l'entrée n'est pas retrouvée.
+    """
+    if valeur is None or isinstance(valeur, (bool, int, float, str)):
+        return valeur
+    if isinstance(valeur, (list, tuple)):
+        return [_canonique(v) for v in valeur]
+    if isinstance(valeur, dict):
+        return {"__dict__": sorted(([_canonique(k), _canonique(v)] for k, v in valeur.items()), key=repr)}
+    if isinstance(valeur, type):
+        return f"{valeur.__module__}.{valeur.__qualname__}"
+    if isinstance(valeur, np.generic):
+        return valeur.item()
+    if hasattr(valeur, "get_params"):
+        # Estimateurs scikit-learn : classe et hyperparamètres.
+        classe = type(valeur)
+        return {
+            "__classe__": f"{classe.__module__}.{classe.__qualname__}",
+            "parametres": _canonique(valeur.get_params(deep=False)),
+        }
+    return repr(valeur)
+
+
+class CacheEtapes:
+    """
+    Cache disque des résultats intermédiaires d'un `Pipeline` (points de reprise).
+
+    - Chaque résultat est indexé par une empreinte du DataFrame d'entrée du pipeline,
+      puis, étape par étape, du nom et des paramètres de chaque étape : une étape
+      modifiée invalide sa clé et celles de toutes les étapes suivantes.
+    - Un résultat est enregistré après chaque étape (par défaut) ou seulement à la fin
+      de chaque bloc d'exécution (`Pipeline.executer(..., points_reprise="blocs")`,
+      voir `Pipeline.plan`). Lors d'une nouvelle exécution, le pipeline reprend après
+      la dernière étape dont le résultat est en cache. Avec des points de reprise par
+      bloc, la fusion limite la réutilisation : modifier une étape d'un bloc fait
+      recalculer tout le bloc (et, pour un pipeline entièrement local, tout le pipeline).
+    - Stockage Arrow IPC non compressé (lecture par projection mémoire, par défaut)
+      ou Parquet (plus compact, plus lent à relire). Nécessite pyarrow.
+    - Éviction par taille totale (`taille_max`, les entrées les moins récemment
+      utilisées sont supprimées en premier) ; invalidation explicite avec `invalider`.
+    - Les compteurs sont disponibles via `stats`.
+
+    Exemple
+    -------
+    >>> cache = CacheEtapes("cache/pipeline", taille_max=2 * 2**30)
+    >>> df_out = pipe.executer(df, cache=cache)   # calcule et enregistre
+    >>> df_out = pipe.executer(df, cache=cache)   # relu depuis le cache
+    >>> cache.invalider("imputer")                # résultats dépendant d'une imputation
+    """
+
+    FORMATS = {"arrow": ".arrow", "parquet": ".parquet"}
+
+    def __init__(self, repertoire: str, taille_max: int = 2 * 2**30, format: str = "arrow"):
+        """
+        Paramètres
+        ----------
+        repertoire : str
+            Répertoire du cache (créé si besoin).
+        taille_max : int, default=2 Go
+            Taille totale maximale du cache, en octets.
+        format : {'arrow', 'parquet'}, default='arrow'
+            Format des fichiers.
+        """
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError("pyarrow est requis pour le cache des étapes : pip install pyarrow")
+        if taille_max <= 0:
+            raise ValueError("`taille_max` doit être strictement positif.")
+        if format not in self.FORMATS:
+            raise ValueError(f"Format '{format}' non supporté. Choisir parmi {list(self.FORMATS)}.")
+        self.repertoire = repertoire
+        self.taille_max = taille_max
+        self.format = format
+        os.makedirs(repertoire, exist_ok=True)
+        self._verrou = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "ecritures": 0, "echecs_ecriture": 0}
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Compteurs du cache :
+        - hits / misses : exécutions reprises depuis le cache / calculées depuis le début
+        - ecritures : résultats enregistrés
+        - echecs_ecriture : résultats non convertibles en Arrow (ex: colonnes objet mixtes)
+        """
+        with self._verrou:
+            return dict(self._stats)
+
+    def incrementer(self, compteur: str, valeur: int = 1) -> None:
+        """
+        Incrémente un compteur de `stats`.
+        """
+        with self._verrou:
+            self._stats[compteur] += valeur
+
+    # ------------------------------------------------------------------
+    # Empreintes
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def empreinte_donnees(df: pd.DataFrame) -> str:
+        """
+        Empreinte du contenu d'un DataFrame : noms et types des colonnes, index et valeurs.
+        Les colonnes NumPy de types fixes et les colonnes Arrow (texte de pandas >= 3, types
+        nullables) sont hachées directement depuis leur mémoire ; les autres (objet,
+        catégories) via `pd.util.hash_pandas_object`.
+        """
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("`df` doit être un pandas.DataFrame.")
+        h = hashlib.sha256()
+        entete = [_VERSION, df.shape, [[repr(c), str(t)] for c, t in df.dtypes.items()]]
+        h.update(json.dumps(entete, default=str).encode("utf-8"))
+
+        index = df.index
+        if isinstance(index, pd.RangeIndex):
+            h.update(f"range:{index.start}:{index.stop}:{index.step}:{index.name!r}".encode("utf-8"))
+        else:
+            h.update(pd.util.hash_pandas_object(index).to_numpy().tobytes())
+
+        for i in range(df.shape[1]):
+            serie = df.iloc[:, i]
+            if isinstance(serie.dtype, np.dtype) and serie.dtype.kind in "biufcmM":
+                h.update(np.ascontiguousarray(serie.to_numpy()).view(np.uint8))
+            elif hasattr(serie.array, "__arrow_array__"):
+                tableau = serie.array.__arrow_array__()
+                for morceau in getattr(tableau, "chunks", [tableau]):
+                    # Les tampons d'un tableau découpé débordent de la tranche : position et longueur incluses.
+                    h.update(f"{morceau.offset}:{len(morceau)}".encode("utf-8"))
+                    for tampon in morceau.buffers():
+                        if tampon is not None:
+                            h.update(tampon)
+            else:
+                h.update(pd.util.hash_pandas_object(serie, index=False).to_numpy().tobytes())
+        return h.hexdigest()
+
+    @staticmethod
+    def empreinte_etape(precedente: str, nom: str, parametres: Dict[str, Any]) -> str:
+        """
+        Clé du résultat d'une étape : empreinte de la clé précédente (ou des données
+        d'entrée), du nom de l'étape et de ses paramètres.
+        """
+        h = hashlib.sha256()
+        h.update(precedente.encode("utf-8"))
+        h.update(json.dumps([nom, _canonique(parametres)], sort_keys=True, default=repr).encode("utf-8"))
+        return h.hexdigest()
+
+    # ------------------------------------------------------------------
+    # Lecture et écriture
+    # ------------------------------------------------------------------
+
+    def _chemin(self, cle: str) -> str:
+        return os.path.join(self.repertoire, cle + self.FORMATS[self.format])
+
+    def contient(self, cle: str) -> bool:
+        """
+        True si un résultat est enregistré sous cette clé.
+        """
+        return os.path.exists(self._chemin(cle))
+
+    def lire(self, cle: str) -> Optional[pd.DataFrame]:
+        """
+        Retourne le DataFrame enregistré sous une clé, sinon None.
+        """
+        import pyarrow as pa
+
+        chemin = self._chemin(cle)
+        try:
+            if self.format == "arrow":
+                table = pa.ipc.open_file(pa.memory_map(chemin)).read_all()
+            else:
+                import pyarrow.parquet as pq
+                table = pq.read_table(chemin)
+        except FileNotFoundError:
+            return None
+        except (OSError, pa.ArrowInvalid) as e:
+            journal.warning("Entrée de cache illisible %s, ignorée : %s", chemin, e)
+            self._supprimer(chemin)
+            return None
+        try:
+            os.utime(chemin)
+        except OSError:
+            pass
+        return table.to_pandas()
+
+    def ecrire(self, cle: str, df: pd.DataFrame, etapes: List[str]) -> bool:
+        """
+        Enregistre un résultat sous une clé.
+
+        Paramètres
+        ----------
+        cle : str
+            Clé du résultat (voir `empreinte_etape`).
+        df : pd.DataFrame
+            Résultat à enregistrer.
+        etapes : list
+            Noms des étapes dont le résultat dépend, depuis le début du pipeline
+            (utilisés par `invalider`).
+
+        Retour
+        ------
+        bool
+            False si le DataFrame n'est pas convertible en Arrow (l'exécution continue sans point de reprise).
+        """
+        import pyarrow as pa
+
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+            journal.warning("Résultat non enregistré dans le cache des étapes : %s", e)
+            self.incrementer("echecs_ecriture")
+            return False
+        meta = {"etapes": list(etapes), "lignes": len(df), "date": time.time()}
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), _META: json.dumps(meta)})
+
+        chemin = self._chemin(cle)
+        fd, tmp = tempfile.mkstemp(dir=self.repertoire)
+        os.close(fd)
+        try:
+            if self.format == "arrow":
+                with pa.OSFile(tmp, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            else:
+                import pyarrow.parquet as pq
+                pq.write_table(table, tmp)
+            os.replace(tmp, chemin)
+        except BaseException:
+            self._supprimer(tmp)
+            raise
+        self.incrementer("ecritures")
+        self.evincer()
+        return True
+
+    def _meta(self, chemin: str) -> Optional[dict]:
+        import pyarrow as pa
+
+        try:
+            if self.format == "arrow":
+                with pa.memory_map(chemin) as source:
+                    schema = pa.ipc.open_file(source).schema
+            else:
+                import pyarrow.parquet as pq
+                schema = pq.read_schema(chemin)
+            return json.loads((schema.metadata or {})[_META])
+        except (OSError, KeyError, ValueError, pa.ArrowInvalid):
+            return None
+
+    # ------------------------------------------------------------------
+    # Éviction et invalidation
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _supprimer(*chemins: str) -> None:
+        for chemin in chemins:
+            try:
+                os.remove(chemin)
+            except OSError:
+                pass
+
+    def _entrees(self) -> List[Tuple[float, int, str]]:
+        """
+        Liste des fichiers du cache : (date d'accès, taille, chemin).
+        """
+        entrees = []
+        extension = self.FORMATS[self.format]
+        for entree in os.scandir(self.repertoire):
+            if entree.name.startswith("tmp") or not entree.name.endswith(extension):
+                continue
+            try:
+                info = entree.stat()
+            except OSError:
+                continue
+            entrees.append((info.st_mtime, info.st_size, entree.path))
+        return entrees
+
+    def taille(self) -> int:
+        """
+        Taille totale des entrées du cache, en octets.
+        """
+        return sum(taille for _, taille, _ in self._entrees())
+
+    def evincer(self) -> int:
+        """
+        Supprime les entrées les moins récemment utilisées jusqu'à revenir sous
+        `taille_max`. Retourne le nombre d'entrées supprimées.
+        """
+        with self._verrou:
+            entrees = sorted(self._entrees())
+            total = sum(taille for _, taille, _ in entrees)
+            supprimes = 0
+            while entrees and total > self.taille_max:
+                _, taille, chemin = entrees.pop(0)
+                self._supprimer(chemin)
+                total -= taille
+                supprimes += 1
+            return supprimes
+
+    def invalider(self, etapes: Optional[Iterable[str]] = None) -> int:
+        """
+        Supprime les résultats qui dépendent de l'une des étapes indiquées
+        (ex: après modification de leur implémentation).
+
+        Paramètres
+        ----------
+        etapes : str ou list, optionnel
+            Noms d'étapes du pipeline (ex: "imputer", ["encoder", "gerer_outliers"]).
+            Par défaut, toutes les entrées sont supprimées.
+
+        Retour
+        ------
+        int
+            Nombre d'entrées supprimées.
+        """
+        if etapes is None:
+            return self.vider()
+        noms = {etapes} if isinstance(etapes, str) else set(etapes)
+        supprimes = 0
+        with self._verrou:
+            for _, _, chemin in self._entrees():
+                meta = self._meta(chemin)
+                if meta is None or noms.intersection(meta["etapes"]):
+                    self._supprimer(chemin)
+                    supprimes += 1
+        return supprimes
+
+    def vider(self) -> int:
+        """
+        Supprime toutes les entrées du cache (les compteurs sont conservés).
+        Retourne le nombre d'entrées supprimées.
+        """
+        with self._verrou:
+            entrees = self._entrees()
+            for _, _, chemin in entrees:
+                self._supprimer(chemin)
+            return len(entrees)
@@ -0,0 +1,400 @@
+import pandas as pd
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from ..imputation.imputer import Imputateur
+from ..imputation.imputation_supervisee import ImputateurML
+from ..transformation.normalisation import NormaliserColonne
+from ..transformation.standardisation_z_score import Standardisation
+from ..transformation.type_colonne import TypeColonne
+from ..nettoyage.gestion_outliers import GestionOutliers
+from ..encodage.methode_encodage import EncodeurCategoriel
+from ..feature_engineering.feature_derivation import FeatureEngineering
+from ..remplacement.remplacer import RemplacementColonne
+from ..outils.instrumentation import compter, instrumenter
+from .cache_etapes import CacheEtapes
+
+
+class _Etape:
+    """
+    Étape enregistrée d'un pipeline.
+
+    - lues / ecrites / supprimees : colonnes lues, écrites (ou créées) et supprimées.
+    - prefixe_cree : préfixe des colonnes créées dont les noms ne sont connus qu'à l'exécution (one-hot).
+    - locale : True si l'étape ne lit que ses colonnes et conserve les lignes ; les étapes
+      locales consécutives sont fusionnées et exécutées sur les seules colonnes concernées.
+    """
+
+    def __init__(
+        self,
+        nom: str,
+        appliquer: Callable[[pd.DataFrame], pd.DataFrame],
+        parametres: Dict[str, Any],
+        lues: List[str],
+        ecrites: List[str],
+        supprimees: Optional[List[str]] = None,
+        prefixe_cree: Optional[str] = None,
+        locale: bool = True,
+    ):
+        self.nom = nom
+        self.appliquer = appliquer
+        self.parametres = parametres
+        self.lues = lues
+        self.ecrites = ecrites
+        self.supprimees = supprimees or []
+        self.prefixe_cree = prefixe_cree
+        self.locale = locale
+
+    def __repr__(self) -> str:
+        return f"{self.nom}({', '.join(f'{k}={v!r}' for k, v in self.parametres.items())})"
+
+
+class Pipeline:
+    """
+    Pipeline de transformations évalué paresseusement.
+
+    Les étapes sont enregistrées par chaînage, puis `executer` :
+    - valide toutes les références de colonnes avant de lancer le moindre calcul ;
+    - fusionne les étapes locales consécutives (imputation, normalisation, remplacement,
+      types, features, encodage, outliers sans suppression de lignes) en blocs : chaque bloc
+      travaille sur une copie des seules colonnes qu'il lit ou écrit, puis les réécrit une fois ;
+    - exécute les autres étapes (suppression d'outliers, imputation ML) sur une unique copie
+      de travail dont les colonnes non modifiées restent partagées avec le DataFrame d'entrée.
+
+    Avec un `CacheEtapes`, les résultats intermédiaires sont enregistrés sur disque et une
+    nouvelle exécution ne recalcule que les étapes modifiées et les suivantes.
+
+    Exemple
+    -------
+    >>> pipe = (
+    ...     Pipeline()
+    ...     .remplacer("CocoaPercentage", ("%", ""))
+    ...     .changer_type("Rating", float)
+    ...     .imputer("Rating", strategie="mediane")
+    ...     .normaliser("Rating")
+    ... )
+    >>> df_out = pipe.executer(df)
+    """
+
+    def __init__(self):
+        self.etapes: List[_Etape] = []
+
+    def __repr__(self) -> str:
+        return "Pipeline(\n" + "".join(f"    {etape!r},\n" for etape in self.etapes) + ")"
+
+    def _ajouter(self, etape: _Etape) -> "Pipeline":
+        self.etapes.append(etape)
+        return self
+
+    # ------------------------------------------------------------------
+    # Enregistrement des étapes
+    # ------------------------------------------------------------------
+
+    def imputer(self, colonne: str, strategie: str = "moyenne", *, fallback: Any = None) -> "Pipeline":
+        """
+        Ajoute une imputation simple (voir `Imputateur.imputer_colonne`).
+        """
+        def appliquer(df: pd.DataFrame) -> pd.DataFrame:
+            df[colonne] = Imputateur.imputer_colonne(df, colonne, strategie, fallback=fallback)[colonne]
+            return df
+
+        return self._ajouter(_Etape(
+            "imputer", appliquer, {"colonne": colonne, "strategie": strategie, "fallback": fallback},
+            lues=[colonne], ecrites=[colonne],
+        ))
+
+    def imputer_ml(self, colonne_cible: str, modele) -> "Pipeline":
+        """
+        Ajoute une imputation supervisée (voir `ImputateurML.imputer_colonne_ml`).
+        L'étape lit toutes les colonnes : elle n'est pas fusionnée.
+        """
+        def appliquer(df: pd.DataFrame) -> pd.DataFrame:
+            df[colonne_cible] = ImputateurML.imputer_colonne_ml(df, colonne_cible, modele)
+            return df
+
+        return self._ajouter(_Etape(
+            "imputer_ml", appliquer, {"colonne_cible": colonne_cible, "modele": modele},
+            lues=[colonne_cible], ecrites=[colonne_cible], locale=False,
+        ))
+
+    def normaliser(self, col: str, as_new: Optional[str] = None) -> "Pipeline":
+        """
+        Ajoute une normalisation Min-Max (voir `NormaliserColonne.normaliser_colonne_choisie`).
+        """
+        def appliquer(df: pd.DataFrame) -> pd.DataFrame:
+            return NormaliserColonne.normaliser_colonne_choisie(df, col, as_new=as_new, inplace=True)
+
+        return self._ajouter(_Etape(
+            "normaliser", appliquer, {"col": col, "as_new": as_new},
+            lues=[col], ecrites=[as_new or col],
+        ))
+
+    def standardiser(self, colonnes: Union[str, List[str]], prefix: Optional[str] = None) -> "Pipeline":
+        """
+        Ajoute une standardisation z-score (voir `Standardisation.zscore`).
+        """
+        colonnes = [colonnes] if isinstance(colonnes, str) else list(colonnes)
+
+        def appliquer(df: pd.DataFrame) -> pd.DataFrame:
+            return Standardisation.zscore(df, colonnes, inplace=prefix is None, prefix=prefix)
+
+        return self._ajouter(_Etape(
+            "standardiser", appliquer, {"colonnes": colonnes, "prefix": prefix},
+            lues=colonnes, ecrites=[f"{prefix}{c}" if prefix else c for c in colonnes],
+        ))
+
+    def gerer_outliers(self, colonne: str, strategie: str = "remove", *, seuil: float = 1.5) -> "Pipeline":
+        """
+        Ajoute un traitement des outliers (voir `GestionOutliers.gerer_outliers`).
+        La stratégie 'remove' supprime des lignes : elle n'est pas fusionnée.
+        """
+        def appliquer(df: pd.DataFrame) -> pd.DataFrame:
+            return GestionOutliers.gerer_outliers(df, colonne, strategie, inplace=True, seuil=seuil)
+
+        ecrites = [f"{colonne}_outlier_flag"] if strategie == "flag" else [] if strategie == "remove" else [colonne]
+        return self._ajouter(_Etape(
+            "gerer_outliers", appliquer, {"colonne": colonne, "strategie": strategie, "seuil": seuil},
+            lues=[colonne], ecrites=ecrites, locale=strategie != "remove",
+        ))
+
+    def encoder(
+        self,
+        colonne: str,
+        strategie: str = "onehot",
+        *,
+        mapping: Optional[dict] = None,
+        prefix: Optional[str] = None,
+    ) -> "Pipeline":
+        """
+        Ajoute un encodage catégoriel (voir `EncodeurCategoriel.encoder_colonne`).
+        """
+        def appliquer(df: pd.DataFrame) -> pd.DataFrame:
+            return EncodeurCategoriel.encoder_colonne(
+                df, colonne, strategie, mapping=mapping, prefix=prefix, inplace=True
+            )
+
+        onehot = strategie == "onehot"
+        return self._ajouter(_Etape(
+            "encoder", appliquer,
+            {"colonne": colonne, "strategie": strategie, "mapping": mapping, "prefix": prefix},
+            lues=[colonne],
+            ecrites=[] if onehot else [colonne],
+            supprimees=[colonne] if onehot else [],
+            prefixe_cree=f"{prefix or colonne}_" if onehot else None,
+        ))
+
+    def remplacer(
+        self,
+        colonne: str,
+        remplacement: Union[Dict[str, str], tuple, list],
+        *,
+        divide: bool = True,
+    ) -> "Pipeline":
+        """
+        Ajoute un remplacement de valeurs (voir `RemplacementColonne.remplacer_valeurs`).
+        """
+        def appliquer(df: pd.DataFrame) -> pd.DataFrame:
+            return RemplacementColonne.remplacer_valeurs(df, colonne, remplacement, inplace=True, divide=divide)
+
+        return self._ajouter(_Etape(
+            "remplacer", appliquer, {"colonne": colonne, "remplacement": remplacement, "divide": divide},
+            lues=[colonne], ecrites=[colonne],
+        ))
+
+    def creer_feature(
+        self,
+        methode: str,
+        col1: str,
+        col2: Optional[str] = None,
+        *,
+        window: Optional[int] = None,
+        periods: int = 1,
+        new_col: Optional[str] = None,
+    ) -> "Pipeline":
+        """
+        Ajoute une feature dérivée (voir `FeatureEngineering.creer_feature`).
+        """
+        noms = {
+            "ratio": f"{col1}_over_{col2}",
+            "difference": f"{col1}_minus_{col2}",
+            "rolling_mean": f"{col1}_rolling_mean_{window}",
+            "rolling_std": f"{col1}_rolling_std_{window}",
+            "lag": f"{col1}_lag_{periods}",
+        }
+        if methode not in noms:
+            raise ValueError(f"Méthode '{methode}' non supportée.")
+
+        def appliquer(df: pd.DataFrame) -> pd.DataFrame:
+            return FeatureEngineering.creer_feature(
+                df, methode, col1, col2, window=window, periods=periods, new_col=new_col, inplace=True
+            )
+
+        return self._ajouter(_Etape(
+            "creer_feature", appliquer,
+            {"methode": methode, "col1": col1, "col2": col2, "window": window, "periods": periods, "new_col": new_col},
+            lues=[col1] + ([col2] if col2 else []), ecrites=[new_col or noms[methode]],
+        ))
+
+    def changer_type(self, cols: Union[str, List[str]], type_) -> "Pipeline":
+        """
+        Ajoute un changement de type (voir `TypeColonne.changer_type_colonne`).
+        """
+        cols = [cols] if isinstance(cols, str) else list(cols)
+
+        def appliquer(df: pd.DataFrame) -> pd.DataFrame:
+            TypeColonne.changer_type_colonne(df, cols, type_, inplace=True)
+            return df
+
+        return self._ajouter(_Etape(
+            "changer_type", appliquer, {"cols": cols, "type_": type_},
+            lues=cols, ecrites=cols,
+        ))
+
+    # ------------------------------------------------------------------
+    # Validation, plan et exécution
+    # ------------------------------------------------------------------
+
+    def valider(self, colonnes) -> List[str]:
+        """
+        Vérifie, sans rien calculer, que chaque étape ne référence que des colonnes
+        disponibles à ce stade du pipeline.
+
+        Paramètres
+        ----------
+        colonnes : itérable
+            Colonnes du DataFrame d'entrée.
+
+        Retour
+        ------
+        list
+            Colonnes connues en sortie (hors colonnes one-hot, nommées à l'exécution).
+        """
+        disponibles = list(colonnes)
+        prefixes: List[str] = []
+        for position, etape in enumerate(self.etapes):
+            absentes = [
+                c for c in etape.lues
+                if c not in disponibles and not any(str(c).startswith(p) for p in prefixes)
+            ]
+            if absentes:
+                raise ValueError(f"Étape {position} ({etape.nom}) : colonnes inexistantes {absentes}")
+            disponibles = [c for c in disponibles if c not in etape.supprimees]
+            disponibles += [c for c in etape.ecrites if c not in disponibles]
+            if etape.prefixe_cree:
+                prefixes.append(etape.prefixe_cree)
+        return disponibles
+
+    def plan(self, etapes: Optional[List[_Etape]] = None) -> List[List[_Etape]]:
+        """
+        Regroupe les étapes (par défaut, toutes celles du pipeline) en blocs d'exécution :
+        étapes locales consécutives fusionnées, autres étapes seules.
+        """
+        blocs: List[List[_Etape]] = []
+        for etape in self.etapes if etapes is None else etapes:
+            if etape.locale and blocs and blocs[-1][0].locale:
+                blocs[-1].append(etape)
+            else:
+                blocs.append([etape])
+        return blocs
+
+    @staticmethod
+    def _executer_bloc(travail: pd.DataFrame, bloc: List[_Etape]) -> pd.DataFrame:
+        """
+        Exécute un bloc d'étapes locales sur une copie des seules colonnes concernées,
+        puis reporte les colonnes écrites, créées ou supprimées dans le DataFrame de travail.
+        """
+        concernees = []
+        for etape in bloc:
+            for c in etape.lues + etape.ecrites + etape.supprimees:
+                if c in travail.columns and c not in concernees:
+                    concernees.append(c)
+        entree = set(concernees)
+        sous = travail[concernees].copy()
+
+        for etape in bloc:
+            sous = etape.appliquer(sous)
+
+        ecrites = {c for etape in bloc for c in etape.ecrites}
+        supprimees = [c for c in concernees if c not in sous.columns]
+        if supprimees:
+            travail = travail.drop(columns=supprimees)
+        for c in sous.columns:
+            if c not in entree or c in ecrites:
+                travail[c] = sous[c]
+        return travail
+
+    @instrumenter("Pipeline.executer")
+    def executer(
+        self,
+        df: pd.DataFrame,
+        copie: bool = True,
+        cache: Optional[CacheEtapes] = None,
+        points_reprise: str = "etapes",
+    ) -> pd.DataFrame:
+        """
+        Valide puis exécute le pipeline.
+
+        Avec un cache, le résultat de chaque étape (ou de chaque bloc) est enregistré et
+        une nouvelle exécution sur les mêmes données reprend après la dernière étape
+        inchangée dont le résultat est en cache (seules les étapes suivantes sont recalculées).
+
+        Paramètres
+        ----------
+        df : pd.DataFrame
+            DataFrame d'entrée.
+        copie : bool, default=True
+            - True  : `df` n'est pas modifié ; seules les colonnes modifiées sont copiées.
+            - False : les colonnes de `df` sont remplacées directement (pas de copie de travail).
+              Lors d'une reprise depuis le cache, `df` n'est pas modifié.
+        cache : CacheEtapes, optionnel
+            Cache des résultats intermédiaires.
+        points_reprise : {'etapes', 'blocs'}, default='etapes'
+            Avec un cache uniquement :
+            - 'etapes' : résultat enregistré après chaque étape ; modifier un paramètre
+              ne recalcule que cette étape et les suivantes. Les étapes locales sont alors
+              exécutées une à une (sans fusion).
+            - 'blocs' : résultat enregistré à la fin de chaque bloc fusionné (moins
+              d'écritures) ; modifier une étape recalcule tout son bloc.
+
+        Retour
+        ------
+        pd.DataFrame
+            DataFrame transformé.
+        """
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("`df` doit être un pandas.DataFrame.")
+        if points_reprise not in ("etapes", "blocs"):
+            raise ValueError(f"`points_reprise` '{points_reprise}' non supporté. Choisir parmi ['etapes', 'blocs'].")
+        self.valider(df.columns)
+
+        travail = None
+        debut = 0
+        if cache is not None:
+            cles = [cache.empreinte_donnees(df)]
+            for etape in self.etapes:
+                cles.append(cache.empreinte_etape(cles[-1], etape.nom, etape.parametres))
+            # Reprise après la dernière étape dont le résultat est en cache.
+            for position in range(len(self.etapes), 0, -1):
+                if cache.contient(cles[position]):
+                    travail = cache.lire(cles[position])
+                    if travail is not None:
+                        debut = position
+                        break
+            cache.incrementer("hits" if debut else "misses")
+            compter(etapes_en_cache=debut)
+
+        if travail is None:
+            travail = df.copy(deep=False) if copie else df
+        fin = debut
+        if cache is not None and points_reprise == "etapes":
+            blocs = [[etape] for etape in self.etapes[debut:]]
+        else:
+            blocs = self.plan(self.etapes[debut:])
+        for bloc in blocs:
+            if bloc[0].locale:
+                travail = self._executer_bloc(travail, bloc)
+            else:
+                travail = bloc[0].appliquer(travail)
+            fin += len(bloc)
+            if cache is not None:
+                cache.ecrire(cles[fin], travail, [etape.nom for etape in self.etapes[:fin]])
+        return travail
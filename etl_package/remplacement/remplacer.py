@@ -1,6 +1,12 @@
+import logging
 import pandas as pd
 from typing import Union, Dict
 
+from ..outils.copie import Copie, copier
+from ..outils.instrumentation import compter, est_active, instrumenter
+
+journal = logging.getLogger(__name__)
+
 class RemplacementColonne:
     """
     Classe permettant de remplacer des valeurs ou sous-chaînes
@@ -9,6 +15,7 @@ class RemplacementColonne:
     """
 
     @staticmethod
+    @instrumenter("RemplacementColonne.remplacer_valeurs")
     def remplacer_valeurs(
         df: pd.DataFrame,
         colonne: str,
@@ -16,6 +23,7 @@ class RemplacementColonne:
         *,
         inplace: bool = False,
         divide: bool = True,
+        copie: Copie = "auto",
     ) -> pd.DataFrame:
         """
         Remplace des valeurs ou sous-chaînes dans une colonne,
@@ -34,6 +42,9 @@ class RemplacementColonne:
             Si True, modifie directement df. Sinon, retourne une copie.
         divide : bool, default=True
             Si True, divise les valeurs de la colonne par 100.
+        copie : {"auto", "profonde", "colonnes"}, default="auto"
+            Mode de copie lorsque `inplace=False` (voir `outils.copie.copier`) :
+            "colonnes" partage les colonnes non modifiées avec `df`.
 
         Retour
         ------
@@ -45,7 +56,7 @@ class RemplacementColonne:
         if colonne not in df.columns:
             raise ValueError(f"La colonne '{colonne}' est absente du DataFrame.")
 
-        df_out = df if inplace else df.copy()
+        df_out = df if inplace else copier(df, copie)
 
        
         if isinstance(remplacement, (tuple, list)) and len(remplacement) == 2:
@@ -59,13 +70,17 @@ class RemplacementColonne:
             df_out[colonne] = df_out[colonne].astype(str).replace(remplacement, regex=True)
 
             
+            if est_active():
+                manquantes = df[colonne].isna().sum()
             df_out[colonne] = pd.to_numeric(df_out[colonne], errors="coerce")
+            if est_active():
+                compter(valeurs_non_numeriques=df_out[colonne].isna().sum() - manquantes)
 
             if divide:
                 df_out[colonne] = df_out[colonne] / 100
-                print(f" Remplacement effectué et colonne '{colonne}' divisée par 100.")
+                journal.info("Remplacement effectué et colonne '%s' divisée par 100.", colonne)
             else:
-                print(f" Remplacement effectué dans la colonne '{colonne}' (sans division).")
+                journal.info("Remplacement effectué dans la colonne '%s' (sans division).", colonne)
         except Exception as e:
             raise ValueError(f"Erreur lors du traitement de '{colonne}' : {e}")
 
@@ -1,4 +1,15 @@
+import logging
+import numpy as np
 import pandas as pd
+from typing import Any, Dict, List, Optional, Union
+
+from ..outils.ajustable import TransformateurAjuste
+from ..outils.colonnes import resoudre_colonnes
+from ..outils.copie import Copie, copier
+from ..outils.instrumentation import instrumenter
+from ..outils.statistiques import Moments
+
+journal = logging.getLogger(__name__)
 
 class NormaliserColonne:
     """
@@ -7,8 +18,8 @@ class NormaliserColonne:
     """
 
     @staticmethod
-    
-    def normaliser_colonne_choisie(df: pd.DataFrame, col: str, as_new: str | None = None,inplace: bool=False) -> pd.DataFrame:
+    @instrumenter("NormaliserColonne.normaliser_colonne_choisie")
+    def normaliser_colonne_choisie(df: pd.DataFrame, col: str | List[str] | Any, as_new: str | None = None,inplace: bool=False, *, copie: Copie = "auto") -> pd.DataFrame:
         """
         Normalise une colonne d'un DataFrame entre 0 et 1.
         
@@ -16,13 +27,18 @@ class NormaliserColonne:
         ----------
         df : pd.DataFrame 
             Le DataFrame dont on veut normaliser une colonne
-        col : str
-            Le nom de la colonne à normaliser
+        col : str, list ou sélecteur de types
+            Le nom de la colonne à normaliser, une liste de colonnes ou un sélecteur
+            de types (ex: "number") : les colonnes sont alors normalisées en un seul passage 2-D.
         as_new : str | None, default=None
             - Si None : la colonne est remplacée
             - Si str  : la colonne normalisée est stockée sous ce nom
+              (plusieurs colonnes : préfixe des nouvelles colonnes)
         inplace : bool, default=False
             Si True, modifie directement df. Sinon, retourne une copie.
+        copie : {"auto", "profonde", "colonnes"}, default="auto"
+            Mode de copie lorsque `inplace=False` (voir `outils.copie.copier`) :
+            "colonnes" partage les colonnes non modifiées avec `df`.
         
         Returns
         -------
@@ -34,11 +50,13 @@ class NormaliserColonne:
             raise TypeError("df doit être un DataFrame pandas")
         
         if df.empty:
-            print("Le DataFrame est vide.")
+            journal.warning("Le DataFrame est vide.")
             return df
-        
-        if col not in df.columns:
-            raise ValueError(f"La colonne '{col}' n'existe pas dans le DataFrame")
+
+        if not (isinstance(col, str) and col in df.columns):
+            return NormaliserColonne._normaliser_bloc(
+                df, resoudre_colonnes(df, col, numeriques=True), as_new, inplace, copie
+            )
         
         if not pd.api.types.is_numeric_dtype(df[col]):
             raise TypeError(f"La colonne '{col}' doit être numérique pour être normalisée.")
@@ -46,26 +64,93 @@ class NormaliserColonne:
         if inplace :
             df = df
         else:
-            df = df.copy()
+            df = copier(df, copie)
        
         
         col_min, col_max = df[col].min(), df[col].max()
         
         if col_min == col_max:
-            print(f"Impossible de normaliser : la colonne '{col}' contient une valeur constante ({col_min}).")
+            journal.warning("Impossible de normaliser : la colonne '%s' contient une valeur constante (%s).", col, col_min)
             return df
         
         try:
             normalized = (df[col] - col_min) / (col_max - col_min)
             if as_new is None:
                 df[col] = normalized
-                print(f"La colonne '{col}' a été normalisée entre 0 et 1 .")
+                journal.info("La colonne '%s' a été normalisée entre 0 et 1 .", col)
             else:
                 if as_new in df.columns:
-                    print(f"Attention : la colonne '{as_new}' existe déjà, elle sera écrasée.")
+                    journal.warning("Attention : la colonne '%s' existe déjà, elle sera écrasée.", as_new)
                 df[as_new] = normalized
-                print(f"La colonne '{col}' a été normalisée entre 0 et 1 et stockée dans '{as_new}'.")
+                journal.info("La colonne '%s' a été normalisée entre 0 et 1 et stockée dans '%s'.", col, as_new)
         except Exception as e:
             raise ValueError(f"Erreur lors de la normalisation de '{col}' : {e}")
         
         return df
+
+    @staticmethod
+    def _normaliser_bloc(
+        df: pd.DataFrame, colonnes: List[str], prefix: Optional[str], inplace: bool, copie: Copie
+    ) -> pd.DataFrame:
+        """
+        Normalise plusieurs colonnes : minimums et maximums calculés en un seul passage
+        NumPy sur le bloc, résultat réécrit en une seule affectation.
+        """
+        df = df if inplace else copier(df, copie)
+        X = df[colonnes].to_numpy(dtype=float)
+        col_min, col_max = np.fmin.reduce(X, axis=0), np.fmax.reduce(X, axis=0)
+
+        constantes = col_min == col_max
+        for c, valeur in zip(np.asarray(colonnes)[constantes], col_min[constantes]):
+            journal.warning("Impossible de normaliser : la colonne '%s' contient une valeur constante (%s).", c, valeur)
+
+        garde = ~constantes
+        if garde.any():
+            cibles = [f"{prefix}{c}" if prefix else c for c in np.asarray(colonnes)[garde]]
+            df[cibles] = (X[:, garde] - col_min[garde]) / (col_max - col_min)[garde]
+            journal.info("%d colonne(s) normalisée(s) entre 0 et 1.", len(cibles))
+        return df
+
+
+class NormaliserColonneAjuste(TransformateurAjuste):
+    """
+    Normalisation Min-Max avec minimum et maximum ajustés par `fit` / `partial_fit`,
+    puis réutilisés par `transform` (les valeurs hors de l'intervalle ajusté
+    sortent de [0, 1]).
+    """
+
+    def __init__(self, colonnes: Union[str, List[str]], prefix: Optional[str] = None):
+        """
+        Paramètres
+        ----------
+        colonnes : str ou list de str
+            Colonne(s) numérique(s) à normaliser.
+        prefix : str ou None
+            Préfixe des colonnes normalisées (ex: "norm_"). Si None, les colonnes sont remplacées.
+        """
+        super().__init__(colonnes)
+        self.prefix = prefix
+
+    def _parametres(self) -> Dict[str, Any]:
+        return {"colonnes": self.colonnes, "prefix": self.prefix}
+
+    def sorties(self) -> List[str]:
+        return [f"{self.prefix}{c}" if self.prefix else c for c in self.colonnes]
+
+    def _statistiques_colonne(self) -> Dict[str, Any]:
+        return {"moments": Moments()}
+
+    def _verifier_colonne(self, s: pd.Series) -> None:
+        if not pd.api.types.is_numeric_dtype(s):
+            raise TypeError(f"La colonne '{s.name}' doit être numérique pour être normalisée.")
+
+    def _transformer(self, df_out: pd.DataFrame) -> pd.DataFrame:
+        for c in self.colonnes:
+            moments = self.statistiques[c]["moments"]
+            if not moments.max > moments.min:
+                journal.warning(
+                    "Impossible de normaliser : la colonne '%s' avait une valeur constante (%s).", c, moments.min
+                )
+                continue
+            df_out[f"{self.prefix}{c}" if self.prefix else c] = (df_out[c] - moments.min) / (moments.max - moments.min)
+        return df_out
@@ -1,8 +1,15 @@
 
 
+import warnings
 import pandas as pd
 import numpy as np
-from typing import Union, List, Optional
+from typing import Any, Dict, Union, List, Optional
+
+from ..outils.ajustable import TransformateurAjuste
+from ..outils.colonnes import resoudre_colonnes
+from ..outils.copie import Copie, copier
+from ..outils.instrumentation import instrumenter
+from ..outils.statistiques import Moments
 
 
 class Standardisation:
@@ -11,12 +18,14 @@ class Standardisation:
     """
 
     @staticmethod
-    
+    @instrumenter("Standardisation.zscore")
     def zscore(
         df: pd.DataFrame,
         colonnes: Union[str, List[str]],
         inplace: bool = False,
-        prefix: Optional[str] = None
+        prefix: Optional[str] = None,
+        *,
+        copie: Copie = "auto",
     ) -> pd.DataFrame:
         """
         Applique la standardisation z-score (centrage-réduction) sur les colonnes spécifiées.
@@ -25,42 +34,84 @@ class Standardisation:
         ----------
         df : pd.DataFrame
             Le DataFrame contenant les données.
-        colonnes : str ou list de str
-            Colonne(s) numérique(s) à standardiser.
+        colonnes : str, list de str ou sélecteur de types
+            Colonne(s) numérique(s) à standardiser, ou sélecteur de types (ex: "number").
+            Moyennes et écarts-types sont calculés en un seul passage 2-D sur le bloc.
         inplace : bool, default=False
             Si True, modifie directement df. Sinon, retourne une copie.
         prefix : str ou None
             Préfixe pour nommer la nouvelle colonne (ex: "std_"). 
             Si None et inplace=False, on remplace les colonnes originales.
+        copie : {"auto", "profonde", "colonnes"}, default="auto"
+            Mode de copie lorsque `inplace=False` (voir `outils.copie.copier`) :
+            "colonnes" partage les colonnes non modifiées avec `df`.
 
         Retour
         ------
         pd.DataFrame
             DataFrame avec colonnes standardisées.
         """
-        if isinstance(colonnes, str):
-            colonnes = [colonnes]
+        colonnes = resoudre_colonnes(df, colonnes, numeriques=True)
 
         if inplace:
             df_out = df
         else:
-            df_out = df.copy()
+            df_out = copier(df, copie)
+
+        if not colonnes:
+            return df_out
+
+        X = df_out[colonnes].to_numpy(dtype=float)
+        with warnings.catch_warnings():
+            # Colonnes entièrement NaN : moyenne et écart-type NaN, comme pandas.
+            warnings.simplefilter("ignore", RuntimeWarning)
+            mean = np.nanmean(X, axis=0)
+            std = np.nanstd(X, axis=0, ddof=0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = (X - mean) / std
+
+        if inplace or not prefix:
+            df_out[colonnes] = z
+        else:
+            df_out[[f"{prefix}{col}" for col in colonnes]] = z
+
+        return df_out
+
+
+class StandardisationAjustee(TransformateurAjuste):
+    """
+    Standardisation z-score avec moyenne et écart-type ajustés par `fit` / `partial_fit`
+    (cumul exact entre lots), puis réutilisés par `transform`.
+    """
+
+    def __init__(self, colonnes: Union[str, List[str]], prefix: Optional[str] = None):
+        """
+        Paramètres
+        ----------
+        colonnes : str ou list de str
+            Colonne(s) numérique(s) à standardiser.
+        prefix : str ou None
+            Préfixe des colonnes standardisées (ex: "std_"). Si None, les colonnes sont remplacées.
+        """
+        super().__init__(colonnes)
+        self.prefix = prefix
 
-        for col in colonnes:
-            if col not in df_out.columns:
-                raise ValueError(f"La colonne '{col}' est absente du DataFrame.")
-            if not np.issubdtype(df_out[col].dtype, np.number):
-                raise TypeError(f"La colonne '{col}' doit être numérique.")
+    def _parametres(self) -> Dict[str, Any]:
+        return {"colonnes": self.colonnes, "prefix": self.prefix}
 
-            mean = df_out[col].mean()
-            std = df_out[col].std(ddof=0)  
+    def sorties(self) -> List[str]:
+        return [f"{self.prefix}{c}" if self.prefix else c for c in self.colonnes]
 
-            z = (df_out[col] - mean) / std
+    def _statistiques_colonne(self) -> Dict[str, Any]:
+        return {"moments": Moments()}
 
-            if inplace:
-                df_out[col] = z
-            else:
-                new_col = f"{prefix}{col}" if prefix else col
-                df_out[new_col] = z
+    def _verifier_colonne(self, s: pd.Series) -> None:
+        if not np.issubdtype(s.dtype, np.number):
+            raise TypeError(f"La colonne '{s.name}' doit être numérique.")
 
+    def _transformer(self, df_out: pd.DataFrame) -> pd.DataFrame:
+        for c in self.colonnes:
+            moments = self.statistiques[c]["moments"]
+            df_out[f"{self.prefix}{c}" if self.prefix else c] = (df_out[c] - moments.moyenne) / moments.ecart_type()
         return df_out
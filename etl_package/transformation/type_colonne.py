@@ -1,12 +1,19 @@
+import logging
 import pandas as pd
 
+from ..outils.copie import Copie, copier
+from ..outils.instrumentation import compter, instrumenter
+
+journal = logging.getLogger(__name__)
+
 class TypeColonne:
     """
     Cette classe permet de changer le type d'une ou plusieurs colonnes d'un DataFrame.
     """
 
     @staticmethod
-    def changer_type_colonne(df: pd.DataFrame, cols, type_, inplace: bool = False) -> pd.DataFrame:
+    @instrumenter("TypeColonne.changer_type_colonne")
+    def changer_type_colonne(df: pd.DataFrame, cols, type_, inplace: bool = False, *, copie: Copie = "auto") -> pd.DataFrame:
         """
         Change le type d'une ou plusieurs colonnes d'un DataFrame.
         
@@ -21,6 +28,9 @@ class TypeColonne:
         inplace : bool, default=False
             - True : modifie le DataFrame original
             - False : renvoie une copie modifiée
+        copie : {"auto", "profonde", "colonnes"}, default="auto"
+            Mode de copie lorsque `inplace=False` (voir `outils.copie.copier`) :
+            "colonnes" partage les colonnes non modifiées avec `df`.
         
         Returns
         -------
@@ -32,7 +42,7 @@ class TypeColonne:
             raise ValueError("df doit être un DataFrame pandas")
         
         if df.empty:
-            print("Le DataFrame est vide.")
+            journal.warning("Le DataFrame est vide.")
             return df
         
       
@@ -46,15 +56,16 @@ class TypeColonne:
             raise ValueError(f"Colonnes inexistantes dans le DataFrame: {missing_cols}")
         
       
-        target_df = df if inplace else df.copy()
+        target_df = df if inplace else copier(df, copie)
         
         for col in cols:
             try:
                 target_df[col] = target_df[col].astype(type_)
 
-                print(f"La colonne '{col}' a été convertie en {target_df[col].dtype}")
+                journal.info("La colonne '%s' a été convertie en %s", col, target_df[col].dtype)
 
             except Exception as e:
-                print(f"Erreur lors de la conversion de '{col}' en {type_} : {e}")
+                compter(conversions_en_echec=1)
+                journal.error("Erreur lors de la conversion de '%s' en %s : %s", col, type_, e)
         
         return None if inplace else target_df
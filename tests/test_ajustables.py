@@ -0,0 +1,38 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from etl_package import GestionOutliers, GestionOutliersAjustee, Imputateur, ImputateurAjuste
+from etl_package.outils.statistiques import Quantiles
+
+
+def _donnees(n=5000):
+    rng = np.random.default_rng(0)
+    x = rng.lognormal(size=n)
+    x[rng.random(n) < 0.2] = np.nan
+    return pd.DataFrame({"x": x})
+
+
+def test_fit_mediane_exacte_comme_imputateur():
+    df = _donnees()
+    attendu = Imputateur.imputer_colonne(df, "x", "mediane")["x"]
+    obtenu = ImputateurAjuste("x", "mediane").fit_transform(df)["x"]
+    pd.testing.assert_series_equal(obtenu, attendu)
+
+
+def test_fit_bornes_exactes_comme_gestion_outliers():
+    df = _donnees()
+    attendu = GestionOutliers.gerer_outliers(df, "x", "winsorize")["x"]
+    obtenu = GestionOutliersAjustee("x", "winsorize").fit_transform(df)["x"]
+    pd.testing.assert_series_equal(obtenu, attendu)
+
+
+def test_quantiles_exacts_oublies_apres_cumul():
+    q = Quantiles(k=16).update(np.arange(1000.0))
+    assert q.quantile(0.5) == 499.5
+    copie = Quantiles.from_dict(json.loads(json.dumps(q.to_dict())))
+    assert copie.quantile(0.5) == 499.5
+    q.update(np.arange(1000.0, 2000.0))
+    assert not q.exacts
+    assert abs(q.quantile(0.5) - 999.5) < 2000 / 16
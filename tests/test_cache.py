@@ -0,0 +1,122 @@
+import os
+import pickle
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+from etl_package import CacheHTTP, ExtractionData
+
+
+class _Cassant:
+    """Objet dont le dépickling échoue, comme un pickle d'une autre version du package."""
+
+    def __reduce__(self):
+        return (_module_absent, ())
+
+
+def _module_absent():
+    import module_absent_du_cache  # noqa: F401
+
+
+def test_lire_df_entree_illisible_supprimee(tmp_path):
+    cache = CacheHTTP(str(tmp_path))
+    cache.ecrire_df("ok", pd.DataFrame({"a": [1]}))
+    assert cache.lire_df("ok")["a"].tolist() == [1]
+
+    chemin = os.path.join(cache._frames, "cassee.pkl")
+    with open(chemin, "wb") as f:
+        f.write(pickle.dumps(_Cassant()))
+    assert cache.lire_df("cassee") is None
+    assert not os.path.exists(chemin)
+    assert cache.lire_df("absente") is None
+    assert (cache.stats["parse_hits"], cache.stats["parse_misses"]) == (1, 2)
+
+
+PAGE = (
+    b"<html><body><table></table><table><tr><td>A</td><td>B</td></tr>"
+    b"<tr><td>1</td><td>2</td></tr></table></body></html>"
+)
+
+
+class _GestionnaireEtag(BaseHTTPRequestHandler):
+    requetes = []
+
+    def do_GET(self):
+        _GestionnaireEtag.requetes.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def serveur():
+    _GestionnaireEtag.requetes = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _GestionnaireEtag)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_port}/page"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_revalidation_304_et_stats(tmp_path, serveur):
+    cache = CacheHTTP(str(tmp_path))
+    premier = ExtractionData.extract_webscrapping(serveur, cache=cache)
+    second = ExtractionData.extract_webscrapping(serveur, cache=cache)
+    pd.testing.assert_frame_equal(premier, second)
+    assert _GestionnaireEtag.requetes == [None, '"v1"']
+    assert cache.stats == {
+        "hits": 1, "misses": 1, "revalidations": 1,
+        "parse_hits": 1, "parse_misses": 1, "octets_economises": len(PAGE),
+    }
+
+
+def test_fraicheur_sans_requete(tmp_path, serveur):
+    cache = CacheHTTP(str(tmp_path), fraicheur=60)
+    ExtractionData.extract_webscrapping(serveur, cache=cache)
+    ExtractionData.extract_webscrapping(serveur, cache=cache)
+    assert _GestionnaireEtag.requetes == [None]
+    assert (cache.stats["hits"], cache.stats["revalidations"]) == (1, 0)
+
+
+def _vieillir(cache, url, secondes):
+    for chemin in cache._chemins_page(url):
+        t = time.time() - secondes
+        os.utime(chemin, (t, t))
+
+
+def test_expiration_depuis_derniere_utilisation(tmp_path):
+    cache = CacheHTTP(str(tmp_path), age_max=100)
+    for url in ("u1", "u2"):
+        cache.ecrire_page(url, b"corps", None, None)
+        _vieillir(cache, url, 80)
+    assert cache.lire_page("u1") is not None  # utilisation : l'entrée est rajeunie
+    _vieillir(cache, "u2", 150)
+    assert cache.lire_page("u2") is None
+    assert not any(os.path.exists(c) for c in cache._chemins_page("u2"))
+    assert cache.evincer() == 0
+    assert cache.lire_page("u1") is not None
+
+
+def test_eviction_par_taille_lru(tmp_path):
+    cache = CacheHTTP(str(tmp_path), taille_max=2_000)
+    for i, url in enumerate(("u1", "u2", "u3")):
+        cache.ecrire_page(url, b"x" * 500, None, None)
+        _vieillir(cache, url, 100 - 10 * i)
+    # u1, la plus ancienne écrite, vient d'être lue : u2 est la moins récemment utilisée.
+    assert cache.lire_page("u1") is not None
+    cache.ecrire_page("u4", b"x" * 500, None, None)
+    presentes = [url for url in ("u1", "u2", "u3", "u4") if cache.lire_page(url) is not None]
+    assert presentes == ["u1", "u3", "u4"]
+    assert not any(os.path.exists(c) for c in cache._chemins_page("u2"))
@@ -0,0 +1,86 @@
+import pandas as pd
+import pytest
+
+from etl_package import Loader
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.dataset as ds  # noqa: E402
+import pyarrow.ipc as ipc  # noqa: E402
+import pyarrow.parquet as pq  # noqa: E402
+
+ECRIVAINS = [(Loader.vers_parquet, "parquet"), (Loader.vers_feather, "ipc"), (Loader.vers_arrow_ipc, "ipc")]
+
+
+def _lire(chemin, format_):
+    table = ds.dataset(str(chemin), format=format_, partitioning="hive").to_table()
+    df = table.to_pandas()
+    return df.sort_values("id").reset_index(drop=True)
+
+
+@pytest.mark.parametrize("ecrire, format_", ECRIVAINS)
+def test_partitions_reecrites_sans_ajouter(tmp_path, ecrire, format_):
+    chemin = tmp_path / "sortie"
+    ecrire(pd.DataFrame({"id": [1, 2, 3], "p": ["a", "a", "b"]}), str(chemin), partition_cols=["p"], verbose=False)
+    ecrire(pd.DataFrame({"id": [4], "p": ["a"]}), str(chemin), partition_cols=["p"], verbose=False)
+    # La partition p=a est remplacée, p=b (non réécrite) est conservée.
+    lues = _lire(chemin, format_)
+    assert lues["id"].tolist() == [3, 4]
+    assert lues["p"].astype(str).tolist() == ["b", "a"]
+
+
+@pytest.mark.parametrize("ecrire, format_", ECRIVAINS)
+def test_partitions_completees_avec_ajouter(tmp_path, ecrire, format_):
+    chemin = tmp_path / "sortie"
+    ecrire(pd.DataFrame({"id": [1, 2, 3], "p": ["a", "a", "b"]}), str(chemin), partition_cols=["p"], verbose=False)
+    ecrire(
+        pd.DataFrame({"id": [4], "p": ["a"]}), str(chemin), partition_cols=["p"], ajouter=True, verbose=False
+    )
+    lues = _lire(chemin, format_)
+    assert lues["id"].tolist() == [1, 2, 3, 4]
+    assert len(list((chemin / "p=a").iterdir())) == 2
+
+
+@pytest.mark.parametrize("ecrire, format_", ECRIVAINS)
+def test_ajouter_sans_partition_ecrit_un_fichier_par_appel(tmp_path, ecrire, format_):
+    chemin = tmp_path / "sortie"
+    for debut in (0, 3):
+        ecrire(pd.DataFrame({"id": range(debut, debut + 3)}), str(chemin), ajouter=True, verbose=False)
+    assert len(list(chemin.iterdir())) == 2
+    assert _lire(chemin, format_)["id"].tolist() == list(range(6))
+
+
+def test_row_group_size_parquet(tmp_path):
+    df = pd.DataFrame({"id": range(10)})
+    Loader.vers_parquet(df, str(tmp_path / "f.parquet"), row_group_size=4, verbose=False)
+    assert pq.ParquetFile(tmp_path / "f.parquet").num_row_groups == 3
+    Loader.vers_parquet(df, str(tmp_path / "rep"), row_group_size=4, ajouter=True, verbose=False)
+    (fichier,) = (tmp_path / "rep").iterdir()
+    assert pq.ParquetFile(fichier).num_row_groups == 3
+
+
+@pytest.mark.parametrize("ecrire", [Loader.vers_feather, Loader.vers_arrow_ipc])
+def test_row_group_size_ipc(tmp_path, ecrire):
+    df = pd.DataFrame({"id": range(10)})
+    ecrire(df, str(tmp_path / "f.arrow"), row_group_size=4, verbose=False)
+    with pa.memory_map(str(tmp_path / "f.arrow")) as source:
+        assert ipc.open_file(source).num_record_batches == 3
+
+
+def test_row_group_size_invalide(tmp_path):
+    with pytest.raises(ValueError, match="row_group_size"):
+        Loader.vers_parquet(pd.DataFrame({"id": [1]}), str(tmp_path / "f.parquet"), row_group_size=0)
+
+
+@pytest.mark.parametrize("ecrire, lire", [
+    (Loader.vers_parquet, pd.read_parquet),
+    (Loader.vers_feather, pd.read_feather),
+    (Loader.vers_arrow_ipc, pd.read_feather),
+])
+def test_index_aller_retour(tmp_path, ecrire, lire):
+    df = pd.DataFrame({"v": [1.5, 2.5, 3.5]}, index=pd.Index(["x", "y", "z"], name="cle"))
+    ecrire(df, str(tmp_path / "avec"), index=True, verbose=False)
+    pd.testing.assert_frame_equal(lire(tmp_path / "avec"), df)
+    ecrire(df, str(tmp_path / "sans"), verbose=False)
+    lues = lire(tmp_path / "sans")
+    assert list(lues.columns) == ["v"]
+    assert lues.index.tolist() == [0, 1, 2]
@@ -0,0 +1,49 @@
+import pandas as pd
+import pytest
+
+from etl_package import Loader
+
+pytest.importorskip("openpyxl")
+
+
+def test_flux_morceaux_et_debordement(tmp_path):
+    chemin = tmp_path / "sortie.xlsx"
+    morceaux = [pd.DataFrame({"id": range(i * 4, i * 4 + 4), "v": ["x"] * 4}) for i in range(3)]
+    lignes = Loader.vers_excel_flux(iter(morceaux), chemin, sheet_name="Data", max_lignes=6, verbose=False)
+    assert lignes == {"Data": 5, "Data_2": 5, "Data_3": 2}
+    feuilles = pd.read_excel(chemin, sheet_name=None)
+    assert list(feuilles) == ["Data", "Data_2", "Data_3"]
+    assert pd.concat(feuilles.values(), ignore_index=True)["id"].tolist() == list(range(12))
+
+
+def test_flux_noms_de_feuilles_tronques_en_double(tmp_path):
+    chemin = tmp_path / "sortie.xlsx"
+    prefixe = "Ventes trimestrielles par region"  # 32 caractères
+    donnees = {
+        prefixe + " A": pd.DataFrame({"a": [1]}),
+        prefixe + " B": pd.DataFrame({"a": [2, 3]}),
+        "VIDE": [],
+        "vide": pd.DataFrame({"a": []}),
+    }
+    lignes = Loader.vers_excel_flux(donnees, chemin, verbose=False)
+    assert lignes == {prefixe[:31]: 1, prefixe[:29] + "_2": 2, "VIDE": 0, "vide_2": 0}
+    feuilles = pd.read_excel(chemin, sheet_name=None)
+    assert list(feuilles) == list(lignes)
+    assert feuilles[prefixe[:29] + "_2"]["a"].tolist() == [2, 3]
+
+
+def test_flux_colonnes_differentes(tmp_path):
+    morceaux = [pd.DataFrame({"a": [1], "b": [2]}), pd.DataFrame({"b": [3], "a": [4]})]
+    with pytest.raises(ValueError, match="colonnes"):
+        Loader.vers_excel_flux(morceaux, tmp_path / "sortie.xlsx", verbose=False)
+    with pytest.raises(TypeError):
+        Loader.vers_excel_flux([pd.DataFrame({"a": [1]}), {"a": 2}], tmp_path / "sortie.xlsx", verbose=False)
+
+
+def test_flux_index(tmp_path):
+    chemin = tmp_path / "sortie.xlsx"
+    df = pd.DataFrame({"v": [1.5, None]}, index=pd.Index(["r1", "r2"], name="cle"))
+    Loader.vers_excel_flux(df, chemin, index=True, verbose=False)
+    lu = pd.read_excel(chemin)
+    assert lu["cle"].tolist() == ["r1", "r2"]
+    assert lu["v"].isna().tolist() == [False, True]
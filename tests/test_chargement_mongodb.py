@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from etl_package import Loader
+
+mongomock = pytest.importorskip("mongomock")
+
+
+@pytest.fixture
+def collection():
+    return mongomock.MongoClient()["db"]["c"]
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        "id": np.arange(25, dtype="int64"),
+        "note": [1.5, np.nan] * 12 + [2.0],
+        "nom": [f"n{i}" for i in range(25)],
+        "date": pd.date_range("2024-01-01", periods=25).where(np.arange(25) != 3),
+    })
+
+
+@pytest.mark.parametrize("n_threads", [1, 3])
+def test_insertion_par_lots(collection, df, n_threads):
+    rapport = Loader.vers_mongodb_batch(df, collection, taille_batch=4, n_threads=n_threads, verbose=False)
+    assert (rapport["documents"], rapport["inseres"], rapport["modifies"]) == (25, 25, 0)
+    docs = sorted(collection.find({}, {"_id": 0}), key=lambda d: d["id"])
+    assert [d["id"] for d in docs] == list(range(25))
+    assert type(docs[0]["id"]) is int
+    assert docs[1]["note"] is None and docs[0]["note"] == 1.5
+    assert docs[3]["date"] is None and docs[4]["date"] == pd.Timestamp("2024-01-05").to_pydatetime()
+
+
+def test_upsert_par_cle(collection, df):
+    from pymongo import UpdateOne
+    try:
+        collection.bulk_write([UpdateOne({"id": -1}, {"$set": {"id": -1}}, upsert=True)])
+    except TypeError as e:
+        pytest.skip(f"mongomock ne gère pas UpdateOne de cette version de pymongo : {e}")
+    collection.delete_many({})
+    Loader.vers_mongodb_batch(df.iloc[:10], collection, taille_batch=3, cles="id", verbose=False)
+    modifie = df.iloc[5:15].assign(nom="maj")
+    rapport = Loader.vers_mongodb_batch(modifie, collection, taille_batch=3, cles=["id"], verbose=False)
+    assert (rapport["inseres"], rapport["modifies"]) == (5, 5)
+    assert collection.count_documents({}) == 15
+    assert collection.count_documents({"nom": "maj"}) == 10
+
+
+def test_parametres_invalides(collection, df):
+    with pytest.raises(TypeError):
+        Loader.vers_mongodb_batch(df.to_dict(), collection)
+    with pytest.raises(ValueError):
+        Loader.vers_mongodb_batch(df, collection, taille_batch=0)
+    with pytest.raises(ValueError):
+        Loader.vers_mongodb_batch(df, collection, cles="absente")
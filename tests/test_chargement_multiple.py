@@ -0,0 +1,41 @@
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+
+from etl_package import ChargementMultiple, Loader
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+
+
+def test_rapport_lignes_ecrites_par_destination(tmp_path, engine):
+    df = pd.DataFrame({"id": [1, 2, 3, 4], "v": ["a", "b", "c", "d"]})
+    Loader.vers_sql_incremental(pd.DataFrame({"id": [1, 2], "v": ["a", "x"]}), "t", engine, "id", verbose=False)
+    sinks = [
+        {"type": "csv", "nom": "csv", "chemin": tmp_path / "out.csv"},
+        {"type": "sql_incremental", "nom": "incr", "table_name": "t", "engine": engine, "cles": "id"},
+        {"type": "sql_bulk", "nom": "bulk", "table_name": "b", "engine": engine},
+        {"type": "csv", "nom": "ko", "chemin": tmp_path / "absent" / "out.csv"},
+    ]
+    rapport = ChargementMultiple.charger(df, sinks, verbose=False).set_index("nom")
+    assert rapport["statut"].to_dict() == {"csv": "ok", "incr": "ok", "bulk": "ok", "ko": "echec"}
+    # 2 insérées (3, 4) + 1 mise à jour (2) ; la ligne 1 est inchangée.
+    assert rapport["lignes"].to_dict() == {"csv": 4, "incr": 3, "bulk": 4, "ko": 0}
+    assert pd.read_sql("SELECT v FROM t ORDER BY id", engine)["v"].tolist() == ["a", "b", "c", "d"]
+
+
+def test_options_arrow_validees(tmp_path):
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"id": [1, 2, 3], "p": ["a", "a", "b"]})
+    sinks = [
+        {"type": "parquet", "nom": "ok", "chemin": str(tmp_path / "ok"), "partition_cols": ["p"], "row_group_size": 2},
+        {"type": "parquet", "nom": "faute", "chemin": str(tmp_path / "faute"), "partition_col": ["p"]},
+        {"type": "feather", "nom": "csv", "chemin": str(tmp_path / "f.arrow"), "sep": ";"},
+    ]
+    rapport = ChargementMultiple.charger(df, sinks, verbose=False).set_index("nom")
+    assert rapport["statut"].to_dict() == {"ok": "ok", "faute": "echec", "csv": "echec"}
+    assert "partition_col" in rapport.loc["faute", "erreur"]
+    assert not (tmp_path / "faute").exists()
+    assert sorted(p.name for p in (tmp_path / "ok").iterdir()) == ["p=a", "p=b"]
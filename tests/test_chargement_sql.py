@@ -0,0 +1,97 @@
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, inspect
+
+from etl_package import Loader
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+
+
+def test_incremental_insere_puis_met_a_jour(engine):
+    df = pd.DataFrame({"id": [1, 2, 3], "v": ["a", "b", "c"]})
+    assert Loader.vers_sql_incremental(df, "t", engine, "id", verbose=False) == {
+        "inseres": 3, "mis_a_jour": 0, "inchanges": 0,
+    }
+    df2 = pd.DataFrame({"id": [2, 3, 4], "v": ["b", "z", "d"]})
+    assert Loader.vers_sql_incremental(df2, "t", engine, "id", verbose=False) == {
+        "inseres": 1, "mis_a_jour": 1, "inchanges": 1,
+    }
+    lues = pd.read_sql("SELECT id, v FROM t ORDER BY id", engine)
+    assert lues["v"].tolist() == ["a", "b", "z", "d"]
+    assert sum(i["unique"] for i in inspect(engine).get_indexes("t")) == 1
+
+
+def test_incremental_table_existante_avec_doublons(engine):
+    pd.DataFrame({"id": [1, 1], "v": ["a", "b"]}).to_sql("t", engine, index=False)
+    with pytest.raises(ValueError, match="double"):
+        Loader.vers_sql_incremental(pd.DataFrame({"id": [2], "v": ["c"]}), "t", engine, "id", verbose=False)
+
+
+def test_incremental_reutilise_cle_primaire(engine):
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+    df = pd.DataFrame({"id": [1, 2], "v": ["a", "b"]})
+    Loader.vers_sql_incremental(df, "t", engine, "id", verbose=False)
+    assert not [i for i in inspect(engine).get_indexes("t") if i["name"].startswith("ux_")]
+
+
+def test_incremental_avec_ecriture_concurrente(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    for essai in range(4):
+        engine = create_engine(f"sqlite:///{tmp_path / f'concurrent{essai}.db'}")
+        pd.DataFrame({"id": [1, 2], "v": ["a", "x"]}).to_sql("t", engine, index=False)
+        df = pd.DataFrame({"id": [1, 2, 3], "v": ["a", "b", "c"]})
+        with ThreadPoolExecutor(2) as pool:
+            autre = pool.submit(df.to_sql, "autre", engine, index=False)
+            rapport = pool.submit(Loader.vers_sql_incremental, df, "t", engine, "id", verbose=False).result()
+            autre.result()
+        assert rapport["inseres"] == 1
+        assert pd.read_sql("SELECT v FROM t ORDER BY id", engine)["v"].tolist() == ["a", "b", "c"]
+
+
+def _lignes(engine, table):
+    with engine.connect() as conn:
+        return conn.exec_driver_sql(f"SELECT * FROM {table} ORDER BY rowid").fetchall()
+
+
+def _pragmas(engine):
+    with engine.connect() as conn:
+        return {p: conn.exec_driver_sql(f"PRAGMA {p}").scalar() for p in ("synchronous", "journal_mode")}
+
+
+def _donnees_bulk():
+    return pd.DataFrame({
+        "t": pd.to_datetime(["2024-01-01 00:00:00", "2024-01-01 00:00:01.123456", None], format="ISO8601"),
+        "tz": pd.to_datetime(["2024-01-01", "2024-06-01 12:30:00.5", None], format="ISO8601").tz_localize("Europe/Paris"),
+        "i": pd.array([1, None, 3], dtype="Int64"),
+        "f": [1.5, None, 2.0],
+        "s": ["a", None, "c"],
+        "b": [True, False, True],
+    })
+
+
+def test_bulk_identique_a_to_sql(engine):
+    df = _donnees_bulk()
+    avant = _pragmas(engine)
+    df.to_sql("reference", engine, index=False)
+    rapport = Loader.vers_sql_bulk(df, "bulk", engine, chunksize=2, verbose=False)
+    assert rapport["lignes"] == 3
+    assert rapport["methode"] == "sqlite-executemany"
+    assert _lignes(engine, "bulk") == _lignes(engine, "reference")
+    assert _pragmas(engine) == avant
+
+
+def test_bulk_if_exists(engine):
+    df = _donnees_bulk()
+    Loader.vers_sql_bulk(df, "t", engine, verbose=False)
+    Loader.vers_sql_bulk(df, "t", engine, if_exists="append", verbose=False)
+    assert len(_lignes(engine, "t")) == 6
+    Loader.vers_sql_bulk(df.head(1), "t", engine, if_exists="replace", verbose=False)
+    assert len(_lignes(engine, "t")) == 1
+    with pytest.raises(IOError):
+        Loader.vers_sql_bulk(df, "t", engine, if_exists="fail", verbose=False)
+    assert len(_lignes(engine, "t")) == 1
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from etl_package import GestionOutliers, NormaliserColonne, ZScoreAnomalie
+from etl_package.outils.colonnes import resoudre_colonnes
+
+
+def test_colonnes_nullables_numeriques():
+    df = pd.DataFrame({"a": pd.array([1, None, 3], dtype="Int64"), "b": [1.0, 2.0, np.nan]})
+    assert resoudre_colonnes(df, ["a", "b"], numeriques=True) == ["a", "b"]
+    out = NormaliserColonne.normaliser_colonne_choisie(df, ["a", "b"])
+    assert out["a"].iloc[2] == 1.0
+
+
+def test_colonnes_non_numeriques_refusees():
+    df = pd.DataFrame({"t": ["x", "y"], "f": [True, False]})
+    with pytest.raises(TypeError):
+        resoudre_colonnes(df, ["t", "f"], numeriques=True)
+
+
+def test_colonne_absente_refusee():
+    df = pd.DataFrame({"a": [1.0, 2.0]})
+    for appel in (
+        lambda: GestionOutliers.gerer_outliers(df, "z"),
+        lambda: NormaliserColonne.normaliser_colonne_choisie(df, "z"),
+        lambda: ZScoreAnomalie.calcul_zscore(df, "z"),
+    ):
+        with pytest.raises(ValueError, match="absentes"):
+            appel()
+
+
+@pytest.mark.parametrize("strategie", ["remove", "winsorize", "median", "mean", "flag"])
+def test_outliers_colonne_nullable(strategie):
+    df = pd.DataFrame({"a": pd.array([1, 2, 3, 4, 5, 100, None], dtype="Int64")})
+    attendu = GestionOutliers.gerer_outliers(df.astype({"a": "float64"}), "a", strategie)
+    out = GestionOutliers.gerer_outliers(df, "a", strategie)
+    # La valeur manquante n'est jamais un outlier.
+    assert len(out) == len(attendu) == (6 if strategie == "remove" else 7)
+    np.testing.assert_allclose(out["a"].astype("float64"), attendu["a"])
+    if strategie == "flag":
+        assert out["a_outlier_flag"].tolist() == [0, 0, 0, 0, 0, 1, 0]
+
+
+def test_outliers_colonne_booleenne_refusee():
+    with pytest.raises(TypeError):
+        GestionOutliers.gerer_outliers(pd.DataFrame({"b": [True, False]}), "b")
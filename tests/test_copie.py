@@ -0,0 +1,62 @@
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from etl_package import (
+    EncodeurCategoriel, FeatureEngineering, GestionOutliers, ImputateurAjuste, NormaliserColonne,
+    RemplacementColonne,
+)
+from etl_package.transformation.standardisation_z_score import Standardisation
+from etl_package.transformation.type_colonne import TypeColonne
+
+N_LIGNES = 20_000
+N_COLONNES = 100
+
+
+@pytest.fixture(scope="module")
+def large():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(N_LIGNES, N_COLONNES)), columns=[f"c{i}" for i in range(N_COLONNES)])
+    df.loc[::7, "c0"] = np.nan
+    df["texte"] = np.where(np.arange(N_LIGNES) % 2, "70%", "65%")
+    df["categorie"] = np.where(np.arange(N_LIGNES) % 3, "a", "b")
+    return df
+
+
+ETAPES = {
+    "normaliser": (lambda df: NormaliserColonne.normaliser_colonne_choisie(df, "c0", copie="colonnes"), ["c0"]),
+    "standardiser": (lambda df: Standardisation.zscore(df, "c0", copie="colonnes"), ["c0"]),
+    "outliers": (lambda df: GestionOutliers.gerer_outliers(df, "c0", "winsorize", copie="colonnes"), ["c0"]),
+    "feature": (lambda df: FeatureEngineering.creer_feature(df, "ratio", "c0", "c1", copie="colonnes"), []),
+    "remplacer": (lambda df: RemplacementColonne.remplacer_valeurs(df, "texte", ("%", ""), copie="colonnes"), ["texte"]),
+    "type": (lambda df: TypeColonne.changer_type_colonne(df, "c0", "float32", copie="colonnes"), ["c0"]),
+    "encoder": (lambda df: EncodeurCategoriel.encoder_colonne(df, "categorie", "onehot", copie="colonnes"), ["categorie"]),
+    "imputer_ajuste": (lambda df: ImputateurAjuste("c0").fit(df).transform(df, copie="colonnes"), ["c0"]),
+}
+
+
+@pytest.mark.parametrize("nom", ETAPES)
+def test_colonnes_non_modifiees_partagees(large, nom):
+    etape, modifiees = ETAPES[nom]
+    avant = large.copy()
+    out = etape(large)
+    for c in large.columns:
+        if c not in modifiees and c in out.columns and pd.api.types.is_numeric_dtype(large[c]):
+            assert np.shares_memory(out[c].to_numpy(), large[c].to_numpy()), c
+    pd.testing.assert_frame_equal(large, avant)
+
+
+@pytest.mark.parametrize("nom", ETAPES)
+def test_pas_de_copie_complete(large, nom):
+    etape, _ = ETAPES[nom]
+    taille = large.memory_usage(deep=False).sum()
+    tracemalloc.start()
+    try:
+        etape(large)
+        _, pic = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # Quelques colonnes temporaires au plus, loin d'une copie des 100+ colonnes.
+    assert pic < taille / 5
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from etl_package import EmpreintesTriees, FiltreBloom, ValeurDouble
+
+
+def test_empreintes_numeriques_independantes_du_dtype():
+    attendu = ValeurDouble.empreintes_lignes(pd.DataFrame({"REF": [1, 2, 3], "nom": ["a", "b", "c"]}))
+    for ref in (
+        [1.0, 2.0, 3.0],
+        pd.array([1, 2, 3], dtype="Int64"),
+        pd.array([1, 2, 3], dtype="UInt8"),
+        np.array([1, 2, 3], dtype="float32"),
+    ):
+        obtenu = ValeurDouble.empreintes_lignes(pd.DataFrame({"REF": ref, "nom": ["a", "b", "c"]}))
+        np.testing.assert_array_equal(obtenu, attendu)
+
+    manquants = [
+        ValeurDouble.empreintes_lignes(pd.DataFrame({"REF": ref}))[1]
+        for ref in ([1.0, np.nan], pd.array([1, None], dtype="Int64"), pd.array([1.0, None], dtype="Float64"))
+    ]
+    assert len(set(manquants)) == 1
+    reels = ValeurDouble.empreintes_lignes(pd.DataFrame({"REF": [1.5, 2.0]}))
+    entiers = ValeurDouble.empreintes_lignes(pd.DataFrame({"REF": [1, 2]}))
+    assert reels[1] == entiers[1]
+    assert reels[0] not in entiers
+
+
+def test_doublons_connus_entre_morceaux_int_puis_float():
+    magasin = EmpreintesTriees()
+    assert not ValeurDouble.doublons_connus(pd.DataFrame({"REF": [1, 2, 3]}), magasin, "REF").any()
+    masque = ValeurDouble.doublons_connus(pd.DataFrame({"REF": [1, 2, np.nan]}), magasin, "REF")
+    assert masque.tolist() == [True, True, False]
+
+
+@pytest.fixture(params=["triees", "bloom"])
+def magasin(request):
+    return EmpreintesTriees() if request.param == "triees" else FiltreBloom(capacite=10_000, taux_faux_positifs=0.01)
+
+
+def _cles(debut, fin):
+    return ValeurDouble.empreintes_lignes(pd.DataFrame({"id": np.arange(debut, fin)}))
+
+
+def test_ajouter_contient(magasin):
+    assert magasin.ajouter(np.concatenate([_cles(0, 100), _cles(0, 10)])) == 100
+    assert len(magasin) == 100
+    assert magasin.contient(_cles(0, 100)).all()
+    assert magasin.ajouter(_cles(50, 150)) == 50
+    with pytest.raises(TypeError):
+        magasin.contient(np.arange(3))
+
+
+def test_sauvegarder_charger(magasin, tmp_path):
+    chemin = tmp_path / "empreintes.bin"
+    magasin.ajouter(_cles(0, 500))
+    magasin.sauvegarder(chemin)
+    recharge = type(magasin).charger(chemin)
+    assert len(recharge) == 500
+    assert recharge.contient(_cles(0, 500)).all()
+    np.testing.assert_array_equal(recharge.contient(_cles(500, 2000)), magasin.contient(_cles(500, 2000)))
+    assert len(type(magasin).charger(tmp_path / "absent.bin")) == 0
+    with pytest.raises(IOError):
+        type(magasin).charger(tmp_path / "absent.bin", creer=False)
+
+
+def test_merge(magasin):
+    autre = EmpreintesTriees() if isinstance(magasin, EmpreintesTriees) else FiltreBloom(10_000, 0.01)
+    magasin.ajouter(_cles(0, 100))
+    autre.ajouter(_cles(100, 200))
+    assert magasin.merge(autre).contient(_cles(0, 200)).all()
+    if isinstance(magasin, FiltreBloom):
+        with pytest.raises(ValueError):
+            magasin.merge(FiltreBloom(100, 0.01))
+
+
+def test_bloom_taux_faux_positifs_mesure():
+    filtre = FiltreBloom(capacite=20_000, taux_faux_positifs=0.01)
+    filtre.ajouter(_cles(0, 20_000))
+    mesure = filtre.contient(_cles(1_000_000, 1_100_000)).mean()
+    assert mesure < 2 * filtre.taux_faux_positifs
+    assert filtre.taux_estime() == pytest.approx(filtre.taux_faux_positifs, rel=0.5)
+
+
+def test_doublons_connus_sur_deux_morceaux(magasin):
+    morceau1 = pd.DataFrame({"REF": [1, 2, 2, 3], "v": list("abcd")})
+    morceau2 = pd.DataFrame({"REF": [3, 4, 1, 4], "v": list("efgh")}, index=[10, 11, 12, 13])
+    assert ValeurDouble.doublons_connus(morceau1, magasin, "REF").tolist() == [False, False, True, False]
+    masque = ValeurDouble.doublons_connus(morceau2, magasin, ["REF"])
+    assert masque.tolist() == [True, False, True, True]
+    assert masque.index.tolist() == [10, 11, 12, 13]
+    assert ValeurDouble.calcul_valeur_double(morceau2, magasin=magasin, colonnes="REF") == 4
+
+
+def test_calcul_valeur_double_keep_invalide_avec_magasin():
+    with pytest.raises(ValueError, match="keep='first'"):
+        ValeurDouble.calcul_valeur_double(pd.DataFrame({"a": [1]}), keep="last", magasin=EmpreintesTriees())
@@ -0,0 +1,81 @@
+import gzip
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from etl_package import EcrivainCSV
+
+
+class _Illisible:
+    def __str__(self):
+        raise RuntimeError("valeur non formatable")
+
+
+def _morceaux(n=20, taille=50):
+    return [
+        pd.DataFrame({"id": np.arange(i * taille, (i + 1) * taille), "v": [f"m{i}"] * taille})
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_ordre_et_entete_unique(tmp_path, compression):
+    chemin = tmp_path / "sortie.csv"
+    morceaux = _morceaux()
+    with EcrivainCSV(chemin, compression=compression, taille_file=2, taille_tampon=500) as ecrivain:
+        for morceau in morceaux:
+            ecrivain.ecrire(morceau)
+    assert ecrivain.lignes_ecrites == 1000
+    lu = pd.read_csv(chemin, compression=compression)
+    pd.testing.assert_frame_equal(lu, pd.concat(morceaux, ignore_index=True))
+    ouvrir = gzip.open if compression else open
+    with ouvrir(chemin, "rt") as f:
+        assert f.read().count("id,v") == 1
+
+
+def test_mode_ajout_sans_seconde_entete(tmp_path):
+    chemin = tmp_path / "sortie.csv"
+    premier, second = _morceaux(2)
+    with EcrivainCSV(chemin) as ecrivain:
+        ecrivain.ecrire(premier)
+    with EcrivainCSV(chemin, mode="a") as ecrivain:
+        ecrivain.ecrire(second)
+    assert pd.read_csv(chemin)["id"].tolist() == list(range(100))
+
+
+def test_erreur_du_thread_propagee_et_lignes_ecrites(tmp_path):
+    chemin = tmp_path / "sortie.csv"
+    ecrivain = EcrivainCSV(chemin, taille_tampon=1)
+    bon, = _morceaux(1)
+    ecrivain.ecrire(bon)
+    ecrivain.ecrire(pd.DataFrame({"id": [0], "v": [_Illisible()]}))
+    with pytest.raises(IOError, match="non formatable"):
+        for morceau in _morceaux(50):
+            ecrivain.ecrire(morceau)
+    # La fermeture attend les threads, ferme le fichier et signale encore l'erreur.
+    with pytest.raises(IOError, match="non formatable"):
+        ecrivain.fermer()
+    # Seules les lignes effectivement écrites sont comptées, pas les 2 551 mises en file.
+    assert ecrivain.lignes_ecrites in (0, 50)
+    with open(chemin) as f:
+        assert ecrivain.lignes_ecrites == max(0, len(f.read().splitlines()) - 1)
+    ecrivain.fermer()  # déjà fermé : sans effet
+
+
+def test_colonnes_differentes_et_fermeture(tmp_path):
+    ecrivain = EcrivainCSV(tmp_path / "sortie.csv")
+    ecrivain.ecrire(pd.DataFrame({"a": [1]}))
+    with pytest.raises(ValueError):
+        ecrivain.ecrire(pd.DataFrame({"b": [1]}))
+    ecrivain.fermer()
+    ecrivain.fermer()
+    with pytest.raises(ValueError, match="fermé"):
+        ecrivain.ecrire(pd.DataFrame({"a": [2]}))
+
+
+def test_exception_en_cours_non_masquee(tmp_path):
+    with pytest.raises(KeyError):
+        with EcrivainCSV(tmp_path / "sortie.csv") as ecrivain:
+            ecrivain.ecrire(pd.DataFrame({"v": [_Illisible()]}))
+            raise KeyError("erreur de l'appelant")
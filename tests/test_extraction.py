@@ -0,0 +1,199 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+from etl_package import CollecteurMesures, ExtractionData, Instrumentation
+from etl_package.extraction.parseur_lxml import ParseurTableFlux
+
+
+def _page(n: int, suivant: str = "") -> bytes:
+    lignes = "".join(
+        f'<tr><td class="page">{n}</td><td class="nom"><a href="/fiche/{i}">p{n}-{i}</a></td></tr>'
+        for i in range(3)
+    )
+    lien = f'<a class="next" href="{suivant}">suivante</a>' if suivant else ""
+    return (
+        "<html><body><table><tr><td>menu</td></tr></table>"
+        f'<table><tr><td class="page">Page</td><td class="nom">Nom</td></tr>{lignes}</table>'
+        f"<div>{lien}</div></body></html>"
+    ).encode()
+
+
+class _Gestionnaire(BaseHTTPRequestHandler):
+    echecs = {}
+    requetes = []
+
+    def do_GET(self):
+        _Gestionnaire.requetes.append(self.path)
+        if self.path.startswith("/flaky") and _Gestionnaire.echecs.get(self.path, 0) < 1:
+            _Gestionnaire.echecs[self.path] = _Gestionnaire.echecs.get(self.path, 0) + 1
+            self.send_response(503)
+            self.end_headers()
+            return
+        if self.path == "/absente":
+            self.send_response(404)
+            self.end_headers()
+            return
+        n = int(self.path.rsplit("/", 1)[-1])
+        corps = _page(n, f"/pag/{n + 1}" if self.path.startswith("/pag/") and n < 3 else "")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(corps)))
+        self.end_headers()
+        self.wfile.write(corps)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def serveur():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Gestionnaire)
+    fil = threading.Thread(target=httpd.serve_forever, daemon=True)
+    fil.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.mark.parametrize("moteur", ["bs4", "lxml"])
+def test_extract_many_ordre_et_source(serveur, moteur):
+    urls = [f"{serveur}/p/{n}" for n in range(6)]
+    df = ExtractionData.extract_many(urls, max_workers=4, max_par_hote=2, colonne_source="src", moteur=moteur)
+    assert len(df) == 18
+    assert df["Page"].tolist() == [str(n) for n in range(6) for _ in range(3)]
+    assert df["src"].tolist() == [u for u in urls for _ in range(3)]
+
+
+def test_extract_many_reessaie_et_isole_les_echecs(serveur):
+    urls = [f"{serveur}/flaky/1", f"{serveur}/absente", f"{serveur}/p/2"]
+    resultats = ExtractionData.extract_many(urls, tentatives=2, backoff=0, concatener=False)
+    assert len(resultats[urls[0]]) == 3
+    assert resultats[urls[1]].empty
+    assert resultats[urls[2]]["Nom"].tolist() == ["p2-0", "p2-1", "p2-2"]
+
+
+def test_extract_many_urls_repetees(serveur):
+    urls = [f"{serveur}/p/{n}" for n in (7, 8, 7)]
+    _Gestionnaire.requetes.clear()
+    resultats = ExtractionData.extract_many(urls, concatener=False, colonne_source="src")
+    assert list(resultats) == urls[:2]
+    assert sorted(_Gestionnaire.requetes) == ["/p/7", "/p/8"]
+    df = ExtractionData.extract_many(urls, colonne_source="src")
+    assert df["src"].tolist() == [u for u in urls for _ in range(3)]
+    assert df.index.tolist() == list(range(9))
+
+
+def test_session_partagee_agrandie_sans_fuite(serveur):
+    session = ExtractionData._obtenir_session(2)
+    adapters = set(map(id, session.adapters.values()))
+    ExtractionData.extract_many([f"{serveur}/p/1"], max_workers=session._taille_pool + 4)
+    assert ExtractionData._obtenir_session() is session
+    assert not adapters & set(map(id, session.adapters.values()))
+    assert session.adapters["http://"]._pool_maxsize == session._taille_pool
+
+
+def test_extract_many_parametres_invalides():
+    with pytest.raises(ValueError):
+        ExtractionData.extract_many(["http://127.0.0.1/"], tentatives=0)
+    with pytest.raises(ValueError):
+        ExtractionData.extract_many(["http://127.0.0.1/"], max_workers=0)
+
+
+@pytest.mark.parametrize("colonnes", [None, ["page", "nom"]])
+def test_iter_extract_pagination(serveur, colonnes):
+    morceaux = list(ExtractionData.iter_extract(
+        f"{serveur}/pag/0", colonnes, taille_chunk=5, selecteur_suivant="a.next", backoff=0,
+    ))
+    assert [len(m) for m in morceaux] == [5, 5, 2]
+    df = pd.concat(morceaux)
+    assert df.index.tolist() == list(range(12))
+    assert df.iloc[:, 1].tolist() == [f"p{n}-{i}" for n in range(4) for i in range(3)]
+
+
+def test_iter_extract_mesure_par_morceau(serveur):
+    collecteur = CollecteurMesures()
+    with Instrumentation.session(hooks=[collecteur], etapes=["ExtractionData.iter_extract"]):
+        morceaux = list(ExtractionData.iter_extract(f"{serveur}/pag/0", taille_chunk=5, selecteur_suivant="a.next"))
+    assert [m["lignes_sortie"] for m in collecteur.mesures] == [len(m) for m in morceaux] + [None]
+
+
+def test_iter_extract_max_pages_et_moteur(serveur):
+    for moteur in ("bs4", "lxml"):
+        df = pd.concat(ExtractionData.iter_extract(
+            f"{serveur}/pag/0", ["page"], selecteur_suivant="a.next", max_pages=2, moteur=moteur,
+        ))
+        assert df["page"].tolist() == ["0"] * 3 + ["1"] * 3
+
+
+def test_parseur_flux_garde_seulement_les_liens():
+    parseur = ParseurTableFlux(garder_liens=True)
+    parseur.alimenter(_page(0, "/pag/1"))
+    parseur.terminer()
+    assert len(parseur.liens) == 4
+    assert parseur.liens[-1] == b'<a class="next" href="/pag/1">suivante</a>'
+    assert parseur.vider()["Nom"].tolist() == ["p0-0", "p0-1", "p0-2"]
+
+
+def test_iter_extract_parametres_invalides():
+    for options in ({"tentatives": 0}, {"moteur": "html5lib"}, {"taille_chunk": 0}):
+        with pytest.raises(ValueError):
+            next(ExtractionData.iter_extract("http://127.0.0.1/", **options))
+
+
+def test_lxml_lignes_courtes_et_longues_comme_bs4(caplog):
+    page = (
+        b"<table></table><table><tr><td>A</td><td>B</td><td>C</td></tr>"
+        b"<tr><td>1</td><td>2</td><td>3</td></tr><tr><td>4</td></tr><tr></tr>"
+        b"<tr><td>5</td><td>6</td></tr></table>"
+    )
+    attendu = ExtractionData._parser_page(page, moteur="bs4")
+    pd.testing.assert_frame_equal(ExtractionData._parser_page(page, moteur="lxml"), attendu)
+    assert attendu["C"].isna().tolist() == [False, True, True]
+
+    longue = page.replace(b"<td>4</td>", b"<td>4</td><td>x</td><td>y</td><td>z</td>")
+    parseur = ParseurTableFlux()
+    parseur.alimenter(longue)
+    parseur.terminer()
+    assert parseur.n_tronquees == 1
+    assert parseur.vider().iloc[1].tolist() == ["4", "x", "y"]
+    assert "tronquée" in caplog.text
+
+
+_TABLE_CLASSES = (
+    b"<table><tr><td class='nom'>Nom</td><td class='age'>Age</td><td class='taille'>Taille</td></tr>"
+    b"<tr><td class='nom'>a</td><td class='age'>12</td><td class='taille'>1.5</td></tr>"
+    b"<tr><td class='nom'>b</td><td class='taille'>1.7</td></tr>"
+    b"<tr><td class='nom'>c</td><td class='age'>300</td></tr>"
+    b"<tr><td class='nom'>d</td><td class='age'>-4</td><td class='taille'>?</td></tr></table>"
+)
+
+
+@pytest.mark.parametrize("moteur", ["bs4", "lxml"])
+def test_classes_alignees_par_ligne(moteur):
+    df = ExtractionData._parser_page(_TABLE_CLASSES, ["nom", "age", "taille"], moteur=moteur)
+    assert df["nom"].tolist() == ["a", "b", "c", "d"]
+    assert df["age"].fillna("").tolist() == ["12", "", "300", "-4"]
+    assert df["taille"].fillna("").tolist() == ["1.5", "1.7", "", "?"]
+
+
+def test_classes_indications_de_type():
+    colonnes = ["nom", "age", "taille"]
+    df = ExtractionData._parser_page(_TABLE_CLASSES, colonnes, dtypes={"age": "int64", "taille": "float32"})
+    assert df["age"].dtype == "Int64"
+    assert df["age"].fillna(0).tolist() == [12, 0, 300, -4]
+    assert df["taille"].dtype == "float32"
+    assert pd.isna(df.loc[3, "taille"])
+
+    df = ExtractionData._parser_page(_TABLE_CLASSES, colonnes, dtypes={"age": "uint8"})
+    assert df["age"].dtype == "UInt8"
+    # 300 et -4 sont hors des bornes de uint8.
+    assert df["age"].isna().tolist() == [False, True, True, True]
+    assert ExtractionData._parser_page(_TABLE_CLASSES, colonnes, dtypes={"age": "Int16"})["age"].dtype == "Int16"
+
+    with pytest.raises(TypeError):
+        ExtractionData._parser_page(_TABLE_CLASSES, colonnes, dtypes={"nom": "str"})
+    with pytest.raises(ValueError):
+        ExtractionData._parser_page(_TABLE_CLASSES, colonnes, dtypes={"autre": "int64"})
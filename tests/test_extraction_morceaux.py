@@ -0,0 +1,95 @@
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+
+from etl_package import ExtractionCSV, ExtractionMongo, ExtractionSQL
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({"id": range(10), "note": [1.0, 4.0] * 5, "nom": list("abcdefghij")})
+
+
+@pytest.fixture
+def csv(tmp_path, df):
+    chemin = tmp_path / "donnees.csv"
+    df.to_csv(chemin, index=False)
+    return chemin
+
+
+@pytest.fixture
+def engine(tmp_path, df):
+    engine = create_engine(f"sqlite:///{tmp_path / 'donnees.db'}")
+    df.to_sql("t", engine, index=False)
+    return engine
+
+
+def _garder_bonnes(morceau):
+    return morceau[morceau["note"] > 3]
+
+
+def test_csv_morceaux(csv):
+    morceaux = list(ExtractionCSV.extract_csv(csv, ["id", "note"], taille_chunk=4))
+    assert [len(m) for m in morceaux] == [4, 4, 2]
+    assert list(morceaux[0].columns) == ["id", "note"]
+
+
+def test_csv_filtre_sans_morceaux_reindexe(csv):
+    lu = ExtractionCSV.extract_csv(csv, filtre=_garder_bonnes)
+    assert lu["id"].tolist() == [1, 3, 5, 7, 9]
+    assert lu.index.equals(pd.RangeIndex(5))
+
+
+def test_sql_table_et_requete(engine, df):
+    morceaux = list(ExtractionSQL.extract_sql("t", engine, ["id", "nom"], taille_chunk=4))
+    assert [len(m) for m in morceaux] == [4, 4, 2]
+    assert pd.concat(morceaux, ignore_index=True).equals(df[["id", "nom"]])
+
+    lu = ExtractionSQL.extract_sql(
+        "SELECT id, note FROM t WHERE id >= :min", engine, dtypes={"note": "float32"}, params={"min": 6},
+    )
+    assert lu["id"].tolist() == [6, 7, 8, 9]
+    assert lu["note"].dtype == "float32"
+
+
+def test_sql_filtre_et_erreurs(engine):
+    lu = ExtractionSQL.extract_sql("t", engine, filtre=_garder_bonnes)
+    assert lu["id"].tolist() == [1, 3, 5, 7, 9]
+    assert lu.index.equals(pd.RangeIndex(5))
+    vide = ExtractionSQL.extract_sql("SELECT id FROM t WHERE id < 0", engine)
+    assert vide.empty
+    with pytest.raises(ValueError):
+        ExtractionSQL.extract_sql("SELECT * FROM t", engine, ["id"])
+    with pytest.raises(IOError):
+        ExtractionSQL.extract_sql("absente", engine)
+
+
+def test_mongodb_projection_et_morceaux(df):
+    mongomock = pytest.importorskip("mongomock")
+    collection = mongomock.MongoClient()["db"]["c"]
+    collection.insert_many(df.to_dict("records"))
+
+    morceaux = list(ExtractionMongo.extract_mongodb(collection, colonnes=["id", "note"], taille_chunk=4, taille_batch=3))
+    assert [len(m) for m in morceaux] == [4, 4, 2]
+    assert list(morceaux[0].columns) == ["id", "note"]
+
+    lu = ExtractionMongo.extract_mongodb(collection, {"note": {"$gt": 3}}, garder_id=True)
+    assert lu["id"].tolist() == [1, 3, 5, 7, 9]
+    assert "_id" in lu.columns
+
+
+def test_sql_resultat_vide_garde_les_colonnes(engine):
+    vide = ExtractionSQL.extract_sql("SELECT * FROM t WHERE id > :max", engine, params={"max": 100})
+    assert vide.empty
+    assert list(vide.columns) == ["id", "note", "nom"]
+    assert list(ExtractionSQL.extract_sql("t", engine, ["nom", "id"], filtre=lambda m: m.iloc[:0]).columns) == ["nom", "id"]
+
+
+def test_mongodb_colonnes_avec_id(df):
+    mongomock = pytest.importorskip("mongomock")
+    collection = mongomock.MongoClient()["db"]["c"]
+    collection.insert_many(df.to_dict("records"))
+    lu = ExtractionMongo.extract_mongodb(collection, colonnes=["id"], garder_id=True)
+    assert list(lu.columns) == ["id", "_id"]
+    assert lu["_id"].notna().all()
+    assert list(ExtractionMongo.extract_mongodb(collection, colonnes=["id"]).columns) == ["id"]
@@ -0,0 +1,19 @@
+import numpy as np
+import pandas as pd
+
+from etl_package import Imputateur
+
+
+def test_imputer_bloc_plusieurs_colonnes():
+    df = pd.DataFrame({"d": [1.0, np.nan, 3.0], "e": [np.nan, 2.0, 4.0]})
+    out = Imputateur.imputer_colonne(df, ["d", "e"])
+    assert out["d"].tolist() == [1.0, 2.0, 3.0]
+    assert out["e"].tolist() == [3.0, 2.0, 4.0]
+    # Le DataFrame d'origine n'est pas modifié.
+    assert df["d"].isna().sum() == 1
+
+
+def test_imputer_bloc_mediane_selecteur():
+    df = pd.DataFrame({"d": [1.0, np.nan, 5.0, 2.0], "t": ["a", None, "a", "b"]})
+    out = Imputateur.imputer_colonne(df, "number", "mediane")
+    assert out["d"].tolist() == [1.0, 2.0, 5.0, 2.0]
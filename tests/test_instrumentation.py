@@ -0,0 +1,126 @@
+import logging
+
+import pandas as pd
+import pytest
+
+from etl_package import CollecteurMesures, Instrumentation
+from etl_package.outils import instrumentation
+from etl_package.outils.instrumentation import compter, instrumenter
+
+
+@instrumenter("interne")
+def _interne(df):
+    compter(lignes_vues=len(df))
+    compter(lignes_vues=1, appels=1)
+    return df.head(1)
+
+
+@instrumenter("externe")
+def _externe(df):
+    compter(externes=1)
+    return _interne(df)
+
+
+@instrumenter("echec")
+def _echec(df):
+    raise KeyError("absente")
+
+
+@instrumenter("flux")
+def _flux(n):
+    for i in range(n):
+        yield pd.DataFrame({"a": range(i + 1)})
+
+
+@pytest.fixture
+def collecteur():
+    collecteur = CollecteurMesures()
+    yield collecteur
+    Instrumentation.desactiver()
+    Instrumentation.retirer_hook(collecteur)
+
+
+def test_inactive_sans_mesure(monkeypatch, collecteur):
+    Instrumentation.ajouter_hook(collecteur)
+
+    def interdit(*args, **kwargs):
+        raise AssertionError("mesure hors session")
+
+    monkeypatch.setattr(instrumentation, "_mesurer", interdit)
+    monkeypatch.setattr(instrumentation, "_publier", interdit)
+    df = pd.DataFrame({"a": [1, 2]})
+    assert len(_externe(df)) == 1
+    assert [len(m) for m in _flux(2)] == [1, 2]
+    compter(ignores=1)
+    assert collecteur.mesures == []
+
+
+def test_parent_formes_et_compteurs(collecteur):
+    with Instrumentation.session(hooks=[collecteur]):
+        _externe(pd.DataFrame({"a": [1, 2, 3]}))
+    interne, externe = collecteur.mesures
+    assert (interne["etape"], interne["parent"]) == ("interne", "externe")
+    assert (externe["etape"], externe["parent"]) == ("externe", None)
+    assert interne["compteurs"] == {"lignes_vues": 4, "appels": 1}
+    assert externe["compteurs"] == {"externes": 1}
+    assert (interne["lignes_entree"], interne["colonnes_entree"]) == (3, 1)
+    assert (externe["lignes_sortie"], externe["colonnes_sortie"]) == (1, 1)
+    assert externe["secondes"] >= interne["secondes"] >= 0
+    assert collecteur.tableau()["lignes_vues"].tolist()[0] == 4
+
+
+def test_etapes_filtrees(collecteur):
+    with Instrumentation.session(hooks=[collecteur], etapes=["interne"]):
+        _externe(pd.DataFrame({"a": [1]}))
+    assert [(m["etape"], m["parent"]) for m in collecteur.mesures] == [("interne", None)]
+
+
+def test_memoire_et_profil_echantillonnes(collecteur):
+    df = pd.DataFrame({"a": range(100)})
+    with Instrumentation.session(hooks=[collecteur], memoire=True, profil=True, echantillon=2):
+        for _ in range(4):
+            _externe(df)
+    externes = [m for m in collecteur.mesures if m["etape"] == "externe"]
+    internes = [m for m in collecteur.mesures if m["etape"] == "interne"]
+    assert [m["memoire_mo"] is not None for m in externes] == [True, False, True, False]
+    assert [m["profil"] is not None for m in externes] == [True, False, True, False]
+    assert all(m["memoire_mo"] >= 0 for m in externes if m["memoire_mo"] is not None)
+    # Les étapes imbriquées sont incluses dans le profil de leur parent.
+    assert all(m["profil"] is None for m in internes)
+    assert collecteur.profil("externe") is not None
+    assert collecteur.profil("interne") is None
+
+
+def test_erreur_de_l_etape_mesuree_et_propagee(collecteur):
+    with Instrumentation.session(hooks=[collecteur]):
+        with pytest.raises(KeyError):
+            _echec(pd.DataFrame({"a": [1]}))
+    (mesure,) = collecteur.mesures
+    assert "KeyError" in mesure["erreur"]
+    assert mesure["lignes_sortie"] is None
+
+
+def test_hook_en_echec_n_interrompt_pas_l_etape(collecteur, caplog):
+    def defaillant(mesure):
+        raise RuntimeError("hook cassé")
+
+    with caplog.at_level(logging.WARNING, logger="etl_package"):
+        with Instrumentation.session(hooks=[defaillant, collecteur]):
+            resultat = _externe(pd.DataFrame({"a": [1, 2]}))
+    assert len(resultat) == 1
+    assert len(collecteur.mesures) == 2
+    assert "hook cassé" in caplog.text
+
+
+def test_generateur_mesure_par_element(collecteur):
+    with Instrumentation.session(hooks=[collecteur]):
+        morceaux = list(_flux(3))
+    assert [len(m) for m in morceaux] == [1, 2, 3]
+    mesures = [m for m in collecteur.mesures if m["etape"] == "flux"]
+    assert [m["lignes_sortie"] for m in mesures] == [1, 2, 3, None]
+
+
+def test_echantillon_invalide():
+    with pytest.raises(ValueError):
+        Instrumentation.activer(echantillon=0)
+    assert not Instrumentation.est_active()
@@ -0,0 +1,134 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from etl_package import (
+    EncodeurCategorielAjuste,
+    GestionOutliersAjustee,
+    ImputateurAjuste,
+    MoteurHorsMemoire,
+    StandardisationAjustee,
+)
+
+pytest.importorskip("pyarrow")
+
+
+def _executer(chemin, **options):
+    morceaux = [pd.DataFrame({"a": [1.0, 2.0]}), pd.DataFrame({"a": [3.0]})]
+    return MoteurHorsMemoire([lambda df: df]).executer(
+        morceaux, {"type": "parquet", "chemin": str(chemin), **options}, verbose=False
+    )
+
+
+def test_repertoire_existant_refuse_sans_ecraser(tmp_path):
+    autre = tmp_path / "notes.txt"
+    autre.write_text("à conserver")
+    with pytest.raises(IOError):
+        _executer(tmp_path)
+    assert autre.exists()
+
+
+def test_ecraser_ne_supprime_que_les_morceaux(tmp_path):
+    sortie = tmp_path / "sortie"
+    _executer(sortie)
+    (sortie / "notes.txt").write_text("à conserver")
+    _executer(sortie, ecraser=True)
+    assert (sortie / "notes.txt").exists()
+    morceaux = [f for f in os.listdir(sortie) if f.startswith("part-")]
+    assert len(morceaux) == 2
+    assert pd.read_parquet(sortie / morceaux[0])["a"].notna().all()
+
+
+def _donnees(n=20000):
+    rng = np.random.default_rng(1)
+    return pd.DataFrame({
+        "x": np.where(rng.random(n) < 0.1, np.nan, rng.lognormal(size=n)),
+        "y": rng.normal(10, 3, n),
+        "z": np.where(rng.random(n) < 0.01, 100, rng.integers(0, 10, n)).astype(float),
+        "cat": rng.choice(list("abcde"), n, p=[0.4, 0.3, 0.15, 0.1, 0.05]),
+    })
+
+
+def _en_memoire(df, etapes):
+    for etape in etapes:
+        df = etape.fit_transform(df)
+    return df
+
+
+def _hors_memoire(df, etapes, taille=3000):
+    morceaux = [df.iloc[i:i + taille] for i in range(0, len(df), taille)]
+    sortie = []
+    rapport = MoteurHorsMemoire(etapes).executer(morceaux, sortie.append, verbose=False)
+    return pd.concat(sortie), rapport
+
+
+def test_resultats_egaux_au_chemin_en_memoire():
+    df = _donnees()
+
+    def etapes():
+        return [
+            ImputateurAjuste("x", "mediane"),
+            StandardisationAjustee("y"),
+            GestionOutliersAjustee("y", "winsorize"),
+            EncodeurCategorielAjuste("cat", "frequence"),
+        ]
+
+    attendu = _en_memoire(df, etapes())
+    obtenu, rapport = _hors_memoire(df, etapes())
+    assert rapport["lignes_ecrites"] == len(df)
+    assert obtenu.index.equals(attendu.index)
+    # Moyennes, écarts-types et fréquences : exacts.
+    np.testing.assert_allclose(obtenu["cat"], attendu["cat"], rtol=0, atol=1e-12)
+    # Médiane et quartiles approchés au-delà de 2048 valeurs : erreur de rang ~1/2048.
+    imputes = df["x"].isna()
+    np.testing.assert_allclose(obtenu.loc[~imputes, "x"], attendu.loc[~imputes, "x"], rtol=0, atol=1e-12)
+    assert obtenu["x"].notna().all()
+    ecart = abs(obtenu.loc[imputes, "x"].iloc[0] - attendu.loc[imputes, "x"].iloc[0])
+    assert ecart < 0.01 * df["x"].std()
+    interieur = attendu["y"].between(attendu["y"].min(), attendu["y"].max(), inclusive="neither")
+    np.testing.assert_allclose(obtenu.loc[interieur, "y"], attendu.loc[interieur, "y"], rtol=0, atol=1e-9)
+    np.testing.assert_allclose(obtenu["y"], attendu["y"], rtol=0, atol=0.01)
+
+
+def test_morceau_unique_identique_au_chemin_en_memoire():
+    df = _donnees(1500)
+
+    def etapes():
+        return [ImputateurAjuste("x", "mediane"), GestionOutliersAjustee("y", "winsorize")]
+
+    obtenu, _ = _hors_memoire(df, etapes(), taille=len(df))
+    pd.testing.assert_frame_equal(obtenu, _en_memoire(df, etapes()), check_exact=False, rtol=1e-12)
+
+
+def test_etapes_independantes_en_un_passage():
+    _, rapport = _hors_memoire(_donnees(5000), [StandardisationAjustee("y"), ImputateurAjuste("x", "moyenne")])
+    # Un passage d'ajustement puis un passage d'écriture.
+    assert rapport["passages"] == 2
+
+
+def test_etape_dependante_attend_un_passage():
+    df = _donnees(5000)
+
+    def etapes():
+        return [StandardisationAjustee("y"), GestionOutliersAjustee("y", "winsorize")]
+
+    obtenu, rapport = _hors_memoire(df, etapes())
+    assert rapport["passages"] == 3
+    np.testing.assert_allclose(obtenu["y"], _en_memoire(df, etapes())["y"], rtol=0, atol=0.01)
+
+
+def test_etape_suivant_une_suppression_de_lignes_attend_un_passage():
+    df = _donnees(5000)
+
+    def etapes():
+        return [GestionOutliersAjustee("z", "remove"), StandardisationAjustee("z")]
+
+    attendu = _en_memoire(df, etapes())
+    obtenu, rapport = _hors_memoire(df, etapes())
+    assert rapport["passages"] == 3
+    assert len(obtenu) == len(attendu) < len(df)
+    # Standardisée sur les seules lignes conservées.
+    assert abs(obtenu["z"].mean()) < 1e-9
+    np.testing.assert_allclose(obtenu["z"], attendu["z"], rtol=0, atol=1e-9)
@@ -0,0 +1,83 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from etl_package import ExecuteurParallele
+
+
+def _doubler(df):
+    return df.assign(x=df["x"] * 2, y2=df["x"] + 1)
+
+
+def _filtrer_et_retirer(df):
+    return df[df["x"] % 2 == 0].drop(columns="x").assign(z=0)
+
+
+@pytest.fixture(scope="module")
+def executeur():
+    with ExecuteurParallele(max_workers=2) as ex:
+        yield ex
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {"x": np.arange(10), "nom": list("abcdefghij"), "v": np.linspace(0, 1, 10)},
+        index=pd.RangeIndex(100, 110),
+    )
+
+
+def test_par_lignes_colonnes_reassemble_sur_df(executeur, df):
+    out = executeur.par_lignes(df, _doubler, colonnes=["x"], n_parts=3)
+    assert list(out.columns) == ["x", "nom", "v", "y2"]
+    assert out.index.equals(df.index)
+    assert out["x"].tolist() == (df["x"] * 2).tolist()
+    pd.testing.assert_series_equal(out["nom"], df["nom"])
+    assert df["x"].tolist() == list(range(10))
+
+
+def test_par_lignes_colonnes_lignes_et_colonnes_retirees(executeur, df):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        out = executeur.par_lignes(df, _filtrer_et_retirer, colonnes=["x"], n_parts=3)
+    assert list(out.columns) == ["nom", "v", "z"]
+    assert out.index.tolist() == [100, 102, 104, 106, 108]
+    assert out["nom"].tolist() == list("acegi")
+
+
+def test_par_lignes_toutes_colonnes(executeur, df):
+    out = executeur.par_lignes(df, _doubler, n_parts=4)
+    assert out.index.equals(df.index)
+    assert list(out.columns) == ["x", "nom", "v", "y2"]
+
+
+def _identite(df):
+    return df
+
+
+def _identite_groupe(df, groupe):
+    return df[[groupe] if isinstance(groupe, str) else list(groupe)]
+
+
+@pytest.fixture
+def df_types():
+    return pd.DataFrame({
+        "entier": pd.array([1, None, 3, 4], dtype="Int64"),
+        "cat": pd.Categorical(["a", "b", "a", None]),
+        "texte": pd.array(["x", None, "z", "w"], dtype="string"),
+        "date": pd.date_range("2024-01-01", periods=4, tz="UTC"),
+        "x": np.arange(4.0),
+    })
+
+
+def test_par_lignes_conserve_les_dtypes(executeur, df_types):
+    pd.testing.assert_frame_equal(executeur.par_lignes(df_types, _identite, n_parts=2), df_types)
+    out = executeur.par_lignes(df_types, _identite, colonnes=["entier", "cat"], n_parts=3)
+    pd.testing.assert_frame_equal(out, df_types)
+
+
+def test_par_colonnes_conserve_les_dtypes(executeur, df_types):
+    out = executeur.par_colonnes(df_types, _identite_groupe, ["entier", "cat", ["texte", "date"]])
+    pd.testing.assert_frame_equal(out, df_types)
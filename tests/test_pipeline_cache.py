@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from etl_package import CacheEtapes, Pipeline
+
+pytest.importorskip("pyarrow")
+
+
+def _donnees():
+    return pd.DataFrame({
+        "Rating": [3.0, np.nan, 4.0, 2.5, 40.0],
+        "CocoaPercentage": ["70%", "72%", "65%", "80%", "70%"],
+        "Company": ["a", "b", "a", "c", "b"],
+    })
+
+
+def _pipeline(prefix):
+    return (
+        Pipeline()
+        .imputer("Rating", "mediane")
+        .gerer_outliers("Rating", "winsorize")
+        .remplacer("CocoaPercentage", ("%", ""))
+        .encoder("Company", prefix=prefix)
+    )
+
+
+def test_reprise_apres_modification_de_la_derniere_etape(tmp_path):
+    cache = CacheEtapes(str(tmp_path))
+    df = _donnees()
+    _pipeline("C").executer(df, cache=cache)
+    assert cache.stats["hits"] == 0
+
+    resultat = _pipeline("E").executer(df, cache=cache)
+    assert cache.stats["hits"] == 1
+    pd.testing.assert_frame_equal(resultat, _pipeline("E").executer(df), check_like=True)
+
+
+def test_points_reprise_par_bloc(tmp_path):
+    cache = CacheEtapes(str(tmp_path))
+    df = _donnees()
+    _pipeline("C").executer(df, cache=cache, points_reprise="blocs")
+    _pipeline("E").executer(df, cache=cache, points_reprise="blocs")
+    assert cache.stats["hits"] == 0
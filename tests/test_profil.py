@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from etl_package import ProfilColonnes
+from etl_package.outils.statistiques import HyperLogLog, Moments, SpaceSaving
+
+
+def _donnees(n=3000):
+    rng = np.random.default_rng(3)
+    return pd.DataFrame({
+        "entier": pd.array(np.where(rng.random(n) < 0.05, None, rng.integers(0, 40, n)), dtype="Int64"),
+        "decimal": rng.normal(5, 2, n),
+        "texte": rng.choice(["a", "b", "c", "d"], n),
+        "date": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 20, n), unit="D"),
+        "pourcent": rng.choice(["10%", "20.5%", "n/a"], n),
+    })
+
+
+def _comparer(obtenu, attendu):
+    exactes = ["colonne", "type_infere", "lignes", "manquantes", "distinctes", "min", "max"]
+    pd.testing.assert_frame_equal(obtenu[exactes], attendu[exactes])
+    for c in ("moyenne", "ecart_type"):
+        np.testing.assert_allclose(obtenu[c].astype(float), attendu[c].astype(float), rtol=1e-12)
+    # Au plus `capacite` valeurs distinctes : effectifs exacts, seul l'ordre des ex aequo peut varier.
+    exacts = attendu["distinctes"] <= 64
+    assert [dict(f) for f in obtenu.loc[exacts, "frequentes"]] == [dict(f) for f in attendu.loc[exacts, "frequentes"]]
+
+
+def test_fusion_des_lots_egale_le_profil_complet():
+    df = _donnees()
+    complet = ProfilColonnes.profiler(df).rapport()
+    lots = [df.iloc[i:i + 700] for i in range(0, len(df), 700)]
+    fusion = ProfilColonnes()
+    for lot in lots:
+        fusion.merge(ProfilColonnes.profiler(lot))
+    _comparer(fusion.rapport(), complet)
+    _comparer(ProfilColonnes.profiler(iter(lots)).rapport(), complet)
+    assert complet.set_index("colonne")["type_infere"].to_dict() == {
+        "entier": "entier", "decimal": "decimal", "texte": "categorie", "date": "date", "pourcent": "categorie",
+    }
+
+
+def test_fusion_parametres_differents():
+    with pytest.raises(ValueError):
+        ProfilColonnes(precision=12).merge(ProfilColonnes())
+
+
+@pytest.mark.parametrize("fichier", ["profil.json", "profil.pkl"])
+def test_sauvegarde_aller_retour(tmp_path, fichier):
+    profil = ProfilColonnes.profiler(_donnees())
+    chemin = str(tmp_path / fichier)
+    profil.sauvegarder(chemin)
+    relu = ProfilColonnes.charger(chemin)
+    _comparer(relu.rapport(), profil.rapport())
+    assert relu.dtypes_suggeres() == profil.dtypes_suggeres()
+    # Un profil relu continue de cumuler comme l'original.
+    lot = _donnees(500)
+    _comparer(relu.update(lot).rapport(), profil.update(lot).rapport())
+
+
+def test_nombres_en_texte_comptes_comme_leur_valeur():
+    profil = ProfilColonnes()
+    profil.update(pd.DataFrame({"a": ["1", "2.0", "x"]}))
+    profil.update(pd.DataFrame({"a": [1, 2, 3]}))
+    assert profil.rapport()["distinctes"].tolist() == [4]
+
+
+@pytest.mark.parametrize("n", [100, 5_000, 200_000])
+def test_hyperloglog_erreur_bornee(n):
+    h = HyperLogLog(14)
+    h.update(np.arange(n))
+    # 3 écarts-types de l'erreur relative théorique 1.04 / sqrt(2**14).
+    assert abs(h.estimation() - n) <= 3 * 1.04 / 2 ** 7 * n
+
+
+def test_hyperloglog_fusion_et_serialisation():
+    a, b = HyperLogLog(12).update(np.arange(0, 60_000)), HyperLogLog(12).update(np.arange(40_000, 100_000))
+    union = HyperLogLog(12).update(np.arange(100_000))
+    assert a.merge(b).estimation() == union.estimation()
+    assert HyperLogLog.from_dict(a.to_dict()).estimation() == a.estimation()
+    with pytest.raises(ValueError):
+        a.merge(HyperLogLog(10))
+
+
+def test_space_saving_garanties():
+    rng = np.random.default_rng(5)
+    valeurs = rng.zipf(1.6, 50_000)
+    valeurs = valeurs[valeurs < 10_000]
+    vrais = pd.Series(valeurs).value_counts()
+    resume = SpaceSaving(20)
+    for debut in range(0, len(valeurs), 4000):
+        resume.merge(SpaceSaving(20).update(valeurs[debut:debut + 4000]))
+    suivies = {v: (c, e) for v, c, e in resume.top(20)}
+    for v, (c, e) in suivies.items():
+        assert vrais[v] <= c <= vrais[v] + e
+    # Toute valeur plus fréquente que le plancher est suivie.
+    assert all(v in suivies for v in vrais[vrais > resume.plancher].index)
+    assert [v for v, _, _ in resume.top(3)] == vrais.index[:3].tolist()
+    relu = SpaceSaving.from_dict(resume.to_dict())
+    assert relu.top(20) == resume.top(20) and relu.plancher == resume.plancher
+
+
+def test_moments_fusion_et_poids():
+    rng = np.random.default_rng(7)
+    x = rng.normal(3, 4, 10_000)
+    x[::50] = np.nan
+    m = Moments()
+    for morceau in np.array_split(x, 7):
+        m.merge(Moments().update(morceau))
+    propres = x[~np.isnan(x)]
+    assert m.n == propres.size
+    np.testing.assert_allclose([m.moyenne, m.variance(ddof=1)], [propres.mean(), propres.var(ddof=1)], rtol=1e-12)
+    assert (m.min, m.max) == (propres.min(), propres.max())
+
+    pondere = Moments().update([1.0, 2.0, 5.0], [3, 1, 2])
+    np.testing.assert_allclose(pondere.ecart_type(), np.std([1, 1, 1, 2, 5, 5]), rtol=1e-12)
+    relu = Moments.from_dict(pondere.to_dict())
+    assert relu.to_dict() == pondere.to_dict()
+    assert np.isnan(Moments().variance()) and Moments.from_dict(Moments().to_dict()).n == 0
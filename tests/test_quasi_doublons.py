@@ -0,0 +1,23 @@
+import pandas as pd
+import pytest
+
+from etl_package import QuasiDoublons
+
+
+def test_variantes_groupees():
+    df = pd.DataFrame({"c": ["Valrhona", "Valhrona", "Amedei ", "amédei", None, "Zotter"]})
+    groupes = QuasiDoublons.grouper(df, "c")
+    assert groupes.tolist() == [0, 0, 1, 1, -1, 2]
+
+
+def test_jaccard_exact_en_trigrammes():
+    # Jaccard exact des trigrammes bordés d'espaces : 6 communs sur 10, soit 0.6.
+    df = pd.DataFrame({"c": ["abcdefgh", "xbcdefgh"]})
+    assert QuasiDoublons.grouper(df, "c", seuil=0.65, n_gram=3).nunique() == 2
+    assert QuasiDoublons.grouper(df, "c", seuil=0.55, n_gram=3).nunique() == 1
+
+
+@pytest.mark.parametrize("n_gram", [0, 4, 5])
+def test_n_gram_hors_bornes(n_gram):
+    with pytest.raises(ValueError):
+        QuasiDoublons.grouper(pd.DataFrame({"c": ["a", "b"]}), "c", n_gram=n_gram)